@@ -0,0 +1,188 @@
+"""Binary Bloom filter for offline package existence checks.
+
+~/.vibesrails/packages/<ecosystem>.bloom used to be a plain list of
+package names, read into a Python set on every lookup (hundreds of ms and
+tens of MB for the ~600k PyPI names). The binary format is a fixed header
+followed by the bit array:
+
+    magic  8s   b"VRBLOOM\\0"
+    version H   FORMAT_VERSION
+    k      H   number of hash functions
+    m      Q   number of bits
+    n      Q   number of names added
+
+Lookups mmap the file and read k bits; nothing is loaded up front. Bit
+positions use double hashing over one blake2b digest. Names are normalised
+as in PEP 503 (case-insensitive, runs of "-", "_", "." are equivalent).
+
+Build a filter from a local name list (one name per line):
+
+    vibesrails-mcp --build-bloom names.txt [ecosystem]
+
+The builder also writes <ecosystem>.names (sorted, normalised), used for
+similarity suggestions, which a Bloom filter cannot provide.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+MAGIC = b"VRBLOOM\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHQQ")
+DEFAULT_FP_RATE = 0.001
+
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 normalised package name."""
+    return _NORMALIZE_RE.sub("-", name.strip()).lower()
+
+
+def optimal_params(n: int, fp_rate: float = DEFAULT_FP_RATE) -> tuple[int, int]:
+    """Return (m bits, k hashes) for n names at the target false-positive rate."""
+    n = max(1, n)
+    m = max(8, math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2)))
+    k = max(1, round(m / n * math.log(2)))
+    return m, k
+
+
+def _positions(name: str, k: int, m: int) -> list[int]:
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % m for i in range(k)]
+
+
+def is_bloom_file(path: Path) -> bool:
+    """True if path holds a binary filter (False for legacy name lists)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class BloomFilter:
+    """Read-only, mmap-backed view of a .bloom file."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.k, self.m, self.count = HEADER.unpack_from(self._mm)
+        except struct.error as e:
+            self._mm.close()
+            raise ValueError(f"Truncated bloom filter: {path}") from e
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"Unsupported bloom filter: {path}")
+        if self.k < 1 or self.m < 1 or len(self._mm) < HEADER.size + (self.m + 7) // 8:
+            self._mm.close()
+            raise ValueError(f"Corrupt bloom filter: {path}")
+
+    def __contains__(self, name: str) -> bool:
+        mm, base = self._mm, HEADER.size
+        for pos in _positions(normalize_name(name), self.k, self.m):
+            if not mm[base + (pos >> 3)] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def build(names: Iterable[str], path: Path, fp_rate: float = DEFAULT_FP_RATE) -> int:
+    """Write a filter for names to path (atomically). Returns the name count."""
+    unique = sorted({normalize_name(n) for n in names if n.strip()})
+    m, k = optimal_params(len(unique), fp_rate)
+    bits = bytearray((m + 7) // 8)
+    for name in unique:
+        for pos in _positions(name, k, m):
+            bits[pos >> 3] |= 1 << (pos & 7)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, k, m, len(unique)))
+        f.write(bits)
+    os.replace(tmp, path)
+    return len(unique)
+
+
+def names_path(bloom_path: Path) -> Path:
+    """Sidecar list of normalised names, for similarity suggestions."""
+    return bloom_path.with_suffix(".names")
+
+
+def build_from_list(source: Path, ecosystem: str = "pypi", dest_dir: Path | None = None) -> Path:
+    """Build <dest_dir>/<ecosystem>.bloom and .names from a name-per-line file."""
+    if dest_dir is None:
+        dest_dir = Path.home() / ".vibesrails" / "packages"
+    names = source.read_text(encoding="utf-8").splitlines()
+    bloom_path = dest_dir / f"{ecosystem}.bloom"
+    build(names, bloom_path)
+    sidecar = names_path(bloom_path)
+    tmp = sidecar.with_suffix(".names.tmp")
+    tmp.write_text(
+        "\n".join(sorted({normalize_name(n) for n in names if n.strip()})) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, sidecar)
+    return bloom_path
+
+
+# ── Open filters, reused while the file is unchanged ────────────────
+
+_open_filters: dict[str, tuple[tuple[int, int, int], BloomFilter]] = {}
+
+
+def load(path: Path) -> BloomFilter | None:
+    """Return the mmap'd filter for path, reopening it if the file changed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = str(path)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _open_filters.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        bloom = BloomFilter(path)
+    except (OSError, ValueError):
+        return None
+    if cached is not None:
+        cached[1].close()
+    _open_filters[key] = (stamp, bloom)
+    return bloom
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Build a filter: <names.txt> [ecosystem]."""
+    args = sys.argv[1:] if argv is None else argv
+    if not args or len(args) > 2:
+        print("Usage: --build-bloom <names.txt> [ecosystem]", file=sys.stderr)
+        return 2
+    source = Path(args[0])
+    ecosystem = args[1] if len(args) == 2 else "pypi"
+    if not source.is_file():
+        print(f"Not a file: {source}", file=sys.stderr)
+        return 1
+    bloom_path = build_from_list(source, ecosystem)
+    bloom = BloomFilter(bloom_path)
+    print(f"{bloom_path}: {bloom.count} names, {bloom.m // 8} bytes, k={bloom.k}")
+    bloom.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
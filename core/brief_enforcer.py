@@ -9,11 +9,11 @@ from __future__ import annotations
 
 import json
 import logging
-import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
-from storage.migrations import get_db_path, migrate
+from storage.connection import connect, ensure_schema
+from storage.migrations import get_db_path
 
 from .brief_enforcer_patterns import (  # noqa: I001
     ACTION_VERBS as _ACTION_VERBS,
@@ -67,7 +67,7 @@ class BriefEnforcer:
         else:
             self._db_path = get_db_path()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        migrate(db_path=str(self._db_path))
+        ensure_schema(self._db_path)
 
     # ── Validate ─────────────────────────────────────────────────
 
@@ -252,7 +252,7 @@ class BriefEnforcer:
     ) -> int:
         """Store a brief evaluation in history. Returns the row ID."""
         now = datetime.now(timezone.utc).isoformat()
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             cursor = conn.execute(
                 "INSERT INTO brief_history "
@@ -267,7 +267,7 @@ class BriefEnforcer:
 
     def get_history(self, session_id: str | None = None) -> list[dict]:
         """Retrieve brief history, optionally filtered by session."""
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             if session_id:
                 cursor = conn.execute(
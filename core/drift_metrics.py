@@ -15,6 +15,8 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from vibesrails.file_index import project_files
+
 # ── Velocity Thresholds ──────────────────────────────────────────────
 
 VELOCITY_NORMAL = 5.0       # 0-5%
@@ -148,7 +150,7 @@ def aggregate_metrics(project_path: Path, *, max_files: int = _MAX_FILES) -> dic
     file_count = 0
     total_complexity = 0.0
 
-    for py_file in sorted(project_path.rglob("*.py")):
+    for py_file in project_files(project_path):
         if file_count >= max_files:
             break
 
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import json
 import logging
-import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -27,7 +26,8 @@ from core.drift_metrics import (
     analyze_file,
     classify_velocity,
 )
-from storage.migrations import get_db_path, migrate
+from storage.connection import connect, ensure_schema
+from storage.migrations import get_db_path
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +70,7 @@ class DriftTracker:
         else:
             self._db_path = get_db_path()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        migrate(db_path=str(self._db_path))
+        ensure_schema(self._db_path)
 
     def take_snapshot(self, project_path: str, session_id: str | None = None) -> dict:
         """Capture a metrics snapshot for the project.
@@ -90,7 +90,7 @@ class DriftTracker:
         now = datetime.now(timezone.utc).isoformat()
 
         # Store in SQLite
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             conn.execute(
                 "INSERT INTO drift_snapshots (session_id, file_path, timestamp, metrics) "
@@ -113,7 +113,7 @@ class DriftTracker:
 
         Returns None if fewer than 2 snapshots exist.
         """
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             cursor = conn.execute(
                 "SELECT metrics, timestamp FROM drift_snapshots "
@@ -170,7 +170,7 @@ class DriftTracker:
 
     def _compute_trend(self, project_path: str, current_velocity: float) -> str:
         """Determine trend by comparing with previous velocity."""
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             cursor = conn.execute(
                 "SELECT metrics FROM drift_snapshots "
@@ -214,7 +214,7 @@ class DriftTracker:
 
         Works backward from most recent, counting pairs with >10% drift.
         """
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             cursor = conn.execute(
                 "SELECT metrics FROM drift_snapshots "
@@ -256,7 +256,7 @@ class DriftTracker:
 
     def get_snapshot_count(self, project_path: str) -> int:
         """Get the number of snapshots for a project."""
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             cursor = conn.execute(
                 "SELECT COUNT(*) FROM drift_snapshots WHERE file_path = ?",
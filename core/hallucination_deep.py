@@ -16,13 +16,15 @@ import importlib.metadata
 import importlib.util
 import logging
 import re
-import sqlite3
 import urllib.error
 import urllib.request
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from storage.migrations import get_db_path, migrate
+from storage.connection import connect, ensure_schema
+from storage.migrations import get_db_path
 
 from .hallucination_registry import (
     check_bloom_filter,
@@ -37,6 +39,10 @@ logger = logging.getLogger(__name__)
 _EXISTENCE_TTL = timedelta(hours=24)
 _API_SURFACE_TTL = timedelta(days=7)
 
+# Batch lookups: concurrent PyPI requests, and names per SQL IN (...) query
+_REGISTRY_WORKERS = 8
+_SQL_BATCH = 500
+
 
 class DeepHallucinationChecker:
     """Multi-level hallucination checker for Python imports."""
@@ -47,7 +53,7 @@ class DeepHallucinationChecker:
         else:
             self._db_path = get_db_path()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        migrate(db_path=str(self._db_path))
+        ensure_schema(self._db_path)
         self._project_path = Path(project_path) if project_path else None
 
     # ── Level 1: Import exists locally? ──────────────────────────────
@@ -129,6 +135,53 @@ class DeepHallucinationChecker:
         similar = self._find_similar(package_name, ecosystem)
         return {"exists": None, "source": "unknown", "similar_packages": similar}
 
+    def check_packages_registry(
+        self, package_names: Iterable[str], ecosystem: str = "pypi",
+        max_workers: int = _REGISTRY_WORKERS,
+    ) -> dict[str, dict]:
+        """Level 2 for many packages: one cache query, concurrent API calls.
+
+        Same strategy and result shape as check_package_registry, keyed by
+        package name. Cache hits are read with a single IN (...) query, the
+        bloom filter handles what it can, and the remaining names are sent
+        to PyPI on up to max_workers threads. New results are cached in
+        one transaction.
+        """
+        names = list(dict.fromkeys(package_names))
+        results: dict[str, dict] = {}
+        fresh: dict[str, bool] = {}
+        pending: list[str] = []
+
+        cached = self._get_cache_many(names, ecosystem)
+        for name in names:
+            if name.lower() in cached:
+                results[name] = {"exists": cached[name.lower()], "source": "cache"}
+                continue
+            bloom_result = self._check_bloom_filter(name, ecosystem)
+            if bloom_result is not None:
+                results[name] = {"exists": bloom_result, "source": "bloom"}
+                fresh[name] = bloom_result
+            else:
+                pending.append(name)
+
+        if pending:
+            workers = max(1, min(max_workers, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for name, api_result in zip(pending, pool.map(self._check_pypi_api, pending)):
+                    if api_result is None:
+                        results[name] = {"exists": None, "source": "unknown"}
+                    else:
+                        results[name] = {"exists": api_result, "source": "api"}
+                        fresh[name] = api_result
+
+        self._set_cache_many(fresh, ecosystem)
+        for name, result in results.items():
+            exists = result["exists"]
+            result["similar_packages"] = (
+                self._find_similar(name, ecosystem) if exists is not True else []
+            )
+        return {name: results[name] for name in names}
+
     def _check_bloom_filter(self, package_name: str, ecosystem: str) -> bool | None:
         """Check bloom filter file. Returns None if file doesn't exist."""
         return check_bloom_filter(package_name, ecosystem)
@@ -240,7 +293,7 @@ class DeepHallucinationChecker:
         self, package_name: str, ecosystem: str, check_type: str
     ) -> bool | None:
         """Get cached existence result. Returns None if expired or missing."""
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             cursor = conn.execute(
                 "SELECT exists_flag, cached_at FROM package_cache "
@@ -270,7 +323,7 @@ class DeepHallucinationChecker:
     ) -> None:
         """Write to package_cache."""
         now = datetime.now(timezone.utc).isoformat()
-        conn = sqlite3.connect(str(self._db_path), timeout=10)
+        conn = connect(self._db_path)
         try:
             conn.execute(
                 "INSERT OR REPLACE INTO package_cache "
@@ -281,3 +334,45 @@ class DeepHallucinationChecker:
             conn.commit()
         finally:
             conn.close()
+
+    def _get_cache_many(self, package_names: list[str], ecosystem: str) -> dict[str, bool]:
+        """Unexpired existence results for many packages, keyed by lowercased name."""
+        keys = list(dict.fromkeys(n.lower() for n in package_names))
+        now = datetime.now(timezone.utc)
+        found: dict[str, bool] = {}
+        conn = connect(self._db_path)
+        try:
+            for start in range(0, len(keys), _SQL_BATCH):
+                chunk = keys[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT package_name, exists_flag, cached_at FROM package_cache "
+                    f"WHERE ecosystem = ? AND package_name IN ({placeholders})",
+                    [ecosystem, *chunk],
+                ).fetchall()
+                for name, exists_flag, cached_at in rows:
+                    ts = datetime.fromisoformat(cached_at)
+                    if ts.tzinfo is None:
+                        ts = ts.replace(tzinfo=timezone.utc)
+                    if now - ts <= _EXISTENCE_TTL:
+                        found[name] = bool(exists_flag)
+        finally:
+            conn.close()
+        return found
+
+    def _set_cache_many(self, results: dict[str, bool], ecosystem: str) -> None:
+        """Write many existence results to package_cache in one transaction."""
+        if not results:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        conn = connect(self._db_path)
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO package_cache "
+                "(package_name, ecosystem, exists_flag, api_surface, version, cached_at) "
+                "VALUES (?, ?, ?, NULL, NULL, ?)",
+                [(name.lower(), ecosystem, int(exists), now) for name, exists in results.items()],
+            )
+            conn.commit()
+        finally:
+            conn.close()
@@ -2,36 +2,54 @@
 
 from __future__ import annotations
 
-import sqlite3
-from difflib import get_close_matches
 from pathlib import Path
 
-_SIMILARITY_CUTOFF = 0.75  # Minimum similarity score for slopsquatting detection
+from core import bloom_filter
+from storage.connection import connect
+from vibesrails.similarity_index import SimilarityIndex
+
+_MAX_SUGGESTIONS = 3
+
+
+def _bloom_path(ecosystem: str) -> Path:
+    return Path.home() / ".vibesrails" / "packages" / f"{ecosystem}.bloom"
 
 
 def check_bloom_filter(package_name: str, ecosystem: str) -> bool | None:
-    """Check bloom filter file. Returns None if file doesn't exist."""
-    bloom_dir = Path.home() / ".vibesrails" / "packages"
-    bloom_file = bloom_dir / f"{ecosystem}.bloom"
+    """Check bloom filter file. Returns None if file doesn't exist.
+
+    Binary filters (see core.bloom_filter) are probed through mmap; a
+    legacy plain-text name list is still accepted.
+    """
+    bloom_file = _bloom_path(ecosystem)
     if not bloom_file.is_file():
         return None
+    bloom = bloom_filter.load(bloom_file)
+    if bloom is not None:
+        return package_name in bloom
     try:
         data = bloom_file.read_text()
         packages = {p.strip().lower() for p in data.splitlines() if p.strip()}
         return package_name.lower() in packages
-    except OSError:
+    except (OSError, UnicodeDecodeError):
         return None
 
 
+def _max_edits(name: str) -> int:
+    """Edit budget for suggestions: 0 below 4 chars, 1 below 8, then 2."""
+    if len(name) >= 8:
+        return 2
+    return 1 if len(name) >= 4 else 0
+
+
 def find_similar(package_name: str, ecosystem: str, db_path: str) -> list[str]:
     """Find similar package names for slopsquatting detection."""
-    known = get_known_packages(ecosystem, db_path)
-    if not known:
+    index = _get_similarity_index(ecosystem, db_path)
+    if index is None:
         return []
-    matches = get_close_matches(
-        package_name.lower(), known, n=3, cutoff=_SIMILARITY_CUTOFF
-    )
-    return [m for m in matches if m != package_name.lower()]
+    query = package_name.lower()
+    matches = index.search(query, _max_edits(query), limit=_MAX_SUGGESTIONS + 1)
+    return [m for m, _ in matches if m != query][:_MAX_SUGGESTIONS]
 
 
 def check_in_project_deps(package_name: str, project_path: Path) -> bool:
@@ -66,20 +84,27 @@ def check_in_project_deps(package_name: str, project_path: Path) -> bool:
     return False
 
 
+def _known_names_file(ecosystem: str) -> Path | None:
+    """Name-per-line file listing the ecosystem's packages, if any."""
+    bloom_file = _bloom_path(ecosystem)
+    if not bloom_file.is_file():
+        return None
+    if bloom_filter.is_bloom_file(bloom_file):
+        # A binary filter cannot list its names: use the builder's sidecar
+        return bloom_filter.names_path(bloom_file)
+    return bloom_file
+
+
 def get_known_packages(ecosystem: str, db_path: str) -> list[str]:
     """Get known packages from bloom filter or cache."""
-    # Try bloom file
-    bloom_dir = Path.home() / ".vibesrails" / "packages"
-    bloom_file = bloom_dir / f"{ecosystem}.bloom"
-    if bloom_file.is_file():
-        try:
-            data = bloom_file.read_text()
-            return [p.strip().lower() for p in data.splitlines() if p.strip()]
-        except OSError:
-            pass
+    source = _known_names_file(ecosystem)
+    if source is not None:
+        names = _read_names(source)
+        if names is not None:
+            return names
 
     # Fallback: packages from cache
-    conn = sqlite3.connect(db_path, timeout=10)
+    conn = connect(db_path)
     try:
         cursor = conn.execute(
             "SELECT package_name FROM package_cache "
@@ -89,3 +114,48 @@ def get_known_packages(ecosystem: str, db_path: str) -> list[str]:
         return [row[0].lower() for row in cursor.fetchall()]
     finally:
         conn.close()
+
+
+_names_cache: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+
+def _read_names(path: Path) -> list[str] | None:
+    """Lowercased names from a name-per-line file, cached while it is unchanged."""
+    try:
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _names_cache.get(str(path))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = path.read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+    names = [p.strip().lower() for p in data.splitlines() if p.strip()]
+    _names_cache[str(path)] = (stamp, names)
+    return names
+
+
+_index_cache: dict[str, tuple[tuple[str, int, int], SimilarityIndex]] = {}
+
+
+def _get_similarity_index(ecosystem: str, db_path: str) -> SimilarityIndex | None:
+    """Similarity index over the known packages, reused while the list is unchanged."""
+    source = _known_names_file(ecosystem)
+    if source is not None:
+        try:
+            st = source.stat()
+        except OSError:
+            st = None
+        if st is not None:
+            key = (str(source), st.st_mtime_ns, st.st_size)
+            cached = _index_cache.get(ecosystem)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            names = _read_names(source)
+            if names:
+                index = SimilarityIndex(names)
+                _index_cache[ecosystem] = (key, index)
+                return index
+    # package_cache fallback: small, changes often, not cached
+    known = get_known_packages(ecosystem, db_path)
+    return SimilarityIndex(known) if known else None
@@ -2,17 +2,22 @@
 
 Provides get_engine() for lazy singleton access and record_safe()
 which wraps record_event in try/except to never crash calling tools.
+
+While a background writer is running (start_writer(), done by the MCP
+server lifespan), record_safe() only queues the event; see learning_writer.
 """
 
 from __future__ import annotations
 
 import logging
 
-from core.learning_engine import LearningEngine
+from core.learning_engine import LearningEngine, validate_event_type
+from core.learning_writer import LearningWriter
 
 logger = logging.getLogger(__name__)
 
 _engine: LearningEngine | None = None
+_writer: LearningWriter | None = None
 
 
 def get_engine(db_path: str | None = None) -> LearningEngine:
@@ -39,8 +44,13 @@ def record_safe(
 
     This is the main entry point for tools to feed the Learning Engine.
     It NEVER raises — if anything goes wrong, it logs and returns silently.
+    Events for the default database are queued when the writer is running.
     """
     try:
+        if _writer is not None and db_path is None:
+            validate_event_type(event_type)
+            _writer.submit(session_id or "anonymous", event_type, event_data)
+            return
         engine = get_engine(db_path=db_path)
         engine.record_event(
             session_id=session_id or "anonymous",
@@ -51,7 +61,27 @@ def record_safe(
         logger.debug("learning_bridge: record_safe failed", exc_info=True)
 
 
+def start_writer(**options) -> LearningWriter:
+    """Start queueing record_safe() events for the default database.
+
+    Options are passed to LearningWriter (flush_interval, max_batch, max_queue).
+    """
+    global _writer
+    if _writer is None:
+        _writer = LearningWriter(get_engine(), **options)
+    return _writer
+
+
+def stop_writer() -> None:
+    """Write all queued events and go back to synchronous recording."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+
 def _reset() -> None:
     """Reset the singleton (for testing only)."""
     global _engine
+    stop_writer()
     _engine = None
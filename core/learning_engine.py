@@ -5,6 +5,8 @@ drift, hallucinations, config issues, injections) into a developer profile
 with actionable insights.
 
 All aggregations use SQL for performance — no bulk Python loading.
+The profile is maintained incrementally: each event updates running
+aggregates in the same transaction as its insert (see learning_profile).
 """
 
 from __future__ import annotations
@@ -15,11 +17,15 @@ import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
-from storage.migrations import get_db_path, migrate
+from storage.connection import connect, ensure_schema
+from storage.migrations import get_db_path
 
 from .learning_profile import (
+    apply_event,
     avg_brief_for_sessions,
     calc_improvement_rate,
+    ensure_aggregates,
+    rebuild_aggregates,
     update_profile,
     upsert_metric,
 )
@@ -38,6 +44,15 @@ VALID_EVENT_TYPES = frozenset({
 })
 
 
+def validate_event_type(event_type: str) -> None:
+    """Raise ValueError if event_type is not a known learning event."""
+    if event_type not in VALID_EVENT_TYPES:
+        raise ValueError(
+            f"Invalid event_type '{event_type}'. "
+            f"Must be one of: {sorted(VALID_EVENT_TYPES)}"
+        )
+
+
 class LearningEngine:
     """Cross-session developer profiling engine."""
 
@@ -45,10 +60,15 @@ class LearningEngine:
         if db_path is None:
             db_path = get_db_path()
         self._db_path = str(db_path)
-        migrate(db_path)
+        ensure_schema(db_path)
+        conn = self._connect()
+        try:
+            ensure_aggregates(conn)
+        finally:
+            conn.close()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, timeout=10)
+        conn = connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -68,29 +88,85 @@ class LearningEngine:
                 hallucination, config_issue, injection.
             event_data: Event payload as dict (stored as JSON).
         """
-        if event_type not in VALID_EVENT_TYPES:
-            raise ValueError(
-                f"Invalid event_type '{event_type}'. "
-                f"Must be one of: {sorted(VALID_EVENT_TYPES)}"
-            )
+        self.record_events([(session_id, event_type, event_data)])
+
+    def record_events(self, events: list[tuple[str, str, dict]]) -> None:
+        """Record several events in one transaction and update the profile once.
+
+        Args:
+            events: (session_id, event_type, event_data) tuples.
+
+        Raises:
+            ValueError: If any event_type is invalid (nothing is recorded).
+            TypeError: If any event_data is not JSON-serializable (nothing is recorded).
+        """
+        self.record_encoded_events([
+            (session_id, event_type, json.dumps(event_data), datetime.now(timezone.utc).isoformat())
+            for session_id, event_type, event_data in events
+        ])
+
+    def record_encoded_events(self, events: list[tuple[str, str, str, str]]) -> None:
+        """Like record_events, for events already encoded as they are stored.
+
+        Args:
+            events: (session_id, event_type, event_data as JSON, created_at
+                as ISO 8601 UTC) tuples.
+
+        Raises:
+            ValueError: If any event_type is invalid (nothing is recorded).
+        """
+        for _, event_type, _, _ in events:
+            validate_event_type(event_type)
+        if not events:
+            return
 
         conn = self._connect()
         try:
-            now = datetime.now(timezone.utc).isoformat()
-            conn.execute(
-                "INSERT INTO learning_events (session_id, event_type, event_data, created_at) "
-                "VALUES (?, ?, ?, ?)",
-                (session_id, event_type, json.dumps(event_data), now),
-            )
-            conn.commit()
+            # Inserts, aggregates and profile commit together (update_profile)
+            for session_id, event_type, data, created_at in events:
+                conn.execute(
+                    "INSERT INTO learning_events "
+                    "(session_id, event_type, event_data, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (session_id, event_type, data, created_at),
+                )
+                apply_event(conn, session_id, event_type, data, created_at)
             self._update_profile(conn)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # ── rebuild_profile ──────────────────────────────────────────────
+
+    def rebuild_profile(self) -> dict:
+        """Recompute aggregates and profile from the full learning_events history.
+
+        Use after importing or editing events outside record_event.
+
+        Returns:
+            The rebuilt profile (same shape as get_profile).
+        """
+        conn = self._connect()
+        try:
+            rebuild_aggregates(conn)
+            conn.execute("DELETE FROM developer_profile")
+            has_events = conn.execute(
+                "SELECT 1 FROM learning_events LIMIT 1"
+            ).fetchone() is not None
+            if has_events:
+                self._update_profile(conn)
+            else:
+                conn.commit()
         finally:
             conn.close()
+        return self.get_profile()
 
     # ── _update_profile ──────────────────────────────────────────────
 
     def _update_profile(self, conn: sqlite3.Connection) -> None:
-        """Recalculate aggregated metrics from learning_events."""
+        """Write profile metrics from the running aggregates."""
         update_profile(conn)
 
     def _calc_improvement_rate(self, conn: sqlite3.Connection) -> float | None:
@@ -1,4 +1,17 @@
-"""Profile update logic for LearningEngine — extracted from learning_engine.py."""
+"""Profile update logic for LearningEngine — extracted from learning_engine.py.
+
+developer_profile is derived from running aggregates instead of scanning
+learning_events on every record:
+
+- learning_counters: sessions, hallucinations, brief_sum, brief_count
+- learning_session_stats: per-session brief sum/count and first brief time
+- learning_tallies: event counts per violation guard / drift metric
+
+apply_event() updates them in the same transaction as the event insert,
+so recording an event costs a handful of primary-key upserts whatever the
+history size. rebuild_aggregates() recomputes them from learning_events
+(backfill for databases created before the aggregates existed).
+"""
 
 from __future__ import annotations
 
@@ -6,40 +19,166 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 
+# meta key set once the aggregates reflect every learning_event
+AGGREGATES_META_KEY = "learning_aggregates"
+
+# event_type -> (tally kind, JSON path of the tallied key)
+_TALLIED_EVENTS = {
+    "violation": ("violation", "$.guard_name"),
+    "drift": ("drift", "$.highest_metric"),
+}
+
+
+def _bump_counter(conn: sqlite3.Connection, name: str, delta: float) -> None:
+    conn.execute(
+        "INSERT INTO learning_counters (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+        (name, delta),
+    )
+
+
+def apply_event(
+    conn: sqlite3.Connection,
+    session_id: str,
+    event_type: str,
+    event_data: str,
+    created_at: str,
+) -> None:
+    """Fold one learning event (event_data as stored JSON) into the aggregates.
+
+    Fields are extracted with json_extract/CAST, like the rebuild queries,
+    so incremental and rebuilt aggregates always agree. Does not commit.
+    """
+    new_session = conn.execute(
+        "INSERT OR IGNORE INTO learning_session_stats (session_id) VALUES (?)",
+        (session_id,),
+    ).rowcount == 1
+    if new_session:
+        _bump_counter(conn, "sessions", 1)
+
+    if event_type == "brief_score":
+        score = conn.execute(
+            "SELECT CAST(json_extract(?, '$.score') AS REAL)", (event_data,),
+        ).fetchone()[0]
+        conn.execute(
+            "UPDATE learning_session_stats SET "
+            "first_brief_at = MIN(COALESCE(first_brief_at, ?), ?), "
+            "brief_sum = brief_sum + ?, brief_count = brief_count + ? "
+            "WHERE session_id = ?",
+            (created_at, created_at, score or 0.0, int(score is not None), session_id),
+        )
+        if score is not None:
+            _bump_counter(conn, "brief_sum", score)
+            _bump_counter(conn, "brief_count", 1)
+    elif event_type == "hallucination":
+        _bump_counter(conn, "hallucinations", 1)
+    elif event_type in _TALLIED_EVENTS:
+        kind, path = _TALLIED_EVENTS[event_type]
+        key = conn.execute("SELECT json_extract(?, ?)", (event_data, path)).fetchone()[0]
+        if key is not None:
+            conn.execute(
+                "INSERT INTO learning_tallies (kind, key, count) VALUES (?, ?, 1) "
+                "ON CONFLICT(kind, key) DO UPDATE SET count = count + 1",
+                (kind, key),
+            )
+
+
+def rebuild_aggregates(conn: sqlite3.Connection) -> None:
+    """Recompute all running aggregates from learning_events and commit."""
+    conn.execute("DELETE FROM learning_counters")
+    conn.execute("DELETE FROM learning_session_stats")
+    conn.execute("DELETE FROM learning_tallies")
+
+    conn.execute(
+        "INSERT INTO learning_session_stats "
+        "(session_id, first_brief_at, brief_sum, brief_count) "
+        "SELECT session_id, "
+        "MIN(CASE WHEN event_type = 'brief_score' THEN created_at END), "
+        "COALESCE(SUM(CASE WHEN event_type = 'brief_score' "
+        "THEN CAST(json_extract(event_data, '$.score') AS REAL) END), 0.0), "
+        "COUNT(CASE WHEN event_type = 'brief_score' "
+        "THEN json_extract(event_data, '$.score') END) "
+        "FROM learning_events GROUP BY session_id"
+    )
+    conn.execute(
+        "INSERT INTO learning_counters (name, value) "
+        "SELECT 'sessions', COUNT(*) FROM learning_session_stats"
+    )
+    conn.execute(
+        "INSERT INTO learning_counters (name, value) "
+        "SELECT 'hallucinations', COUNT(*) FROM learning_events "
+        "WHERE event_type = 'hallucination'"
+    )
+    conn.execute(
+        "INSERT INTO learning_counters (name, value) "
+        "SELECT 'brief_sum', COALESCE(SUM(brief_sum), 0.0) FROM learning_session_stats"
+    )
+    conn.execute(
+        "INSERT INTO learning_counters (name, value) "
+        "SELECT 'brief_count', COALESCE(SUM(brief_count), 0) FROM learning_session_stats"
+    )
+    for event_type, (kind, path) in _TALLIED_EVENTS.items():
+        conn.execute(
+            "INSERT INTO learning_tallies (kind, key, count) "
+            "SELECT ?, json_extract(event_data, ?) AS k, COUNT(*) "
+            "FROM learning_events WHERE event_type = ? AND k IS NOT NULL "
+            "GROUP BY k",
+            (kind, path, event_type),
+        )
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        (AGGREGATES_META_KEY, datetime.now(timezone.utc).isoformat()),
+    )
+    conn.commit()
+
+
+def ensure_aggregates(conn: sqlite3.Connection) -> None:
+    """Backfill the aggregates once if they were never built for this DB."""
+    row = conn.execute(
+        "SELECT 1 FROM meta WHERE key = ?", (AGGREGATES_META_KEY,),
+    ).fetchone()
+    if row is None:
+        rebuild_aggregates(conn)
+
+
+def _counters(conn: sqlite3.Connection) -> dict[str, float]:
+    rows = conn.execute("SELECT name, value FROM learning_counters").fetchall()
+    return {r["name"]: r["value"] for r in rows}
+
+
+def _top_tallies(conn: sqlite3.Connection, kind: str, limit: int) -> list[sqlite3.Row]:
+    return conn.execute(
+        "SELECT key, count FROM learning_tallies WHERE kind = ? "
+        "ORDER BY count DESC, key LIMIT ?",
+        (kind, limit),
+    ).fetchall()
+
 
 def update_profile(conn: sqlite3.Connection) -> None:
-    """Recalculate aggregated metrics from learning_events."""
+    """Write the developer_profile metrics from the running aggregates."""
     now = datetime.now(timezone.utc).isoformat()
+    counters = _counters(conn)
 
     # sessions_count
-    row = conn.execute(
-        "SELECT COUNT(DISTINCT session_id) AS cnt FROM learning_events"
-    ).fetchone()
-    sessions_count = row["cnt"] if row else 0
+    sessions_count = counters.get("sessions", 0)
     upsert_metric(conn, "sessions_count", sessions_count, now)
 
     # avg_brief_score
-    row = conn.execute(
-        "SELECT AVG(CAST(json_extract(event_data, '$.score') AS REAL)) AS avg_score "
-        "FROM learning_events WHERE event_type = 'brief_score'"
-    ).fetchone()
-    avg_brief = round(row["avg_score"], 1) if row and row["avg_score"] is not None else None
+    brief_count = counters.get("brief_count", 0)
+    avg_brief = (
+        round(counters.get("brief_sum", 0.0) / brief_count, 1) if brief_count else None
+    )
     upsert_metric(conn, "avg_brief_score", avg_brief, now)
 
     # top_violations — top 5 violation types by frequency
-    rows = conn.execute(
-        "SELECT json_extract(event_data, '$.guard_name') AS guard, COUNT(*) AS cnt "
-        "FROM learning_events WHERE event_type = 'violation' "
-        "AND json_extract(event_data, '$.guard_name') IS NOT NULL "
-        "GROUP BY guard ORDER BY cnt DESC LIMIT 5"
-    ).fetchall()
-    top_violations = [{"guard": r["guard"], "count": r["cnt"]} for r in rows]
+    top_violations = [
+        {"guard": r["key"], "count": r["count"]}
+        for r in _top_tallies(conn, "violation", 5)
+    ]
     upsert_metric(conn, "top_violations", top_violations, now)
 
     # hallucination_rate
-    halluc_count = conn.execute(
-        "SELECT COUNT(*) AS cnt FROM learning_events WHERE event_type = 'hallucination'"
-    ).fetchone()["cnt"]
+    halluc_count = counters.get("hallucinations", 0)
     if sessions_count > 0:
         halluc_rate = round(halluc_count / sessions_count, 3)
     else:
@@ -51,13 +190,10 @@ def update_profile(conn: sqlite3.Connection) -> None:
     upsert_metric(conn, "improvement_rate", improvement, now)
 
     # common_drift_areas — top 3 drift metrics
-    drift_rows = conn.execute(
-        "SELECT json_extract(event_data, '$.highest_metric') AS metric, COUNT(*) AS cnt "
-        "FROM learning_events WHERE event_type = 'drift' "
-        "AND json_extract(event_data, '$.highest_metric') IS NOT NULL "
-        "GROUP BY metric ORDER BY cnt DESC LIMIT 3"
-    ).fetchall()
-    common_drift = [{"metric": r["metric"], "count": r["cnt"]} for r in drift_rows]
+    common_drift = [
+        {"metric": r["key"], "count": r["count"]}
+        for r in _top_tallies(conn, "drift", 3)
+    ]
     upsert_metric(conn, "common_drift_areas", common_drift, now)
 
     conn.commit()
@@ -70,9 +206,9 @@ def calc_improvement_rate(conn: sqlite3.Connection) -> float | None:
     not enough data.
     """
     sessions = conn.execute(
-        "SELECT session_id, MIN(created_at) AS first_event "
-        "FROM learning_events WHERE event_type = 'brief_score' "
-        "GROUP BY session_id ORDER BY first_event DESC"
+        "SELECT session_id FROM learning_session_stats "
+        "WHERE first_brief_at IS NOT NULL "
+        "ORDER BY first_brief_at DESC LIMIT 10"
     ).fetchall()
 
     if len(sessions) < 2:
@@ -102,12 +238,13 @@ def avg_brief_for_sessions(
     """Calculate average brief_score for a set of sessions."""
     placeholders = ",".join("?" for _ in session_ids)
     row = conn.execute(
-        f"SELECT AVG(CAST(json_extract(event_data, '$.score') AS REAL)) AS avg_score "
-        f"FROM learning_events WHERE event_type = 'brief_score' "
-        f"AND session_id IN ({placeholders})",
+        f"SELECT SUM(brief_sum) AS total, SUM(brief_count) AS cnt "
+        f"FROM learning_session_stats WHERE session_id IN ({placeholders})",
         session_ids,
     ).fetchone()
-    return row["avg_score"] if row and row["avg_score"] is not None else None
+    if not row or not row["cnt"]:
+        return None
+    return row["total"] / row["cnt"]
 
 
 def upsert_metric(
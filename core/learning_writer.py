@@ -0,0 +1,142 @@
+"""Background writer for learning events — keeps SQLite off the tool path.
+
+Tools call learning_bridge.record_safe() while serving an MCP request.
+Writing synchronously means a connection, an insert, a profile update and
+an fsync on every call. While the MCP server runs, events go into a
+bounded in-process queue instead. A daemon thread drains it and writes
+batches with LearningEngine.record_encoded_events (one transaction per
+batch):
+
+- submit() timestamps and JSON-encodes each event right away, so the
+  stored created_at is when the event happened, and an invalid event is
+  rejected on its own instead of failing the batch it would land in
+
+- a batch is written after flush_interval seconds or max_batch events,
+  whichever comes first
+- the queue holds at most max_queue events; when it is full new events
+  are dropped and counted (a tool call never waits on the database)
+- close() writes everything still queued before returning
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from core.learning_engine import LearningEngine, validate_event_type
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 0.2  # seconds
+MAX_BATCH = 100
+MAX_QUEUE = 10_000
+
+_STOP = object()
+
+# (session_id, event_type, event_data as JSON, created_at)
+_Event = tuple[str, str, str, str]
+
+
+class LearningWriter:
+    """Queue learning events and write them in batches from a thread."""
+
+    def __init__(
+        self,
+        engine: LearningEngine,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_batch: int = MAX_BATCH,
+        max_queue: int = MAX_QUEUE,
+    ) -> None:
+        self._engine = engine
+        self._flush_interval = flush_interval
+        self._max_batch = max(1, max_batch)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="vibesrails-learning-writer", daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, session_id: str, event_type: str, event_data: dict) -> bool:
+        """Queue one event. Returns False if it was rejected (invalid) or dropped (queue full)."""
+        created_at = datetime.now(timezone.utc).isoformat()
+        try:
+            validate_event_type(event_type)
+            data = json.dumps(event_data)
+        except (TypeError, ValueError):
+            logger.debug("learning_writer: invalid %s event rejected", event_type, exc_info=True)
+            return False
+        try:
+            self._queue.put_nowait((session_id, event_type, data, created_at))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            logger.debug("learning_writer: queue full, %d event(s) dropped", dropped)
+            return False
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Write all queued events, then stop the thread."""
+        if not self._thread.is_alive():
+            return
+        # Blocking put: the sentinel must get in even if the queue is full
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("learning_writer: events still pending after %ss", timeout)
+
+    def _next_batch(self) -> tuple[list[_Event], bool]:
+        """Wait for the first event, then collect until the deadline or max_batch."""
+        batch: list[_Event] = []
+        item = self._queue.get()
+        if item is _STOP:
+            return batch, True
+        batch.append(item)
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if stop:
+                batch.extend(self._drain())
+            if batch:
+                self._write(batch)
+
+    def _drain(self) -> list[_Event]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not _STOP:
+                items.append(item)
+
+    def _write(self, batch: list[_Event]) -> None:
+        for start in range(0, len(batch), self._max_batch):
+            chunk = batch[start:start + self._max_batch]
+            try:
+                self._engine.record_encoded_events(chunk)
+            except Exception:
+                logger.debug(
+                    "learning_writer: batch of %d event(s) failed", len(chunk), exc_info=True,
+                )
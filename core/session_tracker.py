@@ -16,7 +16,8 @@ import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
-from storage.migrations import get_db_path, migrate
+from storage.connection import connect, ensure_schema
+from storage.migrations import get_db_path
 
 logger = logging.getLogger(__name__)
 
@@ -83,10 +84,10 @@ class SessionTracker:
             db_path = get_db_path()
         self._db_path = Path(db_path)
         # Ensure schema is ready
-        migrate(self._db_path)
+        ensure_schema(self._db_path)
 
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(str(self._db_path), timeout=10)
+        return connect(self._db_path)
 
     def start_session(
         self, project_path: str, ai_tool: str | None = None
@@ -10,9 +10,10 @@ from contextlib import asynccontextmanager
 
 from mcp.server.fastmcp import FastMCP
 
+from core.learning_bridge import start_writer, stop_writer
 from core.logger import log_rate_limit, log_server_start
 from core.rate_limiter import RateLimiter
-from storage.migrations import migrate
+from storage.connection import ensure_schema
 
 # ---------------------------------------------------------------------------
 # Server lifecycle
@@ -42,11 +43,15 @@ def _check_rate_limit(tool_name: str) -> dict | None:
 
 @asynccontextmanager
 async def lifespan(server: FastMCP):
-    """Run database migrations at startup."""
-    migrate()
+    """Run database migrations at startup, flush learning events at shutdown."""
+    ensure_schema()
     tools = await mcp.list_tools()
     log_server_start(VERSION, tools_count=len(tools))
-    yield
+    start_writer()
+    try:
+        yield
+    finally:
+        stop_writer()
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +96,8 @@ def main():
         print("Usage: vibesrails-mcp          Start MCP server (stdio transport)")
         print("       vibesrails-mcp --help    Show this help")
         print("       vibesrails-mcp --version Show version")
+        print("       vibesrails-mcp --build-bloom NAMES [ECOSYSTEM]")
+        print("                                Build the offline package filter")
         print()
         print(f"Available tools ({len(TOOLS)}):")
         for tool in TOOLS:
@@ -101,6 +108,11 @@ def main():
         print(f"vibesrails-mcp {VERSION}")
         sys.exit(0)
 
+    if len(sys.argv) > 1 and sys.argv[1] == "--build-bloom":
+        from core.bloom_filter import main as build_bloom
+
+        sys.exit(build_bloom(sys.argv[2:]))
+
     mcp.run(transport="stdio")
 
 
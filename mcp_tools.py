@@ -182,6 +182,7 @@ def deep_hallucination(
     file_path: str,
     max_level: int = 2,
     ecosystem: str = "pypi",
+    project_path: str | None = None,
 ) -> dict:
     """Multi-level verification of AI-generated imports (hallucination detection).
 
@@ -195,13 +196,19 @@ def deep_hallucination(
         file_path: Path to the Python file to analyze.
         max_level: Maximum verification level (1-4, default 2).
         ecosystem: Package ecosystem ("pypi").
+        project_path: Path to a project directory to check all its Python
+            files in one report (overrides file_path).
     """
     if limited := _check_rate_limit("deep_hallucination"):
         return limited
-    args = {"file_path": file_path, "max_level": max_level, "ecosystem": ecosystem}
+    args = {
+        "file_path": file_path, "project_path": project_path,
+        "max_level": max_level, "ecosystem": ecosystem,
+    }
     with tool_timer() as t:
         result = _deep_hallucination_impl(
             file_path=file_path, max_level=max_level, ecosystem=ecosystem,
+            project_path=project_path,
         )
     log_tool_call("deep_hallucination", args, result.get("status", "unknown"), t.ms)
     return result
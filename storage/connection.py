@@ -0,0 +1,144 @@
+"""Shared SQLite connections for the core trackers.
+
+The MCP server is long-lived, but every tracker used to call migrate() in
+__init__ and open a fresh sqlite3 connection for each operation. This
+module keeps one connection per thread and database file instead:
+
+- connect() returns the thread's cached connection. Its close() only
+  releases it: an uncommitted transaction is rolled back (like a real
+  close) and the connection stays open for the next caller. Call sites
+  keep the usual connect / try / finally close pattern.
+- Statements are prepared once per connection and reused by the sqlite3
+  statement cache.
+- PRAGMAs (busy_timeout, synchronous=NORMAL, cache_size, mmap_size) are
+  applied once, when the connection is opened.
+- ensure_schema() runs migrate() once per process and database file.
+
+A connection is reopened if the database file was replaced or deleted,
+or after a fork. If the cached connection is already in use on this
+thread (nested calls), the caller gets a private connection that closes
+for real.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from storage.migrations import get_db_path, migrate
+
+MAX_CONNECTIONS_PER_THREAD = 8
+STATEMENT_CACHE_SIZE = 256
+
+_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    # Safe with WAL: a power loss can only lose the last commits
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8192",  # KiB
+    "PRAGMA mmap_size=67108864",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_local = threading.local()
+_migrated: set[tuple[str, tuple[int, int] | None]] = set()
+_migrate_lock = threading.Lock()
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() hands it back to the pool."""
+
+    pooled = False
+    in_use = False
+
+    def close(self) -> None:
+        if not self.pooled:
+            super().close()
+            return
+        if self.in_transaction:
+            self.rollback()
+        self.row_factory = None
+        self.in_use = False
+
+    def discard(self) -> None:
+        """Close for real (eviction, stale file)."""
+        self.pooled = False
+        super().close()
+
+
+def _file_id(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _open(path: str, timeout: float) -> PooledConnection:
+    conn = sqlite3.connect(
+        path, timeout=timeout, factory=PooledConnection,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _pool() -> OrderedDict:
+    pool = getattr(_local, "pool", None)
+    if pool is None or getattr(_local, "pid", None) != os.getpid():
+        pool = _local.pool = OrderedDict()
+        _local.pid = os.getpid()
+    return pool
+
+
+def connect(db_path: str | Path, timeout: float = 10) -> sqlite3.Connection:
+    """Return this thread's connection to db_path (close() releases it)."""
+    path = os.path.abspath(db_path)
+    pool = _pool()
+    entry = pool.get(path)
+    if entry is not None:
+        conn, file_id = entry
+        if conn.in_use:
+            return _open(path, timeout)  # nested use: private connection
+        if file_id is not None and file_id == _file_id(path):
+            pool.move_to_end(path)
+            conn.in_use = True
+            return conn
+        del pool[path]
+        conn.discard()
+
+    conn = _open(path, timeout)
+    conn.pooled = True
+    conn.in_use = True
+    pool[path] = (conn, _file_id(path))
+    while len(pool) > MAX_CONNECTIONS_PER_THREAD:
+        _, (old, _) = pool.popitem(last=False)
+        if old.in_use:
+            old.pooled = False  # closes for real when its user is done
+        else:
+            old.discard()
+    return conn
+
+
+def ensure_schema(db_path: str | Path | None = None) -> None:
+    """Run migrate() for db_path unless this process already did."""
+    path = os.path.abspath(db_path if db_path is not None else get_db_path())
+    key = (path, _file_id(path))
+    if key in _migrated:
+        return
+    with _migrate_lock:
+        if key in _migrated:
+            return
+        migrate(path)
+        _migrated.add((path, _file_id(path)))
+
+
+def close_all() -> None:
+    """Close this thread's cached connections (tests, shutdown)."""
+    pool = _pool()
+    while pool:
+        _, (conn, _) = pool.popitem()
+        conn.discard()
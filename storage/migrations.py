@@ -10,7 +10,7 @@ import os
 import sqlite3
 from pathlib import Path
 
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 4
 
 MIGRATIONS: dict[int, list[str]] = {
     1: [
@@ -85,6 +85,29 @@ MIGRATIONS: dict[int, list[str]] = {
             updated_at TEXT DEFAULT CURRENT_TIMESTAMP
         )""",
     ],
+    4: [
+        # Running aggregates behind developer_profile, kept up to date by
+        # LearningEngine.record_event (see core/learning_profile.py).
+        # No type affinity on value/key: counts stay integers, sums stay reals.
+        """CREATE TABLE IF NOT EXISTS learning_counters (
+            name TEXT PRIMARY KEY,
+            value NOT NULL DEFAULT 0
+        )""",
+        """CREATE TABLE IF NOT EXISTS learning_session_stats (
+            session_id TEXT PRIMARY KEY,
+            first_brief_at TEXT,
+            brief_sum REAL NOT NULL DEFAULT 0,
+            brief_count INTEGER NOT NULL DEFAULT 0
+        )""",
+        """CREATE INDEX IF NOT EXISTS idx_learning_session_stats_brief
+            ON learning_session_stats (first_brief_at)""",
+        """CREATE TABLE IF NOT EXISTS learning_tallies (
+            kind TEXT NOT NULL,
+            key NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (kind, key)
+        )""",
+    ],
 }
 
 _META_SEED = "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)"
@@ -0,0 +1,83 @@
+"""Tests for the merged config snapshot (.vibesrails/config.cache)."""
+
+import os
+from unittest import mock
+
+import pytest
+
+from vibesrails import config as config_module
+from vibesrails.config import load_config_with_extends
+from vibesrails.config_cache import ConfigSnapshot
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "base.yaml").write_text("blocking:\n  - id: base\n    regex: 'x'\n")
+    (tmp_path / "vibesrails.yaml").write_text(
+        "extends: ./base.yaml\nguardian:\n  max_file_lines: 120\n"
+    )
+    return tmp_path
+
+
+def _load(path):
+    """Load a config and count how many YAML files were parsed."""
+    with mock.patch.object(
+        config_module, "_safe_yaml_load", wraps=config_module._safe_yaml_load,
+    ) as spy:
+        config = load_config_with_extends(path)
+    return config, spy.call_count
+
+
+def test_second_load_skips_yaml(project):
+    first, parsed = _load(project / "vibesrails.yaml")
+    assert parsed == 2
+    second, parsed = _load(project / "vibesrails.yaml")
+    assert parsed == 0
+    assert second == first
+    assert [p["id"] for p in second["blocking"]] == ["base"]
+    assert (project / ".vibesrails" / "config.cache").exists()
+
+
+def test_extended_file_change_invalidates(project):
+    _load(project / "vibesrails.yaml")
+    (project / "base.yaml").write_text("blocking:\n  - id: changed\n    regex: 'y'\n")
+    config, parsed = _load(project / "vibesrails.yaml")
+    assert parsed == 2
+    assert config["blocking"][0]["id"] == "changed"
+
+
+def test_touch_without_change_keeps_snapshot(project):
+    _load(project / "vibesrails.yaml")
+    st = (project / "base.yaml").stat()
+    os.utime(project / "base.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    _, parsed = _load(project / "vibesrails.yaml")
+    assert parsed == 0
+
+
+def test_creating_missing_extended_file_invalidates(project):
+    (project / "vibesrails.yaml").write_text("extends: ./later.yaml\n")
+    _load(project / "vibesrails.yaml")
+    (project / "later.yaml").write_text("warning:\n  - id: later\n    regex: 'z'\n")
+    config, parsed = _load(project / "vibesrails.yaml")
+    assert parsed == 2
+    assert config["warning"][0]["id"] == "later"
+
+
+def test_remote_extends_is_not_snapshotted(project):
+    snapshot = ConfigSnapshot(project / "vibesrails.yaml")
+    snapshot.store({"blocking": []}, [str(project / "vibesrails.yaml"), "https://github.com/x.yaml"])
+    assert not snapshot.cache_file.exists()
+
+
+def test_corrupt_snapshot_is_ignored(project):
+    _load(project / "vibesrails.yaml")
+    (project / ".vibesrails" / "config.cache").write_bytes(b"\x00garbage")
+    config, parsed = _load(project / "vibesrails.yaml")
+    assert parsed == 2
+    assert config["guardian"]["max_file_lines"] == 120
+
+
+def test_use_cache_false_writes_nothing(project):
+    load_config_with_extends(project / "vibesrails.yaml", use_cache=False)
+    assert not (project / ".vibesrails").exists()
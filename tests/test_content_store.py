@@ -0,0 +1,71 @@
+"""Tests for the run-scoped content store (vibesrails/content_store.py)."""
+
+from pathlib import Path
+
+from vibesrails.content_store import ContentStore, content_run, read_module
+from vibesrails.guards_v2.complexity import ComplexityGuard
+from vibesrails.guards_v2.docstring import DocstringGuard
+
+
+def test_read_module_outside_run_reads_fresh(tmp_path):
+    f = tmp_path / "a.py"
+    f.write_text("x = 1\n")
+    first = read_module(f)
+    assert first.source == "x = 1\n"
+    assert read_module(f) is not first
+
+
+def test_module_shared_within_run(tmp_path):
+    f = tmp_path / "a.py"
+    f.write_text("x = 1\r\ny = 2\n")
+    with content_run() as store:
+        module = read_module(f)
+        assert read_module(str(f)) is module
+        assert module.lines == ["x = 1", "y = 2"]  # universal newlines, like read_text
+        with content_run() as inner:
+            assert inner is store
+    assert (store.reads, store.hits) == (1, 1)
+    assert read_module(f) is not module
+
+
+def test_undecodable_file(tmp_path):
+    f = tmp_path / "latin.py"
+    f.write_bytes(b"s = '\xe9t\xe9'\n")
+    with content_run():
+        assert read_module(f) is None
+        assert read_module(f, errors="ignore").source == "s = 't'\n"
+    assert read_module(tmp_path / "missing.py") is None
+
+
+def test_lru_eviction_bounded_by_source_size(tmp_path):
+    store = ContentStore(max_bytes=25)
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.py"
+        path.write_text("v = 1234567890\n")  # 15 bytes
+        paths.append(path)
+    a = store.module(paths[0])
+    store.module(paths[1])
+    assert len(store) == 1 and store.size == 15
+    store.module(paths[2])
+    assert store.module(paths[0]) is not a
+    assert store.reads == 4
+
+
+def test_guards_read_each_file_once(tmp_path, monkeypatch):
+    for i in range(3):
+        (tmp_path / f"m{i}.py").write_text(f'"""Module {i}."""\n\n\ndef f{i}():\n    return {i}\n')
+    reads: list[str] = []
+    real = Path.read_bytes
+
+    def counting(self):
+        reads.append(self.name)
+        return real(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting)
+    with content_run():
+        expected = ComplexityGuard().scan(tmp_path) + DocstringGuard().scan(tmp_path)
+    assert sorted(reads) == ["m0.py", "m1.py", "m2.py"]
+    reads.clear()
+    assert ComplexityGuard().scan(tmp_path) + DocstringGuard().scan(tmp_path) == expected
+    assert len(reads) == 6
@@ -0,0 +1,106 @@
+"""Tests for the persisted session context cache."""
+
+import os
+import subprocess
+from unittest import mock
+
+import pytest
+import yaml
+
+from vibesrails.context import get_session_context
+from vibesrails.context.cache import SessionContextCache, context_cache_key
+from vibesrails.context.mode import ContextScore, SessionMode
+from vibesrails.context.phase import PhaseResult, PhaseSignals, ProjectPhase
+
+
+@pytest.fixture
+def detectors():
+    """Patch the expensive detectors and count their calls."""
+    with mock.patch("vibesrails.context.ContextDetector") as det, \
+         mock.patch("vibesrails.context.ContextScorer") as scorer, \
+         mock.patch("vibesrails.context.PhaseDetector") as phase:
+        det.return_value.read_forced_mode.return_value = None
+        scorer.return_value.score.return_value = ContextScore(
+            score=0.85, mode=SessionMode.RND, confidence=0.9, signal_scores={}
+        )
+        phase.return_value.detect.return_value = PhaseResult(
+            phase=ProjectPhase.FLESH_OUT, signals=PhaseSignals(),
+            missing_for_next=["has_ci"],
+        )
+        yield det, phase
+
+
+def _git(root, *args):
+    subprocess.run(["git", *args], cwd=root, capture_output=True, check=True)
+
+
+def test_second_call_reads_cache(tmp_path, detectors):
+    det, phase = detectors
+    first = get_session_context(tmp_path)
+    second = get_session_context(tmp_path, {"complexity": {"max_file_lines": 100}})
+
+    assert det.return_value.detect.call_count == 1
+    assert phase.return_value.detect.call_count == 1
+    assert second.mode == first.mode == SessionMode.RND
+    assert second.mode_score == 0.85
+    assert second.phase_name == "FLESH OUT"
+    assert second.phase_missing == ["has_ci"]
+    # adapted_config is rebuilt per call from the caller's base config
+    assert "complexity" in second.adapted_config
+
+
+def test_forced_mode_is_never_cached(tmp_path, detectors):
+    det, _ = detectors
+    get_session_context(tmp_path)
+    det.return_value.read_forced_mode.return_value = "bugfix"
+    ctx = get_session_context(tmp_path)
+    assert ctx.mode == SessionMode.BUGFIX
+    assert ctx.mode_forced is True
+
+
+def test_methodology_change_invalidates(tmp_path, detectors):
+    _, phase = detectors
+    get_session_context(tmp_path)
+    vr = tmp_path / ".vibesrails"
+    (vr / "methodology.yaml").write_text(yaml.dump({"methodology": {"current_phase": 3}}))
+    get_session_context(tmp_path)
+    assert phase.return_value.detect.call_count == 2
+
+
+def test_new_test_file_invalidates(tmp_path):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    before = context_cache_key(tmp_path)
+    (tests / "test_new.py").write_text("def test_x(): pass\n")
+    os.utime(tests / "test_new.py", ns=(before["tests_mtime"] + 10**9,) * 2)
+    assert context_cache_key(tmp_path)["tests_mtime"] > before["tests_mtime"]
+
+
+def test_commit_changes_head_key(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "t@example.com")
+    _git(tmp_path, "config", "user.name", "t")
+    (tmp_path / "a.txt").write_text("a")
+    _git(tmp_path, "add", "a.txt")
+    _git(tmp_path, "commit", "-q", "-m", "one")
+    key = context_cache_key(tmp_path)
+    sha = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=tmp_path, capture_output=True, text=True,
+    ).stdout.strip()
+    assert key["head"].endswith("@" + sha)
+
+    (tmp_path / "b.txt").write_text("b")
+    _git(tmp_path, "add", "b.txt")
+    _git(tmp_path, "commit", "-q", "-m", "two")
+    assert context_cache_key(tmp_path)["head"] != key["head"]
+
+
+def test_expired_entry_is_ignored(tmp_path):
+    SessionContextCache(tmp_path).store({"phase": 1})
+    assert SessionContextCache(tmp_path).load() == {"phase": 1}
+    assert SessionContextCache(tmp_path, ttl=-1).load() is None
+
+
+def test_use_cache_false_writes_nothing(tmp_path, detectors):
+    get_session_context(tmp_path, use_cache=False)
+    assert not (tmp_path / ".vibesrails" / "cache").exists()
@@ -7,6 +7,7 @@ from vibesrails.context.detector import (
     _classify_branch,
     _parse_diff_stat,
 )
+from vibesrails.git_snapshot import parse_status_v2
 
 # ============================================
 # _classify_branch
@@ -97,27 +98,40 @@ def test_parse_diff_stat_single_line():
 # ============================================
 
 
+def _snapshot(status, diff_stat=None):
+    snap = mock.Mock(status=status)
+    snap.diff.return_value = diff_stat
+    return snap
+
+
 def test_detect_all_signals(tmp_path):
     """All signals collected when git returns data."""
-    with mock.patch("vibesrails.context.detector.run_git") as mock_git:
-        mock_git.side_effect = [
-            (True, "feat/new-widget"),      # branch
-            (True, "M foo.py\n?? bar.py"),  # status
-            (True, " src/a.py | 5 +++++\n 1 file changed, 5 insertions(+)\n"),  # diff
-            (True, "abc1234 commit1\ndef5678 commit2"),  # log
-        ]
+    status = parse_status_v2(
+        "# branch.oid abc\0# branch.head feat/new-widget\0"
+        "1 .M N... 100644 100644 100644 h1 h2 foo.py\0? bar.py\0"
+    )
+    diff_stat = " src/a.py | 5 +++++\n 1 file changed, 5 insertions(+)\n"
+    with mock.patch(
+        "vibesrails.context.detector.git_snapshot", return_value=_snapshot(status, diff_stat),
+    ), mock.patch(
+        "vibesrails.context.detector.run_git",
+        return_value=(True, "abc1234 commit1\ndef5678 commit2"),
+    ):
         detector = ContextDetector(tmp_path)
         signals = detector.detect()
 
     assert signals.branch_name == "feat/new-widget"
     assert signals.branch_type == "feature"
     assert signals.uncommitted_count == 2
+    assert signals.diff_spread == 1
     assert signals.commit_frequency == 2
 
 
 def test_detect_no_git(tmp_path):
     """All signals None when git fails."""
-    with mock.patch("vibesrails.context.detector.run_git", return_value=(False, "")):
+    with mock.patch(
+        "vibesrails.context.detector.git_snapshot", return_value=_snapshot(None),
+    ), mock.patch("vibesrails.context.detector.run_git", return_value=(False, "")):
         detector = ContextDetector(tmp_path)
         signals = detector.detect()
 
@@ -131,13 +145,10 @@ def test_detect_no_git(tmp_path):
 
 def test_detect_new_repo_no_commits(tmp_path):
     """New repo with no commits: branch ok, diff fails, log empty."""
-    with mock.patch("vibesrails.context.detector.run_git") as mock_git:
-        mock_git.side_effect = [
-            (True, "main"),        # branch
-            (True, ""),            # status (clean)
-            (False, ""),           # diff HEAD~1 fails (no parent)
-            (True, ""),            # log (no commits in last hour)
-        ]
+    status = parse_status_v2("# branch.oid (initial)\0# branch.head main\0")
+    with mock.patch(
+        "vibesrails.context.detector.git_snapshot", return_value=_snapshot(status),
+    ), mock.patch("vibesrails.context.detector.run_git", return_value=(True, "")):
         detector = ContextDetector(tmp_path)
         signals = detector.detect()
 
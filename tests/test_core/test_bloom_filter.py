@@ -0,0 +1,120 @@
+"""Tests for core/bloom_filter.py — binary mmap Bloom filter."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import pytest  # noqa: E402
+
+from core import bloom_filter  # noqa: E402
+from core.bloom_filter import (  # noqa: E402
+    HEADER,
+    BloomFilter,
+    build,
+    build_from_list,
+    normalize_name,
+    optimal_params,
+)
+from core.hallucination_registry import check_bloom_filter, get_known_packages  # noqa: E402
+
+NAMES = [f"package-{i}" for i in range(5000)] + ["requests", "Django", "zope.interface"]
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter build + lookup."""
+
+    def test_no_false_negatives(self, tmp_path):
+        path = tmp_path / "pypi.bloom"
+        build(NAMES, path)
+        bloom = BloomFilter(path)
+        try:
+            assert all(name in bloom for name in NAMES)
+            assert bloom.count == len(NAMES)
+        finally:
+            bloom.close()
+
+    def test_false_positive_rate_near_target(self, tmp_path):
+        path = tmp_path / "pypi.bloom"
+        build(NAMES, path, fp_rate=0.01)
+        bloom = BloomFilter(path)
+        try:
+            hits = sum(f"absent-{i}" in bloom for i in range(20000))
+        finally:
+            bloom.close()
+        assert hits / 20000 < 0.03
+
+    def test_pep503_normalisation(self, tmp_path):
+        path = tmp_path / "pypi.bloom"
+        build(NAMES, path)
+        bloom = BloomFilter(path)
+        try:
+            assert "django" in bloom
+            assert "Zope_Interface" in bloom
+        finally:
+            bloom.close()
+        assert normalize_name("Foo__Bar.baz") == "foo-bar-baz"
+
+    def test_header_and_size(self, tmp_path):
+        path = tmp_path / "pypi.bloom"
+        build(NAMES, path)
+        m, k = optimal_params(len(NAMES))
+        assert path.stat().st_size == HEADER.size + (m + 7) // 8
+        bloom = BloomFilter(path)
+        try:
+            assert (bloom.m, bloom.k) == (m, k)
+        finally:
+            bloom.close()
+
+    def test_rejects_text_and_truncated_files(self, tmp_path):
+        text = tmp_path / "text.bloom"
+        text.write_text("requests\nnumpy\n")
+        with pytest.raises(ValueError):
+            BloomFilter(text)
+        good = tmp_path / "good.bloom"
+        build(NAMES, good)
+        truncated = tmp_path / "short.bloom"
+        truncated.write_bytes(good.read_bytes()[:HEADER.size + 4])
+        with pytest.raises(ValueError):
+            BloomFilter(truncated)
+
+
+class TestRegistryIntegration:
+    """check_bloom_filter / get_known_packages with binary and legacy files."""
+
+    def test_binary_filter_lookup_and_names(self, home, tmp_path):
+        source = tmp_path / "names.txt"
+        source.write_text("\n".join(NAMES))
+        build_from_list(source, "pypi")
+        assert check_bloom_filter("requests", "pypi") is True
+        assert check_bloom_filter("reqeusts", "pypi") is False
+        assert "requests" in get_known_packages("pypi", str(tmp_path / "x.db"))
+
+    def test_rebuilt_filter_is_reloaded(self, home, tmp_path):
+        bloom_path = home / ".vibesrails" / "packages" / "pypi.bloom"
+        build(["alpha"], bloom_path)
+        assert check_bloom_filter("beta", "pypi") is False
+        build(["alpha", "beta", "gamma"], bloom_path)
+        assert check_bloom_filter("beta", "pypi") is True
+
+    def test_legacy_text_file_still_works(self, home):
+        bloom_dir = home / ".vibesrails" / "packages"
+        bloom_dir.mkdir(parents=True)
+        (bloom_dir / "pypi.bloom").write_text("requests\nnumpy\n")
+        assert check_bloom_filter("numpy", "pypi") is True
+        assert check_bloom_filter("pandas", "pypi") is False
+
+    def test_cli_builder(self, home, tmp_path, capsys):
+        source = tmp_path / "names.txt"
+        source.write_text("requests\nnumpy\n")
+        assert bloom_filter.main([str(source), "pypi"]) == 0
+        assert "2 names" in capsys.readouterr().out
+        assert bloom_filter.main([str(tmp_path / "missing.txt")]) == 1
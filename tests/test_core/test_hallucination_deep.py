@@ -299,3 +299,47 @@ class TestCache:
                 bak.rename(bloom_file)
 
         assert result["source"] == "api"  # Re-fetched, not cache
+
+
+# ── Batch Level 2: check_packages_registry ───────────────────────────
+
+
+class TestBatchRegistry:
+    """Tests for check_packages_registry (many names, one report)."""
+
+    def test_batch_matches_single_lookups(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        c = _checker(tmp_path)
+        c._set_cache("cached_pkg", "pypi", True)
+
+        def fake_api(name):
+            return {"real_pkg": True, "fake_pkg": False}.get(name)
+
+        with patch.object(c, "_check_pypi_api", side_effect=fake_api) as api:
+            results = c.check_packages_registry(
+                ["cached_pkg", "real_pkg", "fake_pkg", "offline_pkg", "real_pkg"],
+            )
+        assert list(results) == ["cached_pkg", "real_pkg", "fake_pkg", "offline_pkg"]
+        assert results["cached_pkg"]["source"] == "cache"
+        assert results["real_pkg"] == {"exists": True, "source": "api", "similar_packages": []}
+        assert results["fake_pkg"]["exists"] is False
+        assert results["offline_pkg"]["source"] == "unknown"
+        assert api.call_count == 3  # duplicates and cache hits skip the API
+        # New answers are cached, unknown ones are not
+        assert c._get_cache("fake_pkg", "pypi", "existence") is False
+        assert c._get_cache("offline_pkg", "pypi", "existence") is None
+
+    def test_api_lookups_run_concurrently(self, tmp_path, monkeypatch):
+        import threading
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        c = _checker(tmp_path)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_api(name):
+            barrier.wait()  # deadlocks unless 4 lookups are in flight at once
+            return True
+
+        with patch.object(c, "_check_pypi_api", side_effect=fake_api):
+            results = c.check_packages_registry([f"pkg{i}" for i in range(4)], max_workers=4)
+        assert all(r["exists"] for r in results.values())
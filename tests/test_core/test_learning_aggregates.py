@@ -0,0 +1,111 @@
+"""Tests for core/learning_profile.py — incremental profile aggregates."""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from core.learning_engine import LearningEngine  # noqa: E402
+from core.learning_profile import AGGREGATES_META_KEY  # noqa: E402
+
+# ── Helpers ───────────────────────────────────────────────────────────
+
+GUARDS = ["dead_code", "complexity", "env_safety", "mutation", "typing", "docs", "tests"]
+METRICS = ["function_count", "complexity_avg", "import_count", "class_count"]
+
+
+def _random_events(seed: int, count: int) -> list[tuple[str, str, dict]]:
+    rng = random.Random(seed)
+    events = []
+    for _ in range(count):
+        session = f"s{rng.randint(0, 14)}"
+        kind = rng.choice(["violation", "brief_score", "drift", "hallucination", "injection"])
+        if kind == "violation":
+            data = {"guard_name": rng.choice(GUARDS + [None])}
+        elif kind == "brief_score":
+            data = {"score": rng.choice([rng.randint(0, 100), "42", None])}
+        elif kind == "drift":
+            data = {"velocity": rng.randint(0, 20), "highest_metric": rng.choice(METRICS)}
+        else:
+            data = {"module": "x"}
+        events.append((session, kind, data))
+    return events
+
+
+# ── Incremental vs rebuild ───────────────────────────────────────────
+
+
+class TestIncrementalMatchesRebuild:
+    """The running aggregates must agree with a full recomputation."""
+
+    def test_random_history(self, tmp_path):
+        e = LearningEngine(db_path=tmp_path / "a.db")
+        for session, kind, data in _random_events(seed=7, count=300):
+            e.record_event(session, kind, data)
+        incremental = e.get_profile()
+        rebuilt = e.rebuild_profile()
+        assert incremental == rebuilt
+        assert incremental["sessions_count"] == 15
+        assert isinstance(incremental["sessions_count"], int)
+
+    def test_improvement_rate_over_many_sessions(self, tmp_path):
+        e = LearningEngine(db_path=tmp_path / "a.db")
+        for i in range(12):
+            e.record_event(f"s{i}", "brief_score", {"score": 40 + i * 5})
+        incremental = e.get_profile()
+        assert incremental["improvement_rate"] is not None
+        assert incremental["improvement_rate"] > 0
+        assert e.rebuild_profile() == incremental
+
+
+# ── Backfill ──────────────────────────────────────────────────────────
+
+
+class TestBackfill:
+    """Databases written before the aggregates existed are backfilled."""
+
+    def test_existing_events_are_backfilled_on_open(self, tmp_path):
+        db = tmp_path / "legacy.db"
+        e = LearningEngine(db_path=db)
+        # Simulate a pre-aggregate database: raw events, no aggregates
+        conn = sqlite3.connect(str(db))
+        conn.executemany(
+            "INSERT INTO learning_events (session_id, event_type, event_data, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                ("old1", "violation", json.dumps({"guard_name": "dead_code"}), "2025-01-01"),
+                ("old2", "brief_score", json.dumps({"score": 80}), "2025-01-02"),
+            ],
+        )
+        conn.execute("DELETE FROM meta WHERE key = ?", (AGGREGATES_META_KEY,))
+        conn.commit()
+        conn.close()
+
+        e = LearningEngine(db_path=db)
+        e.record_event("new", "violation", {"guard_name": "dead_code"})
+        profile = e.get_profile()
+        assert profile["sessions_count"] == 3
+        assert profile["top_violations"] == [{"guard": "dead_code", "count": 2}]
+        assert profile["avg_brief_score"] == 80.0
+
+    def test_rebuild_empty_history_has_no_data(self, tmp_path):
+        e = LearningEngine(db_path=tmp_path / "a.db")
+        assert e.rebuild_profile() == {"status": "no_data", "sessions_count": 0}
+
+    def test_rebuild_picks_up_deleted_events(self, tmp_path):
+        db = tmp_path / "a.db"
+        e = LearningEngine(db_path=db)
+        e.record_event("s1", "hallucination", {"module": "fake"})
+        e.record_event("s2", "violation", {"guard_name": "dead_code"})
+        conn = sqlite3.connect(str(db))
+        conn.execute("DELETE FROM learning_events WHERE event_type = 'hallucination'")
+        conn.commit()
+        conn.close()
+        profile = e.rebuild_profile()
+        assert profile["sessions_count"] == 1
+        assert profile["hallucination_rate"] == 0.0
@@ -0,0 +1,112 @@
+"""Tests for core/learning_writer.py — batched background event writer."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import core.learning_bridge as bridge  # noqa: E402
+from core.learning_engine import LearningEngine  # noqa: E402
+from core.learning_writer import LearningWriter  # noqa: E402
+
+
+class _SlowEngine:
+    """Records batch sizes; blocks writes until released."""
+
+    def __init__(self) -> None:
+        self.batches: list[list] = []
+        self.release = threading.Event()
+
+    def record_encoded_events(self, events):
+        self.release.wait(5)
+        self.batches.append(list(events))
+
+
+class TestLearningWriter:
+    """Tests for LearningWriter."""
+
+    def test_close_flushes_queued_events(self, tmp_path):
+        engine = LearningEngine(db_path=tmp_path / "w.db")
+        writer = LearningWriter(engine, flush_interval=10)
+        for i in range(5):
+            writer.submit("s1", "violation", {"guard_name": f"g{i}"})
+        writer.close()
+        assert engine.get_session_summary("s1")["events_count"] == 5
+        assert engine.get_profile()["sessions_count"] == 1
+
+    def test_events_are_batched(self):
+        engine = _SlowEngine()
+        writer = LearningWriter(engine, flush_interval=10, max_batch=4)
+        for i in range(10):
+            writer.submit("s1", "violation", {"guard_name": f"g{i}"})
+        engine.release.set()
+        writer.close()
+        assert sum(len(b) for b in engine.batches) == 10
+        assert all(len(b) <= 4 for b in engine.batches)
+        assert len(engine.batches) < 10
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        engine = _SlowEngine()
+        writer = LearningWriter(engine, flush_interval=0, max_batch=1, max_queue=2)
+        accepted = [writer.submit("s1", "violation", {}) for _ in range(10)]
+        assert not all(accepted)
+        assert writer.dropped == accepted.count(False)
+        engine.release.set()
+        writer.close()
+        assert sum(len(b) for b in engine.batches) == accepted.count(True)
+
+    def test_failed_batch_does_not_stop_writer(self, tmp_path):
+        engine = LearningEngine(db_path=tmp_path / "w.db")
+        writer = LearningWriter(engine, flush_interval=0, max_batch=1)
+        writer.submit("s1", "not_a_type", {})
+        writer.submit("s1", "violation", {"guard_name": "dead_code"})
+        writer.close()
+        assert engine.get_session_summary("s1")["events_count"] == 1
+
+    def test_created_at_is_submit_time(self, tmp_path):
+        engine = LearningEngine(db_path=tmp_path / "w.db")
+        writer = LearningWriter(engine, flush_interval=10)
+        before = datetime.now(timezone.utc).isoformat()
+        writer.submit("s1", "brief_score", {"score": 80})
+        after = datetime.now(timezone.utc).isoformat()
+        time.sleep(0.05)
+        writer.close()
+        conn = sqlite3.connect(tmp_path / "w.db")
+        try:
+            (created_at,) = conn.execute("SELECT created_at FROM learning_events").fetchone()
+        finally:
+            conn.close()
+        assert before <= created_at <= after
+
+    def test_unserializable_event_is_rejected_alone(self, tmp_path):
+        engine = LearningEngine(db_path=tmp_path / "w.db")
+        writer = LearningWriter(engine, flush_interval=10)
+        assert writer.submit("s1", "violation", {"guard_name": "a"})
+        assert not writer.submit("s1", "violation", {"guard_name": object()})
+        assert writer.submit("s1", "violation", {"guard_name": "b"})
+        writer.close()
+        assert engine.get_session_summary("s1")["events_count"] == 2
+
+
+class TestBridgeWriter:
+    """record_safe() queues events while the writer runs."""
+
+    def test_record_safe_goes_through_writer(self, tmp_path, monkeypatch):
+        bridge._reset()
+        monkeypatch.setattr(bridge, "_engine", LearningEngine(db_path=tmp_path / "b.db"))
+        try:
+            writer = bridge.start_writer(flush_interval=10)
+            bridge.record_safe("s1", "violation", {"guard_name": "dead_code"})
+            bridge.record_safe("s1", "totally_invalid", {})
+            assert bridge.get_engine().get_session_summary("s1")["events_count"] == 0
+            bridge.stop_writer()
+            assert writer.dropped == 0
+            assert bridge.get_engine().get_session_summary("s1")["events_count"] == 1
+        finally:
+            bridge._reset()
@@ -11,6 +11,7 @@ from vibesrails.adapters.coverage_reader import (
     is_coverage_stale,
     read_coverage,
 )
+from vibesrails.git_snapshot import CommitInfo
 
 # ── helpers ────────────────────────────────────────────────────
 
@@ -98,14 +99,23 @@ def test_staleness_fresh(tmp_path):
     # Simulate: last commit was 1 second in the past, file is newer
     past_ts = time.time() - 1.0
 
+    commit = CommitInfo("abc", int(past_ts), "feat: x")
     with mock.patch(
-        "vibesrails.adapters.coverage_reader.subprocess.run"
-    ) as mock_run:
-        mock_run.return_value = mock.Mock(
-            returncode=0,
-            stdout=str(int(past_ts)),
-        )
+        "vibesrails.adapters.coverage_reader.git_snapshot",
+        return_value=mock.Mock(last_commit=commit),
+    ):
         # File was just created so its mtime > past_ts
         result = is_coverage_stale(tmp_path)
 
     assert result is False
+
+
+def test_staleness_older_than_last_commit(tmp_path):
+    """coverage.json older than the last git commit → stale (True)."""
+    _write_coverage_json(tmp_path, _MOCK_COVERAGE)
+    commit = CommitInfo("abc", int(time.time()) + 60, "feat: x")
+    with mock.patch(
+        "vibesrails.adapters.coverage_reader.git_snapshot",
+        return_value=mock.Mock(last_commit=commit),
+    ):
+        assert is_coverage_stale(tmp_path) is True
@@ -0,0 +1,114 @@
+"""Tests for the shared project file index (vibesrails/file_index.py)."""
+
+import os
+
+import pytest
+
+from vibesrails import file_index
+from vibesrails.file_index import ProjectFileIndex, get_index, project_files
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    file_index.clear_cache()
+    yield
+    file_index.clear_cache()
+
+
+def _tree(root, files):
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _rels(root, paths):
+    return [p.relative_to(root).as_posix() for p in paths]
+
+
+def _age(root, seconds=10):
+    """Backdate every directory so its mtime is outside the racy window."""
+    past = os.stat(root).st_mtime - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def test_matches_sorted_rglob_outside_pruned_dirs(tmp_path):
+    _tree(tmp_path, ["b.py", "a/z.py", "a-b.py", "a/b/c.py", "pkg/mod.py"])
+    expected = _rels(tmp_path, sorted(tmp_path.rglob("*.py")))
+    assert _rels(tmp_path, project_files(tmp_path)) == expected
+
+
+def test_prunes_venvs_caches_and_hidden_state(tmp_path):
+    _tree(tmp_path, [
+        "app.py", ".venv/lib/site.py", "venv/x.py", "node_modules/y.py",
+        "__pycache__/z.py", "env/lib/w.py", ".git/hooks/h.py", ".vibesrails/cache/c.py",
+    ])
+    (tmp_path / "env" / "pyvenv.cfg").write_text("home = /usr\n")
+    assert _rels(tmp_path, project_files(tmp_path)) == ["app.py"]
+
+
+def test_honours_gitignore(tmp_path):
+    _tree(tmp_path, [
+        "keep.py", "gen/out.py", "build/lib.py", "src/build/keep.py",
+        "src/skip_me.py", "src/keep_me.py", "sub/local.py", "sub/other.py", "deep/a/b/x.py",
+    ])
+    (tmp_path / ".gitignore").write_text(
+        "# generated\ngen/\n/build\nskip_*.py\n!src/skip_me.py\ndeep/**/x.py\n"
+    )
+    (tmp_path / "sub" / ".gitignore").write_text("local.py\n")
+    assert _rels(tmp_path, project_files(tmp_path)) == [
+        "keep.py", "src/build/keep.py", "src/keep_me.py", "src/skip_me.py", "sub/other.py",
+    ]
+
+
+def test_pattern_and_subdirectory(tmp_path):
+    _tree(tmp_path, ["tests/test_a.py", "tests/helpers.py", "test_root.py", "web/app.ts"])
+    tests = project_files(tmp_path, "test_*.py", under="tests")
+    assert _rels(tmp_path, tests) == ["tests/test_a.py"]
+    assert _rels(tmp_path, project_files(tmp_path, "*.ts")) == ["web/app.ts"]
+
+
+def test_does_not_follow_directory_symlinks(tmp_path):
+    _tree(tmp_path, ["real/a.py"])
+    (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+    assert _rels(tmp_path, project_files(tmp_path)) == ["real/a.py"]
+
+
+def test_index_reused_until_tree_changes(tmp_path):
+    _tree(tmp_path, ["a.py", "pkg/b.py"])
+    _age(tmp_path)
+    first = get_index(tmp_path)
+    assert get_index(tmp_path) is first
+    (tmp_path / "pkg" / "c.py").write_text("")
+    second = get_index(tmp_path)
+    assert second is not first
+    assert [e.rel for e in second.match()] == ["a.py", "pkg/b.py", "pkg/c.py"]
+
+
+def test_recently_modified_tree_is_rewalked(tmp_path):
+    _tree(tmp_path, ["a.py"])
+    first = get_index(tmp_path)
+    assert get_index(tmp_path) is not first
+
+
+def test_entries_carry_stat(tmp_path):
+    (tmp_path / "a.py").write_text("abc")
+    (entry,) = get_index(tmp_path).match()
+    assert entry.size == 3
+    assert entry.mtime_ns == (tmp_path / "a.py").stat().st_mtime_ns
+
+
+def test_persisted_index_skips_walk(tmp_path, monkeypatch):
+    _tree(tmp_path, ["a.py"])
+    (tmp_path / ".vibesrails" / "cache").mkdir(parents=True)
+    _age(tmp_path)
+    get_index(tmp_path, persist=True)
+    assert (tmp_path / file_index.CACHE_FILE).exists()
+    file_index.clear_cache()
+
+    def no_walk(self):
+        raise AssertionError("walked again")
+
+    monkeypatch.setattr(ProjectFileIndex, "_walk", no_walk)
+    assert [e.rel for e in get_index(tmp_path, persist=True).match()] == ["a.py"]
@@ -0,0 +1,133 @@
+"""Tests for the shared git snapshot (vibesrails/git_snapshot.py)."""
+
+import os
+import subprocess
+import time
+
+import pytest
+
+from vibesrails import git_snapshot as gs
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    gs.clear_cache()
+    yield
+    gs.clear_cache()
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=root, check=True, capture_output=True,
+    )
+
+
+def _settle(root):
+    """Age git metadata past the racy window so snapshots can be memoized.
+
+    Only a few seconds back: an index dated at the epoch would switch off
+    git's own racy-clean check and hide same-second edits from git add.
+    """
+    aged = time.time_ns() - 10 * gs.RACY_WINDOW_NS
+    for dirpath, _, filenames in os.walk(root / ".git"):
+        for name in [".", *filenames]:
+            os.utime(os.path.join(dirpath, name), ns=(aged, aged))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "feat: initial")
+    return tmp_path
+
+
+def test_parse_status_v2_records():
+    out = "\0".join([
+        "# branch.oid 1234",
+        "# branch.head feature/x",
+        "# branch.upstream origin/feature/x",
+        "# branch.ab +2 -3",
+        "1 M. N... 100644 100644 100644 h1 h2 staged.py",
+        "1 .M N... 100644 100644 100644 h1 h2 dir/with space.py",
+        "2 R. N... 100644 100644 100644 h1 h2 R100 new.py",
+        "old.py",
+        "u UU N... 100644 100644 100644 100644 h1 h2 h3 conflict.py",
+        "? untracked.py",
+        "! ignored.pyc",
+        "",
+    ])
+    status = gs.parse_status_v2(out)
+    assert (status.branch, status.head, status.upstream) == ("feature/x", "1234", "origin/feature/x")
+    assert (status.ahead, status.behind) == (2, 3)
+    assert status.staged == ("staged.py", "new.py", "conflict.py")
+    assert status.unstaged == ("dir/with space.py", "conflict.py")
+    assert status.untracked == ("untracked.py",)
+    assert status.dirty_count == 5
+
+
+def test_parse_status_v2_detached_and_unborn():
+    assert gs.parse_status_v2("# branch.oid abc\0# branch.head (detached)\0").branch == "HEAD"
+    assert gs.parse_status_v2("# branch.oid (initial)\0# branch.head main\0").head is None
+
+
+def test_split_diff_by_file():
+    diff = (
+        "diff --git a/x.py b/x.py\n--- a/x.py\n+++ b/x.py\n+1\n"
+        "diff --git a/dir/a b.py b/dir/a b.py\n+2\n"
+        "diff --git a/old.py b/new.py\n+3\n"
+    )
+    patches = gs.split_diff(diff)
+    assert list(patches) == ["x.py", "dir/a b.py", "new.py"]
+    assert "".join(patches.values()) == diff
+
+
+def test_snapshot_reads_repository_state(repo):
+    (repo / "a.py").write_text("a = 2\n")
+    _git(repo, "add", "a.py")
+    (repo / "b.py").write_text("b = 2\n")
+    (repo / "c.py").write_text("c = 1\n")
+    _git(repo, "tag", "v1.0")
+    snap = gs.git_snapshot(repo)
+    assert snap.status.branch == "main"
+    assert snap.status.staged == ("a.py",)
+    assert snap.status.unstaged == ("b.py",)
+    assert snap.status.untracked == ("c.py",)
+    assert snap.last_commit.subject == "feat: initial"
+    assert snap.tags == ("v1.0",)
+    assert snap.tracked_files == ("a.py", "b.py")
+
+
+def test_outside_a_repository(tmp_path):
+    snap = gs.git_snapshot(tmp_path)
+    assert snap.status is None
+    assert snap.last_commit is None
+    assert snap.tracked_files is None
+    assert gs.git_snapshot(tmp_path) is not snap
+
+
+def test_snapshot_memoized_until_index_changes(repo):
+    _settle(repo)
+    snap = gs.git_snapshot(repo)
+    assert snap.status.staged == ()
+    assert gs.git_snapshot(repo) is snap
+    (repo / "a.py").write_text("a = 3\n")
+    _git(repo, "add", "a.py")
+    fresh = gs.git_snapshot(repo)
+    assert fresh is not snap
+    assert fresh.status.staged == ("a.py",)
+
+
+def test_snapshot_expires_after_ttl(repo, monkeypatch):
+    _settle(repo)
+    snap = gs.git_snapshot(repo)
+    monkeypatch.setattr(gs, "SNAPSHOT_TTL", 0.0)
+    assert gs.git_snapshot(repo) is not snap
+
+
+def test_recent_metadata_is_not_memoized(repo):
+    snap = gs.git_snapshot(repo)
+    assert gs.git_snapshot(repo) is not snap
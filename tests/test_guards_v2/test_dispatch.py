@@ -0,0 +1,107 @@
+"""Tests for the single-walk V2 guard dispatcher."""
+
+import ast
+from unittest.mock import patch
+
+import pytest
+
+from vibesrails.guards_v2.complexity import ComplexityGuard
+from vibesrails.guards_v2.dead_code import DeadCodeGuard
+from vibesrails.guards_v2.dependency_audit import V2GuardIssue
+from vibesrails.guards_v2.dispatch import NodeDispatcher, dispatch, visits
+from vibesrails.guards_v2.performance import PerformanceGuard
+from vibesrails.guards_v2.type_safety import TypeSafetyGuard
+from vibesrails.parsed_module import ParsedModule
+
+SOURCE = '''from typing import Any
+
+
+def first(x) -> None:
+    pass
+
+
+def second(y: Any):
+    for item in y:
+        total = 0
+        total += len([i for i in item])
+'''
+
+
+def _issue(message, line=1):
+    return V2GuardIssue(guard="demo", severity="info", message=message, file="m.py", line=line)
+
+
+class _NamesGuard:
+    """Reports every function, then every Name, then a line-based issue."""
+
+    @visits(ast.FunctionDef)
+    def _functions(self, node, module):
+        return [_issue(f"def {node.name}", node.lineno)]
+
+    @visits(ast.Name)
+    def _names(self, node, module):
+        return [_issue(f"name {node.id}", node.lineno)]
+
+    def finish(self, module, issues):
+        return [*issues, _issue(f"{len(module.lines)} lines")]
+
+
+class _BrokenGuard:
+    @visits(ast.FunctionDef)
+    def _boom(self, node, module):
+        raise RuntimeError("boom")
+
+
+class _SkippingGuard:
+    def accepts(self, module):
+        return False
+
+    @visits(ast.FunctionDef)
+    def _never(self, node, module):
+        raise AssertionError("should not be called")
+
+
+def test_issues_grouped_per_detector_in_walk_order():
+    module = ParsedModule("m.py", SOURCE)
+    messages = [i.message for i in dispatch(_NamesGuard(), module)]
+    assert messages[:2] == ["def first", "def second"]
+    assert "name Any" in messages
+    assert messages[-1] == "11 lines"
+
+
+def test_failing_guard_is_isolated():
+    module = ParsedModule("m.py", SOURCE)
+    results = NodeDispatcher([_BrokenGuard(), _NamesGuard()]).run(module)
+    assert results[0] is None
+    assert results[1]
+
+
+def test_dispatch_propagates_errors():
+    with pytest.raises(RuntimeError):
+        dispatch(_BrokenGuard(), ParsedModule("m.py", SOURCE))
+
+
+def test_accepts_false_skips_guard():
+    results = NodeDispatcher([_SkippingGuard()]).run(ParsedModule("m.py", SOURCE))
+    assert results == [[]]
+
+
+def test_subclass_override_without_visits_unsubscribes():
+    class Quiet(_NamesGuard):
+        def _names(self, node, module):
+            return []
+
+    messages = [i.message for i in dispatch(Quiet(), ParsedModule("m.py", SOURCE))]
+    assert not any(m.startswith("name ") for m in messages)
+
+
+def test_guards_share_one_traversal():
+    guards = [DeadCodeGuard(), ComplexityGuard(), PerformanceGuard(), TypeSafetyGuard()]
+    module = ParsedModule("m.py", SOURCE)
+    with patch("vibesrails.parsed_module.ast.walk", wraps=ast.walk) as spy:
+        results = NodeDispatcher(guards).run(module)
+    # One walk builds the node list; the rest are detectors walking their own subtree
+    module_walks = [c for c in spy.call_args_list if isinstance(c.args[0], ast.Module)]
+    assert len(module_walks) == 1
+    expected = [g.scan_file("m.py", SOURCE) for g in guards]
+    assert results == expected
@@ -1,9 +1,11 @@
 """Tests for GitWorkflowGuard — real git repos, minimal mocking."""
 
+import re
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+from vibesrails.guards_v2._git_helpers import glob_to_regex, iter_blocklisted
 from vibesrails.guards_v2.git_workflow import GitWorkflowGuard, _run_git
 
 
@@ -317,3 +319,52 @@ def test_tracked_hygiene_detects_pyc(tmp_path: Path):
     guard = GitWorkflowGuard(tmp_path)
     issues = guard.check_tracked_hygiene()
     assert any("bytecode" in i.message for i in issues)
+
+
+def test_tracked_hygiene_detects_egg_info(tmp_path: Path):
+    """Glob directory patterns match at any depth."""
+    _init_git(tmp_path)
+    egg = tmp_path / "src" / "pkg.egg-info"
+    egg.mkdir(parents=True)
+    (egg / "PKG-INFO").write_text("Name: pkg\n")
+    subprocess.run(["git", "add", "-f", "src"], cwd=tmp_path, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "feat: add egg"], cwd=tmp_path, capture_output=True)
+
+    guard = GitWorkflowGuard(tmp_path)
+    issues = guard.check_tracked_hygiene()
+    assert [i.file for i in issues] == ["src/pkg.egg-info/PKG-INFO"]
+    assert "egg-info" in issues[0].message
+
+
+# ── blocklist matcher ───────────────────────────────────────
+
+
+def test_iter_blocklisted_reports_each_path_once():
+    """First blocklist entry wins; other paths are ignored."""
+    stream = "\0".join([
+        "README.md",
+        "src/__pycache__/mod.pyc",
+        "rebuild/x.py",
+        "x.pyc.txt",
+        "a/.DS_Store",
+        "htmlcov/.coverage",
+    ]) + "\0"
+    assert list(iter_blocklisted(stream)) == [
+        ("src/__pycache__/mod.pyc", "Python bytecode cache"),
+        ("a/.DS_Store", "macOS metadata"),
+        ("htmlcov/.coverage", "coverage data"),
+    ]
+
+
+def test_glob_to_regex_gitignore_syntax():
+    """Anchors, segment wildcards, ** and character classes."""
+    def matches(glob: str, path: str) -> bool:
+        return re.search(glob_to_regex(glob), path) is not None
+
+    assert matches("/dist/", "dist/a.whl")
+    assert not matches("/dist/", "pkg/dist/a.whl")
+    assert matches("docs/**/*.tmp", "docs/a/b/c.tmp")
+    assert matches("docs/**/*.tmp", "docs/c.tmp")
+    assert not matches("src/*.log", "src/a/b.log")
+    assert matches("f[!0-9].log", "fa.log")
+    assert not matches("f[!0-9].log", "f1.log")
@@ -0,0 +1,141 @@
+"""Tests for coverage-guided mutant test selection (mutation/coverage_map.py)."""
+
+import json
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vibesrails.guards_v2.mutation import (
+    CoverageMap,
+    MutationGuard,
+    SelectedTests,
+    load_coverage_map,
+    scan_file,
+)
+from vibesrails.guards_v2.mutation import coverage_map as cm
+
+SOURCE = textwrap.dedent("""\
+    LIMIT = 1 > 0
+
+    def add(a, b):
+        return a + b
+
+    def is_positive(x):
+        if x > 0:
+            return True
+        return False
+""")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "calc.py").write_text(SOURCE)
+    tests = tmp_path / "tests" / "unit"
+    tests.mkdir(parents=True)
+    (tmp_path / "tests" / "conftest.py").write_text("")
+    (tests / "test_math.py").write_text(
+        "from calc import add\n\ndef test_add():\n    assert add(2, 3) == 5\n"
+    )
+    return tmp_path
+
+
+def _map():
+    # add() body (line 4) is covered by test_add; is_positive (6-9) by nothing;
+    # line 1 only runs at import
+    return CoverageMap(
+        ["tests/unit/test_math.py::test_add", "tests/unit/test_math.py::test_other"],
+        {"calc.py": {1: [], 3: [], 4: [0], 6: []}},
+    )
+
+
+class _Runner:
+    """Stands in for pytest; records what each mutant was asked to run."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, mutant_path: Path, test_path: Path, test_ids=()):
+        copied = sorted(
+            p.relative_to(test_path).as_posix() for p in test_path.rglob("*.py")
+            if p != mutant_path
+        )
+        self.calls.append((mutant_path.read_text(), tuple(test_ids), copied))
+        return "a - b" not in mutant_path.read_text()
+
+
+def test_tests_for_line():
+    coverage = _map()
+    assert coverage.tests_for("calc.py", 4) == ("tests/unit/test_math.py::test_add",)
+    assert coverage.tests_for("calc.py", 8) == ()
+    assert coverage.tests_for("other.py", 4) == ()
+    # Import-time lines select every test of the file
+    assert coverage.tests_for("calc.py", 1) == ("tests/unit/test_math.py::test_add",)
+    assert coverage.covers_file("calc.py")
+    assert not coverage.covers_file("other.py")
+
+
+def test_map_json_roundtrip():
+    coverage = _map()
+    restored = CoverageMap.from_json(json.loads(json.dumps(coverage.to_json())))
+    assert restored.tests == coverage.tests
+    assert restored.lines == coverage.lines
+    assert CoverageMap.from_json({"version": -1}) is None
+
+
+def test_selected_tests_files():
+    selected = SelectedTests(Path("."), ("t/a.py::x", "t/a.py::y[1-2]", "t/b.py::C::z"))
+    assert selected.files == ["t/a.py", "t/b.py"]
+
+
+def test_uncovered_mutants_skip_pytest(project):
+    runner = _Runner()
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+        report = scan_file(project / "calc.py", None, project, coverage=_map())
+    uncovered = [r for r in report.results if r.no_coverage]
+    assert uncovered and all(r.line >= 6 for r in uncovered)
+    assert report.no_coverage == len(uncovered)
+    assert report.total == report.killed + report.survived + report.no_coverage
+    # Only covered mutants reached the runner, each with the tests of its line
+    assert len(runner.calls) == report.total - report.no_coverage
+    assert all(ids == ("tests/unit/test_math.py::test_add",) for _, ids, _ in runner.calls)
+
+
+def test_selected_test_files_copied_into_sandbox(project):
+    runner = _Runner()
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+        scan_file(project / "calc.py", None, project, coverage=_map())
+    _, _, copied = runner.calls[0]
+    assert copied == ["tests/conftest.py", "tests/unit/test_math.py"]
+
+
+def test_guard_targets_covered_files(project):
+    (project / "untested.py").write_text("def f(x):\n    return x > 1\n")
+    guard = MutationGuard()
+    targets = guard._project_targets(project, _map())
+    assert [(src.name, test) for src, test, _ in targets] == [("calc.py", None)]
+
+
+def test_load_falls_back_without_coverage(project):
+    with patch.object(cm, "coverage_available", return_value=False):
+        assert load_coverage_map(project) is None
+
+
+def test_load_reuses_stored_map(project):
+    stored = _map()
+    stored.fingerprint = cm.project_fingerprint(project)
+    cm._save(project, stored)
+    with patch.object(cm, "coverage_available", return_value=True), \
+            patch.object(cm, "build_coverage_map") as build:
+        loaded = load_coverage_map(project)
+    build.assert_not_called()
+    assert loaded.lines == stored.lines
+
+
+def test_build_real_coverage_map(project):
+    pytest.importorskip("coverage")
+    coverage = cm.build_coverage_map(project)
+    assert coverage is not None
+    assert coverage.tests_for("calc.py", 4) == ("tests/unit/test_math.py::test_add",)
+    assert coverage.tests_for("calc.py", 8) == ()
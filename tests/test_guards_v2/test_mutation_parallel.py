@@ -0,0 +1,122 @@
+"""Tests for concurrent mutant execution (mutation/parallel.py)."""
+
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vibesrails.guards_v2.mutation import (
+    MutantPool,
+    MutationGuard,
+    resolve_mutation_jobs,
+    scan_file,
+)
+
+SOURCE = textwrap.dedent("""\
+    def add(a, b):
+        return a + b
+
+    def is_positive(x):
+        if x > 0:
+            return True
+        return False
+
+    def both(a, b):
+        return a and b
+""")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "calc.py").write_text(SOURCE)
+    (tmp_path / "other.py").write_text("def neg(x):\n    return -x if x > 0 else x\n")
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_calc.py").write_text("from calc import add\n\ndef test_add():\n    assert add(2, 3) == 5\n")
+    (tests / "test_other.py").write_text("def test_nothing():\n    assert True\n")
+    return tmp_path
+
+
+class _FakeRunner:
+    """Stands in for pytest: a mutant survives unless it swapped '+' for '-'."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.sandbox_contents = []
+        self._lock = threading.Lock()
+
+    def __call__(self, mutant_path: Path, test_path: Path) -> bool:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            root = test_path.parent.parent
+            self.sandbox_contents.append(
+                sorted(p.name for p in root.rglob("*.py") if p.parent.name != "tests")
+            )
+        code = mutant_path.read_text()
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return "a - b" not in code
+
+
+def _summary(report):
+    return [(r.mutation_type, r.killed) for r in report.results], report.killed, report.total
+
+
+def test_parallel_matches_sequential(project):
+    src, test = project / "calc.py", project / "tests" / "test_calc.py"
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", _FakeRunner()):
+        sequential = scan_file(src, test, project)
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", _FakeRunner(0.01)):
+        parallel = scan_file(src, test, project, jobs=4)
+    assert sequential.total > 4
+    assert _summary(parallel) == _summary(sequential)
+
+
+def test_mutants_run_concurrently_in_isolated_sandboxes(project):
+    runner = _FakeRunner(delay=0.05)
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+        MutationGuard(jobs=3, coverage_guided=False).scan(project)
+    assert runner.peak == 3
+    # Every sandbox only ever holds the one mutant under test
+    assert all(len(contents) == 1 for contents in runner.sandbox_contents)
+
+
+def test_reports_keep_file_order(project):
+    guard = MutationGuard(jobs=4, coverage_guided=False)
+    targets = guard._project_targets(project)
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", _FakeRunner(0.01)):
+        reports = guard._scan_files(targets, project)
+    assert [r.file for r in reports] == ["calc.py", "other.py"]
+
+
+def test_pool_removes_sandboxes_on_close(project):
+    seen = []
+
+    def runner(mutant_path, test_path):
+        seen.append(mutant_path.parent)
+        return True
+
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+        with MutantPool(2) as pool:
+            pool.submit(Path("calc.py"), project / "tests" / "test_calc.py", SOURCE).result()
+    assert seen and not seen[0].exists()
+
+
+def test_resolve_mutation_jobs():
+    assert resolve_mutation_jobs(None) == 1
+    assert resolve_mutation_jobs(3) == 3
+    assert resolve_mutation_jobs(0) >= 1
+
+
+def test_real_pytest_parallel_matches_sequential(project):
+    src, test = project / "calc.py", project / "tests" / "test_calc.py"
+    sequential = scan_file(src, test, project)
+    parallel = scan_file(src, test, project, jobs=3)
+    assert _summary(parallel) == _summary(sequential)
@@ -0,0 +1,167 @@
+"""Tests for persistent mutant outcomes (mutation/result_cache.py)."""
+
+import ast
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vibesrails.guards_v2.mutation import (
+    MutantKeys,
+    MutationGuard,
+    SelectedTests,
+    open_result_cache,
+)
+from vibesrails.guards_v2.mutation import result_cache as rc
+from vibesrails.guards_v2.mutation.visitors import list_targets
+
+SOURCE = textwrap.dedent("""\
+    def add(a, b):
+        return a + b
+
+    def is_positive(x):
+        if x > 0:
+            return True
+        return False
+""")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "calc.py").write_text(SOURCE)
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_calc.py").write_text("from calc import add\n\ndef test_add():\n    assert add(2, 3) == 5\n")
+    return tmp_path
+
+
+class _Runner:
+    """Stands in for pytest: a mutant survives unless it swapped '+' for '-'."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, mutant_path: Path, test_path: Path) -> bool:
+        self.calls += 1
+        return "a - b" not in mutant_path.read_text()
+
+
+def _scan(project):
+    runner = _Runner()
+    guard = MutationGuard(coverage_guided=False)
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+        reports = guard._scan_files(guard._project_targets(project), project)
+    outcomes = [(r.mutation_type, r.line, r.killed) for r in reports[0].results]
+    return runner.calls, outcomes
+
+
+def _keys(source, mutation_type="comparison_swap"):
+    keys = MutantKeys(ast.parse(source), "calc.py")
+    count = len(list_targets(keys.tree, mutation_type))
+    return [keys.key(mutation_type, idx, "tests") for idx in range(count)]
+
+
+def test_keys_ignore_position_and_docstring():
+    moved = "import os\n\n" + SOURCE.replace(
+        "def is_positive(x):\n", 'def is_positive(x):\n    """Doc."""\n',
+    )
+    assert _keys(moved) == _keys(SOURCE)
+
+
+def test_keys_follow_function_body():
+    assert _keys(SOURCE.replace("x > 0", "x > 1")) != _keys(SOURCE)
+    # Editing another function keeps is_positive's keys
+    assert _keys(SOURCE.replace("a + b", "b + a")) == _keys(SOURCE)
+
+
+TWINS = textwrap.dedent("""\
+    class A:
+        def ok(self, x):
+            return x > 0
+
+    class B:
+        def ok(self, x):
+            return x > 0
+""")
+
+
+def test_identical_functions_get_distinct_keys():
+    assert len(set(_keys(TWINS))) == 2
+    assert len(set(_keys(TWINS, "return_none"))) == 2
+
+
+def test_identical_functions_keep_their_own_outcomes(tmp_path):
+    (tmp_path / "twins.py").write_text(TWINS)
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_twins.py").write_text("def test_a():\n    pass\n")
+
+    def runner(mutant_path, test_path):
+        # Only the mutant inside A is killed
+        return "class A:\n\n    def ok(self, x):\n        return x > 0" in mutant_path.read_text()
+
+    guard = MutationGuard(coverage_guided=False)
+    outcomes = []
+    for _ in range(2):
+        with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+            report = guard._scan_files(guard._project_targets(tmp_path), tmp_path)[0]
+        outcomes.append([(r.mutation_type, r.line, r.killed) for r in report.results])
+    assert outcomes[0] == outcomes[1]
+    assert ("comparison_swap", 3, True) in outcomes[1]
+    assert ("comparison_swap", 7, False) in outcomes[1]
+
+
+def test_tests_digest_follows_test_contents(project):
+    cache = open_result_cache(project)
+    selected = SelectedTests(project, ("tests/test_calc.py::test_add",))
+    before = cache.tests_digest(None, selected)
+    (project / "tests" / "conftest.py").write_text("")
+    assert open_result_cache(project).tests_digest(None, selected) != before
+    assert cache.tests_digest(project / "tests" / "test_calc.py", None) != before
+
+
+def test_unchanged_project_reuses_outcomes(project):
+    calls, outcomes = _scan(project)
+    assert calls == len(outcomes) > 0
+    assert (project / rc.RESULT_CACHE_FILE).exists()
+    assert _scan(project) == (0, outcomes)
+
+
+def test_changed_function_reruns_only_its_mutants(project):
+    _, outcomes = _scan(project)
+    (project / "calc.py").write_text(SOURCE.replace("x > 0", "x >= 0"))
+    calls, _ = _scan(project)
+    is_positive = [o for o in outcomes if o[1] >= 4]
+    assert 0 < calls <= len(is_positive)
+
+
+def test_changed_tests_rerun_everything(project):
+    calls, _ = _scan(project)
+    (project / "tests" / "test_calc.py").write_text(
+        "from calc import add\n\ndef test_add():\n    assert add(1, 1) == 2\n"
+    )
+    assert _scan(project)[0] == calls
+
+
+def test_disabled_cache_runs_everything(project):
+    calls, _ = _scan(project)
+    guard = MutationGuard(coverage_guided=False, result_cache=False)
+    runner = _Runner()
+    with patch("vibesrails.guards_v2.mutation.engine.run_tests_on_mutant", runner):
+        guard._scan_files(guard._project_targets(project), project)
+    assert runner.calls == calls
+
+
+def test_prune_drops_stale_rows(project):
+    cache = open_result_cache(project)
+    cache.put([("old", True), ("new", False)])
+    conn = cache._connect(cache.path)
+    try:
+        conn.execute("UPDATE mutant_results SET used_at = 0 WHERE key = 'old'")
+        conn.commit()
+    finally:
+        conn.close()
+    cache.prune()
+    assert cache.get("old") is None
+    assert cache.get("new") is False
@@ -0,0 +1,146 @@
+"""Tests for in-process mutant switching (mutation/schemata.py)."""
+
+import ast
+import builtins
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from vibesrails.guards_v2.mutation import (
+    CoverageMap,
+    MutationGuard,
+    apply_mutation,
+    build_schema,
+    scan_file,
+    schemata_supported,
+)
+from vibesrails.guards_v2.mutation.engine import _collect_mutations, _schema_mutations
+from vibesrails.guards_v2.mutation.schemata import SWITCH
+
+SOURCE = textwrap.dedent("""\
+    import math
+
+    LIMIT = 10 + 1
+
+    def add(a, b):
+        return a + b
+
+    def is_positive(x):
+        if x > 0:
+            return True
+        return False
+
+    def both(a, b):
+        return a and b
+
+    def nothing():
+        return None
+""")
+
+PROBES = [
+    lambda ns: ns["LIMIT"],
+    lambda ns: ns["add"](6, 3),
+    lambda ns: ns["is_positive"](2),
+    lambda ns: ns["is_positive"](-2),
+    lambda ns: ns["both"](1, 0),
+    lambda ns: ns["both"](0, 1),
+    lambda ns: ns["nothing"](),
+]
+
+needs_fork = pytest.mark.skipif(not schemata_supported(), reason="needs os.fork")
+
+
+def _behaviour(code, mutant_id=0):
+    ns = {}
+    with patch.object(builtins, SWITCH, mutant_id, create=True):
+        exec(compile(code, "<schema>", "exec"), ns)
+        return [probe(ns) for probe in PROBES]
+
+
+@pytest.fixture
+def tree():
+    return ast.parse(SOURCE)
+
+
+def test_switch_off_runs_original(tree):
+    schema = build_schema(tree, _collect_mutations(tree))
+    assert _behaviour(schema.code) == _behaviour(SOURCE)
+
+
+def test_each_mutant_matches_temp_file_mutant(tree):
+    mutations = _collect_mutations(tree)
+    schema = build_schema(tree, mutations)
+    assert len(schema.lines) == len(mutations)
+    for mutant_id, (mut_type, idx) in enumerate(mutations, 1):
+        expected = _behaviour(ast.unparse(apply_mutation(tree, mut_type, idx)))
+        assert _behaviour(schema.code, mutant_id) == expected, (mut_type, idx)
+
+
+def test_schema_preloads_imports(tree):
+    assert build_schema(tree, []).preload == ["math"]
+
+
+def test_schema_mutations_filter(tree):
+    assert _schema_mutations(tree, None) == _collect_mutations(tree)
+    assert _schema_mutations(tree, {"missing"}) == []
+    kept = _schema_mutations(tree, {"add"})
+    # nothing()'s "return None" has no mutant that changes the code
+    assert len(kept) == len(_collect_mutations(tree)) - 1
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "calc.py").write_text(SOURCE)
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_calc.py").write_text(textwrap.dedent("""\
+        from calc import LIMIT, add, is_positive
+
+        def test_add():
+            assert add(2, 3) == 5
+
+        def test_positive():
+            assert is_positive(3)
+
+        def test_limit():
+            assert LIMIT == 11
+    """))
+    return tmp_path
+
+
+def _outcomes(report):
+    return [(r.mutation_type, r.line, r.killed) for r in report.results]
+
+
+@needs_fork
+def test_fork_server_kills_and_keeps_mutants(project):
+    report = scan_file(
+        project / "calc.py", project / "tests" / "test_calc.py", project,
+        jobs=2, schemata=True,
+    )
+    outcomes = _outcomes(report)
+    assert ("arithmetic_swap", 3, True) in outcomes  # import-time mutant
+    assert ("arithmetic_swap", 6, True) in outcomes
+    assert ("boolean_swap", 14, False) in outcomes  # both() is untested
+    assert report.killed + report.survived == report.total
+
+
+@needs_fork
+def test_fork_server_runs_selected_tests(project):
+    coverage = CoverageMap(
+        ["tests/test_calc.py::test_add", "tests/test_calc.py::test_positive"],
+        {"calc.py": {6: [0], 9: [1], 10: [1]}},
+    )
+    report = scan_file(
+        project / "calc.py", None, project, coverage=coverage, schemata=True,
+    )
+    by_line = {(r.mutation_type, r.line): r for r in report.results}
+    assert by_line[("arithmetic_swap", 6)].killed
+    assert by_line[("comparison_swap", 9)].killed
+    assert by_line[("arithmetic_swap", 3)].no_coverage
+
+
+def test_guard_ignores_schemata_without_fork():
+    with patch("vibesrails.guards_v2.mutation.guard.schemata_supported", return_value=False):
+        assert MutationGuard(schemata=True).schemata is False
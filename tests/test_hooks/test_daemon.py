@@ -0,0 +1,103 @@
+"""Tests for the hook daemon and its thin client."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from vibesrails.hooks import daemon
+from vibesrails.hooks.client import run_via_daemon
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+SECRET_BASH = {"tool_name": "Bash", "tool_input": {"command": "echo sk-abcdefghijklmnop1234"}}
+
+
+def _env(**extra):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT, **extra)
+    env.pop("VIBESRAILS_NO_DAEMON", None)
+    return env
+
+
+def _run_hook(name, payload, cwd, **env):
+    return subprocess.run(
+        [sys.executable, "-m", f"vibesrails.hooks.{name}"],
+        input=json.dumps(payload), capture_output=True, text=True,
+        timeout=30, cwd=cwd, env=_env(**env),
+    )
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "vibesrails", "--daemon"],
+        cwd=tmp_path, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    sock = tmp_path / ".vibesrails" / "hookd.sock"
+    deadline = time.monotonic() + 20
+    while not sock.exists():
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            pytest.skip("hook daemon did not start")
+        time.sleep(0.05)
+    yield sock
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+def test_client_without_daemon_restores_stdin(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "stdin", io.StringIO('{"tool_name": "Read"}'))
+    assert run_via_daemon("pre_tool_use") is None
+    assert sys.stdin.read() == '{"tool_name": "Read"}'
+
+
+def test_run_hook_captures_output_and_exit_code(monkeypatch):
+    def main():
+        data = json.loads(sys.stdin.read())
+        sys.stdout.write(f"saw {data['tool_name']}\n")
+        sys.stderr.write("warned\n")
+        sys.exit(2)
+
+    monkeypatch.setitem(sys.modules, "demo_hook", types.SimpleNamespace(main=main))
+    monkeypatch.setitem(daemon.HOOK_MODULES, "demo", "demo_hook")
+    result = daemon.run_hook("demo", '{"tool_name": "Write"}')
+    assert result == {"exit": 2, "stdout": "saw Write\n", "stderr": "warned\n"}
+
+
+def test_run_hook_unknown_hook_falls_back():
+    assert daemon.run_hook("nope", "{}") == {"fallback": True}
+
+
+def test_daemon_serves_hook(tmp_path, running_daemon):
+    served = _run_hook("pre_tool_use", SECRET_BASH, tmp_path)
+    direct = _run_hook("pre_tool_use", SECRET_BASH, tmp_path, VIBESRAILS_NO_DAEMON="1")
+    assert served.returncode == direct.returncode == 1
+    assert served.stdout == direct.stdout
+    assert "BLOCKED" in served.stdout
+
+
+def test_other_project_falls_back_in_process(tmp_path, running_daemon):
+    other = tmp_path / "sub"
+    (other / ".vibesrails").mkdir(parents=True)
+    # Same socket, but requests from another directory are not served
+    (other / ".vibesrails" / "hookd.sock").symlink_to(running_daemon)
+    result = _run_hook("pre_tool_use", SECRET_BASH, other)
+    assert result.returncode == 1
+    assert "BLOCKED" in result.stdout
+
+
+def test_socket_removed_on_shutdown(tmp_path):
+    proc = subprocess.Popen(
+        [sys.executable, "-c",
+         "from pathlib import Path; from vibesrails.hooks.daemon import serve; "
+         "raise SystemExit(serve(Path('.'), idle_timeout=0.5))"],
+        cwd=tmp_path, env=_env(),
+    )
+    assert proc.wait(timeout=30) == 0
+    assert not (tmp_path / ".vibesrails" / "hookd.sock").exists()
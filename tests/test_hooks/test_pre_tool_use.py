@@ -457,6 +457,23 @@ class TestFileSizeGuard:
         assert "BLOCKED" in result.stdout
         assert "500 lines" in result.stdout
 
+    @pytest.mark.parametrize("warm", [False, True])
+    def test_max_file_lines_from_extends(self, tmp_path, monkeypatch, warm):
+        """Cold (no snapshot) and warm (snapshot) lookups both apply extends."""
+        from vibesrails.config import load_config_with_extends
+        from vibesrails.hooks.pre_tool_use import _load_max_file_lines
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "base.yaml").write_text("guardian:\n  max_file_lines: 500\n")
+        (tmp_path / "vibesrails.yaml").write_text('extends: "./base.yaml"\n')
+        if warm:
+            load_config_with_extends(tmp_path / "vibesrails.yaml")
+        assert ((tmp_path / ".vibesrails" / "config.cache").exists()) is warm
+        assert _load_max_file_lines() == 500
+        # The cold lookup leaves a snapshot for the next hook
+        assert (tmp_path / ".vibesrails" / "config.cache").exists()
+        assert _load_max_file_lines() == 500
+
     def test_custom_max_file_lines_passes(self, tmp_path):
         """Custom max_file_lines: 500 allows 400-line files."""
         config = tmp_path / "vibesrails.yaml"
@@ -0,0 +1,151 @@
+"""Tests for vibesrails.hooks.session_scan incremental mode."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+
+import pytest
+
+from vibesrails.hooks import session_scan
+
+BAD = "def f():\n    try:\n        pass\n    except:\n        pass\n"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.py").write_text(BAD)
+    (tmp_path / "b.py").write_text("x = 1\n")
+    return tmp_path
+
+
+def _run(capsys) -> str:
+    with pytest.raises(SystemExit):
+        session_scan.main()
+    return capsys.readouterr().out
+
+
+def _count_scans(monkeypatch) -> list[str]:
+    scanned: list[str] = []
+    real = session_scan._scan_file
+
+    def spy(dispatcher, senior_guards, module, rel):
+        scanned.append(rel)
+        return real(dispatcher, senior_guards, module, rel)
+
+    monkeypatch.setattr(session_scan, "_scan_file", spy)
+    return scanned
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=root, check=True, capture_output=True,
+    )
+
+
+def test_warm_run_reuses_findings(project, capsys, monkeypatch):
+    cold = _run(capsys)
+    scanned = _count_scans(monkeypatch)
+    assert _run(capsys) == cold
+    assert scanned == []
+
+
+def test_only_changed_files_are_rescanned(project, capsys, monkeypatch):
+    _run(capsys)
+    scanned = _count_scans(monkeypatch)
+    (project / "b.py").write_text("y = 2\n")
+    _run(capsys)
+    assert scanned == ["b.py"]
+
+
+def test_touched_but_identical_file_is_not_rescanned(project, capsys, monkeypatch):
+    _run(capsys)
+    scanned = _count_scans(monkeypatch)
+    os.utime(project / "a.py", ns=(1, 1))
+    _run(capsys)
+    assert scanned == []
+
+
+def test_output_matches_uncached_scan(project, capsys, monkeypatch):
+    _run(capsys)
+    cached = _run(capsys)
+    monkeypatch.setenv("VIBESRAILS_SESSION_CACHE", "0")
+    assert _run(capsys) == cached
+    assert (project / ".vibesrails" / "cache" / "session_scan.json").exists()
+
+
+def test_git_changes_force_rehash(project, capsys, monkeypatch):
+    _git(project, "init", "-q")
+    _git(project, "add", "a.py", "b.py")
+    _git(project, "commit", "-qm", "init")
+    _run(capsys)
+    # Same size and mtime as before, but git knows the file changed
+    st = (project / "b.py").stat()
+    (project / "b.py").write_text("z = 3\n")
+    os.utime(project / "b.py", ns=(st.st_atime_ns, st.st_mtime_ns))
+    scanned = _count_scans(monkeypatch)
+    _run(capsys)
+    assert scanned == ["b.py"]
+
+
+def test_deleted_files_are_dropped(project, capsys):
+    _run(capsys)
+    (project / "b.py").unlink()
+    _run(capsys)
+    assert "b.py" not in (project / ".vibesrails" / "cache" / "session_scan.json").read_text()
+
+
+@pytest.mark.parametrize("where", ["project", "site-packages"])
+def test_new_module_between_sessions_updates_findings(project, capsys, monkeypatch, tmp_path, where):
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.syspath_prepend(str(project))
+    (project / "c.py").write_text("import vibes_late_helper\n")
+    assert "vibes_late_helper" in _run(capsys)
+    # Installed (or written) after the first session; c.py itself is unchanged
+    (site if where == "site-packages" else project).joinpath("vibes_late_helper.py").write_text("")
+    scanned = _count_scans(monkeypatch)
+    assert "vibes_late_helper" not in _run(capsys)
+    assert "c.py" in scanned
+
+
+def test_parallel_scan_matches_serial(project, capsys, monkeypatch):
+    for i in range(2 * session_scan.MIN_FILES_PER_WORKER):
+        (project / f"m{i:02d}.py").write_text(BAD if i % 3 else "x = 1\n")
+    monkeypatch.setenv("VIBESRAILS_SESSION_CACHE", "0")
+    monkeypatch.setenv("VIBESRAILS_SESSION_JOBS", "1")
+    serial = _run(capsys)
+    monkeypatch.setenv("VIBESRAILS_SESSION_JOBS", "2")
+    assert _run(capsys) == serial
+    assert "BLOCKING issues" in serial or "Top warnings" in serial
+
+
+def test_pool_failure_falls_back_to_serial(project, capsys, monkeypatch):
+    for i in range(2 * session_scan.MIN_FILES_PER_WORKER):
+        (project / f"m{i:02d}.py").write_text(BAD)
+    monkeypatch.setenv("VIBESRAILS_SESSION_CACHE", "0")
+    monkeypatch.setenv("VIBESRAILS_SESSION_JOBS", "1")
+    serial = _run(capsys)
+
+    def no_pool(*args, **kwargs):
+        raise OSError("no processes here")
+
+    monkeypatch.setattr(session_scan, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setenv("VIBESRAILS_SESSION_JOBS", "4")
+    out = _run(capsys)
+    assert "scanning serially" in out  # debug log, routed to stdout in tests
+    assert out.endswith(serial)
+
+
+@pytest.mark.parametrize("value,expected", [("3", 3), ("junk", 1)])
+def test_session_jobs_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv("VIBESRAILS_SESSION_JOBS", value)
+    assert session_scan.session_jobs() == expected
+
+
+def test_session_jobs_defaults_to_all_cores(monkeypatch):
+    monkeypatch.delenv("VIBESRAILS_SESSION_JOBS", raising=False)
+    assert session_scan.session_jobs() == (os.cpu_count() or 1)
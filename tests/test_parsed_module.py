@@ -0,0 +1,73 @@
+"""Tests for vibesrails.parsed_module — one parse shared across guards."""
+
+import ast
+from unittest.mock import patch
+
+from vibesrails.guards_v2.complexity import ComplexityGuard
+from vibesrails.guards_v2.dead_code import DeadCodeGuard
+from vibesrails.guards_v2.observability import ObservabilityGuard
+from vibesrails.guards_v2.type_safety import TypeSafetyGuard
+from vibesrails.hooks.post_tool_use import _run_senior_guards, _run_v2_guards
+from vibesrails.parsed_module import ParsedModule
+
+SOURCE = '''import os
+
+
+def public(x):
+    try:
+        return os.path.join(x, "a")
+    except:
+        pass
+
+
+class Settings:
+    api_key: str = ""
+'''
+
+
+def test_views_are_computed_lazily_and_cached():
+    module = ParsedModule("mod.py", SOURCE)
+    with patch("vibesrails.parsed_module.ast.parse", wraps=ast.parse) as spy:
+        assert module.tree is module.tree
+        assert module.walk is module.walk
+    assert spy.call_count == 1
+    assert module.lines[0] == "import os"
+
+
+def test_nodes_by_type_follow_walk_order():
+    module = ParsedModule("mod.py", SOURCE)
+    funcs = module.nodes(ast.FunctionDef)
+    assert [f.name for f in funcs] == ["public"]
+    mixed = module.nodes(ast.ClassDef, ast.FunctionDef)
+    assert [n.name for n in mixed] == ["public", "Settings"]
+    assert isinstance(module.parents[funcs[0]], ast.Module)
+
+
+def test_syntax_error_gives_no_tree():
+    module = ParsedModule("bad.py", "def (:\n")
+    assert module.tree is None
+    assert module.walk == []
+    assert module.nodes(ast.FunctionDef) == []
+
+
+def test_read_missing_file(tmp_path):
+    assert ParsedModule.read(tmp_path / "missing.py") is None
+
+
+def test_scan_parsed_matches_scan_file(tmp_path):
+    path = tmp_path / "mod.py"
+    module = ParsedModule(path, SOURCE)
+    for guard_cls in (DeadCodeGuard, ObservabilityGuard, ComplexityGuard, TypeSafetyGuard):
+        guard = guard_cls()
+        assert guard.scan_parsed(module) == guard.scan_file(path, SOURCE)
+
+
+def test_hook_guards_parse_file_once(tmp_path):
+    path = tmp_path / "mod.py"
+    module = ParsedModule(path, SOURCE)
+    with patch("vibesrails.parsed_module.ast.parse", wraps=ast.parse) as spy:
+        v2_lines = _run_v2_guards(module)
+        senior_lines = _run_senior_guards(module, str(path))
+    assert spy.call_count == 1
+    assert any("[type-safety]" in line for line in v2_lines)
+    assert any("[ErrorHandlingGuard]" in line for line in senior_lines)
@@ -3,6 +3,7 @@
 import subprocess
 from unittest import mock
 
+from vibesrails.git_snapshot import parse_status_v2
 from vibesrails.preflight import (
     CheckResult,
     check_ahead_behind,
@@ -560,13 +561,15 @@ def test_check_session_mode_forced(tmp_path):
 
 def test_check_session_mode_mixed_no_thresholds(tmp_path):
     """MIXED mode shows no threshold adjustments."""
-    with mock.patch("vibesrails.context.detector.run_git") as mock_git:
-        mock_git.side_effect = [
-            (True, "main"),      # branch → unknown → 0.5
-            (True, ""),          # status (clean)
-            (False, ""),         # diff fails
-            (True, ""),          # log (no recent commits)
-        ]
+    # branch "main" → unknown → 0.5, clean tree, diff fails
+    status = parse_status_v2("# branch.oid abc\0# branch.head main\0")
+    snapshot = mock.Mock(status=status)
+    snapshot.diff.return_value = None
+    with mock.patch(
+        "vibesrails.context.detector.git_snapshot", return_value=snapshot,
+    ), mock.patch(
+        "vibesrails.context.detector.run_git", return_value=(True, ""),  # no recent commits
+    ):
         results = check_session_mode(tmp_path)
     # MIXED mode → only the session mode line, no threshold lines
     threshold_results = [r for r in results if r.name == "Threshold"]
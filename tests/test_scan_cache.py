@@ -0,0 +1,95 @@
+"""Tests for vibesrails scan_cache — content-hash incremental scan cache."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from vibesrails.scan_cache import ScanCache, config_fingerprint, file_digest
+from vibesrails.scan_runner import _run_vibesrails_scan
+from vibesrails.scanner import ScanResult
+
+
+@pytest.fixture
+def in_tmp(tmp_path):
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    yield tmp_path
+    os.chdir(original_cwd)
+
+
+def _result(path, line=1):
+    return ScanResult(path, line, "test_secret", "Hardcoded password", "BLOCK")
+
+
+def test_roundtrip_for_unchanged_file(sample_config, in_tmp):
+    (in_tmp / "a.py").write_text("x = 1\n")
+    digest = file_digest("a.py")
+
+    cache = ScanCache(sample_config)
+    cache.put("a.py", digest, [_result("a.py", 3)])
+    cache.save()
+
+    reloaded = ScanCache(sample_config)
+    assert reloaded.get("a.py", digest) == [_result("a.py", 3)]
+    assert reloaded.hits == 1
+
+
+def test_changed_content_is_a_miss(sample_config, in_tmp):
+    (in_tmp / "a.py").write_text("x = 1\n")
+    cache = ScanCache(sample_config)
+    cache.put("a.py", file_digest("a.py"), [])
+    cache.save()
+
+    (in_tmp / "a.py").write_text("x = 2\n")
+    assert ScanCache(sample_config).get("a.py", file_digest("a.py")) is None
+
+
+def test_config_change_discards_entries(sample_config, in_tmp):
+    (in_tmp / "a.py").write_text("x = 1\n")
+    digest = file_digest("a.py")
+    cache = ScanCache(sample_config)
+    cache.put("a.py", digest, [])
+    cache.save()
+
+    changed = {**sample_config, "complexity": {"max_file_lines": 10}}
+    assert config_fingerprint(changed) != config_fingerprint(sample_config)
+    assert ScanCache(changed).get("a.py", digest) is None
+
+
+def test_save_evicts_deleted_files_and_caps_size(sample_config, in_tmp):
+    for name in ("a.py", "b.py", "c.py"):
+        (in_tmp / name).write_text(name)
+    cache = ScanCache(sample_config, max_entries=2)
+    for name in ("a.py", "b.py", "c.py", "gone.py"):
+        cache.put(name, "digest", [])
+    cache.save()
+
+    reloaded = ScanCache(sample_config, max_entries=2)
+    assert reloaded.get("gone.py", "digest") is None
+    kept = [n for n in ("a.py", "b.py", "c.py") if reloaded.get(n, "digest") is not None]
+    assert len(kept) == 2
+
+
+def test_run_vibesrails_scan_reuses_cache(sample_config, in_tmp):
+    (in_tmp / "bad.py").write_text('password = "secret123"\n')
+    first, _, _ = _run_vibesrails_scan(sample_config, ["bad.py"])
+    assert [r.pattern_id for r in first] == ["test_secret"]
+
+    with patch("vibesrails.scan_runner.scan_file") as mock_scan:
+        second, _, _ = _run_vibesrails_scan(sample_config, ["bad.py"])
+    mock_scan.assert_not_called()
+    assert second == first
+
+
+def test_run_vibesrails_scan_without_cache(sample_config, in_tmp):
+    (in_tmp / "bad.py").write_text('password = "secret123"\n')
+    _run_vibesrails_scan(sample_config, ["bad.py"], use_cache=False)
+    assert not (in_tmp / ".vibesrails" / "cache").exists()
+
+
+def test_cache_disabled_in_config(sample_config, in_tmp):
+    (in_tmp / "bad.py").write_text('password = "secret123"\n')
+    config = {**sample_config, "scan_cache": {"enabled": False}}
+    _run_vibesrails_scan(config, ["bad.py"])
+    assert not (in_tmp / ".vibesrails" / "cache").exists()
@@ -0,0 +1,56 @@
+"""Tests for vibesrails scan_parallel — process pool file scanning."""
+
+import os
+
+import pytest
+
+from vibesrails.scan_parallel import resolve_jobs, scan_files_parallel
+from vibesrails.scan_runner import _run_vibesrails_scan
+from vibesrails.scanner import scan_file
+
+
+@pytest.fixture
+def project(tmp_path):
+    original_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    files = []
+    for i in range(20):
+        path = tmp_path / f"mod_{i:02d}.py"
+        body = 'password = "secret123"\n' if i % 3 == 0 else "x = 1\n"
+        path.write_text(body * (i + 1))
+        files.append(path.name)
+    yield files
+    os.chdir(original_cwd)
+
+
+def test_resolve_jobs_cli_overrides_config():
+    assert resolve_jobs({"scan_jobs": 4}, 2) == 2
+    assert resolve_jobs({"scan_jobs": 4}) == 4
+    assert resolve_jobs({}) == 1
+
+
+def test_resolve_jobs_zero_means_all_cores():
+    assert resolve_jobs({}, 0) == (os.cpu_count() or 1)
+
+
+def test_resolve_jobs_invalid_value_falls_back_to_serial():
+    assert resolve_jobs({"scan_jobs": "many"}) == 1
+
+
+def test_parallel_results_match_serial_order(sample_config, project):
+    serial = [scan_file(f, sample_config) for f in project]
+    parallel = scan_files_parallel(project, sample_config, jobs=2)
+    assert parallel == serial
+
+
+def test_small_file_list_stays_in_process(sample_config, project):
+    assert scan_files_parallel(project[:3], sample_config, jobs=8) == [
+        scan_file(f, sample_config) for f in project[:3]
+    ]
+
+
+def test_run_vibesrails_scan_with_jobs_is_deterministic(sample_config, project):
+    serial, _, _ = _run_vibesrails_scan(sample_config, project, use_cache=False, jobs=1)
+    parallel, _, _ = _run_vibesrails_scan(sample_config, project, use_cache=False, jobs=3)
+    assert parallel == serial
+    assert len(serial) == sum(i + 1 for i in range(0, 20, 3))
@@ -0,0 +1,105 @@
+"""Tests for vibesrails scanner_engine — compiled single-pass pattern matching."""
+
+from vibesrails.scanner_engine import (
+    clear_cache,
+    compile_config,
+    compile_pattern,
+    compile_patterns,
+)
+
+
+def _pattern(pid, regex, **extra):
+    return {"id": pid, "name": pid, "regex": regex, "message": f"{pid} found", **extra}
+
+
+# ============================================
+# Compilation
+# ============================================
+
+
+def test_compile_pattern_invalid_regex_returns_none():
+    assert compile_pattern(_pattern("bad", "[invalid"), "WARN") is None
+
+
+def test_compile_pattern_invalid_exclude_is_ignored():
+    cp = compile_pattern(_pattern("p", "foo", exclude_regex="[bad"), "WARN")
+    assert cp is not None
+    assert cp.exclude is None
+
+
+def test_compile_pattern_malformed_returns_none():
+    assert compile_pattern({"regex": "foo"}, "WARN") is None
+    assert compile_pattern({"id": "x"}, "WARN") is None
+    assert compile_pattern("not a dict", "WARN") is None
+
+
+def test_compile_config_is_cached():
+    clear_cache()
+    config = {"blocking": [_pattern("a", "foo")], "warning": []}
+    first = compile_config(config)
+    assert compile_config(dict(config)) is first
+
+
+def test_compile_config_recompiles_on_pattern_change():
+    clear_cache()
+    config = {"blocking": [_pattern("a", "foo")], "warning": []}
+    first = compile_config(config)
+    config["blocking"].append(_pattern("b", "bar"))
+    assert compile_config(config) is not first
+
+
+def test_backreference_pattern_kept_out_of_prefilter():
+    pattern_set = compile_patterns([_pattern("rep", r"(\w)\1\1"), _pattern("x", "xyz")], "WARN")
+    assert pattern_set.prefilter is not None
+    assert pattern_set.prefilter.search("aaa") is None
+    results = pattern_set.scan_lines(["zzz = 1", "xyz"], "mod.py", set())
+    assert [r.pattern_id for r in results] == ["rep", "x"]
+
+
+# ============================================
+# Single-pass scanning
+# ============================================
+
+
+def test_scan_lines_orders_by_pattern_then_line():
+    config = {
+        "blocking": [_pattern("secret", r"password\s*=")],
+        "warning": [_pattern("todo", r"TODO")],
+    }
+    lines = ["# TODO", "password = 1", "x = 2", "password = 3  # TODO"]
+    results = compile_config(config).scan_lines(lines, "mod.py", set())
+    assert [(r.pattern_id, r.line, r.level) for r in results] == [
+        ("secret", 2, "BLOCK"),
+        ("secret", 4, "BLOCK"),
+        ("todo", 1, "WARN"),
+        ("todo", 4, "WARN"),
+    ]
+
+
+def test_scan_lines_case_insensitive_flag_is_scoped():
+    config = {
+        "blocking": [_pattern("ci", "secret", flags="i")],
+        "warning": [_pattern("cs", "token")],
+    }
+    results = compile_config(config).scan_lines(["SECRET", "TOKEN"], "mod.py", set())
+    assert [r.pattern_id for r in results] == ["ci"]
+
+
+def test_scan_lines_respects_exclude_regex():
+    config = {"blocking": [_pattern("yaml", r"yaml\.load\(", exclude_regex=r"Loader\s*=")]}
+    lines = ["yaml.load(f)", "yaml.load(f, Loader=SafeLoader)"]
+    results = compile_config(config).scan_lines(lines, "mod.py", set())
+    assert [r.line for r in results] == [1]
+
+
+def test_scan_lines_skips_comments_for_code_only_patterns():
+    config = {"blocking": [_pattern("hardcoded_secret", r"password\s*=")]}
+    lines = ['# password = "x"', 'password = "x"']
+    results = compile_config(config).scan_lines(lines, "mod.py", set())
+    assert [r.line for r in results] == [2]
+
+
+def test_scan_lines_truncates_long_lines():
+    config = {"warning": [_pattern("tail", "target")]}
+    results = compile_config(config).scan_lines(["x" * 20_000 + "target"], "mod.py", set())
+    assert results == []
@@ -0,0 +1,55 @@
+"""Tests for the trigram similarity index (vibesrails/similarity_index.py)."""
+
+import random
+import string
+
+import pytest
+
+from vibesrails.guards_v2.dependency_audit_checks import _levenshtein
+from vibesrails.similarity_index import SimilarityIndex, bounded_levenshtein
+
+
+def _random_names(seed, count):
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + "-"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 12)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("limit", [0, 1, 2, 3])
+def test_bounded_levenshtein_matches_full(limit):
+    rng = random.Random(limit)
+    for _ in range(300):
+        a, b = rng.sample(_random_names(rng.random(), 20), 2)
+        assert bounded_levenshtein(a, b, limit) == min(_levenshtein(a, b), limit + 1)
+
+
+@pytest.mark.parametrize("max_distance", [1, 2])
+def test_search_matches_brute_force(max_distance):
+    names = _random_names(1, 1500)
+    index = SimilarityIndex(names)
+    rng = random.Random(2)
+    queries = [rng.choice(names) for _ in range(50)]
+    # Mutate some queries so they are near, but not equal to, indexed names
+    queries += [q[:-1] + "x" for q in queries[:25]] + ["ab", "zz-top", "q"]
+    first_seen = {}
+    for i, n in enumerate(names):
+        first_seen.setdefault(n, i)
+    for query in queries:
+        expected = sorted(
+            (d, first_seen[n]) for n in first_seen
+            if (d := _levenshtein(query, n)) <= max_distance
+        )
+        got = index.search(query, max_distance)
+        assert [(d, first_seen[n]) for n, d in got] == expected
+
+
+def test_top_k_prefers_closest_then_earliest():
+    index = SimilarityIndex(["requestz", "requests", "request", "flask"])
+    assert index.search("requestss", 2, limit=1) == [("requests", 1)]
+    # requestz and request are both 2 edits away: earlier entry first
+    assert index.search("requestss", 2) == [("requests", 1), ("requestz", 2), ("request", 2)]
+    assert "requests" in index
+    assert len(index) == 4
@@ -0,0 +1,61 @@
+"""Tests for startup profiling and the hook cold-start budget."""
+
+import pytest
+
+import vibesrails
+from vibesrails.startup_profile import (
+    HOOK_IMPORT_BUDGET_MS,
+    entry_cost_ms,
+    format_report,
+    parse_importtime,
+    profile_import,
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:       300 |        300 |     yaml.error
+import time:      2000 |       2300 |   yaml
+import time:       500 |       2800 | demo.hook
+"""
+
+HEAVY_MODULES = {"yaml", "vibesrails.scanner", "vibesrails.scan_runner", "vibesrails.learner"}
+
+
+def test_parse_importtime():
+    costs = parse_importtime(SAMPLE)
+    assert [(c.module, c.depth) for c in costs] == [
+        ("_io", 0), ("yaml.error", 2), ("yaml", 1), ("demo.hook", 0),
+    ]
+    assert entry_cost_ms(costs, "demo.hook") == 2.8
+    assert entry_cost_ms(costs, "missing") == 0.0
+
+
+def test_report_only_lists_entry_point_imports():
+    report = format_report("demo.hook", parse_importtime(SAMPLE))
+    assert report.splitlines()[0] == "demo.hook: 2.8 ms"
+    assert "yaml" in report
+    assert "_io" not in report
+
+
+def test_package_exports_load_on_access():
+    from vibesrails.scanner import scan_file
+
+    assert vibesrails.scan_file is scan_file
+    with pytest.raises(AttributeError):
+        vibesrails.not_an_export  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    "module", ["vibesrails.hooks.pre_tool_use", "vibesrails.hooks.post_tool_use"],
+)
+def test_hook_cold_start_within_budget(module):
+    costs = profile_import(module)
+    imported = {c.module for c in costs}
+    assert not HEAVY_MODULES & imported
+    assert entry_cost_ms(costs, module) <= HOOK_IMPORT_BUDGET_MS
+
+
+def test_cli_import_skips_scanner():
+    imported = {c.module for c in profile_import("vibesrails.cli")}
+    assert not HEAVY_MODULES & imported
@@ -0,0 +1,118 @@
+"""Tests for storage/connection.py — pooled per-thread SQLite connections."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import storage.connection as connection  # noqa: E402
+from storage.connection import close_all, connect, ensure_schema  # noqa: E402
+
+
+class TestConnect:
+    """Tests for connect()."""
+
+    def test_connection_is_reused_after_close(self, tmp_path):
+        db = tmp_path / "pool.db"
+        c1 = connect(db)
+        c1.close()
+        c2 = connect(db)
+        c2.close()
+        assert c1 is c2
+        close_all()
+
+    def test_pragmas_applied(self, tmp_path):
+        conn = connect(tmp_path / "pool.db")
+        try:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8192
+        finally:
+            conn.close()
+        close_all()
+
+    def test_close_rolls_back_uncommitted_work(self, tmp_path):
+        db = tmp_path / "pool.db"
+        conn = connect(db)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.close()
+        conn = connect(db)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        finally:
+            conn.close()
+        close_all()
+
+    def test_nested_use_gets_private_connection(self, tmp_path):
+        db = tmp_path / "pool.db"
+        outer = connect(db)
+        inner = connect(db)
+        assert inner is not outer
+        inner.close()
+        outer.execute("SELECT 1")  # still usable
+        outer.close()
+        close_all()
+
+    def test_threads_get_their_own_connection(self, tmp_path):
+        db = tmp_path / "pool.db"
+        main = connect(db)
+        main.close()
+        seen = []
+
+        def worker():
+            conn = connect(db)
+            seen.append(conn)
+            conn.close()
+            close_all()
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert seen[0] is not main
+        close_all()
+
+    def test_replaced_file_is_reopened(self, tmp_path):
+        db = tmp_path / "pool.db"
+        conn = connect(db)
+        conn.execute("CREATE TABLE old (x)")
+        conn.commit()
+        conn.close()
+        db.unlink()
+        sqlite3.connect(str(db)).close()
+        fresh = connect(db)
+        try:
+            assert fresh is not conn
+            tables = fresh.execute("SELECT name FROM sqlite_master").fetchall()
+            assert tables == []
+        finally:
+            fresh.close()
+        close_all()
+
+    def test_pool_is_bounded(self, tmp_path):
+        conns = []
+        for i in range(connection.MAX_CONNECTIONS_PER_THREAD + 3):
+            conn = connect(tmp_path / f"db{i}.db")
+            conn.close()
+            conns.append(conn)
+        assert len(connection._pool()) == connection.MAX_CONNECTIONS_PER_THREAD
+        close_all()
+
+
+class TestEnsureSchema:
+    """Tests for ensure_schema()."""
+
+    def test_migrates_once_per_file(self, tmp_path):
+        db = tmp_path / "schema.db"
+        with patch("storage.connection.migrate", wraps=connection.migrate) as spy:
+            ensure_schema(db)
+            ensure_schema(db)
+            assert spy.call_count == 1
+            db.unlink()
+            ensure_schema(db)
+            assert spy.call_count == 2
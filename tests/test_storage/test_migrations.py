@@ -19,6 +19,7 @@ from storage.migrations import (  # noqa: E402
 EXPECTED_TABLES = {
     "meta", "sessions", "violations", "drift_snapshots", "package_cache",
     "brief_history", "learning_events", "developer_profile",
+    "learning_counters", "learning_session_stats", "learning_tallies",
 }
 
 
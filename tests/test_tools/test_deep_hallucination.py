@@ -183,3 +183,69 @@ class TestResultStructure:
         db = tmp_path / "test.db"
         result = deep_hallucination(file_path=str(f), max_level=1, db_path=str(db))
         assert result["imports_checked"] == 0
+
+
+# ── Project (batch) mode ─────────────────────────────────────────────
+
+
+class TestProjectMode:
+    """Tests for project_path: one report, each module resolved once."""
+
+    def _project(self, tmp_path: Path) -> Path:
+        proj = tmp_path / "proj"
+        (proj / "pkg").mkdir(parents=True)
+        (proj / "pkg" / "__init__.py").write_text("")
+        (proj / "pkg" / "a.py").write_text("import os\nimport ghost_pkg_one\nfrom pkg import b\n")
+        (proj / "pkg" / "b.py").write_text("import ghost_pkg_one\nimport ghost_pkg_two\n")
+        (proj / "main.py").write_text("import pkg\nimport helpers\n")
+        (proj / "helpers.py").write_text("")
+        hidden = proj / ".venv" / "lib"
+        hidden.mkdir(parents=True)
+        (hidden / "skip.py").write_text("import ghost_pkg_three\n")
+        return proj
+
+    def test_single_report_for_project(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        proj = self._project(tmp_path)
+        calls = []
+
+        def fake_urlopen(req, timeout):
+            calls.append(req.full_url)
+            resp = type("Resp", (), {"status": 404})()
+            return type("Ctx", (), {
+                "__enter__": lambda self: resp,
+                "__exit__": lambda *a: None,
+            })()
+
+        with patch("core.hallucination_deep.urllib.request.urlopen", side_effect=fake_urlopen):
+            result = deep_hallucination(
+                project_path=str(proj), max_level=2, db_path=str(tmp_path / "t.db"),
+            )
+        assert result["files_checked"] == 5
+        assert result["imports_checked"] == 7
+        # Project modules (pkg, helpers) are local; each ghost is looked up once
+        assert sorted(calls) == [
+            "https://pypi.org/pypi/ghost_pkg_one/json",
+            "https://pypi.org/pypi/ghost_pkg_two/json",
+        ]
+        flagged = sorted((h["file"], h["module"]) for h in result["hallucinations"])
+        assert flagged == [
+            ("pkg/a.py", "ghost_pkg_one"),
+            ("pkg/b.py", "ghost_pkg_one"),
+            ("pkg/b.py", "ghost_pkg_two"),
+        ]
+
+    def test_second_run_served_from_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        proj = self._project(tmp_path)
+        db = str(tmp_path / "t.db")
+        with patch("core.hallucination_deep.urllib.request.urlopen", side_effect=_mock_urlopen_200):
+            deep_hallucination(project_path=str(proj), db_path=db)
+        with patch("core.hallucination_deep.urllib.request.urlopen") as mock_open:
+            result = deep_hallucination(project_path=str(proj), db_path=db)
+        mock_open.assert_not_called()
+        assert result["status"] == "pass"
+
+    def test_requires_a_path(self, tmp_path):
+        result = deep_hallucination(db_path=str(tmp_path / "t.db"))
+        assert result["status"] == "error"
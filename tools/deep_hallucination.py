@@ -9,11 +9,13 @@ from __future__ import annotations
 import ast
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 
 from core.hallucination_deep import DeepHallucinationChecker
 from core.input_validator import InputValidationError, validate_enum, validate_int
 from core.learning_bridge import record_safe
 from core.path_validator import PathValidationError, validate_path
+from vibesrails.file_index import get_index
 
 from .deep_hallucination_pedagogy import (
     error_result as _error_result,
@@ -82,25 +84,68 @@ def _parse_imports(source: str) -> list[_ParsedImport]:
     return imports
 
 
+# ── Project walk ──────────────────────────────────────────────────────
+
+_MAX_PROJECT_FILES = 2000
+_MAX_FILE_BYTES = 10 * 1024 * 1024
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules", "site-packages", "venv", "env"})
+
+
+def _project_files(root: Path) -> list[Path]:
+    """Python files under root, skipping hidden, cache and virtualenv dirs."""
+    files: list[Path] = []
+    for entry in get_index(root).match("*.py"):
+        parts = entry.rel.split("/")[:-1]
+        if any(p.startswith(".") or p in _SKIP_DIRS for p in parts):
+            continue
+        # Same limits as a single file: no symlinks out of the tree, no huge files
+        py_file = root / entry.rel
+        if entry.size > _MAX_FILE_BYTES or py_file.is_symlink():
+            continue
+        files.append(py_file)
+        if len(files) >= _MAX_PROJECT_FILES:
+            break
+    return files
+
+
+def _local_modules(root: Path, files: list[Path]) -> set[str]:
+    """Top-level module names provided by the project itself (root or src/)."""
+    local: set[str] = set()
+    for py_file in files:
+        parts = py_file.relative_to(root).parts
+        if parts[0] == "src" and len(parts) > 1:
+            parts = parts[1:]
+        local.add(parts[0][:-3] if len(parts) == 1 else parts[0])
+    return local
+
+
 # ── Core logic ────────────────────────────────────────────────────────
 
 def deep_hallucination(
-    file_path: str,
+    file_path: str | None = None,
     max_level: int = 2,
     ecosystem: str = "pypi",
     db_path: str | None = None,
+    project_path: str | None = None,
 ) -> dict:
-    """Analyze a Python file for hallucinated imports at multiple verification levels.
+    """Analyze a Python file or project for hallucinated imports at multiple levels.
+
+    Each distinct top-level module is resolved once: level 1 per module,
+    then one batched level 2 lookup (single cache query, concurrent
+    registry requests) for everything not found locally.
 
     Args:
         file_path: Path to the Python file to analyze.
         max_level: Maximum verification level (1-4, default 2).
         ecosystem: Package ecosystem ("pypi", default "pypi").
         db_path: SQLite DB path override (for testing).
+        project_path: Analyze every Python file under this directory
+            instead (takes precedence over file_path). Modules provided
+            by the project itself count as local.
 
     Returns:
         Dict with status, imports_checked, hallucinations, verified,
-        unverifiable, pedagogy.
+        unverifiable, pedagogy (plus files_checked for a project).
     """
     # Validate inputs
     try:
@@ -112,19 +157,31 @@ def deep_hallucination(
     max_level = max(1, min(4, max_level))
 
     try:
-        fp = validate_path(
-            file_path, must_exist=True, must_be_file=True,
-            max_size_mb=10, allowed_extensions={".py"},
-        )
+        if project_path:
+            root = validate_path(project_path, must_exist=True, must_be_dir=True)
+            files = _project_files(root)
+        elif file_path:
+            fp = validate_path(
+                file_path, must_exist=True, must_be_file=True,
+                max_size_mb=10, allowed_extensions={".py"},
+            )
+            root, files = fp.parent, [fp]
+        else:
+            return _error_result("Either file_path or project_path is required.")
     except PathValidationError as exc:
         return _error_result(str(exc))
 
-    try:
-        source = fp.read_text()
-    except OSError as exc:
-        return _error_result(f"Cannot read file: {exc}")
+    imports: list[tuple[str | None, _ParsedImport]] = []
+    for py_file in files:
+        try:
+            source = py_file.read_text()
+        except (OSError, UnicodeDecodeError) as exc:
+            if not project_path:
+                return _error_result(f"Cannot read file: {exc}")
+            continue
+        rel = str(py_file.relative_to(root)) if project_path else None
+        imports.extend((rel, imp) for imp in _parse_imports(source))
 
-    imports = _parse_imports(source)
     if not imports:
         return {
             "status": "pass",
@@ -139,15 +196,33 @@ def deep_hallucination(
         }
 
     checker = DeepHallucinationChecker(
-        db_path=db_path, project_path=str(fp.parent),
+        db_path=db_path, project_path=str(root),
     )
 
+    # Resolve each distinct top-level module once
+    project_modules = _local_modules(root, files) if project_path else set()
+    exists_locally = {
+        module: module in project_modules or checker.check_import_exists(module)
+        for module in dict.fromkeys(imp.module for _, imp in imports)
+    }
+    registry: dict[str, dict] = {}
+    if max_level >= 2:
+        registry = checker.check_packages_registry(
+            [m for m, found in exists_locally.items() if not found], ecosystem,
+        )
+
     hallucinations: list[dict] = []
     verified: list[dict] = []
     unverifiable: list[dict] = []
 
-    for imp in imports:
-        result = _check_import(checker, imp, max_level, ecosystem)
+    for rel, imp in imports:
+        result = _check_import(
+            checker, imp, max_level, ecosystem,
+            exists_locally=exists_locally[imp.module],
+            registry=registry.get(imp.module),
+        )
+        if rel is not None:
+            result["file"] = rel
         if result["category"] == "hallucination":
             hallucinations.append(result)
         elif result["category"] == "verified":
@@ -161,7 +236,7 @@ def deep_hallucination(
     for h in hallucinations:
         record_safe(None, "hallucination", {"module": h["module"]})
 
-    return {
+    report = {
         "status": status,
         "imports_checked": len(imports),
         "hallucinations": hallucinations,
@@ -179,6 +254,9 @@ def deep_hallucination(
             ),
         },
     }
+    if project_path:
+        report["files_checked"] = len(files)
+    return report
 
 
 def _check_import(
@@ -186,12 +264,19 @@ def _check_import(
     imp: _ParsedImport,
     max_level: int,
     ecosystem: str,
+    exists_locally: bool | None = None,
+    registry: dict | None = None,
 ) -> dict:
-    """Run multi-level checks on a single import."""
+    """Run multi-level checks on a single import.
+
+    exists_locally / registry take precomputed level 1 / level 2 results
+    (batch mode); when None they are looked up here.
+    """
     base = {"module": imp.full_module, "line": imp.line}
 
     # ── Level 1 ──
-    exists_locally = checker.check_import_exists(imp.module)
+    if exists_locally is None:
+        exists_locally = checker.check_import_exists(imp.module)
     if not exists_locally:
         if max_level < 2:
             return {
@@ -204,7 +289,8 @@ def _check_import(
             }
 
         # ── Level 2 ──
-        registry = checker.check_package_registry(imp.module, ecosystem)
+        if registry is None:
+            registry = checker.check_package_registry(imp.module, ecosystem)
         if registry["exists"] is False:
             similar = registry["similar_packages"]
             is_slopsquat = len(similar) > 0
@@ -12,6 +12,8 @@ import logging
 from core.input_validator import InputValidationError, sanitize_for_output, validate_list
 from core.learning_bridge import record_safe
 from core.path_validator import PathValidationError, validate_path
+from vibesrails.file_index import project_files
+from vibesrails.parsed_module import ParsedModule
 from vibesrails.senior_mode.guards import (
     BypassGuard,
     ErrorHandlingGuard,
@@ -179,7 +181,7 @@ def scan_senior(
     try:
         if project_path:
             root = validate_path(project_path, must_exist=True, must_be_dir=True)
-            py_files = sorted(root.rglob("*.py"))
+            py_files = project_files(root)
         elif file_path:
             fp = validate_path(file_path, must_exist=True, must_be_file=True)
             py_files = [fp]
@@ -213,11 +215,13 @@ def scan_senior(
             continue
 
         filepath_str = str(py_file)
+        # One parse per file, shared by every requested guard
+        module = ParsedModule(filepath_str, code)
 
         for slug, guard_cls in guard_pairs:
             try:
                 guard = guard_cls()
-                issues = guard.check(code, filepath_str)
+                issues = guard.check_parsed(module, filepath_str)
             except Exception:
                 logger.exception("Senior guard %s raised an exception on %s", slug, py_file)
                 continue
@@ -8,15 +8,25 @@ A YAML-driven security and quality scanner for Python projects.
 
 __version__ = "2.5.0"
 
-from .scanner import (
-    ScanResult,
-    get_all_python_files,
-    get_staged_files,
-    load_config,
-    scan_file,
-    show_patterns,
-    validate_config,
-)
+# Scanner API, imported on first access so that hooks and lightweight CLI
+# commands do not pay for the scanner (and yaml) at package import time.
+_SCANNER_EXPORTS = frozenset({
+    "ScanResult",
+    "get_all_python_files",
+    "get_staged_files",
+    "load_config",
+    "scan_file",
+    "show_patterns",
+    "validate_config",
+})
+
+
+def __getattr__(name: str):
+    if name in _SCANNER_EXPORTS:
+        from . import scanner
+        return getattr(scanner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "scan_file",
@@ -8,10 +8,11 @@ running pytest. Pure JSON file reader for fast gate checks.
 from __future__ import annotations
 
 import json
-import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from ..git_snapshot import git_snapshot
+
 
 @dataclass
 class CoverageReport:
@@ -88,19 +89,11 @@ def is_coverage_stale(root: Path) -> bool:
     if coverage_path is None:
         return True
 
+    commit = git_snapshot(root).last_commit
+    if commit is None:
+        # Not a git repo or no commits — treat as fresh
+        return False
     try:
-        result = subprocess.run(
-            ["git", "-C", str(root), "log", "-1", "--format=%ct"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0 or not result.stdout.strip():
-            # Not a git repo or no commits — treat as fresh
-            return False
-
-        last_commit_ts = int(result.stdout.strip())
-        coverage_mtime = coverage_path.stat().st_mtime
-        return coverage_mtime < last_commit_ts
-    except (subprocess.TimeoutExpired, ValueError, OSError):
+        return coverage_path.stat().st_mtime < commit.timestamp
+    except OSError:
         return False
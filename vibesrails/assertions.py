@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
+from .file_index import project_files
 from .scanner_types import BLUE, GREEN, NC, RED
 
 logger = logging.getLogger(__name__)
@@ -38,7 +39,7 @@ class AssertionResult:
 def _collect_python_files(root: Path) -> list[Path]:
     """Collect Python files, skipping common non-project dirs."""
     files = []
-    for py_file in root.rglob("*.py"):
+    for py_file in project_files(root):
         if any(p in str(py_file) for p in _SKIP_DIRS):
             continue
         files.append(py_file)
@@ -22,20 +22,10 @@ from .cli_setup import (
     uninstall,
 )
 from .cli_v2 import dispatch_v2_commands
-from .learn_runner import handle_learn_command
-from .scan_runner import run_scan
-from .scanner import (
-    BLUE,
-    GREEN,
-    NC,
-    RED,
-    YELLOW,
-    get_all_python_files,
-    get_staged_files,
-    load_config,
-    show_patterns,
-    validate_config,
-)
+from .scanner_types import BLUE, GREEN, NC, RED, YELLOW
+
+# The scanner, scan runner and learner are imported where they are used:
+# info and hook commands (--version, --daemon, --mode...) never load them.
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +59,12 @@ def _parse_args():
     g_scan = parser.add_argument_group("Scanning")
     g_scan.add_argument("--all", action="store_true", help="Scan all Python files")
     g_scan.add_argument("--file", "-f", help="Scan specific file")
+    g_scan.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached results in .vibesrails/cache/ and rescan every file "
+                             "(or rerun every mutant with --mutation)")
+    g_scan.add_argument("--jobs", "-j", type=int, metavar="N",
+                        help="Scan files in N processes, or run N mutants at once with "
+                             "--mutation (0 = all cores, default: scan_jobs or 1)")
     g_scan.add_argument("--senior", action="store_true",
                         help="Run Senior Mode (architecture + guards + review)")
     g_scan.add_argument("--senior-v2", action="store_true", help="Run ALL v2 guards (comprehensive scan)")
@@ -96,6 +92,9 @@ def _parse_args():
                           help="Mutation testing -- verify tests catch real bugs")
     g_guards.add_argument("--mutation-quick", action="store_true",
                           help="Mutation testing on changed functions only")
+    g_guards.add_argument("--mutation-schemata", action="store_true",
+                          help="With --mutation/--mutation-quick: instrument each file once "
+                               "and switch mutants in forked pytest workers (POSIX only)")
     g_guards.add_argument("--pr-check", action="store_true", help="Generate PR review checklist")
     g_guards.add_argument("--pre-deploy", action="store_true", help="Pre-deployment verification")
     g_guards.add_argument("--preflight", action="store_true",
@@ -131,6 +130,10 @@ def _parse_args():
     g_session.add_argument("--watch", action="store_true", help="Live scanning on file save")
     g_session.add_argument("--queue", metavar="MSG", help="Send a task to other Claude Code sessions")
     g_session.add_argument("--inbox", metavar="MSG", help="Add instruction to mobile inbox")
+    g_session.add_argument("--daemon", action="store_true",
+                           help="Serve Claude Code hooks from a warm background process")
+    g_session.add_argument("--profile-startup", action="store_true",
+                           help="Report per-module import cost of the hooks and CLI")
     g_session.add_argument("--throttle-status", action="store_true",
                            help="Show write throttle counter")
     g_session.add_argument("--throttle-reset", action="store_true",
@@ -180,6 +183,10 @@ def _handle_info_commands(args) -> None:
         logger.info("Throttle reset.")
         sys.exit(0)
 
+    if args.profile_startup:
+        from .startup_profile import run_profile_startup
+        sys.exit(run_profile_startup())
+
     if args.guardian_stats:
         from .ai_guardian import show_guardian_stats
         show_guardian_stats()
@@ -277,6 +284,7 @@ def _handle_setup_commands(args) -> None:
 
     if getattr(args, "bandit", False):
         from .adapters.bandit_adapter import BanditAdapter, classify_severity
+        from .scanner import get_all_python_files
         adapter = BanditAdapter({})
         if not adapter.is_installed():
             logger.error("Bandit not installed. Run: pip install bandit")
@@ -385,6 +393,10 @@ def _handle_hook_commands(args) -> None:
         logger.info("Added to inbox: %s", args.inbox)
         sys.exit(0)
 
+    if getattr(args, "daemon", False):
+        from .hooks.daemon import serve
+        sys.exit(serve(Path.cwd()))
+
 
 def _handle_standalone_commands(args):
     """Handle commands that don't need a config file. Returns True if handled."""
@@ -396,6 +408,8 @@ def _handle_standalone_commands(args):
 
 def _handle_config_commands(args, config, files):
     """Handle commands that require a loaded config."""
+    from .scanner import show_patterns, validate_config
+
     if args.validate:
         sys.exit(0 if validate_config(config) else 1)
 
@@ -413,7 +427,8 @@ def _handle_config_commands(args, config, files):
             sys.exit(0)
         logger.info("")
 
-    sys.exit(run_scan(config, files))
+    from .scan_runner import run_scan
+    sys.exit(run_scan(config, files, use_cache=not args.no_cache, jobs=args.jobs))
 
 
 def main() -> None:
@@ -421,6 +436,7 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Handle learn command (positional argument)
     if len(sys.argv) > 1 and sys.argv[1] == "learn":
+        from .learn_runner import handle_learn_command
         sys.exit(handle_learn_command())
 
     args = _parse_args()
@@ -438,6 +454,8 @@ def main() -> None:
         logger.info("Run: vibesrails --init")
         sys.exit(1)
 
+    from .scanner import get_all_python_files, get_staged_files, load_config
+
     try:
         config = load_config(config_path)
     except ValueError as e:
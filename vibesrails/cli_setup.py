@@ -8,7 +8,7 @@ import logging
 import shutil
 from pathlib import Path
 
-from .scanner import BLUE, GREEN, NC, RED, YELLOW
+from .scanner_types import BLUE, GREEN, NC, RED, YELLOW
 
 logger = logging.getLogger(__name__)
 
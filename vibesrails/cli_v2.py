@@ -10,7 +10,9 @@ import logging
 import sys
 from pathlib import Path
 
-from .scanner import BLUE, GREEN, NC, RED, YELLOW
+from .content_store import content_run, read_module
+from .file_index import project_files
+from .scanner_types import BLUE, GREEN, NC, RED, YELLOW
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +59,14 @@ _SKIP_DIRS = ("__pycache__", ".venv", "venv", "node_modules", ".git", "build", "
 def _collect_v1_files(root: Path) -> list[tuple[str, str]]:
     """Collect Python files for V1 guard scanning."""
     files = []
-    for py_file in root.glob("**/*.py"):
+    for py_file in project_files(root):
         if any(p in str(py_file) for p in _SKIP_DIRS):
             continue
-        try:
-            files.append((str(py_file), py_file.read_text()))
-        except (OSError, UnicodeDecodeError) as e:
-            logger.debug("Failed to read file for senior scan: %s", e)
+        module = read_module(py_file)
+        if module is None:
+            logger.debug("Failed to read file for senior scan: %s", py_file)
+            continue
+        files.append((str(py_file), module.source))
     return files[:50]
 
 
@@ -114,9 +117,15 @@ def _get_v2_guards() -> list[tuple[str, object]]:
 
 def _run_senior_v2() -> int:
     """Run ALL v2 guards — comprehensive senior scan."""
+    # Every guard shares the files read (and parsed) once by the content store
+    with content_run():
+        return _senior_v2_scan(Path.cwd())
+
+
+def _senior_v2_scan(root: Path) -> int:
+    """Run the V1 and V2 guards over root and print the summary."""
     from .senior_mode.guards import SeniorGuards
 
-    root = Path.cwd()
     all_issues = []
 
     logger.info(f"\n{BLUE}╔══════════════════════════════════════════════╗{NC}")
@@ -277,16 +286,25 @@ def _dispatch_test_mutation(args) -> None:
         sys.exit(1 if any(i.severity == "block" for i in issues) else 0)
 
     if args.mutation:
-        from .guards_v2.mutation import MutationGuard
-        guard = MutationGuard()
+        from .guards_v2.mutation import MutationGuard, resolve_mutation_jobs
+        jobs = resolve_mutation_jobs(getattr(args, "jobs", None))
+        guard = MutationGuard(
+            jobs=jobs, schemata=getattr(args, "mutation_schemata", False),
+            result_cache=not getattr(args, "no_cache", False),
+        )
         logger.info(guard.generate_report(Path.cwd()))
         issues = guard.scan(Path.cwd())
         _print_v2_issues("Mutation Testing", issues)
         sys.exit(1 if any(i.severity == "block" for i in issues) else 0)
 
     if args.mutation_quick:
-        from .guards_v2.mutation import MutationGuard
-        issues = MutationGuard().scan_quick(Path.cwd())
+        from .guards_v2.mutation import MutationGuard, resolve_mutation_jobs
+        jobs = resolve_mutation_jobs(getattr(args, "jobs", None))
+        schemata = getattr(args, "mutation_schemata", False)
+        result_cache = not getattr(args, "no_cache", False)
+        issues = MutationGuard(
+            jobs=jobs, schemata=schemata, result_cache=result_cache,
+        ).scan_quick(Path.cwd())
         _print_v2_issues("Mutation Testing (quick)", issues)
         sys.exit(1 if any(i.severity == "block" for i in issues) else 0)
 
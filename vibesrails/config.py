@@ -159,13 +159,15 @@ def fetch_remote_config(
 
 def load_extended_config(
     config_path: Path,
-    seen_paths: set[str] | None = None
+    seen_paths: set[str] | None = None,
+    sources: list[str] | None = None,
 ) -> dict:
     """Load config with extends resolution.
 
     Args:
         config_path: Path to the config file
         seen_paths: Set of already-loaded paths (circular reference detection)
+        sources: If given, collects every file path and URL the config was built from
 
     Returns:
         Merged config dict
@@ -181,6 +183,8 @@ def load_extended_config(
         return {}
 
     seen_paths.add(path_key)
+    if sources is not None:
+        sources.append(path_key)
 
     # Load the config file
     try:
@@ -215,7 +219,7 @@ def load_extended_config(
 
     # Process each parent config
     for parent_ref in extends:
-        parent_config = resolve_extends(parent_ref, config_path.parent, seen_paths)
+        parent_config = resolve_extends(parent_ref, config_path.parent, seen_paths, sources)
         if parent_config:
             merged = deep_merge(merged, parent_config)
 
@@ -225,11 +229,13 @@ def load_extended_config(
     return merged
 
 
-def _resolve_pack(ref: str, seen_paths: set[str]) -> dict | None:
+def _resolve_pack(
+    ref: str, seen_paths: set[str], sources: list[str] | None = None,
+) -> dict | None:
     """Resolve a built-in pack reference."""
     pack_path = resolve_pack_path(ref)
     if pack_path:
-        return load_extended_config(pack_path, seen_paths.copy())
+        return load_extended_config(pack_path, seen_paths.copy(), sources)
     logger.warning("Unknown pack: %s", ref)
     logger.info(f"{YELLOW}WARN: Unknown pack: {ref}{NC}")
     logger.info(f"  Available packs: {', '.join(BUILTIN_PACKS.keys())}")
@@ -259,17 +265,22 @@ def resolve_extends(
     ref: str,
     base_dir: Path,
     seen_paths: set[str],
+    sources: list[str] | None = None,
 ) -> dict | None:
     """Resolve a single extends reference."""
     if ref.startswith("@vibesrails/"):
-        return _resolve_pack(ref, seen_paths)
+        return _resolve_pack(ref, seen_paths, sources)
 
     if ref.startswith(("http://", "https://")):
+        if sources is not None:
+            sources.append(ref)
         return _resolve_remote(ref)
 
     local_path = _resolve_local_path(ref, base_dir)
     if local_path.exists():
-        return load_extended_config(local_path, seen_paths.copy())
+        return load_extended_config(local_path, seen_paths.copy(), sources)
+    if sources is not None:
+        sources.append(str(local_path.resolve()))  # creating it must invalidate
 
     if ref.startswith(("./", "../", "/")):
         logger.warning("Config file not found: %s", local_path)
@@ -280,10 +291,12 @@ def resolve_extends(
     return None
 
 
-def load_config_with_extends(config_path: Path | str) -> dict:
+def load_config_with_extends(config_path: Path | str, use_cache: bool = True) -> dict:
     """Load config file with full extends support.
 
-    This is the main entry point for loading configs.
+    This is the main entry point for loading configs. Unless use_cache is
+    False, the merged result is reused from .vibesrails/config.cache while
+    the config and every file it extends are unchanged.
     """
     config_path = Path(config_path)
 
@@ -294,4 +307,15 @@ def load_config_with_extends(config_path: Path | str) -> dict:
     if config_path.stat().st_size > 1_000_000:
         raise ValueError(f"Config file too large: {config_path}")
 
-    return load_extended_config(config_path)
+    if not use_cache:
+        return load_extended_config(config_path)
+
+    from .config_cache import ConfigSnapshot
+
+    snapshot = ConfigSnapshot(config_path)
+    config = snapshot.load()
+    if config is None:
+        sources: list[str] = []
+        config = load_extended_config(config_path, sources=sources)
+        snapshot.store(config, sources)
+    return config
@@ -0,0 +1,118 @@
+"""Config snapshot — skip YAML parsing and extends resolution on warm loads.
+
+load_config_with_extends parses vibesrails.yaml and every file it extends
+(local files and built-in packs) on every call, and every hook process loads
+the config again. The fully merged config is stored in
+.vibesrails/config.cache together with the files it was built from. Each
+source is recorded with its mtime, size and sha256. The snapshot is reused
+until one of them changes:
+
+- unchanged mtime and size: reused without reading the file
+- touched but identical content (same sha256): still reused
+
+Extended files that did not exist are recorded too, so creating one
+invalidates the snapshot.
+
+Configs that extend a remote URL are never snapshotted, since their content
+can change without any local file changing.
+
+The snapshot is written with marshal, not pickle: it lives in the working
+tree, and loading it must never be able to execute code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CACHE_FILE = Path(".vibesrails") / "config.cache"
+SNAPSHOT_VERSION = 1
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _fingerprint(path: str) -> list[Any]:
+    """Return [path, mtime_ns, size, sha256] for a source file ([path] if missing)."""
+    p = Path(path)
+    if not p.exists():
+        return [path]
+    st = p.stat()
+    return [path, st.st_mtime_ns, st.st_size, _sha256(p)]
+
+
+def _source_unchanged(entry: Any) -> bool:
+    try:
+        if len(entry) == 1:
+            return not os.path.exists(entry[0])
+        path, mtime_ns, size, digest = entry
+        st = os.stat(path)
+        if st.st_mtime_ns == mtime_ns and st.st_size == size:
+            return True
+        return _sha256(Path(path)) == digest
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+class ConfigSnapshot:
+    """Merged config for one root config file, cached under root/.vibesrails."""
+
+    def __init__(self, config_path: Path, root: Path | None = None):
+        self.config_path = str(Path(config_path).resolve())
+        self.root = root if root is not None else Path.cwd()
+
+    @property
+    def cache_file(self) -> Path:
+        return self.root / CONFIG_CACHE_FILE
+
+    def load(self) -> dict | None:
+        """Return the cached merged config, or None if any source changed."""
+        try:
+            data = marshal.loads(self.cache_file.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        if data.get("version") != SNAPSHOT_VERSION or data.get("vibesrails") != __version__:
+            return None
+        if data.get("config_path") != self.config_path:
+            return None
+        sources = data.get("sources")
+        if not isinstance(sources, list) or not sources:
+            return None
+        if not all(_source_unchanged(entry) for entry in sources):
+            return None
+        config = data.get("config")
+        return config if isinstance(config, dict) else None
+
+    def store(self, config: dict, sources: list[str]) -> None:
+        """Persist a merged config built from sources (local file paths or URLs)."""
+        if any(src.startswith(("http://", "https://")) for src in sources):
+            return  # remote extends: no local file can tell us it changed
+        cache_dir = self.cache_file.parent
+        try:
+            payload = marshal.dumps({
+                "version": SNAPSHOT_VERSION,
+                "vibesrails": __version__,
+                "config_path": self.config_path,
+                "sources": [_fingerprint(src) for src in sources],
+                "config": config,
+            })
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Symlink protection: the snapshot must stay inside the project
+            cache_dir.resolve().relative_to(self.root.resolve())
+            tmp = self.cache_file.with_suffix(".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.cache_file)
+        except (OSError, ValueError) as e:
+            # ValueError also covers values marshal cannot store (e.g. YAML dates)
+            logger.debug("Config snapshot not saved: %s", e)
@@ -0,0 +1,132 @@
+"""Run-scoped store of parsed files shared by every guard in one run.
+
+A senior scan runs a dozen guards whose scan(project_root) each used to
+read, decode, split and parse every project file again. Inside
+``with content_run():`` read_module() hands out one ParsedModule per file
+for the whole run: the file is read and decoded once, and its lines, AST,
+parent map and node index are computed at most once, by whichever guard
+asks first. Outside a run, read_module() reads the file afresh, so guards
+behave the same when used on their own.
+
+The store assumes files do not change during the run. It keeps the most
+recently used modules up to max_bytes of source text; the parsed views
+of a module are dropped with it (an AST is roughly ten times the size of
+its source).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .parsed_module import ParsedModule
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _decode(data: bytes, errors: str) -> str:
+    """Decode like Path.read_text(encoding="utf-8"): universal newlines."""
+    text = data.decode("utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class _Entry:
+    __slots__ = ("strict", "lenient", "size")
+
+    def __init__(self, strict: ParsedModule | None, lenient: ParsedModule):
+        self.strict = strict  # None when the file is not valid UTF-8
+        self.lenient = lenient
+        self.size = len(lenient.source)
+
+
+class ContentStore:
+    """LRU of ParsedModule per file, bounded by total source size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.reads = 0
+        self.hits = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def module(self, path: Path | str, errors: str = "strict") -> ParsedModule | None:
+        """Parsed file, or None if unreadable (or not UTF-8 when errors="strict")."""
+        key = os.path.abspath(path)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            entry = self._load(path)
+            if entry is None:
+                return None
+            self._add(key, entry)
+        return entry.strict if errors == "strict" else entry.lenient
+
+    def _load(self, path: Path | str) -> _Entry | None:
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return None
+        self.reads += 1
+        try:
+            strict = ParsedModule(path, _decode(data, "strict"))
+        except UnicodeDecodeError:
+            return _Entry(None, ParsedModule(path, _decode(data, "ignore")))
+        return _Entry(strict, strict)
+
+    def _add(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self.size += entry.size
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+
+_active: ContentStore | None = None
+
+
+@contextmanager
+def content_run(max_bytes: int = DEFAULT_MAX_BYTES) -> Iterator[ContentStore]:
+    """Share parsed files across everything in the block (nested runs reuse the outer store)."""
+    global _active
+    if _active is not None:
+        yield _active
+        return
+    _active = store = ContentStore(max_bytes)
+    try:
+        yield store
+    finally:
+        _active = None
+        logger.debug(
+            "Content store: %d reads, %d hits, %d files kept",
+            store.reads, store.hits, len(store),
+        )
+
+
+def read_module(path: Path | str, errors: str = "strict") -> ParsedModule | None:
+    """ParsedModule for a UTF-8 file, shared within a content_run().
+
+    errors="ignore" drops undecodable bytes instead of returning None.
+    """
+    if _active is not None:
+        return _active.module(path, errors)
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    try:
+        return ParsedModule(path, _decode(data, errors))
+    except UnicodeDecodeError:
+        return None
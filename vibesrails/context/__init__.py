@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from .adapter import PHASE_PROFILES, ContextAdapter
+from .cache import SessionContextCache
 from .detector import ContextDetector
 from .mode import ContextScore, ContextSignals, SessionContext, SessionMode
 from .phase import PhaseDetector, PhaseResult, PhaseSignals, ProjectPhase
@@ -37,21 +38,31 @@ def get_current_mode(root: Path | None = None) -> tuple[SessionMode, ContextScor
 def get_session_context(
     root: Path | None = None,
     base_config: dict | None = None,
+    use_cache: bool = True,
 ) -> SessionContext:
     """Detect session mode + project phase, return unified context.
 
     This is the recommended single entry point for context-aware decisions.
     Combines both dimensions and produces an adapted config.
 
+    Detected mode and phase are cached in .vibesrails/cache/ (see
+    context.cache), so repeated calls from hooks skip the git/pytest
+    subprocesses until HEAD, the index, tests/ or methodology.yaml change.
+
     Args:
         root: Project root. Defaults to cwd.
         base_config: Scanner config to adapt. Defaults to empty dict.
+        use_cache: Read/write the persisted detection cache.
     """
     if root is None:
         root = Path.cwd()
     if base_config is None:
         base_config = {}
 
+    cache = SessionContextCache(root) if use_cache else None
+    cached = (cache.load() if cache else None) or {}
+    fresh: dict = {}
+
     # ── Mode detection ──
     mode_forced = False
     detector = ContextDetector(root)
@@ -61,30 +72,52 @@ def get_session_context(
         mode_score = 0.5
         mode_confidence = 0.0
         mode_forced = True
+    elif "mode" in cached:
+        mode = SessionMode(cached["mode"])
+        mode_score = cached["mode_score"]
+        mode_confidence = cached["mode_confidence"]
     else:
         signals = detector.detect()
         score = ContextScorer().score(signals)
         mode = score.mode
         mode_score = score.score
         mode_confidence = score.confidence
+        fresh.update(
+            mode=mode.value, mode_score=mode_score, mode_confidence=mode_confidence,
+        )
 
     # ── Phase detection ──
-    phase_detector = PhaseDetector(root)
-    phase_result = phase_detector.detect()
+    if "phase" in cached:
+        phase = ProjectPhase(cached["phase"])
+        phase_is_override = cached["phase_is_override"]
+        phase_missing = list(cached["phase_missing"])
+    else:
+        phase_result = PhaseDetector(root).detect()
+        phase = phase_result.phase
+        phase_is_override = phase_result.is_override
+        phase_missing = phase_result.missing_for_next
+        fresh.update(
+            phase=phase.value,
+            phase_is_override=phase_is_override,
+            phase_missing=list(phase_missing),
+        )
+
+    if cache and fresh:
+        cache.store({**cached, **fresh})
 
     # ── Adapt config (mode + phase) ──
     adapter = ContextAdapter(base_config.get("session_profiles"))
-    adapted = adapter.adapt_full_config(mode, phase_result.phase, base_config)
+    adapted = adapter.adapt_full_config(mode, phase, base_config)
 
     return SessionContext(
         mode=mode,
         mode_score=mode_score,
         mode_confidence=mode_confidence,
         mode_forced=mode_forced,
-        phase=phase_result.phase.value,
-        phase_name=phase_result.phase.name.replace("_", " "),
-        phase_is_override=phase_result.is_override,
-        phase_missing=phase_result.missing_for_next,
+        phase=phase.value,
+        phase_name=phase.name.replace("_", " "),
+        phase_is_override=phase_is_override,
+        phase_missing=phase_missing,
         adapted_config=adapted,
     )
 
@@ -96,6 +129,7 @@ __all__ = [
     "ContextScore",
     "ContextScorer",
     "ContextSignals",
+    "SessionContextCache",
     "SessionContext",
     "SessionMode",
     "get_current_mode",
@@ -0,0 +1,171 @@
+"""Session context cache — persist mode + phase detection between hook calls.
+
+Detecting the session mode runs four git subprocesses, and detecting the
+phase runs ``pytest --collect-only``. Hooks fire on every tool call, so the
+detected values are stored in .vibesrails/cache/session_context.json under a
+key that is cheap to recompute without any subprocess:
+
+- HEAD (ref name + commit sha, read straight from .git)
+- .git/index mtime (staging, commits, checkouts)
+- newest mtime under tests/ (test count)
+- .vibesrails/methodology.yaml mtime (phase override)
+
+Entries also expire after CACHE_TTL seconds, so slow-moving signals (commits
+in the last hour, new CI/README files) are eventually refreshed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".vibesrails") / "cache"
+CACHE_FILE_NAME = "session_context.json"
+CACHE_VERSION = 1
+CACHE_TTL = 300  # seconds
+
+_SKIP_DIRS = frozenset({"__pycache__", ".pytest_cache"})
+
+
+def _find_git_dir(root: Path) -> Path | None:
+    """Return the git directory for root (supports worktrees and subdirs)."""
+    for candidate in (root, *root.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text().strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                return (candidate / content[len("gitdir:"):].strip()).resolve()
+            return None
+    return None
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> str:
+    """Resolve a ref to a sha via loose refs, then packed-refs."""
+    dirs = [git_dir]
+    try:
+        common = (git_dir / "commondir").read_text().strip()
+        dirs.append((git_dir / common).resolve())
+    except OSError:
+        pass
+    for base in dirs:
+        try:
+            return (base / ref).read_text().strip()
+        except OSError:
+            pass
+        try:
+            for line in (base / "packed-refs").read_text().splitlines():
+                if line.endswith(" " + ref):
+                    return line.split(" ", 1)[0]
+        except OSError:
+            pass
+    return ""
+
+
+def _head_state(git_dir: Path | None) -> str:
+    """Return 'ref@sha' for HEAD, or '' outside a git repository."""
+    if git_dir is None:
+        return ""
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return ""
+    if head.startswith("ref: "):
+        ref = head[len("ref: "):]
+        return f"{ref}@{_resolve_ref(git_dir, ref)}"
+    return head  # detached HEAD: already a sha
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _tree_mtime_ns(path: Path) -> int:
+    """Newest mtime of a directory tree (dirs catch adds/removes, files catch edits)."""
+    newest = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                newest = max(newest, current.stat().st_mtime_ns)
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(Path(entry.path))
+                    else:
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+        except OSError:
+            continue
+    return newest
+
+
+def context_cache_key(root: Path) -> dict[str, Any]:
+    """Compute the invalidation key for root's cached session context."""
+    git_dir = _find_git_dir(root)
+    return {
+        "head": _head_state(git_dir),
+        "index_mtime": _mtime_ns(git_dir / "index") if git_dir else 0,
+        "tests_mtime": _tree_mtime_ns(root / "tests"),
+        "methodology_mtime": _mtime_ns(root / ".vibesrails" / "methodology.yaml"),
+    }
+
+
+class SessionContextCache:
+    """Read/write the detected mode + phase for one project root."""
+
+    def __init__(self, root: Path, ttl: float = CACHE_TTL):
+        self.root = root
+        self.ttl = ttl
+        self.key = context_cache_key(root)
+
+    @property
+    def cache_file(self) -> Path:
+        return self.root / CACHE_DIR / CACHE_FILE_NAME
+
+    def load(self) -> dict[str, Any] | None:
+        """Return cached detection values if the key matches and the entry is fresh."""
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return None
+        if data.get("key") != self.key:
+            return None
+        created = data.get("created", 0)
+        if not isinstance(created, (int, float)) or time.time() - created > self.ttl:
+            return None
+        values = data.get("values")
+        return values if isinstance(values, dict) else None
+
+    def store(self, values: dict[str, Any]) -> None:
+        """Persist detection values atomically; failures are logged and ignored."""
+        cache_dir = self.root / CACHE_DIR
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Symlink protection: the cache directory must stay inside the project
+            cache_dir.resolve().relative_to(self.root.resolve())
+            tmp = self.cache_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "version": CACHE_VERSION,
+                "key": self.key,
+                "created": time.time(),
+                "values": values,
+            }))
+            os.replace(tmp, self.cache_file)
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug("Session context cache not saved: %s", e)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from ..git_snapshot import git_snapshot
 from ..guards_v2._git_helpers import run_git
 from .mode import ContextSignals
 
@@ -133,21 +134,21 @@ class ContextDetector:
         """Collect all available signals. Missing signals are None."""
         signals = ContextSignals()
 
+        snapshot = git_snapshot(self.root)
+
         # Signal 1: Branch name + type
-        ok, branch = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=self.root)
-        if ok and branch:
-            signals.branch_name = branch.strip()
+        status = snapshot.status
+        if status is not None and status.branch:
+            signals.branch_name = status.branch
             signals.branch_type = _classify_branch(signals.branch_name)
 
         # Signal 2: Uncommitted files count
-        ok, output = run_git(["status", "--porcelain"], cwd=self.root)
-        if ok:
-            dirty = [line for line in output.splitlines() if line.strip()]
-            signals.uncommitted_count = len(dirty)
+        if status is not None:
+            signals.uncommitted_count = status.dirty_count
 
         # Signal 3: Files created ratio + diff spread (from last commit)
-        ok, diff_output = run_git(["diff", "--stat", "HEAD~1"], cwd=self.root)
-        if ok and diff_output:
+        diff_output = snapshot.diff("--stat", "HEAD~1")
+        if diff_output:
             ratio, spread = _parse_diff_stat(diff_output)
             signals.files_created_ratio = ratio
             signals.diff_spread = spread
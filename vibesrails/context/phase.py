@@ -20,6 +20,9 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from pathlib import Path
 
+from ..file_index import project_files
+from ..git_snapshot import git_snapshot
+
 logger = logging.getLogger(__name__)
 
 _SKIP_DIRS = {"__pycache__", ".venv", "venv", ".git", "build", "dist", ".egg", "node_modules"}
@@ -275,7 +278,7 @@ class PhaseDetector:
         count = 0
         tests_dir = self.root / "tests"
         if tests_dir.is_dir():
-            for py_file in tests_dir.rglob("test_*.py"):
+            for py_file in project_files(self.root, "test_*.py", under="tests"):
                 try:
                     content = py_file.read_text(errors="ignore")
                     count += len(re.findall(r"^def test_", content, re.MULTILINE))
@@ -295,7 +298,7 @@ class PhaseDetector:
                 return True
 
         # Check for integration markers in test files (sample 10)
-        for i, py_file in enumerate(tests_dir.rglob("test_*.py")):
+        for i, py_file in enumerate(project_files(self.root, "test_*.py", under="tests")):
             if i >= 10:
                 break
             try:
@@ -331,20 +334,7 @@ class PhaseDetector:
 
     def _count_release_tags(self) -> int:
         """Count git tags matching version patterns."""
-        try:
-            result = subprocess.run(
-                ["git", "tag", "--list", "v*"],
-                cwd=self.root,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                tags = [t for t in result.stdout.strip().splitlines() if t]
-                return len(tags)
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            pass
-        return 0
+        return sum(1 for tag in git_snapshot(self.root).tags if tag.startswith("v"))
 
     def _read_methodology_override(self) -> int | None:
         """Read manual phase override from .vibesrails/methodology.yaml."""
@@ -364,7 +354,7 @@ class PhaseDetector:
     def _iter_py_files(self, limit: int = 100):
         """Iterate .py files in the project, skipping common non-source dirs."""
         count = 0
-        for py_file in sorted(self.root.rglob("*.py")):
+        for py_file in project_files(self.root):
             if any(skip in py_file.parts for skip in _SKIP_DIRS):
                 continue
             yield py_file
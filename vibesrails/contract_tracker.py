@@ -13,6 +13,8 @@ import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .file_index import project_files
+
 logger = logging.getLogger(__name__)
 
 CONTRACTS_DIR = ".vibesrails/contracts"
@@ -131,7 +133,7 @@ def extract_signatures(filepath: Path, module_name: str = "") -> list[Signature]
 def _iter_py_files(root: Path, limit: int = 500) -> list[Path]:
     """Iterate Python files, skipping tests and hidden dirs."""
     files = []
-    for path in root.rglob("*.py"):
+    for path in project_files(root):
         # Skip excluded dirs
         parts = set(path.relative_to(root).parts)
         if parts & _SKIP_DIRS:
@@ -0,0 +1,320 @@
+"""Project file index shared by every project-wide file walker.
+
+Guards, context detectors and MCP tools used to run their own
+``rglob("*.py")`` with slightly different skip lists, so one ``--senior-v2``
+run walked the tree more than a dozen times, and walkers without a venv
+filter descended into ``.venv``. The index is built with a single
+``os.scandir`` walk that:
+
+- prunes PRUNE_DIRS (VCS metadata, caches, virtualenvs, node_modules,
+  .vibesrails state) and any directory holding a ``pyvenv.cfg`` before
+  descending into it;
+- honours the ``.gitignore`` files it meets (no global excludes);
+- does not follow directory symlinks;
+- records (size, mtime_ns) for every file it keeps.
+
+Callers keep their own filters (tests, build output, ...) on top of it.
+
+Indexes are cached per process by resolved root. A cached index is reused
+while no indexed directory and no .gitignore has changed (adding, removing
+or renaming a file changes its directory's mtime). Directories modified
+within RACY_WINDOW_NS of the walk are not trusted, as their mtime may hide
+a later change in the same timestamp tick. get_index(persist=True) also
+keeps the index in .vibesrails/cache/file_index.json across processes.
+File stats are as of the walk: read the file when its content matters.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+PRUNE_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "node_modules",
+    "site-packages", ".tox", ".nox", ".eggs", ".mypy_cache", ".ruff_cache",
+    ".pytest_cache", ".vibesrails",
+})
+RACY_WINDOW_NS = 1_000_000_000
+CACHE_FILE = Path(".vibesrails") / "cache" / "file_index.json"
+INDEX_VERSION = 1
+
+
+class FileEntry(NamedTuple):
+    """One indexed file, relative to the index root (POSIX separators)."""
+
+    rel: str
+    size: int
+    mtime_ns: int
+
+
+# ── .gitignore ──────────────────────────────────────────────────────
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (with ** support) to a regex body."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class _IgnoreRule(NamedTuple):
+    base: str  # directory of the .gitignore, "" for the root
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+def _parse_gitignore(base: str, text: str) -> list[_IgnoreRule]:
+    rules: list[_IgnoreRule] = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        line = line.lstrip("/")
+        rules.append(_IgnoreRule(
+            base, re.compile(_glob_to_regex(line) + r"\Z"), negate, dir_only, anchored,
+        ))
+    return rules
+
+
+def _ignored(rules: list[_IgnoreRule], rel: str, is_dir: bool) -> bool:
+    """Last matching rule wins, as in git."""
+    ignored = False
+    name = rel.rsplit("/", 1)[-1]
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.base:
+            if not rel.startswith(rule.base + "/"):
+                continue
+            sub = rel[len(rule.base) + 1:]
+        else:
+            sub = rel
+        if rule.regex.match(sub if rule.anchored else name):
+            ignored = not rule.negate
+    return ignored
+
+
+# ── Index ───────────────────────────────────────────────────────────
+
+
+class ProjectFileIndex:
+    """Files under one root, from a single pruned scandir walk."""
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+        self.entries: list[FileEntry] = []
+        self.built_ns = 0
+        self._dirs: dict[str, int] = {}
+        self._gitignores: dict[str, int] = {}
+        self._by_pattern: dict[str, list[FileEntry]] = {}
+
+    @classmethod
+    def build(cls, root: Path | str) -> ProjectFileIndex:
+        index = cls(root)
+        index._walk()
+        return index
+
+    def _walk(self) -> None:
+        self.built_ns = time.time_ns()
+        rules: list[_IgnoreRule] = []
+        files: list[FileEntry] = []
+        stack = [("", str(self.root))]
+        while stack:
+            rel_dir, abs_dir = stack.pop()
+            try:
+                mtime = os.stat(abs_dir).st_mtime_ns
+                with os.scandir(abs_dir) as it:
+                    children = list(it)
+            except OSError:
+                continue
+            names = {child.name for child in children}
+            if rel_dir and "pyvenv.cfg" in names:
+                continue  # a virtualenv, whatever its name
+            self._dirs[rel_dir] = mtime
+            if ".gitignore" in names:
+                # Rules only apply below their own directory, so one list serves the walk
+                rules.extend(self._read_gitignore(rel_dir, abs_dir))
+            for child in children:
+                rel = f"{rel_dir}/{child.name}" if rel_dir else child.name
+                try:
+                    if child.is_dir(follow_symlinks=False):
+                        if child.name not in PRUNE_DIRS and not _ignored(rules, rel, True):
+                            stack.append((rel, child.path))
+                        continue
+                    if not child.is_file() or _ignored(rules, rel, False):
+                        continue
+                    st = child.stat()
+                except OSError:
+                    continue
+                files.append(FileEntry(rel, st.st_size, st.st_mtime_ns))
+        files.sort(key=lambda e: e.rel.split("/"))
+        self.entries = files
+
+    def _read_gitignore(self, rel_dir: str, abs_dir: str) -> list[_IgnoreRule]:
+        path = os.path.join(abs_dir, ".gitignore")
+        try:
+            self._gitignores[rel_dir] = os.stat(path).st_mtime_ns
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                return _parse_gitignore(rel_dir, f.read())
+        except OSError:
+            return []
+
+    def is_current(self) -> bool:
+        """True while no indexed directory or .gitignore has changed since the walk."""
+        trusted_before = self.built_ns - RACY_WINDOW_NS
+        for rel_dir, mtime in self._dirs.items():
+            if mtime >= trusted_before:
+                return False
+            try:
+                if os.stat(self.root / rel_dir).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        for rel_dir, mtime in self._gitignores.items():
+            try:
+                if os.stat(self.root / rel_dir / ".gitignore").st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def match(self, pattern: str = "*.py", under: str = "") -> list[FileEntry]:
+        """Entries whose file name matches pattern, optionally below a subdirectory."""
+        entries = self._by_pattern.get(pattern)
+        if entries is None:
+            entries = self._by_pattern[pattern] = [
+                e for e in self.entries
+                if fnmatch.fnmatchcase(e.rel.rsplit("/", 1)[-1], pattern)
+            ]
+        if under:
+            prefix = under.strip("/") + "/"
+            entries = [e for e in entries if e.rel.startswith(prefix)]
+        return entries
+
+    def to_json(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "built_ns": self.built_ns,
+            "dirs": self._dirs,
+            "gitignores": self._gitignores,
+            "files": [list(e) for e in self.entries],
+        }
+
+    @classmethod
+    def from_json(cls, root: Path | str, data: dict) -> ProjectFileIndex | None:
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        index = cls(root)
+        try:
+            index.built_ns = int(data["built_ns"])
+            index._dirs = {str(k): int(v) for k, v in data["dirs"].items()}
+            index._gitignores = {str(k): int(v) for k, v in data["gitignores"].items()}
+            index.entries = [FileEntry(str(r), int(s), int(m)) for r, s, m in data["files"]]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return index
+
+
+# ── Per-process cache ───────────────────────────────────────────────
+
+_indexes: dict[str, ProjectFileIndex] = {}
+
+
+def _load_persisted(root: Path) -> ProjectFileIndex | None:
+    try:
+        data = json.loads((root / CACHE_FILE).read_text())
+    except (OSError, json.JSONDecodeError, ValueError):
+        return None
+    index = ProjectFileIndex.from_json(root, data)
+    return index if index is not None and index.is_current() else None
+
+
+def _save_persisted(root: Path, index: ProjectFileIndex) -> None:
+    path = root / CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Symlink protection: the cache directory must stay under the root
+        path.parent.resolve().relative_to(root.resolve())
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index.to_json()))
+        os.replace(tmp, path)
+    except (OSError, ValueError) as e:
+        logger.debug("File index not saved: %s", e)
+
+
+def get_index(root: Path | str, persist: bool = False) -> ProjectFileIndex:
+    """Index for root, reused while the tree is unchanged."""
+    root = Path(root)
+    key = os.path.realpath(root)
+    index = _indexes.get(key)
+    if index is not None and index.is_current():
+        return index
+    index = _load_persisted(root) if persist else None
+    if index is None:
+        index = ProjectFileIndex.build(key)
+        if persist:
+            _save_persisted(root, index)
+    _indexes[key] = index
+    return index
+
+
+def project_files(root: Path | str, pattern: str = "*.py", under: str = "") -> list[Path]:
+    """Sorted paths (root / relative path) of indexed files matching pattern."""
+    root = Path(root)
+    return [root / e.rel for e in get_index(root).match(pattern, under)]
+
+
+def clear_cache() -> None:
+    """Forget every per-process index."""
+    _indexes.clear()
@@ -0,0 +1,287 @@
+"""Git state shared by every check in a process.
+
+Guards, context detectors and hooks used to ask git the same questions one
+subprocess at a time: the workflow guard alone ran rev-parse twice, then
+``diff --cached`` and ``diff``, ``ls-files`` and ``log``; the context
+detector, phase detector, coverage reader and post-commit hook each added
+their own. git_snapshot(root) answers them from one GitSnapshot:
+
+- status: branch, HEAD, upstream, ahead/behind, staged, unstaged and
+  untracked paths, from a single ``git status --porcelain=v2 --branch -z``;
+- last_commit, tags, tracked_stream/tracked_files and diff(): one git
+  call each.
+
+Every part is fetched on first use, so a caller pays only for what it reads.
+Snapshots are memoized per repository and reused, by later checks and across
+requests in the hook daemon, while HEAD, the ref it points to, the index and
+the tag refs keep the same stat. Since editing a file without staging it
+changes none of these, a snapshot is also dropped after SNAPSHOT_TTL
+seconds. Files modified within RACY_WINDOW_NS are not trusted, as their
+mtime may hide a later change in the same timestamp tick. Outside a
+repository (or with GIT_DIR set) nothing is memoized.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+GIT_TIMEOUT = 10
+SNAPSHOT_TTL = 2.0
+RACY_WINDOW_NS = 1_000_000_000
+
+
+class GitStatus(NamedTuple):
+    """Working tree state from ``git status --porcelain=v2 --branch``."""
+
+    branch: str  # "HEAD" when detached, as `git rev-parse --abbrev-ref HEAD`
+    head: str | None  # None before the first commit
+    upstream: str | None
+    ahead: int
+    behind: int
+    staged: tuple[str, ...]
+    unstaged: tuple[str, ...]
+    untracked: tuple[str, ...]
+    changed: int  # tracked paths with any change (a rename counts once)
+
+    @property
+    def dirty_count(self) -> int:
+        """Entries `git status --porcelain` would list."""
+        return self.changed + len(self.untracked)
+
+
+class CommitInfo(NamedTuple):
+    oid: str
+    timestamp: int
+    subject: str
+
+
+def parse_status_v2(output: str) -> GitStatus:
+    """Parse ``git status --porcelain=v2 --branch -z`` output."""
+    branch, head, upstream = "", None, None
+    ahead = behind = changed = 0
+    staged: list[str] = []
+    unstaged: list[str] = []
+    untracked: list[str] = []
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        entry = fields[i]
+        i += 1
+        if entry.startswith("# "):
+            key, _, value = entry[2:].partition(" ")
+            if key == "branch.oid":
+                head = None if value == "(initial)" else value
+            elif key == "branch.head":
+                branch = "HEAD" if value == "(detached)" else value
+            elif key == "branch.upstream":
+                upstream = value
+            elif key == "branch.ab":
+                a, _, b = value.partition(" ")
+                try:
+                    ahead, behind = int(a), -int(b)
+                except ValueError:
+                    pass
+            continue
+        kind = entry[:2]
+        if kind == "? ":
+            untracked.append(entry[2:])
+            continue
+        if kind == "1 ":
+            parts = entry.split(" ", 8)
+        elif kind == "2 ":
+            parts = entry.split(" ", 9)
+            i += 1  # the original path of the rename/copy follows
+        elif kind == "u ":
+            parts = entry.split(" ", 10)
+        else:
+            continue  # ignored files, or an unknown record
+        if len(parts) < 3:
+            continue
+        xy, path = parts[1], parts[-1]
+        changed += 1
+        if xy[0] != "." or kind == "u ":
+            staged.append(path)
+        if xy[1:2] != "." or kind == "u ":
+            unstaged.append(path)
+    return GitStatus(
+        branch, head, upstream, ahead, behind,
+        tuple(staged), tuple(unstaged), tuple(untracked), changed,
+    )
+
+
+def split_diff(diff: str) -> dict[str, str]:
+    """Split a ``git diff`` patch into per-file patches, keyed by path."""
+    chunks: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in diff.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            current = [line]
+            chunks[_diff_path(line)] = current
+        elif current is not None:
+            current.append(line)
+    return {path: "".join(lines) for path, lines in chunks.items()}
+
+
+def _diff_path(header: str) -> str:
+    """Path from a ``diff --git a/<path> b/<path>`` header (the b/ side)."""
+    rest = header[len("diff --git "):].rstrip("\n")
+    half = (len(rest) - 1) // 2
+    if rest.startswith("a/") and rest[half + 1:].startswith("b/"):
+        return rest[half + 3:]
+    _, sep, new = rest.rpartition(" b/")
+    return new if sep else rest
+
+
+# ── Snapshot ────────────────────────────────────────────────────────
+
+
+def _git(root: Path, *args: str) -> str | None:
+    """Raw stdout of a git command in root; None if git fails or is missing."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True,
+            timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+class GitSnapshot:
+    """Lazily fetched git state of one repository."""
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+        self._diffs: dict[tuple[str, ...], str | None] = {}
+
+    @cached_property
+    def status(self) -> GitStatus | None:
+        """Branch and working tree state; None outside a git repository."""
+        out = _git(
+            self.root, "--no-optional-locks", "status", "--porcelain=v2", "--branch", "-z",
+        )
+        return parse_status_v2(out) if out is not None else None
+
+    @cached_property
+    def last_commit(self) -> CommitInfo | None:
+        """HEAD commit, or None before the first commit."""
+        out = _git(self.root, "log", "-1", "--format=%H%x00%ct%x00%s")
+        fields = out.rstrip("\n").split("\0") if out else []
+        if len(fields) != 3:
+            return None
+        try:
+            return CommitInfo(fields[0], int(fields[1]), fields[2])
+        except ValueError:
+            return None
+
+    @cached_property
+    def tags(self) -> tuple[str, ...]:
+        out = _git(self.root, "tag", "--list")
+        return tuple(t for t in out.splitlines() if t) if out else ()
+
+    @cached_property
+    def tracked_stream(self) -> str | None:
+        """Raw NUL-separated ``git ls-files -z`` output; None if git fails."""
+        return _git(self.root, "ls-files", "-z")
+
+    @cached_property
+    def tracked_files(self) -> tuple[str, ...] | None:
+        """Paths from ``git ls-files`` (relative to root); None if git fails."""
+        out = self.tracked_stream
+        return tuple(p for p in out.split("\0") if p) if out is not None else None
+
+    def diff(self, *args: str) -> str | None:
+        """Output of ``git diff <args>``, fetched once per snapshot."""
+        if args not in self._diffs:
+            self._diffs[args] = _git(self.root, "diff", *args)
+        return self._diffs[args]
+
+
+def _git_dir(root: Path) -> Path | None:
+    """The .git directory of the repository containing root, found without git."""
+    for directory in (root, *root.parents):
+        dotgit = directory / ".git"
+        if dotgit.is_dir():
+            return dotgit
+        if dotgit.is_file():  # worktree or submodule: "gitdir: <path>"
+            try:
+                text = dotgit.read_text().strip()
+            except OSError:
+                return None
+            if not text.startswith("gitdir:"):
+                return None
+            return (directory / text[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def _stamp(root: Path) -> tuple | None:
+    """Stat of HEAD, its ref, the index and tag refs; None if not trustworthy."""
+    if "GIT_DIR" in os.environ:
+        return None
+    git_dir = _git_dir(root)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text()
+    except OSError:
+        return None
+    try:
+        common = git_dir / (git_dir / "commondir").read_text().strip()
+    except OSError:
+        common = git_dir
+    paths = [
+        git_dir / "HEAD", git_dir / "index",
+        common / "packed-refs", common / "refs" / "tags",
+    ]
+    if head.startswith("ref: "):
+        paths.append(common / head[5:].strip())
+    trusted_before = time.time_ns() - RACY_WINDOW_NS
+    stats: list[tuple[int, int, int] | None] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            stats.append(None)
+            continue
+        if st.st_mtime_ns >= trusted_before:
+            return None
+        stats.append((st.st_mtime_ns, st.st_size, st.st_ino))
+    return (str(git_dir), head, tuple(stats))
+
+
+# ── Per-process cache ───────────────────────────────────────────────
+
+_snapshots: dict[str, tuple[tuple, float, GitSnapshot]] = {}
+
+
+def git_snapshot(root: Path | str) -> GitSnapshot:
+    """Snapshot for root, shared while the repository is unchanged."""
+    key = os.path.realpath(root)
+    stamp = _stamp(Path(key))
+    now = time.monotonic()
+    cached = _snapshots.get(key)
+    if cached is not None and stamp is not None:
+        cached_stamp, created, snapshot = cached
+        if cached_stamp == stamp and now - created < SNAPSHOT_TTL:
+            return snapshot
+    snapshot = GitSnapshot(root)
+    if stamp is None:
+        _snapshots.pop(key, None)
+    else:
+        _snapshots[key] = (stamp, now, snapshot)
+    return snapshot
+
+
+def clear_cache() -> None:
+    """Forget every memoized snapshot."""
+    _snapshots.clear()
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from ..content_store import content_run
 from .api_design import APIDesignGuard
 from .architecture_drift import ArchitectureDriftGuard
 from .complexity import ComplexityGuard
@@ -46,9 +47,11 @@ ALL_GUARD_CLASSES = (
 def run_all_guards(project_root: Path) -> list[V2GuardIssue]:
     """Run all v2 guards on a project and return combined issues."""
     issues: list[V2GuardIssue] = []
-    for guard_cls in ALL_GUARD_CLASSES:
-        guard = guard_cls()
-        issues.extend(guard.scan(project_root))
+    # Guards share each file's source, lines and AST for the whole run
+    with content_run():
+        for guard_cls in ALL_GUARD_CLASSES:
+            guard = guard_cls()
+            issues.extend(guard.scan(project_root))
     return issues
 
 
@@ -2,6 +2,7 @@
 
 import re
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 
 VALID_BRANCH_PREFIXES = (
@@ -20,8 +21,13 @@ CONVENTIONAL_RE = re.compile(
 MAX_UNRELATED_DIRS = 3
 
 # Patterns for files/dirs that should never be tracked in git
-# Each entry: (glob pattern for git ls-files matching, description)
+# Each entry: (gitignore-style glob for git ls-files matching, description).
+# A trailing "/" matches a directory; patterns match at any depth unless
+# they start with "/"; "*", "?", "[...]" stay within a path segment, "**"
+# spans segments.
 TRACKED_FILE_BLOCKLIST: list[tuple[str, str]] = [
+    (".vibesrails/cache/", "vibesrails caches (local state)"),
+    (".vibesrails/config.cache", "vibesrails config snapshot (local state)"),
     (".vibesrails/metrics/", "vibesrails metrics (local state)"),
     (".vibesrails/guardian.log", "guardian log (local state)"),
     (".claude/settings.local.json", "Claude local settings"),
@@ -37,6 +43,78 @@ TRACKED_FILE_BLOCKLIST: list[tuple[str, str]] = [
 ]
 
 
+def glob_to_regex(pattern: str) -> str:
+    """Translate a blocklist glob into a regex over NUL-separated paths.
+
+    The regex matches inside a single ``git ls-files -z`` path: it starts at
+    a path or segment boundary and never crosses a NUL.
+    """
+    anchored = pattern.startswith("/")
+    directory = pattern.endswith("/")
+    body = pattern.strip("/")
+    out: list[str] = []
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if body.startswith("**/", i):
+            out.append("(?:[^\\0]*/)?")
+            i += 3
+            continue
+        if body.startswith("**", i):
+            out.append("[^\\0]*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/\\0]*")
+        elif c == "?":
+            out.append("[^/\\0]")
+        elif c == "[" and "]" in body[i + 2:]:
+            end = body.index("]", i + 2)
+            cls = body[i + 1:end]
+            if cls.startswith("!"):
+                cls = "^" + cls[1:]
+            out.append("[" + cls.replace("\\", "\\\\") + "]")
+            i = end + 1
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    start = "(?<![^\\0])" if anchored else "(?<![^\\0/])"
+    # ls-files lists files only, so a directory pattern needs a child path
+    end = "/" if directory else "(?![^\\0/])"
+    return start + "".join(out) + end
+
+
+TRACKED_FILE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(glob_to_regex(pattern)), desc)
+    for pattern, desc in TRACKED_FILE_BLOCKLIST
+]
+
+# Every blocklist entry in one alternation, to scan the ls-files stream once
+TRACKED_FILE_RE = re.compile(
+    "|".join(f"(?:{regex.pattern})" for regex, _ in TRACKED_FILE_PATTERNS)
+)
+
+
+def iter_blocklisted(stream: str) -> Iterator[tuple[str, str]]:
+    """Yield (path, description) for blocklisted paths in a NUL-separated stream.
+
+    Each path is reported once, with the first blocklist entry it matches.
+    """
+    pos = 0
+    while (match := TRACKED_FILE_RE.search(stream, pos)) is not None:
+        start = stream.rfind("\0", 0, match.start()) + 1
+        end = stream.find("\0", match.end())
+        if end == -1:
+            end = len(stream)
+        path = stream[start:end]
+        for regex, desc in TRACKED_FILE_PATTERNS:
+            if regex.search(path):
+                yield path, desc
+                break
+        pos = end + 1
+
+
 def run_git(
     args: list[str],
     cwd: Path,
@@ -5,7 +5,11 @@ import logging
 import re
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -80,34 +84,44 @@ class APIDesignGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for API design issues."""
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+        return self.scan_parsed(ParsedModule(filepath, content))
+
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for API design issues."""
+        return dispatch(self, module)
 
-        if not _is_api_file(filepath, content):
-            return issues
+    def accepts(self, module: ParsedModule) -> bool:
+        """Only FastAPI/Flask files are checked."""
+        return _is_api_file(module.path, module.source)
 
-        lines = content.splitlines()
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Wrap the route handler issues with the line-based checks."""
+        fname = str(module.path)
+        lines = module.lines
 
         # Check CORS wildcard
-        issues.extend(self._check_cors(fname, lines))
-
-        # AST-based checks on route handlers
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return issues
-
-        route_funcs = self._find_route_functions(tree, lines)
-        for func_node, route_path in route_funcs:
-            issues.extend(
-                self._check_route_handler(
-                    func_node, route_path, fname, content
-                )
-            )
+        result = self._check_cors(fname, lines)
+        if module.tree is None:
+            return result
 
+        result.extend(issues)
         # Mixed naming conventions
-        issues.extend(self._check_mixed_naming(fname, lines))
-        return issues
+        result.extend(self._check_mixed_naming(fname, lines))
+        return result
+
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
+    def _check_route_function(
+        self, node: ast.FunctionDef, module: ParsedModule
+    ) -> list[V2GuardIssue]:
+        """Check a function if it is decorated as a route handler."""
+        route_path = self._route_path(node, module.lines)
+        if route_path is None:
+            return []
+        return self._check_route_handler(
+            node, route_path, str(module.path), module.source
+        )
 
     @staticmethod
     def _check_cors(
@@ -176,40 +190,30 @@ class APIDesignGuard:
     ) -> list[V2GuardIssue]:
         """Scan entire project for API design issues."""
         issues: list[V2GuardIssue] = []
-        for pyfile in project_root.rglob("*.py"):
+        for pyfile in project_files(project_root):
             if ".venv" in pyfile.parts:
                 continue
             if "node_modules" in pyfile.parts:
                 continue
-            try:
-                content = pyfile.read_text(
-                    encoding="utf-8", errors="ignore"
-                )
-            except OSError:
+            module = read_module(pyfile, errors="ignore")
+            if module is None:
                 continue
-            issues.extend(self.scan_file(pyfile, content))
+            issues.extend(self.scan_parsed(module))
         return issues
 
     @staticmethod
-    def _find_route_functions(
-        tree: ast.Module, lines: list[str]
-    ) -> list[tuple[ast.FunctionDef, str]]:
-        """Find functions decorated with route decorators."""
-        results: list[tuple[ast.FunctionDef, str]] = []
-        for node in ast.walk(tree):
-            if not isinstance(
-                node, (ast.FunctionDef, ast.AsyncFunctionDef)
-            ):
-                continue
-            for dec in node.decorator_list:
-                dec_line = lines[dec.lineno - 1] if (
-                    dec.lineno <= len(lines)
-                ) else ""
-                m = ROUTE_DECORATOR_RE.search(dec_line)
-                if m:
-                    results.append((node, m.group(2)))
-                    break
-        return results
+    def _route_path(
+        node: ast.FunctionDef, lines: list[str]
+    ) -> str | None:
+        """Return the route path if a route decorator is applied."""
+        for dec in node.decorator_list:
+            dec_line = lines[dec.lineno - 1] if (
+                dec.lineno <= len(lines)
+            ) else ""
+            m = ROUTE_DECORATOR_RE.search(dec_line)
+            if m:
+                return m.group(2)
+        return None
 
     @staticmethod
     def _check_mixed_naming(
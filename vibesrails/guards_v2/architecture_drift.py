@@ -14,6 +14,8 @@ from ._arch_layers import (
 from ._arch_layers import (
     layer_for_dir as _layer_for_dir,
 )
+from ..content_store import read_module
+from ..file_index import project_files
 from .dependency_audit import V2GuardIssue
 
 logger = logging.getLogger(__name__)
@@ -184,16 +186,14 @@ class ArchitectureDriftGuard:
 
     def _iter_py_files(self, project_root: Path) -> list[Path]:
         results: list[Path] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             if not any(part in self._SKIP_DIRS for part in py_file.parts):
                 results.append(py_file)
         return results
 
     def _parse_file(self, path: Path) -> ast.Module | None:
-        try:
-            return ast.parse(path.read_text())
-        except (SyntaxError, UnicodeDecodeError):
-            return None
+        module = read_module(path)
+        return None if module is None else module.tree
 
     def _track_drift(self, project_root: Path, current_violations: int) -> list[V2GuardIssue]:
         """Track violation count over time."""
@@ -4,7 +4,11 @@ import ast
 import logging
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -165,23 +169,23 @@ class ComplexityGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file's content for complexity issues."""
-        try:
-            tree = ast.parse(content, filename=str(filepath))
-        except SyntaxError:
-            return []
+        return self.scan_parsed(ParsedModule(filepath, content))
 
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                issues.extend(
-                    self.analyze_function(node, str(filepath))
-                )
-        return issues
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for complexity issues."""
+        return dispatch(self, module)
+
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
+    def _check_function(
+        self, node: ast.FunctionDef, module: ParsedModule
+    ) -> list[V2GuardIssue]:
+        """Run every complexity metric on one function."""
+        return self.analyze_function(node, str(module.path))
 
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan all Python files under project_root."""
         issues: list[V2GuardIssue] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             # Skip hidden dirs and common non-project dirs
             parts = py_file.parts
             if any(
@@ -192,9 +196,8 @@ class ComplexityGuard:
                 for p in parts
             ):
                 continue
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, content))
+            issues.extend(self.scan_parsed(module))
         return issues
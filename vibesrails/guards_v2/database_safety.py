@@ -4,7 +4,11 @@ import logging
 import re
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch
 
 logger = logging.getLogger(__name__)
 
@@ -80,10 +84,19 @@ class DatabaseSafetyGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for database safety issues."""
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+        return self.scan_parsed(ParsedModule(filepath, content))
+
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for database safety issues."""
+        return dispatch(self, module)
+
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Run the line-based checks (this guard has no AST detectors)."""
+        fname = str(module.path)
 
-        for lineno, line in enumerate(content.splitlines(), 1):
+        for lineno, line in enumerate(module.lines, 1):
             if line.strip().startswith("#"):
                 continue
 
@@ -113,7 +126,7 @@ class DatabaseSafetyGuard:
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan entire project for database safety issues."""
         issues: list[V2GuardIssue] = []
-        for pyfile in sorted(project_root.rglob("*.py")):
+        for pyfile in project_files(project_root):
             rel = pyfile.relative_to(project_root)
             parts = rel.parts
             if any(
@@ -125,13 +138,8 @@ class DatabaseSafetyGuard:
             # Skip test files — they contain intentional SQL fixtures
             if parts[0] == "tests" or pyfile.name.startswith("test_"):
                 continue
-            try:
-                content = pyfile.read_text(
-                    encoding="utf-8", errors="ignore"
-                )
-            except OSError:
+            module = read_module(pyfile, errors="ignore")
+            if module is None:
                 continue
-            issues.extend(
-                self.scan_file(pyfile, content)
-            )
+            issues.extend(self.scan_parsed(module))
         return issues
@@ -6,7 +6,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -27,32 +31,37 @@ class DeadCodeGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for dead code issues."""
-        try:
-            tree = ast.parse(content, filename=str(filepath))
-        except SyntaxError:
-            return []
+        return self.scan_parsed(ParsedModule(filepath, content))
 
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for dead code issues."""
+        return dispatch(self, module)
 
-        issues.extend(self._unused_imports(tree, content, fname))
-        issues.extend(self._unreachable_code(tree, fname))
-        issues.extend(self._unused_variables(tree, content, fname))
-        issues.extend(self._empty_functions(tree, fname))
+    def accepts(self, module: ParsedModule) -> bool:
+        """Only files that parse are checked."""
+        return module.tree is not None
 
-        return issues
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Put module-level checks ahead of the per-function detectors."""
+        fname = str(module.path)
+        return [
+            *self._unused_imports(module, fname),
+            *self._unreachable_code(module.tree, fname),
+            *issues,
+        ]
 
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan all Python files under *project_root*."""
         issues: list[V2GuardIssue] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             if _is_excluded(py_file):
                 continue
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, content))
+            issues.extend(self.scan_parsed(module))
 
         issues.extend(self._run_vulture(project_root))
         return issues
@@ -76,19 +85,18 @@ class DeadCodeGuard:
         return imported
 
     @staticmethod
-    def _collect_used_names(tree: ast.Module) -> set[str]:
+    def _collect_used_names(module: ParsedModule) -> set[str]:
         """Collect all Name references in the AST."""
-        return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        return {node.id for node in module.nodes(ast.Name)}
 
     def _unused_imports(
         self,
-        tree: ast.Module,
-        content: str,
+        module: ParsedModule,
         filepath: str,
     ) -> list[V2GuardIssue]:
         """Find imports whose names are never referenced."""
-        imported = self._collect_imports(tree)
-        used_names = self._collect_used_names(tree)
+        imported = self._collect_imports(module.tree)
+        used_names = self._collect_used_names(module)
 
         return [
             V2GuardIssue(
@@ -162,44 +170,38 @@ class DeadCodeGuard:
             if not name.startswith("_") and name not in read
         ]
 
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
     def _unused_variables(
         self,
-        tree: ast.Module,
-        content: str,
-        filepath: str,
+        func_node: ast.FunctionDef,
+        module: ParsedModule,
     ) -> list[V2GuardIssue]:
         """Find variables assigned but never read (skip _ prefix)."""
-        issues: list[V2GuardIssue] = []
-        for func_node in ast.walk(tree):
-            if not isinstance(func_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            for name, lineno in self._find_unused_in_func(func_node):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME, severity="info",
-                    message=f"Unused variable: '{name}'",
-                    file=filepath, line=lineno,
-                ))
-        return issues
+        return [
+            V2GuardIssue(
+                guard=GUARD_NAME, severity="info",
+                message=f"Unused variable: '{name}'",
+                file=str(module.path), line=lineno,
+            )
+            for name, lineno in self._find_unused_in_func(func_node)
+        ]
 
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
     def _empty_functions(
         self,
-        tree: ast.Module,
-        filepath: str,
+        node: ast.FunctionDef,
+        module: ParsedModule,
     ) -> list[V2GuardIssue]:
         """Detect functions whose body is only `pass` or `...`."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
-            if self._is_empty_body(node.body):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="info",
-                    message=f"Empty function: '{node.name}'",
-                    file=filepath,
-                    line=node.lineno,
-                ))
-        return issues
+        if not self._is_empty_body(node.body):
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="info",
+            message=f"Empty function: '{node.name}'",
+            file=str(module.path),
+            line=node.lineno,
+        )]
 
     @staticmethod
     def _is_empty_body(body: list[ast.stmt]) -> bool:
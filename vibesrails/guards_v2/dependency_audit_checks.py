@@ -9,6 +9,7 @@ import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
+from ..similarity_index import SimilarityIndex
 from .dependency_audit import V2GuardIssue
 
 logger = logging.getLogger(__name__)
@@ -80,17 +81,29 @@ def normalize_pkg_name(name: str) -> str:
     return re.sub(r"[-_.]+", "-", name).lower()
 
 
+_popular_index: SimilarityIndex | None = None
+
+
+def _get_popular_index() -> SimilarityIndex:
+    """Trigram index of POPULAR_PACKAGES (normalized), built once."""
+    global _popular_index
+    if _popular_index is None:
+        _popular_index = SimilarityIndex(normalize_pkg_name(p) for p in POPULAR_PACKAGES)
+    return _popular_index
+
+
 def check_typosquatting(normalized_name: str) -> str | None:
-    """Return the popular package name if typosquatting is detected."""
-    for popular in POPULAR_PACKAGES:
-        pop_norm = normalize_pkg_name(popular)
-        if normalized_name == pop_norm:
-            # exact match with popular package, not a typo
-            return None
-        dist = _levenshtein(normalized_name, pop_norm)
-        if dist <= _LEVENSHTEIN_THRESHOLD and dist > 0:
-            return popular
-    return None
+    """Return the popular package name if typosquatting is detected.
+
+    The closest popular name within _LEVENSHTEIN_THRESHOLD edits wins;
+    ties go to the more popular (earlier) entry.
+    """
+    index = _get_popular_index()
+    if normalized_name in index:
+        # exact match with popular package, not a typo
+        return None
+    matches = index.search(normalized_name, _LEVENSHTEIN_THRESHOLD, limit=1)
+    return matches[0][0] if matches else None
 
 
 def _find_latest_release_date(releases: dict) -> datetime | None:
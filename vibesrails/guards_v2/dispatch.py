@@ -0,0 +1,146 @@
+"""Single-walk AST dispatch for V2 guards.
+
+Guards declare the node types each detector wants with @visits. A
+NodeDispatcher walks a file's AST once and fans every node out to the
+subscribed detectors of all its guards, instead of every detector running
+its own ast.walk over the same tree.
+
+A dispatchable guard is any object with @visits detectors, plus optionally:
+
+- accepts(module) -> bool: skip the file entirely when False.
+- finish(module, issues) -> list: combine the detector issues with line- or
+  file-level checks; the default keeps the detector issues as they are.
+
+Detector issues come back grouped per detector in declaration order, each
+group in ast.walk order — the same order as one ast.walk per detector.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from ..parsed_module import ParsedModule
+from .dependency_audit import V2GuardIssue
+
+logger = logging.getLogger(__name__)
+
+_HANDLER_CACHE: dict[type, list[tuple[tuple[type, ...], str]]] = {}
+
+
+def visits(*node_types: type) -> Callable:
+    """Subscribe a detector ``(self, node, module) -> issues`` to exact AST classes."""
+    def decorate(fn: Callable) -> Callable:
+        fn._visits = node_types
+        return fn
+    return decorate
+
+
+def _handlers(guard_cls: type) -> list[tuple[tuple[type, ...], str]]:
+    """Return (node_types, method name) for a guard class, in declaration order."""
+    cached = _HANDLER_CACHE.get(guard_cls)
+    if cached is not None:
+        return cached
+    found: dict[str, tuple[type, ...]] = {}
+    for klass in reversed(guard_cls.__mro__):
+        for name, attr in vars(klass).items():
+            node_types = getattr(attr, "_visits", None)
+            if node_types is not None:
+                found[name] = node_types
+            elif name in found:
+                del found[name]  # overridden without @visits
+    handlers = [(node_types, name) for name, node_types in found.items()]
+    _HANDLER_CACHE[guard_cls] = handlers
+    return handlers
+
+
+class NodeDispatcher:
+    """Run several guards over one file with a single AST traversal."""
+
+    def __init__(self, guards: Sequence[Any]):
+        self.guards = list(guards)
+        self._sizes: list[int] = []
+        self._table: dict[type, list[tuple[int, int, Callable]]] = {}
+        for gi, guard in enumerate(self.guards):
+            handlers = _handlers(type(guard))
+            self._sizes.append(len(handlers))
+            for hi, (node_types, name) in enumerate(handlers):
+                method = getattr(guard, name)
+                for node_type in node_types:
+                    self._table.setdefault(node_type, []).append((gi, hi, method))
+
+    def run(self, module: ParsedModule) -> list[list[V2GuardIssue] | None]:
+        """Issues per guard, in guard order; None for a guard that raised."""
+        return self._run(module, isolate=True)
+
+    def _run(
+        self, module: ParsedModule, isolate: bool
+    ) -> list[list[V2GuardIssue] | None]:
+        skipped: set[int] = set()
+        failed: set[int] = set()
+        for gi, guard in enumerate(self.guards):
+            accepts = getattr(guard, "accepts", None)
+            if accepts is None:
+                continue
+            try:
+                if not accepts(module):
+                    skipped.add(gi)
+            except Exception as e:
+                if not isolate:
+                    raise
+                self._log_failure(gi, e)
+                failed.add(gi)
+
+        buckets = [[[] for _ in range(size)] for size in self._sizes]
+        table = self._table
+        for node in module.walk:
+            subscribers = table.get(type(node))
+            if subscribers is None:
+                continue
+            for gi, hi, method in subscribers:
+                if gi in skipped or gi in failed:
+                    continue
+                try:
+                    found = method(node, module)
+                except Exception as e:
+                    if not isolate:
+                        raise
+                    self._log_failure(gi, e)
+                    failed.add(gi)
+                    continue
+                if found:
+                    buckets[gi][hi].extend(found)
+
+        results: list[list[V2GuardIssue] | None] = []
+        for gi, guard in enumerate(self.guards):
+            if gi in failed:
+                results.append(None)
+                continue
+            if gi in skipped:
+                results.append([])
+                continue
+            issues = [issue for bucket in buckets[gi] for issue in bucket]
+            finish = getattr(guard, "finish", None)
+            if finish is not None:
+                try:
+                    issues = finish(module, issues)
+                except Exception as e:
+                    if not isolate:
+                        raise
+                    self._log_failure(gi, e)
+                    results.append(None)
+                    continue
+            results.append(issues)
+        return results
+
+    def _log_failure(self, gi: int, error: Exception) -> None:
+        logger.debug(
+            "V2 guard %s failed: %s", self.guards[gi].__class__.__name__, error,
+        )
+
+
+def dispatch(guard: Any, module: ParsedModule) -> list[V2GuardIssue]:
+    """Run one guard over a parsed file; exceptions propagate to the caller."""
+    return NodeDispatcher([guard])._run(module, isolate=False)[0] or []
+
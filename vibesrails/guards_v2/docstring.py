@@ -5,7 +5,11 @@ import logging
 import re
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -19,31 +23,35 @@ class DocstringGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for docstring issues."""
-        try:
-            tree = ast.parse(content, filename=str(filepath))
-        except SyntaxError:
-            return []
+        return self.scan_parsed(ParsedModule(filepath, content))
 
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for docstring issues."""
+        return dispatch(self, module)
 
-        issues.extend(self._check_module_docstring(tree, fname))
-        issues.extend(self._check_classes(tree, fname))
-        issues.extend(self._check_functions(tree, fname))
+    def accepts(self, module: ParsedModule) -> bool:
+        """Only files that parse are checked."""
+        return module.tree is not None
 
-        return issues
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Put the module docstring check ahead of class/function checks."""
+        return [
+            *self._check_module_docstring(module.tree, str(module.path)),
+            *issues,
+        ]
 
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan all Python files under *project_root*."""
         issues: list[V2GuardIssue] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             if _is_excluded(py_file):
                 continue
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, content))
+            issues.extend(self.scan_parsed(module))
         return issues
 
     # ----------------------------------------------------------
@@ -73,78 +81,65 @@ class DocstringGuard:
             )]
         return []
 
+    @visits(ast.ClassDef)
     def _check_classes(
-        self, tree: ast.Module, fname: str
+        self, node: ast.ClassDef, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Check public classes for missing/empty docstrings."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ClassDef):
-                continue
-            if node.name.startswith("_"):
-                continue
-            doc = ast.get_docstring(node)
-            if doc is None:
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=f"Public class '{node.name}' missing"
-                            " docstring",
-                    file=fname,
-                    line=node.lineno,
-                ))
-            elif _is_empty_docstring(doc):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=f"Public class '{node.name}' has"
-                            " empty docstring",
-                    file=fname,
-                    line=node.lineno,
-                ))
-        return issues
+        if node.name.startswith("_"):
+            return []
+        doc = ast.get_docstring(node)
+        if doc is None:
+            return [V2GuardIssue(
+                guard=GUARD_NAME,
+                severity="warn",
+                message=f"Public class '{node.name}' missing"
+                        " docstring",
+                file=str(module.path),
+                line=node.lineno,
+            )]
+        if _is_empty_docstring(doc):
+            return [V2GuardIssue(
+                guard=GUARD_NAME,
+                severity="warn",
+                message=f"Public class '{node.name}' has"
+                        " empty docstring",
+                file=str(module.path),
+                line=node.lineno,
+            )]
+        return []
 
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
     def _check_functions(
-        self, tree: ast.Module, fname: str
+        self, node: ast.FunctionDef, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Check public functions/methods for docstring issues."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(
-                node, (ast.FunctionDef, ast.AsyncFunctionDef)
-            ):
-                continue
-            if node.name.startswith("_"):
-                continue
-
-            doc = ast.get_docstring(node)
-            if doc is None:
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=f"Public function '{node.name}'"
-                            " missing docstring",
-                    file=fname,
-                    line=node.lineno,
-                ))
-                continue
+        if node.name.startswith("_"):
+            return []
+        fname = str(module.path)
 
-            if _is_empty_docstring(doc):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=f"Public function '{node.name}'"
-                            " has empty docstring",
-                    file=fname,
-                    line=node.lineno,
-                ))
-                continue
+        doc = ast.get_docstring(node)
+        if doc is None:
+            return [V2GuardIssue(
+                guard=GUARD_NAME,
+                severity="warn",
+                message=f"Public function '{node.name}'"
+                        " missing docstring",
+                file=fname,
+                line=node.lineno,
+            )]
 
-            issues.extend(
-                self._check_outdated_params(node, doc, fname)
-            )
+        if _is_empty_docstring(doc):
+            return [V2GuardIssue(
+                guard=GUARD_NAME,
+                severity="warn",
+                message=f"Public function '{node.name}'"
+                        " has empty docstring",
+                file=fname,
+                line=node.lineno,
+            )]
 
-        return issues
+        return self._check_outdated_params(node, doc, fname)
 
     def _check_outdated_params(
         self,
@@ -12,7 +12,11 @@ from ._env_patterns import (
     SECRET_PATTERNS,
     UNSAFE_ENVIRON_RE,
 )
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -50,17 +54,27 @@ class EnvSafetyGuard:
         Returns:
             List of detected issues.
         """
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+        return self.scan_parsed(ParsedModule(filepath, content))
+
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for env safety issues."""
+        return dispatch(self, module)
+
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Put the line-based checks ahead of the class detector issues."""
+        result: list[V2GuardIssue] = []
+        fname = str(module.path)
 
-        for lineno, line in enumerate(content.splitlines(), 1):
+        for lineno, line in enumerate(module.lines, 1):
             # Detect unsafe direct-subscript environ access
             for match in UNSAFE_ENVIRON_RE.finditer(line):
                 key = match.group(1)
                 # Build message without triggering our own regex
                 env_call = "os.environ" + '["{k}"]'.format(k=key)
                 safe_call = "os.environ.get" + '("{k}")'.format(k=key)
-                issues.append(V2GuardIssue(
+                result.append(V2GuardIssue(
                     guard=GUARD_NAME,
                     severity="warn",
                     message=(
@@ -74,7 +88,7 @@ class EnvSafetyGuard:
             # Check hardcoded secrets
             for label, pattern in SECRET_PATTERNS:
                 if pattern.search(line):
-                    issues.append(V2GuardIssue(
+                    result.append(V2GuardIssue(
                         guard=GUARD_NAME,
                         severity="block",
                         message=f"{label} detected in source",
@@ -82,30 +96,17 @@ class EnvSafetyGuard:
                         line=lineno,
                     ))
 
-        # Check for Settings/Config classes that may leak secrets in __repr__
-        issues.extend(self._check_secret_leak_in_repr(filepath, content))
-
-        return issues
+        # Settings/Config classes that may leak secrets in __repr__
+        result.extend(issues)
+        return result
 
+    @visits(ast.ClassDef)
     def _check_secret_leak_in_repr(
-        self, filepath: Path, content: str
+        self, node: ast.ClassDef, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Detect Settings/Config classes with secret fields that lack masked __repr__."""
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return []
-
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                issue = self._check_class_for_secret_leak(node, fname)
-                if issue:
-                    issues.append(issue)
-
-        return issues
+        issue = self._check_class_for_secret_leak(node, str(module.path))
+        return [issue] if issue else []
 
     def _check_class_for_secret_leak(
         self, node: ast.ClassDef, fname: str
@@ -270,7 +271,7 @@ class EnvSafetyGuard:
     ) -> list[V2GuardIssue]:
         """Walk Python source files and scan each."""
         issues: list[V2GuardIssue] = []
-        for pyfile in project_root.rglob("*.py"):
+        for pyfile in project_files(project_root):
             # Skip venv / hidden dirs
             parts = pyfile.relative_to(project_root).parts
             if any(p.startswith(".") or p == "venv" for p in parts):
@@ -278,9 +279,8 @@ class EnvSafetyGuard:
             # Skip test files — they contain intentional secret fixtures
             if parts[0] == "tests" or pyfile.name.startswith("test_"):
                 continue
-            try:
-                content = pyfile.read_text(errors="ignore")
-            except OSError:
+            module = read_module(pyfile, errors="ignore")
+            if module is None:
                 continue
-            issues.extend(self.scan_file(pyfile, content))
+            issues.extend(self.scan_parsed(module))
         return issues
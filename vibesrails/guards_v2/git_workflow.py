@@ -3,11 +3,12 @@
 import logging
 from pathlib import Path
 
+from ..git_snapshot import git_snapshot
 from ._git_helpers import (
     CONVENTIONAL_RE,
     MAX_UNRELATED_DIRS,
-    TRACKED_FILE_BLOCKLIST,
     VALID_BRANCH_PREFIXES,
+    iter_blocklisted,
 )
 from ._git_helpers import (
     run_git as _run_git,
@@ -27,17 +28,15 @@ class GitWorkflowGuard:
 
     def _is_git_repo(self) -> bool:
         """Check if project_root is inside a git repository."""
-        ok, _ = _run_git(["rev-parse", "--git-dir"], self.root)
-        return ok
+        return git_snapshot(self.root).status is not None
 
     def check_branch(self) -> list[V2GuardIssue]:
         """Check branch name conventions."""
         issues: list[V2GuardIssue] = []
-        ok, branch = _run_git(
-            ["rev-parse", "--abbrev-ref", "HEAD"], self.root
-        )
-        if not ok:
+        status = git_snapshot(self.root).status
+        if status is None or not status.branch:
             return issues
+        branch = status.branch
 
         if branch in ("main", "master"):
             issues.append(V2GuardIssue(
@@ -91,14 +90,12 @@ class GitWorkflowGuard:
         """Check for messy workflow and unfocused commits."""
         issues: list[V2GuardIssue] = []
 
-        # Check mixed staged + unstaged changes
-        _, staged = _run_git(
-            ["diff", "--cached", "--name-only"], self.root
-        )
-        _, unstaged = _run_git(
-            ["diff", "--name-only"], self.root
-        )
+        status = git_snapshot(self.root).status
+        if status is None:
+            return issues
+        staged, unstaged = status.staged, status.unstaged
 
+        # Check mixed staged + unstaged changes
         if staged and unstaged:
             issues.append(V2GuardIssue(
                 guard=GUARD_NAME,
@@ -111,11 +108,7 @@ class GitWorkflowGuard:
 
         # Check unfocused commit (staged files span many dirs)
         if staged:
-            dirs = {
-                str(Path(f).parts[0])
-                for f in staged.splitlines()
-                if f.strip()
-            }
+            dirs = {str(Path(f).parts[0]) for f in staged}
             if len(dirs) > MAX_UNRELATED_DIRS:
                 issues.append(V2GuardIssue(
                     guard=GUARD_NAME,
@@ -195,43 +188,17 @@ class GitWorkflowGuard:
     def check_tracked_hygiene(self) -> list[V2GuardIssue]:
         """Detect files tracked by git that should be local-only."""
         issues: list[V2GuardIssue] = []
-        ok, tracked_output = _run_git(["ls-files"], self.root)
-        if not ok:
+        tracked = git_snapshot(self.root).tracked_stream
+        if tracked is None:
             return issues
 
-        tracked = tracked_output.splitlines()
-        for filepath in tracked:
-            for pattern, desc in TRACKED_FILE_BLOCKLIST:
-                if pattern.endswith("/"):
-                    # Directory prefix match
-                    if filepath.startswith(pattern) or f"/{pattern}" in filepath:
-                        issues.append(V2GuardIssue(
-                            guard=GUARD_NAME,
-                            severity="warn",
-                            message=f"Tracked file should be in .gitignore ({desc}): {filepath}",
-                            file=filepath,
-                        ))
-                        break
-                elif pattern.startswith("*"):
-                    # Suffix match
-                    if filepath.endswith(pattern[1:]):
-                        issues.append(V2GuardIssue(
-                            guard=GUARD_NAME,
-                            severity="warn",
-                            message=f"Tracked file should be in .gitignore ({desc}): {filepath}",
-                            file=filepath,
-                        ))
-                        break
-                else:
-                    # Exact or basename match
-                    if filepath == pattern or filepath.endswith(f"/{pattern}"):
-                        issues.append(V2GuardIssue(
-                            guard=GUARD_NAME,
-                            severity="warn",
-                            message=f"Tracked file should be in .gitignore ({desc}): {filepath}",
-                            file=filepath,
-                        ))
-                        break
+        for filepath, desc in iter_blocklisted(tracked):
+            issues.append(V2GuardIssue(
+                guard=GUARD_NAME,
+                severity="warn",
+                message=f"Tracked file should be in .gitignore ({desc}): {filepath}",
+                file=filepath,
+            ))
 
         return issues
 
@@ -249,10 +216,8 @@ class GitWorkflowGuard:
         issues.extend(self.check_tracked_hygiene())
 
         # Check last commit message
-        ok, msg = _run_git(
-            ["log", "-1", "--format=%s"], self.root
-        )
-        if ok and msg:
-            issues.extend(self.check_commit_message(msg))
+        commit = git_snapshot(self.root).last_commit
+        if commit is not None and commit.subject:
+            issues.extend(self.check_commit_message(commit.subject))
 
         return issues
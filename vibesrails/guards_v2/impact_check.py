@@ -7,6 +7,7 @@ import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from ..file_index import project_files
 from .dependency_audit import V2GuardIssue
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ class CallIndex:
 def _iter_py_files(root: Path, limit: int = 300):
     """Yield .py files under *root*, skipping excluded directories."""
     count = 0
-    for path in sorted(root.rglob("*.py")):
+    for path in project_files(root):
         if count >= limit:
             break
         # Skip any path whose parts contain a skip dir or test file patterns
@@ -1,7 +1,8 @@
 """Mutation testing package for VibesRails guards v2.
 
 Re-exports all public symbols for backward compatibility.
-Internal modules: guard, engine, visitors, mutmut.
+Internal modules: guard, engine, parallel, coverage_map, schemata,
+result_cache, visitors, mutmut (fork_server runs standalone, see schemata).
 """
 
 from .engine import (
@@ -22,12 +23,21 @@ from .engine import (
     _parse_diff_line,
     _should_skip_mutation,
     apply_mutation,
+    collect_file,
     find_test_file,
     get_changed_functions,
     get_source_files,
     mutation_in_functions,
+    pytest_invocation,
     run_tests_on_mutant,
     scan_file,
+    submit_file,
+)
+from .coverage_map import (
+    CoverageMap,
+    SelectedTests,
+    build_coverage_map,
+    load_coverage_map,
 )
 from .guard import (
     BLOCK_THRESHOLD,
@@ -36,6 +46,9 @@ from .guard import (
     MutationGuard,
 )
 from .mutmut import _parse_mutmut_results, scan_with_mutmut
+from .parallel import MutantPool, resolve_mutation_jobs
+from .result_cache import MutantKeys, ResultCache, open_result_cache
+from .schemata import ForkServer, Schema, build_schema, schemata_supported
 
 __all__ = [
     # Guard
@@ -58,13 +71,33 @@ __all__ = [
     "apply_mutation",
     "find_test_file",
     "run_tests_on_mutant",
+    "pytest_invocation",
     "mutation_in_functions",
     "scan_file",
+    "submit_file",
+    "collect_file",
     "get_source_files",
     "get_changed_functions",
     "_collect_mutations",
     "_should_skip_mutation",
     "_parse_diff_line",
+    # Coverage-guided test selection
+    "CoverageMap",
+    "SelectedTests",
+    "build_coverage_map",
+    "load_coverage_map",
+    # Parallel execution
+    "MutantPool",
+    "resolve_mutation_jobs",
+    # Persistent results
+    "MutantKeys",
+    "ResultCache",
+    "open_result_cache",
+    # Mutation schemata
+    "Schema",
+    "ForkServer",
+    "build_schema",
+    "schemata_supported",
     # Constants
     "MAX_MUTATIONS_PER_FILE",
     "MUTATION_TEST_TIMEOUT",
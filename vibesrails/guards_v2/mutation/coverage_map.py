@@ -0,0 +1,246 @@
+"""Per-line test coverage for coverage-guided mutant test selection.
+
+find_test_file guesses one test file per source file by name, and every
+mutant ran that whole file: slow, and a wrong guess reports mutants as
+survivors when the tests that exercise them live elsewhere.
+
+build_coverage_map runs the project's suite once under coverage.py, with
+one dynamic context per test (its pytest node ID, see coverage_plugin),
+and records which tests execute each source line. A mutant then runs only
+the tests covering its line; a mutant on a line no test executes is "no
+coverage" without running anything. Lines executed only at import time
+(module constants, decorators) select every test that covers the file.
+Tests that fail on the unmutated code are left out, as they would kill
+every mutant.
+
+The map is kept in .vibesrails/cache/mutation_coverage.json and rebuilt
+when any .py file of the project changes. Without coverage.py installed,
+load_coverage_map returns None and callers fall back to find_test_file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+from ...file_index import get_index
+
+logger = logging.getLogger(__name__)
+
+COVERAGE_MAP_FILE = Path(".vibesrails") / "cache" / "mutation_coverage.json"
+COVERAGE_MAP_VERSION = 1
+COVERAGE_RUN_TIMEOUT = 600
+PLUGIN = "vibesrails.guards_v2.mutation.coverage_plugin"
+
+
+class SelectedTests(NamedTuple):
+    """Tests to run for one mutant: pytest node IDs relative to root."""
+
+    root: Path
+    ids: tuple[str, ...]
+
+    @property
+    def files(self) -> list[str]:
+        """Test files holding the selected tests, relative to root."""
+        return sorted({nodeid.split("::", 1)[0] for nodeid in self.ids})
+
+    @property
+    def support_files(self) -> list[str]:
+        """files plus the conftest.py and __init__.py files on their paths."""
+        wanted: dict[str, None] = {}
+        for rel in self.files:
+            parts = Path(rel).parts
+            wanted[rel] = None
+            for depth in range(len(parts)):
+                for name in ("conftest.py", "__init__.py"):
+                    wanted[Path(*parts[:depth], name).as_posix()] = None
+        return list(wanted)
+
+
+class CoverageMap:
+    """Which tests execute each line of each source file."""
+
+    def __init__(
+        self,
+        tests: list[str],
+        lines: dict[str, dict[int, list[int]]],
+        fingerprint: str = "",
+    ):
+        self.tests = tests  # node IDs; lines refer to them by index
+        self.lines = lines  # source rel path -> line -> test indexes ([] = import only)
+        self.fingerprint = fingerprint
+
+    def covers_file(self, source_rel: str) -> bool:
+        """True if any test executes a line of the file."""
+        return any(self.lines.get(source_rel, {}).values())
+
+    def tests_for(self, source_rel: str, line: int) -> tuple[str, ...]:
+        """Node IDs of the tests that execute a line; () if none does."""
+        file_lines = self.lines.get(source_rel, {})
+        indexes = file_lines.get(line)
+        if indexes is None:
+            return ()
+        if not indexes:  # ran at import only: any test of the file may depend on it
+            indexes = sorted({i for ids in file_lines.values() for i in ids})
+        return tuple(self.tests[i] for i in sorted(indexes))
+
+    def to_json(self) -> dict:
+        return {
+            "version": COVERAGE_MAP_VERSION,
+            "fingerprint": self.fingerprint,
+            "tests": self.tests,
+            "lines": {
+                rel: {str(line): ids for line, ids in file_lines.items()}
+                for rel, file_lines in self.lines.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> CoverageMap | None:
+        if not isinstance(data, dict) or data.get("version") != COVERAGE_MAP_VERSION:
+            return None
+        try:
+            lines = {
+                str(rel): {int(line): [int(i) for i in ids] for line, ids in file_lines.items()}
+                for rel, file_lines in data["lines"].items()
+            }
+            return cls([str(t) for t in data["tests"]], lines, str(data["fingerprint"]))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+
+def coverage_available() -> bool:
+    return importlib.util.find_spec("coverage") is not None
+
+
+def project_fingerprint(project_root: Path) -> str:
+    """Hash of every .py file's path, size and mtime under the project."""
+    digest = hashlib.sha256()
+    for entry in get_index(project_root).match("*.py"):
+        digest.update(f"{entry.rel}\0{entry.size}\0{entry.mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _run_suite(project_root: Path, workdir: Path) -> tuple[Path, set[str]] | None:
+    """Run pytest under coverage; (data file, failing test IDs), or None."""
+    data_file = workdir / ".coverage"
+    failed_file = workdir / "failed.txt"
+    rcfile = workdir / "coveragerc"
+    # Our own rcfile: the project's [tool.coverage] source/omit would hide files
+    rcfile.write_text(f"[run]\ndata_file = {data_file}\nsource = {project_root}\n")
+    env = os.environ.copy()
+    env["VIBESRAILS_FAILED_TESTS"] = str(failed_file)
+    # The plugin must import from this vibesrails even if the project's venv lacks it
+    package_parent = str(Path(__file__).resolve().parents[3])
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (env.get("PYTHONPATH"), package_parent) if p
+    )
+    try:
+        subprocess.run(
+            [
+                sys.executable, "-m", "coverage", "run", f"--rcfile={rcfile}",
+                "-m", "pytest", "-p", PLUGIN, f"--rootdir={project_root}",
+                "-p", "no:cacheprovider", "--no-header", "-q", "--tb=no",
+            ],
+            capture_output=True,
+            timeout=COVERAGE_RUN_TIMEOUT,
+            cwd=str(project_root),
+            env=env,
+        )
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.debug("Coverage run failed: %s", e)
+        return None
+    if not data_file.exists():
+        return None
+    try:
+        failed = set(failed_file.read_text(encoding="utf-8").split("\n")) - {""}
+    except OSError:
+        failed = set()
+    return data_file, failed
+
+
+def _read_coverage_data(
+    data_file: Path, project_root: Path, failed: set[str],
+) -> tuple[list[str], dict[str, dict[int, list[int]]]]:
+    from coverage import CoverageData
+
+    data = CoverageData(basename=str(data_file))
+    data.read()
+    root = os.path.realpath(project_root)
+    tests: list[str] = []
+    test_index: dict[str, int] = {}
+    lines: dict[str, dict[int, list[int]]] = {}
+    for filename in sorted(data.measured_files()):
+        rel = os.path.relpath(os.path.realpath(filename), root)
+        if rel.startswith(".."):
+            continue
+        file_lines: dict[int, list[int]] = {}
+        for line, contexts in data.contexts_by_lineno(filename).items():
+            ids: list[int] = []
+            for context in contexts:
+                if not context or context in failed:
+                    continue
+                if context not in test_index:
+                    test_index[context] = len(tests)
+                    tests.append(context)
+                ids.append(test_index[context])
+            if not ids and any(contexts):
+                continue  # only failing tests ran it: as good as uncovered
+            file_lines[line] = sorted(ids)
+        lines[Path(rel).as_posix()] = file_lines
+    return tests, lines
+
+
+def build_coverage_map(project_root: Path) -> CoverageMap | None:
+    """Run the suite once under coverage and map lines to tests."""
+    if not coverage_available():
+        return None
+    fingerprint = project_fingerprint(project_root)
+    with tempfile.TemporaryDirectory(prefix="vibesrails-coverage-") as tmp:
+        ran = _run_suite(project_root, Path(tmp))
+        if ran is None:
+            return None
+        try:
+            tests, lines = _read_coverage_data(ran[0], project_root, ran[1])
+        except Exception as e:  # noqa: BLE001 — a corrupt data file means no map
+            logger.debug("Coverage data unreadable: %s", e)
+            return None
+    return CoverageMap(tests, lines, fingerprint)
+
+
+def _save(project_root: Path, coverage_map: CoverageMap) -> None:
+    path = project_root / COVERAGE_MAP_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Symlink protection: the cache directory must stay under the root
+        path.parent.resolve().relative_to(project_root.resolve())
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(coverage_map.to_json()))
+        os.replace(tmp, path)
+    except (OSError, ValueError) as e:
+        logger.debug("Coverage map not saved: %s", e)
+
+
+def load_coverage_map(project_root: Path) -> CoverageMap | None:
+    """Stored map if the project is unchanged, else a freshly built one."""
+    if not coverage_available():
+        return None
+    try:
+        data = json.loads((project_root / COVERAGE_MAP_FILE).read_text())
+    except (OSError, json.JSONDecodeError, ValueError):
+        data = None
+    cached = CoverageMap.from_json(data) if data is not None else None
+    if cached is not None and cached.fingerprint == project_fingerprint(project_root):
+        return cached
+    coverage_map = build_coverage_map(project_root)
+    if coverage_map is not None:
+        _save(project_root, coverage_map)
+    return coverage_map
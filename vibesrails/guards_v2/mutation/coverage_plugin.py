@@ -0,0 +1,34 @@
+"""pytest plugin loaded by coverage_map.build_coverage_map.
+
+Switches coverage.py to one dynamic context per test, named by the test's
+node ID, and writes the IDs of failing tests to $VIBESRAILS_FAILED_TESTS.
+"""
+
+import os
+
+import coverage
+import pytest
+
+_failed: set[str] = set()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    cov = coverage.Coverage.current()
+    if cov is not None:
+        cov.switch_context(item.nodeid)
+    yield
+    if cov is not None:
+        cov.switch_context("")
+
+
+def pytest_runtest_logreport(report):
+    if report.failed:
+        _failed.add(report.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = os.environ.get("VIBESRAILS_FAILED_TESTS")
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(sorted(_failed)))
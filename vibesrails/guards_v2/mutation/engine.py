@@ -8,12 +8,17 @@ import ast
 import copy
 import logging
 import os
-import shutil
 import subprocess
 import sys
-import tempfile
+from collections.abc import Sequence
+from concurrent.futures import Future
 from pathlib import Path
 
+from ...file_index import project_files
+from .coverage_map import CoverageMap, SelectedTests
+from .parallel import MutantPool
+from .result_cache import MutantKeys, ResultCache
+from .schemata import build_schema
 from .visitors import (
     MUTATION_TYPES,
     ArithmeticSwapper,
@@ -24,6 +29,7 @@ from .visitors import (
     ReturnNoneSwapper,
     StatementRemover,
     _count_targets,
+    list_targets,
 )
 
 logger = logging.getLogger(__name__)
@@ -40,8 +46,8 @@ __all__ = [
     "ComparisonSwapper", "BooleanSwapper", "ReturnNoneSwapper",
     "ArithmeticSwapper", "StatementRemover",
     "MUTATION_TYPES", "_count_targets",
-    "apply_mutation", "find_test_file", "run_tests_on_mutant",
-    "mutation_in_functions", "scan_file",
+    "apply_mutation", "find_test_file", "run_tests_on_mutant", "pytest_invocation",
+    "mutation_in_functions", "scan_file", "submit_file", "collect_file",
     "get_source_files", "get_changed_functions",
     "MAX_MUTATIONS_PER_FILE", "MUTATION_TEST_TIMEOUT",
     "PYTEST_PER_MUTANT_TIMEOUT", "SKIP_FILES",
@@ -54,16 +60,25 @@ def apply_mutation(
     target_idx: int,
 ) -> ast.Module | None:
     """Apply a single mutation to an AST tree."""
+    return _apply_mutation_at(tree, mutation_type, target_idx)[0]
+
+
+def _apply_mutation_at(
+    tree: ast.Module,
+    mutation_type: str,
+    target_idx: int,
+) -> tuple[ast.Module | None, int]:
+    """Apply a single mutation; (mutated tree, source line of the mutation)."""
     tree_copy = copy.deepcopy(tree)
     visitor_cls = MUTATION_TYPES.get(mutation_type)
     if visitor_cls is None:
-        return None
+        return None, 0
     visitor = visitor_cls(target_idx)
     mutated = visitor.visit(tree_copy)
     if not visitor.applied:
-        return None
+        return None, 0
     ast.fix_missing_locations(mutated)
-    return mutated
+    return mutated, visitor.line
 
 
 def find_test_file(
@@ -82,24 +97,44 @@ def find_test_file(
     return None
 
 
+def pytest_invocation(
+    mutant_path: Path, test_path: Path, test_ids: Sequence[str] = (),
+) -> tuple[list[str], Path, list[str]]:
+    """(pytest targets, cwd, PYTHONPATH entries) to test a mutant.
+
+    With test_ids, runs only those pytest node IDs, relative to the
+    directory test_path; otherwise the whole test file test_path.
+    """
+    env_dir = mutant_path.parent
+    if test_ids:
+        return [*test_ids, f"--rootdir={test_path}"], test_path, [str(env_dir), str(test_path)]
+    return [str(test_path)], env_dir, [str(env_dir)]
+
+
 def run_tests_on_mutant(
-    mutant_path: Path, test_path: Path
+    mutant_path: Path, test_path: Path, test_ids: Sequence[str] = (),
 ) -> bool:
-    """Run tests against a mutant. Returns True if mutant survived."""
-    env_dir = mutant_path.parent
+    """Run tests against a mutant. Returns True if mutant survived.
+
+    test_path and test_ids as for pytest_invocation.
+    """
+    targets, cwd, pythonpath = pytest_invocation(mutant_path, test_path, test_ids)
     env = os.environ.copy()
-    env["PYTHONPATH"] = str(env_dir)
+    env["PYTHONPATH"] = os.pathsep.join(pythonpath)
+    # Sandboxes are reused: a .pyc from the previous same-size mutant written
+    # within the same second would otherwise be imported instead of this one.
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
     try:
         result = subprocess.run(
             [
                 sys.executable, "-m", "pytest",
-                str(test_path),
+                *targets,
                 f"--timeout={PYTEST_PER_MUTANT_TIMEOUT}",
                 "--no-header", "-q", "--tb=no", "-x",
             ],
             capture_output=True,
             timeout=MUTATION_TEST_TIMEOUT,
-            cwd=str(env_dir),
+            cwd=str(cwd),
             env=env,
         )
         return result.returncode == 0
@@ -145,68 +180,172 @@ def _should_skip_mutation(
     return False
 
 
-def _run_single_mutation(
+def _mutant_code(
     mut_type: str, idx: int, tree: ast.Module,
     functions_filter: set[str] | None,
-    tmp_src: Path, tmp_test: Path, report: "FileMutationReport",
-) -> None:
-    """Run a single mutation and update report."""
-    mutated = apply_mutation(tree, mut_type, idx)
+) -> tuple[str, int] | None:
+    """(source, mutated line) of one mutant, or None if the mutation is skipped."""
+    mutated, line = _apply_mutation_at(tree, mut_type, idx)
     if _should_skip_mutation(mutated, tree, functions_filter):
-        return
-    report.total += 1
+        return None
     try:
-        mutant_code = ast.unparse(mutated)
+        return ast.unparse(mutated), line
     except (ValueError, RecursionError) as e:
         logger.debug("Failed to unparse mutant: %s", e)
-        report.total -= 1
-        return
-    tmp_src.write_text(mutant_code, encoding="utf-8")
-    survived = run_tests_on_mutant(tmp_src, tmp_test)
-    report.results.append(MutantResult(
-        file=report.file, function="unknown",
-        mutation_type=mut_type, line=0, killed=not survived,
-    ))
-    if survived:
-        report.survived += 1
-    else:
-        report.killed += 1
+        return None
 
 
-def scan_file(
-    source_path: Path, test_path: Path, project_root: Path,
-    functions_filter: set[str] | None = None,
-) -> FileMutationReport:
-    """Run mutation testing on a single source file."""
-    report = FileMutationReport(file=str(source_path.relative_to(project_root)))
-    try:
-        tree = ast.parse(source_path.read_text(encoding="utf-8"))
-    except SyntaxError:
-        return report
+def _settled(survived: bool | None) -> Future:
+    """An already settled mutant: cached, or None when no test executes its line."""
+    future: Future = Future()
+    future.set_result(survived)
+    return future
+
 
+def _schema_mutations(
+    tree: ast.Module, functions_filter: set[str] | None,
+) -> list[tuple[str, int]]:
+    """The mutations _mutant_code would keep, without building each mutant."""
     mutations = _collect_mutations(tree)
-    if not mutations:
-        return report
+    if functions_filter is None:
+        return mutations
+    if functions_filter and not any(
+        isinstance(node, ast.FunctionDef) and node.name in functions_filter
+        for node in ast.walk(tree)
+    ):
+        return []
+    # A return already returning None mutates into identical code
+    targets = list_targets(tree, "return_none")
+    return [
+        (mut_type, idx) for mut_type, idx in mutations
+        if not (
+            mut_type == "return_none"
+            and isinstance(targets[idx][0].value, ast.Constant)
+            and targets[idx][0].value.value is None
+        )
+    ]
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_dir = Path(tmp)
-        tmp_test = tmp_dir / "tests" / test_path.name
-        tmp_test.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(test_path, tmp_test)
 
-        tmp_src = tmp_dir / source_path.relative_to(project_root)
-        tmp_src.parent.mkdir(parents=True, exist_ok=True)
+def _iter_mutants(
+    tree: ast.Module, functions_filter: set[str] | None, schemata: bool,
+):
+    """(mutation type, target index, line, mutant) for every kept mutation.
 
-        for mut_type, idx in mutations:
-            _run_single_mutation(mut_type, idx, tree, functions_filter, tmp_src, tmp_test, report)
+    mutant is the mutant's source, or with schemata its (Schema, mutant id).
+    """
+    if schemata:
+        mutations = _schema_mutations(tree, functions_filter)
+        schema = build_schema(tree, mutations)
+        for mutant_id, (mut_type, idx) in enumerate(mutations, 1):
+            yield mut_type, idx, schema.lines[mutant_id - 1], (schema, mutant_id)
+        return
+    for mut_type, idx in _collect_mutations(tree):
+        mutant = _mutant_code(mut_type, idx, tree, functions_filter)
+        if mutant is not None:
+            yield mut_type, idx, mutant[1], mutant[0]
 
+
+def submit_file(
+    pool: MutantPool, source_path: Path, test_path: Path | None, project_root: Path,
+    functions_filter: set[str] | None = None,
+    coverage: CoverageMap | None = None,
+    cache: ResultCache | None = None,
+) -> tuple[FileMutationReport, list[tuple[str, int, Future, str | None]]]:
+    """Queue every mutant of a source file on pool; finish with collect_file.
+
+    With a coverage map, each mutant runs only the tests covering its line
+    (test_path is unused); without one, the whole test file test_path.
+    A schemata pool gets one instrumented module for all of the file's mutants.
+    With a result cache, mutants whose function and tests are unchanged
+    since a previous run take that run's outcome instead of running.
+    """
+    source_rel = source_path.relative_to(project_root)
+    report = FileMutationReport(file=str(source_rel))
+    try:
+        tree = ast.parse(source_path.read_text(encoding="utf-8"))
+    except SyntaxError:
+        return report, []
+
+    keys = MutantKeys(tree, source_rel.as_posix()) if cache is not None else None
+    pending = []
+    for mut_type, idx, line, mutant in _iter_mutants(tree, functions_filter, pool.schemata):
+        selected = None
+        if coverage is not None:
+            test_ids = coverage.tests_for(source_rel.as_posix(), line)
+            if not test_ids:
+                pending.append((mut_type, line, _settled(None), None))
+                continue
+            selected = SelectedTests(project_root, test_ids)
+        key = None
+        if cache is not None:
+            key = keys.key(mut_type, idx, cache.tests_digest(test_path, selected))
+            survived = cache.get(key)
+            if survived is not None:
+                pending.append((mut_type, line, _settled(survived), None))
+                continue
+        if pool.schemata:
+            schema, mutant_id = mutant
+            future = pool.submit_schema(source_rel, test_path, schema, mutant_id, selected)
+        elif selected is not None:
+            future = pool.submit(source_rel, test_path, mutant, selected)
+        else:
+            future = pool.submit(source_rel, test_path, mutant)
+        pending.append((mut_type, line, future, key))
+    return report, pending
+
+
+def collect_file(
+    submitted: tuple[FileMutationReport, list[tuple[str, int, Future, str | None]]],
+    cache: ResultCache | None = None,
+) -> FileMutationReport:
+    """Wait for a file's mutants and fill its report, in mutation order.
+
+    A future resolving to None is a mutant no test covers: counted in the
+    total, neither killed nor survived. Outcomes of mutants submitted with
+    a cache key are stored in cache.
+    """
+    report, pending = submitted
+    outcomes: list[tuple[str, bool]] = []
+    for mut_type, line, future, key in pending:
+        survived = future.result()
+        if key is not None and survived is not None:
+            outcomes.append((key, survived))
+        report.total += 1
+        report.results.append(MutantResult(
+            file=report.file, function="unknown",
+            mutation_type=mut_type, line=line, killed=survived is False,
+            no_coverage=survived is None,
+        ))
+        if survived is None:
+            report.no_coverage += 1
+        elif survived:
+            report.survived += 1
+        else:
+            report.killed += 1
+    if cache is not None:
+        cache.put(outcomes)
     return report
 
 
+def scan_file(
+    source_path: Path, test_path: Path | None, project_root: Path,
+    functions_filter: set[str] | None = None,
+    jobs: int = 1,
+    coverage: CoverageMap | None = None,
+    schemata: bool = False,
+    cache: ResultCache | None = None,
+) -> FileMutationReport:
+    """Run mutation testing on a single source file, on up to `jobs` workers."""
+    with MutantPool(jobs, schemata=schemata) as pool:
+        return collect_file(submit_file(
+            pool, source_path, test_path, project_root, functions_filter, coverage, cache,
+        ), cache)
+
+
 def get_source_files(project_root: Path) -> list[Path]:
     """Get all Python source files to mutate."""
     files = []
-    for f in project_root.rglob("*.py"):
+    for f in project_files(project_root):
         if f.name in SKIP_FILES:
             continue
         if "test" in f.name.lower():
@@ -0,0 +1,86 @@
+"""Fork server for mutation schemata (see schemata.py).
+
+Run by path with the stdlib only, so nothing of vibesrails lands in the
+interpreter that imports the code under test. Protocol, one JSON object
+per line:
+
+- stdin, first line: {"preload": [module, ...], "fresh": [module, ...],
+  "timeout": seconds}, fresh modules being dropped again after preloading;
+- stdin, then per mutant: {"mutant": id, "cwd": dir, "args": [pytest args]};
+- stdout, per mutant: {"survived": bool}.
+
+Each mutant runs in a forked child with ``__vibesrails_mutant__`` set; a
+child still running after the timeout is killed by SIGALRM and counts as
+killed, as a timed-out pytest did in the temp-file engine.
+"""
+
+import builtins
+import importlib
+import json
+import os
+import signal
+import sys
+
+SWITCH = "__vibesrails_mutant__"
+
+
+def _preload(modules, fresh):
+    for name in ["pytest", *modules]:
+        if name in fresh:
+            continue
+        try:
+            importlib.import_module(name)
+        except BaseException:  # noqa: BLE001 — any failure just means no preload
+            pass
+    try:
+        from importlib.metadata import entry_points
+
+        for plugin in entry_points(group="pytest11"):
+            try:
+                plugin.load()
+            except BaseException:  # noqa: BLE001
+                pass
+    except Exception:  # noqa: BLE001
+        pass
+    for name in fresh:
+        sys.modules.pop(name, None)
+
+
+def _child(request, timeout):
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    signal.alarm(timeout)
+    setattr(builtins, SWITCH, request["mutant"])
+    os.chdir(request["cwd"])
+    import pytest
+
+    os._exit(int(pytest.main(request["args"])))
+
+
+def main():
+    protocol = os.fdopen(os.dup(1), "w")
+    # Stray output from preloaded modules must not reach the protocol stream
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    setattr(builtins, SWITCH, 0)
+    config = json.loads(sys.stdin.readline())
+    timeout = int(config["timeout"])
+    _preload(config["preload"], set(config["fresh"]))
+    for line in sys.stdin:
+        request = json.loads(line)
+        protocol.flush()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _child(request, timeout)
+            finally:
+                os._exit(3)
+        _, status = os.waitpid(pid, 0)
+        survived = os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        protocol.write(json.dumps({"survived": survived}) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -22,15 +22,21 @@ from .engine import (  # noqa: F401
     StatementRemover,
     _count_targets,
     apply_mutation,
+    collect_file,
     find_test_file,
     get_changed_functions,
     get_source_files,
     mutation_in_functions,
     run_tests_on_mutant,
     scan_file,
+    submit_file,
 )
+from .coverage_map import CoverageMap, load_coverage_map
 from .mutmut import _parse_mutmut_results
 from .mutmut import scan_with_mutmut as _scan_with_mutmut
+from .parallel import MutantPool
+from .result_cache import open_result_cache
+from .schemata import schemata_supported
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +65,26 @@ __all__ = [
 ]
 
 class MutationGuard:
-    """Mutation testing guard for verifying test quality."""
+    """Mutation testing guard for verifying test quality.
+
+    jobs: number of mutants run concurrently, across all files.
+    coverage_guided: run each mutant against the tests that cover its line
+    (from one coverage run of the suite) when coverage.py is installed,
+    instead of the whole test file find_test_file guesses.
+    schemata: instrument each file once and switch mutants inside forked
+    pytest workers (see schemata.py); ignored where os.fork is missing.
+    result_cache: reuse the outcomes of mutants whose function and tests
+    are unchanged since an earlier run (see result_cache.py).
+    """
+
+    def __init__(
+        self, jobs: int = 1, coverage_guided: bool = True, schemata: bool = False,
+        result_cache: bool = True,
+    ):
+        self.jobs = jobs
+        self.coverage_guided = coverage_guided
+        self.schemata = schemata and schemata_supported()
+        self.result_cache = result_cache
 
     def _apply_mutation(self, tree, mutation_type, target_idx):
         """Apply a single mutation to an AST tree."""
@@ -77,9 +102,67 @@ class MutationGuard:
                    functions_filter=None):
         """Run mutation testing on a single source file."""
         return scan_file(
-            source_path, test_path, project_root, functions_filter
+            source_path, test_path, project_root, functions_filter, jobs=self.jobs,
+            schemata=self.schemata,
         )
 
+    def _coverage_map(self, project_root: Path) -> CoverageMap | None:
+        """Line-to-tests map of the project, or None to guess test files."""
+        if not self.coverage_guided:
+            return None
+        return load_coverage_map(project_root)
+
+    def _scan_files(
+        self, targets: list[tuple[Path, Path | None, set[str] | None]], project_root: Path,
+        coverage: CoverageMap | None = None,
+    ) -> list[FileMutationReport]:
+        """Mutation-test (source, test, functions_filter) targets on one shared pool.
+
+        All mutants are queued up front so workers never idle between files;
+        reports come back in target order. With a coverage map, mutants run
+        the tests covering their line rather than the target's test file.
+        """
+        cache = open_result_cache(project_root) if self.result_cache else None
+        reports: list[FileMutationReport] = []
+        with MutantPool(self.jobs, schemata=self.schemata) as pool:
+            submitted = [
+                submit_file(pool, src, test, project_root, funcs, coverage, cache)
+                for src, test, funcs in targets
+            ]
+            for done, pending in enumerate(submitted, 1):
+                report = collect_file(pending, cache)
+                logger.debug(
+                    "Mutation testing %d/%d: %s (%d/%d killed)",
+                    done, len(submitted), report.file, report.killed, report.total,
+                )
+                reports.append(report)
+        return reports
+
+    def _test_target(
+        self, src: Path, project_root: Path, coverage: CoverageMap | None,
+    ) -> tuple[bool, Path | None]:
+        """(is a target, test file) for a source file.
+
+        With a coverage map, any file some test executes is a target;
+        without one, only files whose test file can be guessed.
+        """
+        if coverage is not None:
+            rel = src.relative_to(project_root).as_posix()
+            return coverage.covers_file(rel), None
+        test_file = self._find_test_file(src, project_root)
+        return test_file is not None, test_file
+
+    def _project_targets(
+        self, project_root: Path, coverage: CoverageMap | None = None,
+    ) -> list[tuple[Path, Path | None, None]]:
+        """(source, test, None) for every source file that has tests."""
+        targets = []
+        for src in self._get_source_files(project_root):
+            is_target, test_file = self._test_target(src, project_root, coverage)
+            if is_target:
+                targets.append((src, test_file, None))
+        return targets
+
     @staticmethod
     def _mutation_in_functions(original, mutated, functions):
         """Check if mutation affects one of the target functions."""
@@ -111,9 +194,10 @@ class MutationGuard:
             ))
         for m in r.results:
             if not m.killed:
+                kind = "Uncovered" if m.no_coverage else "Surviving"
                 issues.append(V2GuardIssue(
                     guard=GUARD_NAME, severity="info",
-                    message=f"Surviving mutant in {r.file}: {m.mutation_type}",
+                    message=f"{kind} mutant in {r.file}: {m.mutation_type}",
                     file=r.file, line=m.line,
                 ))
         return issues
@@ -135,14 +219,13 @@ class MutationGuard:
 
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Run full mutation testing with built-in engine."""
-        reports: list[FileMutationReport] = []
-        for src in self._get_source_files(project_root):
-            test_file = self._find_test_file(src, project_root)
-            if test_file is None:
-                continue
-            report = self._scan_file(src, test_file, project_root)
-            if report.total > 0:
-                reports.append(report)
+        coverage = self._coverage_map(project_root)
+        reports = [
+            r for r in self._scan_files(
+                self._project_targets(project_root, coverage), project_root, coverage,
+            )
+            if r.total > 0
+        ]
 
         issues: list[V2GuardIssue] = []
         for r in reports:
@@ -165,18 +248,19 @@ class MutationGuard:
         if not changed:
             return []
 
-        issues: list[V2GuardIssue] = []
+        coverage = self._coverage_map(project_root)
+        targets = []
         for src_rel, funcs in changed.items():
             src = project_root / src_rel
             if not src.exists():
                 continue
-            test_file = self._find_test_file(src, project_root)
-            if test_file is None:
+            is_target, test_file = self._test_target(src, project_root, coverage)
+            if not is_target:
                 continue
-            report = self._scan_file(
-                src, test_file, project_root,
-                functions_filter=funcs,
-            )
+            targets.append((src, test_file, funcs))
+
+        issues: list[V2GuardIssue] = []
+        for report in self._scan_files(targets, project_root, coverage):
             if report.total == 0:
                 continue
             if report.score < BLOCK_THRESHOLD:
@@ -219,18 +303,13 @@ class MutationGuard:
         self, project_root: Path
     ) -> str:
         """Generate a human-readable mutation testing report."""
-        sources = self._get_source_files(project_root)
-        reports: list[FileMutationReport] = []
-
-        for src in sources:
-            test_file = self._find_test_file(src, project_root)
-            if test_file is None:
-                continue
-            report = self._scan_file(
-                src, test_file, project_root
+        coverage = self._coverage_map(project_root)
+        reports = [
+            r for r in self._scan_files(
+                self._project_targets(project_root, coverage), project_root, coverage,
             )
-            if report.total > 0:
-                reports.append(report)
+            if r.total > 0
+        ]
 
         if not reports:
             return "No mutation testing results available."
@@ -246,11 +325,16 @@ class MutationGuard:
         ]
 
         for r in reports:
-            lines.append(f"  {r.file}: {r.score:.0%} ({r.killed}/{r.total})")
-            survivors = [m for m in r.results if not m.killed]
+            uncovered = f", {r.no_coverage} uncovered" if r.no_coverage else ""
+            lines.append(f"  {r.file}: {r.score:.0%} ({r.killed}/{r.total}{uncovered})")
+            survivors = [m for m in r.results if not m.killed and not m.no_coverage]
             if survivors:
                 lines.append("    Surviving mutants:")
                 lines.extend(f"      - {m.mutation_type}" for m in survivors)
+            no_tests = [m for m in r.results if m.no_coverage]
+            if no_tests:
+                lines.append("    Mutants no test covers:")
+                lines.extend(f"      - {m.mutation_type} (line {m.line})" for m in no_tests)
 
         weak = [r for r in reports if r.score < WARN_THRESHOLD]
         if weak:
@@ -0,0 +1,239 @@
+"""Concurrent mutant execution for the built-in mutation engine.
+
+Each mutant costs one pytest subprocess, so a run is bound by waiting on
+child processes rather than by Python code: a thread pool is enough to keep
+N pytest runs in flight. Every worker gets its own sandbox directory, reused
+for all the mutants it runs. A sandbox holds one mutant at a time (the
+mutated module plus a copy of its test file), exactly like the sequential
+engine, so two mutants never see each other. Coverage-guided mutants bring
+the test files of their selected tests instead, copied at their project
+paths with the conftest.py and __init__.py files above them; those copies
+stay for the next mutant, as only node IDs decide what runs.
+
+A schemata pool (see schemata.py) writes a file's instrumented module to a
+sandbox once and keeps it there with the sandbox's ForkServer; mutants of
+that file then differ only by the mutant ID sent to the server.
+
+Futures are collected in submission order, so reports come out the same
+whatever the worker count.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from .coverage_map import SelectedTests
+from .schemata import ForkServer, Schema
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_mutation_jobs(jobs: int | None) -> int:
+    """Worker count from --jobs: None = 1 (sequential), 0 = all cores."""
+    if jobs is None:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+class _Sandbox:
+    """A reusable temp directory that holds one mutant at a time."""
+
+    def __init__(self) -> None:
+        self.root = Path(tempfile.mkdtemp(prefix="vibesrails-mutant-"))
+        self._test_source: Path | None = None
+        self._copied: set[str] = set()
+        self._schema: tuple[Path, str] | None = None  # (path, code) written
+        self._server: ForkServer | None = None
+        self._server_key: tuple | None = None
+
+    def prepare(
+        self, source_rel: Path, test_path: Path | None, code: str,
+        selected: SelectedTests | None = None,
+    ) -> tuple[Path, Path]:
+        """Write the mutant; returns (mutant, test file or, with selected, sandbox root)."""
+        tmp_src = self.root / source_rel
+        if selected is not None:
+            self._copy_test_files(selected)
+            tmp_test = self.root
+        else:
+            tmp_test = self._copy_single_test(test_path)
+        tmp_src.parent.mkdir(parents=True, exist_ok=True)
+        tmp_src.write_text(code, encoding="utf-8")
+        return tmp_src, tmp_test
+
+    def prepare_schema(
+        self, source_rel: Path, test_path: Path | None, schema: Schema,
+        selected: SelectedTests | None = None,
+    ) -> tuple[Path, Path]:
+        """Like prepare, but the schema stays in place until another replaces it."""
+        tmp_src = self.root / source_rel
+        if selected is not None:
+            self._copy_test_files(selected)
+            tmp_test = self.root
+        else:
+            tmp_test = self._copy_single_test(test_path)
+        if self._schema != (tmp_src, schema.code):
+            if self._schema is not None and self._schema[0] != tmp_src:
+                self.reset(self._schema[0])
+            tmp_src.parent.mkdir(parents=True, exist_ok=True)
+            tmp_src.write_text(schema.code, encoding="utf-8")
+            self._schema = (tmp_src, schema.code)
+        return tmp_src, tmp_test
+
+    def fork_server(self, schema: Schema, pythonpath: list[str], fresh: list[str]) -> ForkServer:
+        """The sandbox's server for this schema, (re)started as needed."""
+        from . import engine  # late: engine imports this module
+
+        key = (schema.code, tuple(pythonpath))
+        if self._server is not None and (self._server_key != key or not self._server.alive()):
+            self._server.close()
+            self._server = None
+        if self._server is None:
+            self._server = ForkServer(
+                self.root, pythonpath, schema.preload, fresh, engine.MUTATION_TEST_TIMEOUT,
+            )
+            self._server_key = key
+        return self._server
+
+    def _copy_single_test(self, test_path: Path) -> Path:
+        tmp_test = self.root / "tests" / test_path.name
+        if self._test_source != test_path:
+            tmp_test.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(test_path, tmp_test)
+            self._test_source = test_path
+        return tmp_test
+
+    def _copy_test_files(self, selected: SelectedTests) -> None:
+        """Copy the selected test files and their conftest/__init__ files, once each."""
+        for item in selected.support_files:
+            if item in self._copied:
+                continue
+            self._copied.add(item)
+            source = selected.root / item
+            if not source.is_file():
+                continue
+            target = self.root / item
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+
+    def reset(self, tmp_src: Path) -> None:
+        """Remove the mutant so the next one starts from an empty tree."""
+        try:
+            tmp_src.unlink()
+        except OSError:
+            pass
+        for parent in tmp_src.relative_to(self.root).parents:
+            if parent == Path("."):
+                break
+            try:
+                (self.root / parent).rmdir()
+            except OSError:
+                break  # not empty (or already gone)
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class MutantPool:
+    """Run mutants on up to `jobs` workers, each with its own sandbox.
+
+    With schemata, mutants are submitted with submit_schema instead of submit.
+    """
+
+    def __init__(self, jobs: int = 1, schemata: bool = False):
+        self.jobs = max(1, jobs)
+        self.schemata = schemata
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.jobs, thread_name_prefix="vibesrails-mutant",
+        )
+        self._sandboxes: list[_Sandbox] = []
+        self._free: queue.SimpleQueue[_Sandbox] = queue.SimpleQueue()
+
+    def __enter__(self) -> MutantPool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(
+        self, source_rel: Path, test_path: Path | None, code: str,
+        selected: SelectedTests | None = None,
+    ) -> Future:
+        """Schedule one mutant; the future resolves to True if it survived.
+
+        With selected, only those tests run instead of the file test_path.
+        """
+        return self._executor.submit(self._run, source_rel, test_path, code, selected)
+
+    def submit_schema(
+        self, source_rel: Path, test_path: Path | None, schema: Schema,
+        mutant_id: int, selected: SelectedTests | None = None,
+    ) -> Future:
+        """Schedule mutant mutant_id of schema; as submit otherwise."""
+        return self._executor.submit(
+            self._run_schema, source_rel, test_path, schema, mutant_id, selected,
+        )
+
+    def _acquire(self) -> _Sandbox:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            sandbox = _Sandbox()
+            self._sandboxes.append(sandbox)
+            return sandbox
+
+    def _run(
+        self, source_rel: Path, test_path: Path | None, code: str,
+        selected: SelectedTests | None,
+    ) -> bool:
+        from . import engine  # late: engine imports this module
+
+        sandbox = self._acquire()
+        try:
+            tmp_src, tmp_test = sandbox.prepare(source_rel, test_path, code, selected)
+            try:
+                if selected is not None:
+                    return engine.run_tests_on_mutant(tmp_src, tmp_test, selected.ids)
+                return engine.run_tests_on_mutant(tmp_src, tmp_test)
+            finally:
+                sandbox.reset(tmp_src)
+        finally:
+            self._free.put(sandbox)
+
+    def _run_schema(
+        self, source_rel: Path, test_path: Path | None, schema: Schema,
+        mutant_id: int, selected: SelectedTests | None,
+    ) -> bool:
+        from . import engine
+
+        sandbox = self._acquire()
+        try:
+            tmp_src, tmp_test = sandbox.prepare_schema(source_rel, test_path, schema, selected)
+            targets, cwd, pythonpath = engine.pytest_invocation(
+                tmp_src, tmp_test, selected.ids if selected is not None else (),
+            )
+            # The module under test must be imported by each child, never preloaded
+            fresh = [tmp_src.stem, ".".join(source_rel.with_suffix("").parts)]
+            server = sandbox.fork_server(schema, pythonpath, fresh)
+            return server.run(mutant_id, cwd, [
+                *targets, "--no-header", "-q", "--tb=no", "-x", "-p", "no:cacheprovider",
+            ])
+        finally:
+            self._free.put(sandbox)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for sandbox in self._sandboxes:
+            sandbox.close()
+        self._sandboxes.clear()
@@ -0,0 +1,222 @@
+"""Persistent mutant outcomes, so unchanged mutants are not run again.
+
+Every --mutation run used to execute every mutant, even on a codebase
+that had not changed since the last run. ResultCache keeps each outcome
+in .vibesrails/cache/mutation_results.db, keyed by what decides it:
+
+- the enclosing function's qualified name (e.g. ``A.ok``) and its AST,
+  without positions or docstring (module level code: the whole module),
+  so moving or documenting a function keeps its results while identical
+  functions keep apart;
+- the mutation type and the target's rank among that type's targets in
+  the function;
+- the tests run against it: the selected node IDs and the contents of
+  their files, conftest.py and __init__.py files included.
+
+A mutant whose function or tests changed gets a new key and runs again;
+rows unused for RESULT_CACHE_MAX_AGE are pruned. Outcomes are the
+engine's: a mutant whose tests time out is cached as killed, and mutants
+no test covers are never cached (they cost nothing to recompute).
+
+Connections come from storage.connection; without it, open_result_cache
+returns None and every mutant runs.
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+from .coverage_map import SelectedTests
+from .visitors import list_targets
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_FILE = Path(".vibesrails") / "cache" / "mutation_results.db"
+RESULT_CACHE_VERSION = 2
+RESULT_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+_SCHEMA = """CREATE TABLE IF NOT EXISTS mutant_results (
+    key TEXT PRIMARY KEY,
+    survived INTEGER NOT NULL,
+    used_at INTEGER NOT NULL
+)"""
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _fingerprint(node: ast.AST) -> str:
+    """Hash of a node's AST, ignoring positions and a leading docstring."""
+    if isinstance(node, (*_FUNCTIONS, ast.Module)) and ast.get_docstring(node) is not None:
+        node = copy.copy(node)
+        node.body = node.body[1:]
+    return hashlib.sha256(ast.dump(node).encode()).hexdigest()
+
+
+class MutantKeys:
+    """Cache keys of one source file's mutants, tests digest aside."""
+
+    def __init__(self, tree: ast.Module, source_rel: str):
+        self.tree = tree
+        self.source_rel = source_rel
+        self._owners: dict[int, ast.AST | None] = {}
+        self._qualnames: dict[int, str] = {}
+        self._assign_owners(tree, None)
+        self._fingerprints: dict[int, str] = {}
+        self._ranks: dict[str, list[tuple[ast.AST | None, int]]] = {}
+
+    def _assign_owners(self, node: ast.AST, owner: ast.AST | None) -> None:
+        """Map every node to its innermost enclosing function (None: module).
+
+        Functions are named by qualified name; a redefinition of the same
+        name gets "#2", "#3"... in source order.
+        """
+        stack = [(node, owner, "")]
+        counts: dict[str, int] = {}
+        while stack:
+            node, owner, prefix = stack.pop()
+            self._owners[id(node)] = owner
+            inner = owner
+            if isinstance(node, (*_FUNCTIONS, ast.ClassDef)):
+                prefix = f"{prefix}{node.name}."
+            if isinstance(node, _FUNCTIONS):
+                inner = node
+                qualname = prefix[:-1]
+                counts[qualname] = counts.get(qualname, 0) + 1
+                if counts[qualname] > 1:
+                    qualname += f"#{counts[qualname]}"
+                self._qualnames[id(node)] = qualname
+            children = list(ast.iter_child_nodes(node))
+            stack.extend((child, inner, prefix) for child in reversed(children))
+
+    def _rank(self, mutation_type: str, idx: int) -> tuple[ast.AST | None, int]:
+        """(enclosing function, rank of the target among its targets of the type)."""
+        if mutation_type not in self._ranks:
+            seen: dict[int, int] = {}
+            ranks = []
+            for node, _ in list_targets(self.tree, mutation_type):
+                owner = self._owners.get(id(node))
+                rank = seen.get(id(owner), 0)
+                seen[id(owner)] = rank + 1
+                ranks.append((owner, rank))
+            self._ranks[mutation_type] = ranks
+        return self._ranks[mutation_type][idx]
+
+    def key(self, mutation_type: str, idx: int, tests_digest: str) -> str:
+        owner, rank = self._rank(mutation_type, idx)
+        scope = owner if owner is not None else self.tree
+        if id(scope) not in self._fingerprints:
+            self._fingerprints[id(scope)] = _fingerprint(scope)
+        qualname = self._qualnames.get(id(owner), "") if owner is not None else ""
+        parts = [
+            str(RESULT_CACHE_VERSION), self.source_rel, qualname, self._fingerprints[id(scope)],
+            mutation_type, str(rank), tests_digest,
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """Mutant outcomes of earlier runs; use open_result_cache to get one."""
+
+    def __init__(self, project_root: Path, connect):
+        self.root = project_root
+        self.path = project_root / RESULT_CACHE_FILE
+        self._connect = connect
+        self._file_digests: dict[Path, str] = {}
+        self._used: list[str] = []
+        self.hits = 0
+
+    def _file_digest(self, path: Path) -> str:
+        if path not in self._file_digests:
+            try:
+                self._file_digests[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                self._file_digests[path] = "-"
+        return self._file_digests[path]
+
+    def tests_digest(self, test_path: Path | None, selected: SelectedTests | None) -> str:
+        """Digest of the tests a mutant runs: selected, else the file test_path."""
+        digest = hashlib.sha256()
+        if selected is not None:
+            digest.update("\n".join(selected.ids).encode())
+            for rel in selected.support_files:
+                digest.update(f"\0{rel}\0{self._file_digest(selected.root / rel)}".encode())
+        elif test_path is not None:
+            digest.update(f"{test_path.name}\0{self._file_digest(test_path)}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> bool | None:
+        """True/False if the mutant survived/was killed last time, None if unknown."""
+        conn = self._connect(self.path)
+        try:
+            row = conn.execute(
+                "SELECT survived FROM mutant_results WHERE key = ?", (key,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        self.hits += 1
+        self._used.append(key)
+        return bool(row[0])
+
+    def put(self, outcomes: list[tuple[str, bool]]) -> None:
+        """Store (key, survived) outcomes, and mark this run's hits as used."""
+        now = int(time.time())
+        conn = self._connect(self.path)
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO mutant_results (key, survived, used_at) VALUES (?, ?, ?)",
+                [(key, int(survived), now) for key, survived in outcomes],
+            )
+            conn.executemany(
+                "UPDATE mutant_results SET used_at = ? WHERE key = ?",
+                [(now, key) for key in self._used],
+            )
+            conn.commit()
+            self._used.clear()
+        finally:
+            conn.close()
+
+    def prune(self) -> None:
+        """Drop outcomes no run has used for RESULT_CACHE_MAX_AGE."""
+        conn = self._connect(self.path)
+        try:
+            conn.execute(
+                "DELETE FROM mutant_results WHERE used_at < ?",
+                (int(time.time()) - RESULT_CACHE_MAX_AGE,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def open_result_cache(project_root: Path) -> ResultCache | None:
+    """The project's result cache, or None if it cannot be used."""
+    try:
+        from storage.connection import connect
+    except ImportError:
+        logger.debug("storage package unavailable: no mutation result cache")
+        return None
+    path = project_root / RESULT_CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Symlink protection: the cache directory must stay under the root
+        path.parent.resolve().relative_to(project_root.resolve())
+        conn = connect(path)
+        try:
+            conn.execute(_SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+        cache = ResultCache(project_root, connect)
+        cache.prune()
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.debug("Mutation result cache unavailable: %s", e)
+        return None
+    return cache
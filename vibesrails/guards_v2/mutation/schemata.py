@@ -0,0 +1,193 @@
+"""Mutation schemata: every mutant of a module in one instrumented source.
+
+The temp-file engine deep-copies and unparses the AST, writes a file and
+cold-starts a pytest interpreter for every mutant. build_schema instead
+rewrites a module once, with each mutation point guarded by a switch:
+
+    a > b          ->  (a < b) if __vibesrails_mutant__ == 3 else (a > b)
+    return x       ->  if __vibesrails_mutant__ == 5: return None
+                       else: return x
+    stmt           ->  if __vibesrails_mutant__ != 7: stmt
+
+``__vibesrails_mutant__`` is a builtin set by fork_server: 0 runs the
+original code, N runs mutant N (the N-th entry of the mutation list). The
+schema is written once per sandbox, and a ForkServer per sandbox keeps an
+interpreter with pytest and the module's dependencies imported, forking a
+child per mutant. The module under test itself is imported in the child,
+so mutants of import-time code take effect too.
+
+Needs os.fork: schemata_supported() is False elsewhere (Windows).
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from .visitors import ArithmeticSwapper, BooleanSwapper, ComparisonSwapper, list_targets
+
+logger = logging.getLogger(__name__)
+
+SWITCH = "__vibesrails_mutant__"
+FORK_SERVER = Path(__file__).with_name("fork_server.py")
+
+
+class Schema(NamedTuple):
+    """Instrumented source; mutant i + 1 is mutations[i], at lines[i].
+
+    preload lists the modules the source imports, for the fork server.
+    """
+
+    code: str
+    lines: list[int]
+    preload: list[str]
+
+
+def schemata_supported() -> bool:
+    return hasattr(os, "fork")
+
+
+def _switch(mutant_id: int, op: ast.cmpop) -> ast.Compare:
+    return ast.Compare(
+        left=ast.Name(id=SWITCH, ctx=ast.Load()),
+        ops=[op], comparators=[ast.Constant(value=mutant_id)],
+    )
+
+
+def _variant(node: ast.AST, mutation_type: str, detail: object) -> ast.AST:
+    """node with one mutation applied, sharing its (instrumented) children."""
+    if mutation_type == "comparison_swap":
+        variant = copy.copy(node)
+        variant.ops = list(node.ops)
+        variant.ops[detail] = ComparisonSwapper.SWAPS[type(node.ops[detail])]()
+    elif mutation_type == "boolean_swap" and isinstance(node, ast.Constant):
+        variant = ast.Constant(value=not node.value)
+    elif mutation_type == "boolean_swap":
+        variant = copy.copy(node)
+        variant.op = BooleanSwapper.SWAPS[type(node.op)]()
+    elif mutation_type == "arithmetic_swap":
+        variant = copy.copy(node)
+        variant.op = ArithmeticSwapper.SWAPS[type(node.op)]()
+    else:  # return_none
+        variant = ast.Return(value=ast.Constant(value=None))
+    return ast.copy_location(variant, node)
+
+
+class _Instrumenter(ast.NodeTransformer):
+    """Wraps every mutation point, innermost first, in its switch."""
+
+    def __init__(self, points: dict[int, list[tuple[int, str, object]]]):
+        self.points = points  # id(node) -> [(mutant id, type, detail)]
+
+    def visit(self, node: ast.AST) -> ast.AST:
+        mutations = self.points.get(id(node))
+        node = self.generic_visit(node)
+        if not mutations:
+            return node
+        guarded = node
+        for mutant_id, mutation_type, detail in mutations:
+            if mutation_type == "statement_remove":
+                guarded = ast.If(test=_switch(mutant_id, ast.NotEq()), body=[guarded], orelse=[])
+            elif mutation_type == "return_none":
+                guarded = ast.If(
+                    test=_switch(mutant_id, ast.Eq()),
+                    body=[_variant(node, mutation_type, detail)], orelse=[guarded],
+                )
+            else:
+                guarded = ast.IfExp(
+                    test=_switch(mutant_id, ast.Eq()),
+                    body=_variant(node, mutation_type, detail), orelse=guarded,
+                )
+            ast.copy_location(guarded, node)
+        return guarded
+
+
+def build_schema(tree: ast.Module, mutations: list[tuple[str, int]]) -> Schema:
+    """Instrument a copy of tree with every (type, index) mutation."""
+    tree = copy.deepcopy(tree)
+    targets = {m: list_targets(tree, m) for m in {m for m, _ in mutations}}
+    points: dict[int, list[tuple[int, str, object]]] = {}
+    lines: list[int] = []
+    for mutant_id, (mutation_type, idx) in enumerate(mutations, 1):
+        node, detail = targets[mutation_type][idx]
+        points.setdefault(id(node), []).append((mutant_id, mutation_type, detail))
+        lines.append(node.lineno)
+    instrumented = ast.fix_missing_locations(_Instrumenter(points).visit(tree))
+    return Schema(ast.unparse(instrumented), lines, module_imports(tree))
+
+
+def module_imports(tree: ast.Module) -> list[str]:
+    """Absolute modules the module imports, for the fork server to preload."""
+    names: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+class ForkServer:
+    """A long-lived interpreter that runs pytest for one mutant per fork.
+
+    pythonpath and preload are fixed for the server's life: a sandbox
+    restarts it when it moves on to another source file. Modules in fresh
+    (the module under test) are dropped again if a preload imported them.
+    """
+
+    def __init__(
+        self, cwd: Path, pythonpath: list[str], preload: list[str],
+        fresh: list[str], timeout: int,
+    ):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(pythonpath)
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        # Run by path, not -m: importing the vibesrails package would put it
+        # in sys.modules of the code under test
+        self._proc = subprocess.Popen(
+            [
+                sys.executable, "-c",
+                "import runpy, sys; runpy.run_path(sys.argv.pop(1), run_name='__main__')",
+                str(FORK_SERVER),
+            ],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            cwd=str(cwd), env=env, text=True,
+        )
+        self._send({"preload": preload, "fresh": fresh, "timeout": timeout})
+
+    def _send(self, message: dict) -> None:
+        self._proc.stdin.write(json.dumps(message) + "\n")
+        self._proc.stdin.flush()
+
+    def run(self, mutant_id: int, cwd: Path, args: list[str]) -> bool:
+        """Run pytest args with mutant_id active. Returns True if it survived."""
+        try:
+            self._send({"mutant": mutant_id, "cwd": str(cwd), "args": args})
+            reply = self._proc.stdout.readline()
+        except (OSError, ValueError) as e:
+            logger.debug("Fork server gone: %s", e)
+            return False
+        if not reply:
+            return False
+        return bool(json.loads(reply).get("survived"))
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def close(self) -> None:
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
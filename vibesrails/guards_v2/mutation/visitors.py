@@ -17,6 +17,7 @@ class MutantResult:
     mutation_type: str
     line: int
     killed: bool
+    no_coverage: bool = False  # no test executes the mutated line
 
 
 @dataclass
@@ -27,6 +28,7 @@ class FileMutationReport:
     total: int = 0
     killed: int = 0
     survived: int = 0
+    no_coverage: int = 0
     results: list[MutantResult] = field(default_factory=list)
 
     @property
@@ -37,7 +39,34 @@ class FileMutationReport:
         return self.killed / self.total
 
 
-class ComparisonSwapper(ast.NodeTransformer):
+class _MutationVisitor(ast.NodeTransformer):
+    """Base of the mutation visitors: counts targets, mutates the target_idx-th.
+
+    With targets set to a list, nothing is mutated: every target is noted
+    there as (node, detail) instead, in the order mutation indexes count.
+    """
+
+    def __init__(self, target_idx: int) -> None:
+        self.target_idx = target_idx
+        self.current_idx = 0
+        self.applied = False
+        self.line = 0
+        self.targets: list[tuple[ast.AST, object]] | None = None
+
+    def _is_target(self, node: ast.AST, detail: object = None) -> bool:
+        """Count a mutation target; True if it is the one to mutate."""
+        if self.targets is not None:
+            self.targets.append((node, detail))
+            return False
+        hit = self.current_idx == self.target_idx
+        self.current_idx += 1
+        if hit:
+            self.applied = True
+            self.line = node.lineno
+        return hit
+
+
+class ComparisonSwapper(_MutationVisitor):
     """Swap comparison operators."""
 
     SWAPS = {
@@ -46,79 +75,44 @@ class ComparisonSwapper(ast.NodeTransformer):
         ast.Eq: ast.NotEq, ast.NotEq: ast.Eq,
     }
 
-    def __init__(self, target_idx: int) -> None:
-        self.target_idx = target_idx
-        self.current_idx = 0
-        self.applied = False
-
     def visit_Compare(self, node: ast.Compare) -> ast.Compare:
         """Handle Compare nodes."""
         for i, op in enumerate(node.ops):
-            if type(op) in self.SWAPS:
-                if self.current_idx == self.target_idx:
-                    node.ops[i] = self.SWAPS[type(op)]()
-                    self.applied = True
-                    return node
-                self.current_idx += 1
+            if type(op) in self.SWAPS and self._is_target(node, i):
+                node.ops[i] = self.SWAPS[type(op)]()
         return node
 
 
-class BooleanSwapper(ast.NodeTransformer):
+class BooleanSwapper(_MutationVisitor):
     """Swap True/False and and/or."""
 
-    def __init__(self, target_idx: int) -> None:
-        self.target_idx = target_idx
-        self.current_idx = 0
-        self.applied = False
+    SWAPS = {ast.And: ast.Or, ast.Or: ast.And}
 
     def visit_Constant(self, node: ast.Constant) -> ast.Constant:
         """Handle Constant nodes."""
-        if isinstance(node.value, bool):
-            if self.current_idx == self.target_idx:
-                node.value = not node.value
-                self.applied = True
-                return node
-            self.current_idx += 1
+        if isinstance(node.value, bool) and self._is_target(node):
+            node.value = not node.value
         return node
 
     def visit_BoolOp(self, node: ast.BoolOp) -> ast.BoolOp:
         """Handle BoolOp nodes."""
         self.generic_visit(node)
-        if isinstance(node.op, ast.And):
-            if self.current_idx == self.target_idx:
-                node.op = ast.Or()
-                self.applied = True
-                return node
-            self.current_idx += 1
-        elif isinstance(node.op, ast.Or):
-            if self.current_idx == self.target_idx:
-                node.op = ast.And()
-                self.applied = True
-                return node
-            self.current_idx += 1
+        if type(node.op) in self.SWAPS and self._is_target(node):
+            node.op = self.SWAPS[type(node.op)]()
         return node
 
 
-class ReturnNoneSwapper(ast.NodeTransformer):
+class ReturnNoneSwapper(_MutationVisitor):
     """Replace return values with None."""
 
-    def __init__(self, target_idx: int) -> None:
-        self.target_idx = target_idx
-        self.current_idx = 0
-        self.applied = False
-
     def visit_Return(self, node: ast.Return) -> ast.Return:
         """Handle Return nodes."""
-        if node.value is not None:
-            if self.current_idx == self.target_idx:
-                node.value = ast.Constant(value=None)
-                self.applied = True
-                return node
-            self.current_idx += 1
+        if node.value is not None and self._is_target(node):
+            node.value = ast.Constant(value=None)
         return node
 
 
-class ArithmeticSwapper(ast.NodeTransformer):
+class ArithmeticSwapper(_MutationVisitor):
     """Swap arithmetic operators."""
 
     SWAPS = {
@@ -126,45 +120,24 @@ class ArithmeticSwapper(ast.NodeTransformer):
         ast.Mult: ast.Div, ast.Div: ast.Mult,
     }
 
-    def __init__(self, target_idx: int) -> None:
-        self.target_idx = target_idx
-        self.current_idx = 0
-        self.applied = False
-
     def visit_BinOp(self, node: ast.BinOp) -> ast.BinOp:
         """Handle BinOp nodes."""
         self.generic_visit(node)
-        if type(node.op) in self.SWAPS:
-            if self.current_idx == self.target_idx:
-                node.op = self.SWAPS[type(node.op)]()
-                self.applied = True
-                return node
-            self.current_idx += 1
+        if type(node.op) in self.SWAPS and self._is_target(node):
+            node.op = self.SWAPS[type(node.op)]()
         return node
 
 
-class StatementRemover(ast.NodeTransformer):
+class StatementRemover(_MutationVisitor):
     """Remove a statement from a function body."""
 
-    def __init__(self, target_idx: int) -> None:
-        self.target_idx = target_idx
-        self.current_idx = 0
-        self.applied = False
-
     def visit_FunctionDef(
         self, node: ast.FunctionDef
     ) -> ast.FunctionDef:
         """Handle FunctionDef nodes."""
         if len(node.body) <= 1:
             return node
-        new_body = []
-        for stmt in node.body:
-            if self.current_idx == self.target_idx:
-                self.applied = True
-                self.current_idx += 1
-                continue
-            new_body.append(stmt)
-            self.current_idx += 1
+        new_body = [stmt for stmt in node.body if not self._is_target(stmt)]
         if new_body:
             node.body = new_body
         return node
@@ -184,3 +157,17 @@ def _count_targets(tree: ast.Module, mutation_type: str) -> int:
     counter = MUTATION_TYPES[mutation_type](target_idx=999999)
     counter.visit(copy.deepcopy(tree))
     return counter.current_idx
+
+
+def list_targets(
+    tree: ast.Module, mutation_type: str,
+) -> list[tuple[ast.AST, object]]:
+    """Every target of a mutation type in tree, as (node, detail), unmutated.
+
+    The i-th entry is what mutation index i mutates; detail is the operator
+    position for comparison_swap, None otherwise.
+    """
+    lister = MUTATION_TYPES[mutation_type](target_idx=-1)
+    lister.targets = []
+    lister.visit(tree)
+    return lister.targets
@@ -6,7 +6,11 @@ import re
 from fnmatch import fnmatch
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -35,137 +39,118 @@ class ObservabilityGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for observability issues."""
-        if _should_skip(filepath):
-            return []
-        try:
-            tree = ast.parse(content, filename=str(filepath))
-        except SyntaxError:
-            return []
+        return self.scan_parsed(ParsedModule(filepath, content))
 
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for observability issues."""
+        return dispatch(self, module)
+
+    def accepts(self, module: ParsedModule) -> bool:
+        """Skip CLI entry points, tests and files that do not parse."""
+        return not _should_skip(module.path) and module.tree is not None
 
-        issues.extend(self._bare_prints(tree, fname))
-        issues.extend(self._traceback_print_exc(tree, fname))
-        issues.extend(self._silent_except(tree, fname))
-        issues.extend(self._logging_without_level(tree, fname))
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Append line-based checks after the AST detectors."""
         issues.extend(
-            self._print_looks_like_logging(content, fname)
+            self._print_looks_like_logging(module.lines, str(module.path))
         )
         return issues
 
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan all Python files under *project_root*."""
         issues: list[V2GuardIssue] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             if _is_excluded(py_file) or _should_skip(py_file):
                 continue
-            try:
-                text = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, text))
+            issues.extend(self.scan_parsed(module))
         return issues
 
     # ----------------------------------------------------------
     # Detectors
     # ----------------------------------------------------------
 
+    @visits(ast.Expr)
     def _bare_prints(
-        self, tree: ast.Module, filepath: str
+        self, node: ast.Expr, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Detect print() calls (debug leftovers)."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Expr):
-                continue
-            call = node.value
-            if not isinstance(call, ast.Call):
-                continue
-            if _is_print_call(call):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message="print() found — use logger instead",
-                    file=filepath,
-                    line=node.lineno,
-                ))
-        return issues
-
+        call = node.value
+        if not isinstance(call, ast.Call) or not _is_print_call(call):
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="warn",
+            message="print() found — use logger instead",
+            file=str(module.path),
+            line=node.lineno,
+        )]
+
+    @visits(ast.Expr)
     def _traceback_print_exc(
-        self, tree: ast.Module, filepath: str
+        self, node: ast.Expr, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Detect traceback.print_exc() usage."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Expr):
-                continue
-            call = node.value
-            if not isinstance(call, ast.Call):
-                continue
-            if _is_traceback_print_exc(call):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=(
-                        "traceback.print_exc() — "
-                        "use logger.exception() instead"
-                    ),
-                    file=filepath,
-                    line=node.lineno,
-                ))
-        return issues
-
+        call = node.value
+        if not isinstance(call, ast.Call) or not _is_traceback_print_exc(call):
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="warn",
+            message=(
+                "traceback.print_exc() — "
+                "use logger.exception() instead"
+            ),
+            file=str(module.path),
+            line=node.lineno,
+        )]
+
+    @visits(ast.ExceptHandler)
     def _silent_except(
-        self, tree: ast.Module, filepath: str
+        self, node: ast.ExceptHandler, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Detect except blocks with no logging at all."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ExceptHandler):
-                continue
-            if not _body_has_logging(node.body):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=(
-                        "except block without logging "
-                        "— silent error swallowing"
-                    ),
-                    file=filepath,
-                    line=node.lineno,
-                ))
-        return issues
-
+        if _body_has_logging(node.body):
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="warn",
+            message=(
+                "except block without logging "
+                "— silent error swallowing"
+            ),
+            file=str(module.path),
+            line=node.lineno,
+        )]
+
+    @visits(ast.Expr)
     def _logging_without_level(
-        self, tree: ast.Module, filepath: str
+        self, node: ast.Expr, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Detect logging.log() without level or bare logger()."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Expr):
-                continue
-            call = node.value
-            if not isinstance(call, ast.Call):
-                continue
-            if _is_logging_log_no_level(call):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="warn",
-                    message=(
-                        "logging.log() without explicit level"
-                    ),
-                    file=filepath,
-                    line=node.lineno,
-                ))
-        return issues
+        call = node.value
+        if not isinstance(call, ast.Call) or not _is_logging_log_no_level(call):
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="warn",
+            message=(
+                "logging.log() without explicit level"
+            ),
+            file=str(module.path),
+            line=node.lineno,
+        )]
 
     def _print_looks_like_logging(
-        self, content: str, filepath: str
+        self, lines: list[str], filepath: str
     ) -> list[V2GuardIssue]:
         """Detect print('DEBUG:...') or print('Error:...')."""
         issues: list[V2GuardIssue] = []
-        for i, line in enumerate(content.splitlines(), 1):
+        for i, line in enumerate(lines, 1):
             if _PRINT_LOG_RE.search(line):
                 issues.append(V2GuardIssue(
                     guard=GUARD_NAME,
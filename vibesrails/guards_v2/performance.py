@@ -26,7 +26,11 @@ from ._perf_patterns import (
 from ._perf_patterns import (
     call_name as _call_name,
 )
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -41,54 +45,60 @@ class PerformanceGuard:
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan all .py files under *project_root* for performance issues."""
         issues: list[V2GuardIssue] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             # Skip hidden dirs, venv, etc.
             parts = py_file.relative_to(project_root).parts
             if any(p.startswith(".") or p in ("venv", "node_modules")
                    for p in parts):
                 continue
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, content))
+            issues.extend(self.scan_parsed(module))
         return issues
 
     def scan_file(
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for performance anti-patterns."""
-        issues: list[V2GuardIssue] = []
+        return self.scan_parsed(ParsedModule(filepath, content))
+
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for performance anti-patterns."""
+        return dispatch(self, module)
+
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Wrap the AST detector issues with the regex and module-level checks."""
+        filepath = module.path
         fname = str(filepath)
+        lines = module.lines
 
         # Regex-based checks (work even if AST parse fails)
-        issues.extend(self._check_select_star(fname, filepath, content))
-        issues.extend(self._check_no_limit(fname, content))
-        issues.extend(
-            self._check_time_sleep(fname, filepath, content)
+        result: list[V2GuardIssue] = []
+        result.extend(self._check_select_star(fname, filepath, lines))
+        result.extend(self._check_no_limit(fname, lines))
+        result.extend(
+            self._check_time_sleep(fname, filepath, lines)
         )
-        issues.extend(self._check_read_no_limit(fname, content))
+        result.extend(self._check_read_no_limit(fname, lines))
 
         # AST-based checks
-        try:
-            tree = ast.parse(content, filename=fname)
-        except SyntaxError:
-            return issues
+        tree = module.tree
+        if tree is None:
+            return result
 
-        issues.extend(self._check_nplus1(fname, tree))
-        issues.extend(self._check_regex_in_loop(fname, tree))
-        issues.extend(self._check_string_concat_in_loop(fname, tree))
-        issues.extend(self._check_len_listcomp(fname, tree))
-        issues.extend(self._check_global_mutation(fname, tree, content))
+        result.extend(issues)
+        result.extend(self._check_global_mutation(fname, tree, lines))
+        return result
 
-        return issues
-
-    def _check_select_star(self, fname: str, filepath: Path, content: str) -> list[V2GuardIssue]:
+    def _check_select_star(self, fname: str, filepath: Path, lines: list[str]) -> list[V2GuardIssue]:
         # Skip test files — they contain SELECT * in test data  # vibesrails: ignore
         if filepath.name.startswith("test_") or "/tests/" in fname:
             return []
         issues: list[V2GuardIssue] = []
-        for i, line in enumerate(content.splitlines(), 1):
+        for i, line in enumerate(lines, 1):
             if _IGNORE_MARKER in line:
                 continue
             if _SELECT_STAR_RE.search(line):
@@ -99,9 +109,9 @@ class PerformanceGuard:
                 ))
         return issues
 
-    def _check_no_limit(self, fname: str, content: str) -> list[V2GuardIssue]:
+    def _check_no_limit(self, fname: str, lines: list[str]) -> list[V2GuardIssue]:
         issues: list[V2GuardIssue] = []
-        for i, line in enumerate(content.splitlines(), 1):
+        for i, line in enumerate(lines, 1):
             if _SQL_SELECT_RE.search(line):
                 if not _LIMIT_RE.search(line) and not _OFFSET_RE.search(line):
                     # Don't double-flag SELECT * lines  # vibesrails: ignore — pattern definition
@@ -119,12 +129,12 @@ class PerformanceGuard:
                     ))
         return issues
 
-    def _check_time_sleep(self, fname: str, filepath: Path, content: str) -> list[V2GuardIssue]:
+    def _check_time_sleep(self, fname: str, filepath: Path, lines: list[str]) -> list[V2GuardIssue]:
         # Skip test files
         if filepath.name.startswith("test_") or "/tests/" in fname:
             return []
         issues: list[V2GuardIssue] = []
-        for i, line in enumerate(content.splitlines(), 1):
+        for i, line in enumerate(lines, 1):
             stripped = line.strip()
             if _IGNORE_MARKER in line:
                 continue
@@ -141,10 +151,10 @@ class PerformanceGuard:
                 ))
         return issues
 
-    def _check_read_no_limit(self, fname: str, content: str) -> list[V2GuardIssue]:
+    def _check_read_no_limit(self, fname: str, lines: list[str]) -> list[V2GuardIssue]:
         issues: list[V2GuardIssue] = []
         pat = re.compile(r"\.read\(\s*\)")
-        for i, line in enumerate(content.splitlines(), 1):
+        for i, line in enumerate(lines, 1):
             if pat.search(line):
                 issues.append(V2GuardIssue(
                     guard=self.GUARD_NAME,
@@ -158,99 +168,91 @@ class PerformanceGuard:
                 ))
         return issues
 
-    def _check_nplus1(self, fname: str, tree: ast.Module) -> list[V2GuardIssue]:
+    @visits(ast.For)
+    def _check_nplus1(self, node: ast.For, module: ParsedModule) -> list[V2GuardIssue]:
         """Detect DB calls inside for loops (N+1 pattern)."""
         issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.For):
-                continue
-            for child in ast.walk(node):
-                if isinstance(child, ast.Call):
-                    src = _call_name(child)
-                    if src and any(p in src for p in _DB_CALL_PATTERNS):
-                        issues.append(V2GuardIssue(
-                            guard=self.GUARD_NAME,
-                            severity="warn",
-                            message=(
-                                f"Potential N+1 query: {src} "
-                                f"inside for loop"
-                            ),
-                            file=fname,
-                            line=child.lineno,
-                        ))
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                src = _call_name(child)
+                if src and any(p in src for p in _DB_CALL_PATTERNS):
+                    issues.append(V2GuardIssue(
+                        guard=self.GUARD_NAME,
+                        severity="warn",
+                        message=(
+                            f"Potential N+1 query: {src} "
+                            f"inside for loop"
+                        ),
+                        file=str(module.path),
+                        line=child.lineno,
+                    ))
         return issues
 
-    def _check_regex_in_loop(self, fname: str, tree: ast.Module) -> list[V2GuardIssue]:
+    @visits(ast.For, ast.While)
+    def _check_regex_in_loop(self, node: ast.AST, module: ParsedModule) -> list[V2GuardIssue]:
         """Detect re.search/match/findall inside loops."""
         issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.For, ast.While)):
-                continue
-            for child in ast.walk(node):
-                if isinstance(child, ast.Call):
-                    src = _call_name(child)
-                    if src and src in _RE_FUNCS:
-                        issues.append(V2GuardIssue(
-                            guard=self.GUARD_NAME,
-                            severity="info",
-                            message=(
-                                f"{src} inside loop — "
-                                f"precompile with re.compile()"
-                            ),
-                            file=fname,
-                            line=child.lineno,
-                        ))
-        return issues
-
-    def _check_string_concat_in_loop(self, fname: str, tree: ast.Module) -> list[V2GuardIssue]:
-        """Detect += on string variables inside loops."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.For, ast.While)):
-                continue
-            for child in ast.walk(node):
-                if (
-                    isinstance(child, ast.AugAssign)
-                    and isinstance(child.op, ast.Add)
-                    and isinstance(child.target, ast.Name)
-                ):
+        for child in ast.walk(node):
+            if isinstance(child, ast.Call):
+                src = _call_name(child)
+                if src and src in _RE_FUNCS:
                     issues.append(V2GuardIssue(
                         guard=self.GUARD_NAME,
                         severity="info",
                         message=(
-                            f"String concatenation with += in loop "
-                            f"(variable '{child.target.id}') — "
-                            f"consider list + join"
+                            f"{src} inside loop — "
+                            f"precompile with re.compile()"
                         ),
-                        file=fname,
+                        file=str(module.path),
                         line=child.lineno,
                     ))
         return issues
 
-    def _check_len_listcomp(self, fname: str, tree: ast.Module) -> list[V2GuardIssue]:
-        """Detect len([x for x in ...]) — use sum(1 for ...) instead."""
+    @visits(ast.For, ast.While)
+    def _check_string_concat_in_loop(self, node: ast.AST, module: ParsedModule) -> list[V2GuardIssue]:
+        """Detect += on string variables inside loops."""
         issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
+        for child in ast.walk(node):
             if (
-                isinstance(node, ast.Call)
-                and isinstance(node.func, ast.Name)
-                and node.func.id == "len"
-                and len(node.args) == 1
-                and isinstance(node.args[0], ast.ListComp)
+                isinstance(child, ast.AugAssign)
+                and isinstance(child.op, ast.Add)
+                and isinstance(child.target, ast.Name)
             ):
                 issues.append(V2GuardIssue(
                     guard=self.GUARD_NAME,
                     severity="info",
                     message=(
-                        "len([x for x in ...]) — "
-                        "use sum(1 for x in ...) to avoid "
-                        "allocating a list"
+                        f"String concatenation with += in loop "
+                        f"(variable '{child.target.id}') — "
+                        f"consider list + join"
                     ),
-                    file=fname,
-                    line=node.lineno,
+                    file=str(module.path),
+                    line=child.lineno,
                 ))
         return issues
 
+    @visits(ast.Call)
+    def _check_len_listcomp(self, node: ast.Call, module: ParsedModule) -> list[V2GuardIssue]:
+        """Detect len([x for x in ...]) — use sum(1 for ...) instead."""
+        if not (
+            isinstance(node.func, ast.Name)
+            and node.func.id == "len"
+            and len(node.args) == 1
+            and isinstance(node.args[0], ast.ListComp)
+        ):
+            return []
+        return [V2GuardIssue(
+            guard=self.GUARD_NAME,
+            severity="info",
+            message=(
+                "len([x for x in ...]) — "
+                "use sum(1 for x in ...) to avoid "
+                "allocating a list"
+            ),
+            file=str(module.path),
+            line=node.lineno,
+        )]
+
     @staticmethod
     def _collect_module_names(tree: ast.Module) -> set[str]:
         """Collect module-level variable names."""
@@ -273,9 +275,11 @@ class PerformanceGuard:
                 return True
         return False
 
-    def _check_global_mutation(self, fname: str, tree: ast.Module, content: str = "") -> list[V2GuardIssue]:
+    def _check_global_mutation(
+        self, fname: str, tree: ast.Module, lines: list[str] | None = None,
+    ) -> list[V2GuardIssue]:
         """Detect assignment to module-level variable inside a function."""
-        lines = content.splitlines() if content else []
+        lines = lines or []
         issues: list[V2GuardIssue] = []
         module_names = self._collect_module_names(tree)
 
@@ -6,6 +6,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
 from .dependency_audit import V2GuardIssue
 
 logger = logging.getLogger(__name__)
@@ -73,18 +75,13 @@ def check_blocking_todos(
 ) -> list[V2GuardIssue]:
     """Find TODO/FIXME with BLOCK or CRITICAL."""
     issues: list[V2GuardIssue] = []
-    for py_file in sorted(project_root.rglob("*.py")):
+    for py_file in project_files(project_root):
         if is_excluded(py_file):
             continue
-        try:
-            text = py_file.read_text(
-                encoding="utf-8", errors="ignore"
-            )
-        except OSError:
+        module = read_module(py_file, errors="ignore")
+        if module is None:
             continue
-        for lineno, line in enumerate(
-            text.splitlines(), 1
-        ):
+        for lineno, line in enumerate(module.lines, 1):
             if _BLOCKING_TODO_RE.search(line):
                 issues.append(V2GuardIssue(
                     guard=GUARD_NAME,
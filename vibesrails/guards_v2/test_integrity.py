@@ -1,9 +1,11 @@
 """Test Integrity Guard — Detects cheating tests that over-mock."""
 
-import ast
 import logging
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from . import test_integrity_detectors as det
 from .dependency_audit import V2GuardIssue
 
@@ -24,14 +26,17 @@ class TestIntegrityGuard:
         self, filepath: Path, content: str,
     ) -> list[V2GuardIssue]:
         """Scan a single test file for integrity issues."""
-        if not filepath.name.startswith("test_"):
+        return self.scan_parsed(ParsedModule(filepath, content))
+
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed test file for integrity issues."""
+        if not module.path.name.startswith("test_"):
             return []
-        try:
-            tree = ast.parse(content, filename=str(filepath))
-        except SyntaxError:
+        tree = module.tree
+        if tree is None:
             return []
 
-        fname = str(filepath)
+        fname = str(module.path)
         issues: list[V2GuardIssue] = []
 
         mock_count, total = det.count_mocks(tree)
@@ -58,11 +63,11 @@ class TestIntegrityGuard:
                     file=fname,
                 ))
 
-        issues.extend(det.detect_sut_mocking(tree, filepath))
+        issues.extend(det.detect_sut_mocking(tree, module.path))
         issues.extend(det.detect_assert_free(tree, fname))
         issues.extend(det.detect_trivial_assertions(tree, fname))
         issues.extend(det.detect_mock_echo(tree, fname))
-        issues.extend(det.detect_missing_imports(tree, filepath))
+        issues.extend(det.detect_missing_imports(tree, module.path))
 
         return issues
 
@@ -77,18 +82,15 @@ class TestIntegrityGuard:
 
         mock_ratios: list[float] = []
 
-        for py_file in sorted(test_dir.rglob("test_*.py")):
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+        for py_file in project_files(project_root, "test_*.py", under="tests"):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, content))
+            issues.extend(self.scan_parsed(module))
 
-            try:
-                tree = ast.parse(content)
-            except SyntaxError:
+            if module.tree is None:
                 continue
-            mc, total = det.count_mocks(tree)
+            mc, total = det.count_mocks(module.tree)
             if total > 0:
                 mock_ratios.append(mc / total)
 
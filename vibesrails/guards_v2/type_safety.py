@@ -7,7 +7,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+from ..content_store import read_module
+from ..file_index import project_files
+from ..parsed_module import ParsedModule
 from .dependency_audit import V2GuardIssue
+from .dispatch import dispatch, visits
 
 logger = logging.getLogger(__name__)
 
@@ -33,34 +37,35 @@ class TypeSafetyGuard:
         self, filepath: Path, content: str
     ) -> list[V2GuardIssue]:
         """Scan a single file for type safety issues."""
-        try:
-            tree = ast.parse(content, filename=str(filepath))
-        except SyntaxError:
-            return []
+        return self.scan_parsed(ParsedModule(filepath, content))
 
-        issues: list[V2GuardIssue] = []
-        fname = str(filepath)
+    def scan_parsed(self, module: ParsedModule) -> list[V2GuardIssue]:
+        """Scan an already-parsed file for type safety issues."""
+        return dispatch(self, module)
 
-        issues.extend(self._missing_return_types(tree, fname))
-        issues.extend(self._missing_param_types(tree, fname))
-        issues.extend(self._explicit_any(tree, fname))
+    def accepts(self, module: ParsedModule) -> bool:
+        """Only files that parse are checked."""
+        return module.tree is not None
+
+    def finish(
+        self, module: ParsedModule, issues: list[V2GuardIssue]
+    ) -> list[V2GuardIssue]:
+        """Append line-based checks after the AST detectors."""
         issues.extend(
-            self._bare_type_ignore(content, fname)
+            self._bare_type_ignore(module.lines, str(module.path))
         )
-
         return issues
 
     def scan(self, project_root: Path) -> list[V2GuardIssue]:
         """Scan all Python files under *project_root*."""
         issues: list[V2GuardIssue] = []
-        for py_file in sorted(project_root.rglob("*.py")):
+        for py_file in project_files(project_root):
             if _is_excluded(py_file):
                 continue
-            try:
-                content = py_file.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            module = read_module(py_file)
+            if module is None:
                 continue
-            issues.extend(self.scan_file(py_file, content))
+            issues.extend(self.scan_parsed(module))
 
         issues.extend(self._run_mypy(project_root))
         return issues
@@ -69,94 +74,77 @@ class TypeSafetyGuard:
     # Detectors
     # ------------------------------------------------------------------
 
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
     def _missing_return_types(
-        self, tree: ast.Module, filepath: str
+        self, node: ast.FunctionDef, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Public functions without return type annotation."""
+        if node.name.startswith("_") or node.returns is not None:
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="warn",
+            message=(
+                f"Public function '{node.name}' "
+                f"has no return type annotation"
+            ),
+            file=str(module.path),
+            line=node.lineno,
+        )]
+
+    @visits(ast.FunctionDef, ast.AsyncFunctionDef)
+    def _missing_param_types(
+        self, node: ast.FunctionDef, module: ParsedModule
+    ) -> list[V2GuardIssue]:
+        """Public function params without type annotations."""
+        if node.name.startswith("_"):
+            return []
         issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(
-                node, (ast.FunctionDef, ast.AsyncFunctionDef)
-            ):
+        for arg in node.args.args:
+            if arg.arg in _SKIP_PARAMS:
                 continue
-            if node.name.startswith("_"):
-                continue
-            if node.returns is None:
+            if arg.annotation is None:
                 issues.append(V2GuardIssue(
                     guard=GUARD_NAME,
                     severity="warn",
                     message=(
-                        f"Public function '{node.name}' "
-                        f"has no return type annotation"
+                        f"Parameter '{arg.arg}' in "
+                        f"'{node.name}' has no type"
                     ),
-                    file=filepath,
+                    file=str(module.path),
                     line=node.lineno,
                 ))
         return issues
 
-    def _missing_param_types(
-        self, tree: ast.Module, filepath: str
-    ) -> list[V2GuardIssue]:
-        """Public function params without type annotations."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(
-                node, (ast.FunctionDef, ast.AsyncFunctionDef)
-            ):
-                continue
-            if node.name.startswith("_"):
-                continue
-            for arg in node.args.args:
-                if arg.arg in _SKIP_PARAMS:
-                    continue
-                if arg.annotation is None:
-                    issues.append(V2GuardIssue(
-                        guard=GUARD_NAME,
-                        severity="warn",
-                        message=(
-                            f"Parameter '{arg.arg}' in "
-                            f"'{node.name}' has no type"
-                        ),
-                        file=filepath,
-                        line=node.lineno,
-                    ))
-        return issues
-
+    @visits(ast.Name, ast.Attribute)
     def _explicit_any(
-        self, tree: ast.Module, filepath: str
+        self, node: ast.AST, module: ParsedModule
     ) -> list[V2GuardIssue]:
         """Warn on explicit use of Any type."""
-        issues: list[V2GuardIssue] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and node.id == "Any":
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="info",
-                    message="Explicit 'Any' usage detected",
-                    file=filepath,
-                    line=node.lineno,
-                ))
-            elif (
-                isinstance(node, ast.Attribute)
-                and node.attr == "Any"
+        if isinstance(node, ast.Name):
+            is_any = node.id == "Any"
+        else:
+            is_any = (
+                node.attr == "Any"
                 and isinstance(node.value, ast.Name)
                 and node.value.id == "typing"
-            ):
-                issues.append(V2GuardIssue(
-                    guard=GUARD_NAME,
-                    severity="info",
-                    message="Explicit 'Any' usage detected",
-                    file=filepath,
-                    line=node.lineno,
-                ))
-        return issues
+            )
+        if not is_any:
+            return []
+        return [V2GuardIssue(
+            guard=GUARD_NAME,
+            severity="info",
+            message="Explicit 'Any' usage detected",
+            file=str(module.path),
+            line=node.lineno,
+        )]
 
     def _bare_type_ignore(
-        self, content: str, filepath: str
+        self, lines: list[str], filepath: str
     ) -> list[V2GuardIssue]:
         """Find bare type-ignore comments without explanation."""
         issues: list[V2GuardIssue] = []
-        for i, line in enumerate(content.splitlines(), 1):
+        for i, line in enumerate(lines, 1):
             stripped = line.rstrip()
             if not re.search(
                 r"#\s*type:\s*ignore", stripped
@@ -0,0 +1,63 @@
+"""Thin hook client: forward a hook call to the running hook daemon.
+
+Only the standard library is imported here, so a hook that is served by the
+daemon (see hooks/daemon.py) never pays for the scanner or guard imports.
+When no daemon answers, the caller runs the hook in-process as before.
+Set VIBESRAILS_NO_DAEMON=1 to always run in-process.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import sys
+
+SOCKET_PATH = os.path.join(".vibesrails", "hookd.sock")
+CONNECT_TIMEOUT = 0.2  # seconds — a live daemon accepts immediately
+REPLY_TIMEOUT = 60  # seconds — covers the slowest post-commit guards
+
+
+def _exchange(request: bytes) -> dict | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(SOCKET_PATH)
+        sock.settimeout(REPLY_TIMEOUT)
+        sock.sendall(request)
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        sock.close()
+    response = json.loads(b"".join(chunks).decode("utf-8"))
+    return response if isinstance(response, dict) else None
+
+
+def run_via_daemon(hook: str) -> int | None:
+    """Relay this hook call through the daemon and return its exit code.
+
+    Returns None when the hook must run in-process; stdin is then restored
+    so the hook's main() can read it as usual.
+    """
+    if os.environ.get("VIBESRAILS_NO_DAEMON") == "1" or not os.path.exists(SOCKET_PATH):
+        return None
+    payload = sys.stdin.read()
+    request = json.dumps({"hook": hook, "cwd": os.path.realpath(os.getcwd()), "stdin": payload})
+    try:
+        response = _exchange(request.encode("utf-8"))
+    except (OSError, ValueError):
+        response = None
+    if response is None or response.get("fallback") or "exit" not in response:
+        sys.stdin = io.StringIO(payload)
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    code = response["exit"]
+    return code if isinstance(code, int) else 1
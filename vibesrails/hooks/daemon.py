@@ -0,0 +1,192 @@
+"""Hook daemon: serve PreToolUse/PostToolUse from one warm process.
+
+Every hook call used to start a fresh interpreter, import the scanner and
+guards, load the config and re-detect the session context. ``vibesrails
+--daemon`` keeps one process alive per project that listens on a Unix socket
+at .vibesrails/hookd.sock. The hook entry points forward their stdin to it
+(see hooks/client.py) and relay its stdout, stderr and exit code, so imports,
+compiled patterns, guard instances and in-process caches stay warm between
+tool calls.
+
+Protocol: the client sends one JSON object and shuts down its write side:
+
+    {"hook": "pre_tool_use", "cwd": "/abs/project", "stdin": "<hook JSON>"}
+
+The daemon answers with one JSON object and closes the connection:
+
+    {"exit": 0, "stdout": "...", "stderr": "..."}
+
+or {"fallback": true} when it cannot serve the request (unknown hook, other
+project), in which case the client runs the hook in-process.
+
+Requests are handled one at a time in the main thread, so hooks keep their
+process-wide assumptions (sys.stdout redirection, SIGALRM scan timeouts).
+The daemon exits after IDLE_TIMEOUT seconds without a request.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SOCKET_PATH = Path(".vibesrails") / "hookd.sock"
+IDLE_TIMEOUT = 1800  # seconds
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+HOOK_MODULES = {
+    "pre_tool_use": "vibesrails.hooks.pre_tool_use",
+    "post_tool_use": "vibesrails.hooks.post_tool_use",
+}
+
+
+def read_message(sock: socket.socket, limit: int = MAX_REQUEST_BYTES) -> Any:
+    """Read one JSON message terminated by EOF."""
+    chunks: list[bytes] = []
+    size = 0
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > limit:
+            raise ValueError("message too large")
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def run_hook(hook: str, stdin: str) -> dict[str, Any]:
+    """Run a hook's main() in this process with redirected stdio."""
+    module_name = HOOK_MODULES.get(hook)
+    if module_name is None:
+        return {"fallback": True}
+    module = importlib.import_module(module_name)
+
+    out, err = io.StringIO(), io.StringIO()
+    saved_stdin = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    code = 0
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                module.main()
+            except SystemExit as e:
+                if e.code is None:
+                    code = 0
+                elif isinstance(e.code, int):
+                    code = e.code
+                else:
+                    err.write(f"{e.code}\n")
+                    code = 1
+            except Exception:  # noqa: BLE001
+                # Same outcome as an uncaught error in a standalone hook
+                err.write(traceback.format_exc())
+                code = 1
+    finally:
+        sys.stdin = saved_stdin
+        try:
+            signal.alarm(0)  # never leak a scan timeout into the next request
+        except (AttributeError, OSError):
+            pass
+    return {"exit": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+class _HookHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = read_message(self.request)
+        except (OSError, ValueError) as e:
+            logger.debug("Bad hook request: %s", e)
+            return
+        if not isinstance(request, dict):
+            return
+        if request.get("cwd") != str(self.server.root):
+            response: dict[str, Any] = {"fallback": True}
+        else:
+            response = run_hook(str(request.get("hook")), str(request.get("stdin", "")))
+        try:
+            self.request.sendall(json.dumps(response).encode("utf-8"))
+        except OSError as e:
+            logger.debug("Hook client went away: %s", e)
+
+
+class HookServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server for one project root."""
+
+    def __init__(self, root: Path, idle_timeout: float = IDLE_TIMEOUT):
+        self.root = root
+        self.timeout = idle_timeout
+        self.idle = False
+        super().__init__(str(SOCKET_PATH), _HookHandler)
+
+    def handle_timeout(self) -> None:
+        self.idle = True
+
+
+def _socket_in_use() -> bool:
+    """True if another daemon already answers on the socket."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(SOCKET_PATH))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def serve(root: Path, idle_timeout: float = IDLE_TIMEOUT) -> int:
+    """Run the hook daemon for root until idle; returns a process exit code."""
+    root = root.resolve()
+    # Bind with a relative path: AF_UNIX paths are limited to ~100 bytes
+    os.chdir(root)
+    state_dir = SOCKET_PATH.parent
+    state_dir.mkdir(exist_ok=True)
+    try:
+        # Symlink protection: the socket must stay inside the project
+        state_dir.resolve().relative_to(root)
+    except ValueError:
+        logger.error("%s points outside the project, refusing to start", state_dir)
+        return 1
+
+    if SOCKET_PATH.exists():
+        if _socket_in_use():
+            logger.error("Hook daemon already running on %s", SOCKET_PATH)
+            return 1
+        SOCKET_PATH.unlink()  # stale socket from a killed daemon
+
+    old_umask = os.umask(0o177)  # socket is 0600: only this user may connect
+    try:
+        server = HookServer(root, idle_timeout)
+    finally:
+        os.umask(old_umask)
+
+    def _terminate(signum, frame):  # noqa: ARG001
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _terminate)
+    logger.info("VibesRails hook daemon listening on %s", root / SOCKET_PATH)
+    try:
+        with server:
+            while not server.idle:
+                server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            SOCKET_PATH.unlink()
+        except OSError:
+            pass
+    return 0
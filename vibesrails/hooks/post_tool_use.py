@@ -11,10 +11,11 @@ import json
 import logging
 import os
 import signal
-import subprocess
 import sys
 from pathlib import Path
 
+from vibesrails.parsed_module import ParsedModule
+
 logger = logging.getLogger(__name__)
 
 SCAN_TIMEOUT = 5  # seconds — auto-scan must complete within this
@@ -23,6 +24,8 @@ SCAN_TIMEOUT = 5  # seconds — auto-scan must complete within this
 # Heavy guards (mutation, dependency_audit, vulture, git_workflow, pre_deploy,
 # pr_checklist, env_safety) are left for --senior-v2 CLI.
 _FAST_V2_GUARDS = None
+_V2_DISPATCHER = None  # guard instances are stateless: reuse across calls
+_SENIOR_GUARDS = None
 
 
 def _get_fast_v2_guards():  # noqa: ANN202
@@ -50,36 +53,51 @@ def _get_fast_v2_guards():  # noqa: ANN202
     return _FAST_V2_GUARDS
 
 
-def _run_v2_guards(filepath: Path, content: str) -> list[str]:
-    """Run fast V2 guards on a single file."""
+def _get_v2_dispatcher():  # noqa: ANN202
+    """Lazily build one dispatcher over the fast V2 guards (None if unavailable)."""
+    global _V2_DISPATCHER  # noqa: PLW0603
+    if _V2_DISPATCHER is None:
+        guard_classes = _get_fast_v2_guards()
+        if not guard_classes:
+            return None
+        from vibesrails.guards_v2.dispatch import NodeDispatcher
+
+        _V2_DISPATCHER = NodeDispatcher([guard_cls() for guard_cls in guard_classes])
+    return _V2_DISPATCHER
+
+
+def _run_v2_guards(module: ParsedModule) -> list[str]:
+    """Run fast V2 guards on a single already-parsed file, in one AST walk."""
+    dispatcher = _get_v2_dispatcher()
+    if dispatcher is None:
+        return []
+
     lines: list[str] = []
-    for guard_cls in _get_fast_v2_guards():
-        guard = guard_cls()
-        try:
-            issues = guard.scan_file(filepath, content)
-        except Exception as e:  # noqa: BLE001
-            logger.debug("V2 guard %s failed: %s", guard.__class__.__name__, e)
-            continue
-        for issue in issues:
+    # A guard that raises is logged by the dispatcher and yields None
+    for issues in dispatcher.run(module):
+        for issue in issues or ():
             sev = issue.severity.upper()
             lines.append(f"  - L{issue.line} [{sev}] [{issue.guard}] {issue.message}")
     return lines
 
 
 # ── Senior guards (per-file, regex+AST) ──────────────────────────
-def _run_senior_guards(filepath: str, content: str) -> list[str]:
-    """Run Senior Mode guards on a single file."""
+def _run_senior_guards(module: ParsedModule, filepath: str) -> list[str]:
+    """Run Senior Mode guards on a single already-parsed file."""
+    global _SENIOR_GUARDS  # noqa: PLW0603
     lines: list[str] = []
     try:
-        from vibesrails.senior_mode.guards import SeniorGuards
+        if _SENIOR_GUARDS is None:
+            from vibesrails.senior_mode.guards import SeniorGuards
 
-        sg = SeniorGuards()
+            _SENIOR_GUARDS = SeniorGuards()
+        sg = _SENIOR_GUARDS
         issues = []
-        issues.extend(sg.error_guard.check(content, filepath))
-        issues.extend(sg.hallucination_guard.check(content, filepath))
-        issues.extend(sg.lazy_guard.check(content, filepath))
-        issues.extend(sg.bypass_guard.check(content, filepath))
-        issues.extend(sg.resilience_guard.check(content, filepath))
+        issues.extend(sg.error_guard.check_parsed(module, filepath))
+        issues.extend(sg.hallucination_guard.check_parsed(module, filepath))
+        issues.extend(sg.lazy_guard.check_parsed(module, filepath))
+        issues.extend(sg.bypass_guard.check_parsed(module, filepath))
+        issues.extend(sg.resilience_guard.check_parsed(module, filepath))
         for issue in issues:
             sev = issue.severity.upper()
             lines.append(f"  - L{issue.line} [{sev}] [{issue.guard}] {issue.message}")
@@ -91,26 +109,27 @@ def _run_senior_guards(filepath: str, content: str) -> list[str]:
 # ── Post-commit guards (project-level) ───────────────────────────
 def _run_post_commit_guards() -> list[str]:
     """Run guards relevant after a git commit."""
+    from vibesrails.git_snapshot import git_snapshot, split_diff
+
     lines: list[str] = []
+    # One diff of the last commit for all three guards, split per file
+    last_diff = git_snapshot(Path.cwd()).diff("HEAD~1", "--", "*.py", "test_*", "tests/")
+    patches = split_diff(last_diff or "")
     try:
         from vibesrails.senior_mode.guards import SeniorGuards
 
         sg = SeniorGuards()
 
         # DiffSizeGuard — check last commit size
-        diff = subprocess.run(
-            ["git", "diff", "HEAD~1", "--", "*.py"],
-            capture_output=True, text=True, timeout=10,
-        ).stdout
+        diff = "".join(patch for f, patch in patches.items() if f.endswith(".py"))
         if diff:
             for issue in sg.diff_guard.check(diff):
                 lines.append(f"  - [{issue.severity.upper()}] [{issue.guard}] {issue.message}")
 
             # TestCoverageGuard — code vs test ratio
-            test_diff = subprocess.run(
-                ["git", "diff", "HEAD~1", "--", "test_*", "tests/"],
-                capture_output=True, text=True, timeout=10,
-            ).stdout
+            test_diff = "".join(
+                patch for f, patch in patches.items() if f.startswith(("test_", "tests/"))
+            )
             for issue in sg.test_guard.check(diff, test_diff):
                 lines.append(f"  - [{issue.severity.upper()}] [{issue.guard}] {issue.message}")
     except Exception as e:  # noqa: BLE001
@@ -120,10 +139,7 @@ def _run_post_commit_guards() -> list[str]:
     try:
         from vibesrails.guards_v2.architecture_drift import ArchitectureDriftGuard
 
-        changed = subprocess.run(
-            ["git", "diff", "--name-only", "HEAD~1", "--", "*.py"],
-            capture_output=True, text=True, timeout=10,
-        ).stdout.strip().splitlines()
+        changed = [f for f in patches if f.endswith(".py")]
         guard = ArchitectureDriftGuard()
         for fpath in changed:
             p = Path(fpath)
@@ -183,13 +199,13 @@ def _handle_write_edit(tool_input: dict) -> None:
     except Exception as e:  # noqa: BLE001
         logger.debug("V1 scanner failed: %s", e)
 
-    # V2 guards (AST-based)
-    try:
-        content = Path(file_path).read_text(encoding="utf-8")
-        all_issues.extend(_run_v2_guards(Path(file_path), content))
-        all_issues.extend(_run_senior_guards(file_path, content))
-    except (OSError, UnicodeDecodeError) as e:
-        logger.debug("Failed to read %s: %s", file_path, e)
+    # V2 + Senior guards (AST-based) — read and parse the file once for all
+    module = ParsedModule.read(file_path)
+    if module is not None:
+        all_issues.extend(_run_v2_guards(module))
+        all_issues.extend(_run_senior_guards(module, file_path))
+    else:
+        logger.debug("Failed to read %s", file_path)
 
     # Cancel scan timeout
     try:
@@ -293,4 +309,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    from vibesrails.hooks.client import run_via_daemon
+
+    _code = run_via_daemon("post_tool_use")
+    if _code is not None:
+        sys.exit(_code)
     main()
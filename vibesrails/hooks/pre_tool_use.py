@@ -19,22 +19,25 @@ VIBESRAILS_DIR = Path.cwd() / ".vibesrails"
 # Commands that count as "verification" — resets the write counter
 CHECK_COMMANDS = ["pytest", "ruff", "vibesrails", "lint-imports", "bandit", "mypy"]
 
-# Secret patterns — imported from central source of truth
-try:
-    from core.secret_patterns import SECRET_PATTERN_DEFS
-    SECRET_PATTERNS = [(p, label) for p, label in SECRET_PATTERN_DEFS]
-except ImportError:
-    # Fallback if core not installed (standalone hook usage)
-    SECRET_PATTERNS = [
-        (
-            r"(?:api_key|secret|token|password|passwd)\s*=\s*['\"][^'\"]{8,}['\"]",
-            "Hardcoded secret detected",
-        ),
-        (
-            r"(?:AKIA|sk-|ghp_|gho_)[A-Za-z0-9_\-]{10,}",
-            "API key detected",
-        ),
-    ]
+
+def _load_secret_patterns() -> list[tuple[str, str]]:
+    """Secret patterns — imported from central source of truth."""
+    try:
+        from core.secret_patterns import SECRET_PATTERN_DEFS
+        return [(p, label) for p, label in SECRET_PATTERN_DEFS]
+    except ImportError:
+        # Fallback if core not installed (standalone hook usage)
+        return [
+            (
+                r"(?:api_key|secret|token|password|passwd)\s*=\s*['\"][^'\"]{8,}['\"]",
+                "Hardcoded secret detected",
+            ),
+            (
+                r"(?:AKIA|sk-|ghp_|gho_)[A-Za-z0-9_\-]{10,}",
+                "API key detected",
+            ),
+        ]
+
 
 # Code patterns — applied to .py files ONLY (not relevant for config files)
 CODE_PATTERNS = [
@@ -60,13 +63,6 @@ CODE_PATTERNS = [
     ),
 ]
 
-# Combined for backward compat (used by .py scanning)
-CRITICAL_PATTERNS = SECRET_PATTERNS + CODE_PATTERNS
-
-COMPILED_SECRET_PATTERNS = [(re.compile(p, re.IGNORECASE), msg) for p, msg in SECRET_PATTERNS]
-COMPILED_CODE_PATTERNS = [(re.compile(p, re.IGNORECASE), msg) for p, msg in CODE_PATTERNS]
-COMPILED_PATTERNS = COMPILED_SECRET_PATTERNS + COMPILED_CODE_PATTERNS
-
 # File extensions to scan for secrets (beyond .py)
 SCANNABLE_EXTENSIONS = {
     ".py", ".env", ".yaml", ".yml", ".json", ".toml",
@@ -101,32 +97,59 @@ BASH_SECRET_PATTERNS = [
     ),
 ]
 
-COMPILED_BASH_PATTERNS = [(re.compile(p, re.IGNORECASE), msg) for p, msg in BASH_SECRET_PATTERNS]
+
+def _compile(patterns: list[tuple[str, str]]) -> list[tuple[re.Pattern, str]]:
+    return [(re.compile(p, re.IGNORECASE), msg) for p, msg in patterns]
+
+
+# Built on first use: a Bash call only ever compiles the Bash patterns.
+_LAZY_CONSTANTS = {
+    "SECRET_PATTERNS": _load_secret_patterns,
+    # Combined for backward compat (used by .py scanning)
+    "CRITICAL_PATTERNS": lambda: _lazy("SECRET_PATTERNS") + CODE_PATTERNS,
+    "COMPILED_SECRET_PATTERNS": lambda: _compile(_lazy("SECRET_PATTERNS")),
+    "COMPILED_CODE_PATTERNS": lambda: _compile(CODE_PATTERNS),
+    "COMPILED_PATTERNS": lambda: (
+        _lazy("COMPILED_SECRET_PATTERNS") + _lazy("COMPILED_CODE_PATTERNS")
+    ),
+    "COMPILED_BASH_PATTERNS": lambda: _compile(BASH_SECRET_PATTERNS),
+}
+
+
+def _lazy(name: str):  # noqa: ANN202
+    """Return a lazily built module constant, memoized as a real global."""
+    if name not in globals():
+        globals()[name] = _LAZY_CONSTANTS[name]()
+    return globals()[name]
+
+
+def __getattr__(name: str):  # noqa: ANN202
+    if name in _LAZY_CONSTANTS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 DEFAULT_MAX_FILE_LINES = 300
 
 
 def _load_max_file_lines() -> int:
-    """Load max_file_lines from vibesrails.yaml guardian config, fallback to 300."""
-    try:
-        import yaml
-
-        def _safe_yaml_load(stream):
-            class _L(yaml.SafeLoader):
-                def compose_node(self, parent, index):
-                    if self.check_event(yaml.AliasEvent):
-                        cnt = getattr(self, '_alias_count', 0) + 1
-                        if cnt > 100:
-                            raise yaml.YAMLError("YAML alias limit exceeded")
-                        self._alias_count = cnt
-                    return super().compose_node(parent, index)
-            return yaml.load(stream, Loader=_L)
+    """Load guardian.max_file_lines from the merged vibesrails.yaml config, fallback to 300.
 
+    The merged config (extends applied) comes from the .vibesrails/config.cache
+    snapshot when it is fresh, and is rebuilt (and snapshotted) when it is not,
+    so the limit never depends on whether a scan ran first.
+    """
+    try:
         config_path = Path.cwd() / "vibesrails.yaml"
         if not config_path.exists():
             return DEFAULT_MAX_FILE_LINES
-        with open(config_path) as f:
-            config = _safe_yaml_load(f)
+        from vibesrails.config_cache import ConfigSnapshot
+
+        config = ConfigSnapshot(config_path).load()
+        if config is None:
+            from vibesrails.config import load_config_with_extends
+
+            config = load_config_with_extends(config_path)
         if not isinstance(config, dict):
             return DEFAULT_MAX_FILE_LINES
         guardian = config.get("guardian", {})
@@ -142,7 +165,7 @@ def _load_max_file_lines() -> int:
 def scan_bash_command(command: str) -> list[str]:
     """Scan a bash command for leaked secrets."""
     issues = []
-    for pattern, message in COMPILED_BASH_PATTERNS:
+    for pattern, message in _lazy("COMPILED_BASH_PATTERNS"):
         if pattern.search(command):
             # Redact the match in output
             redacted = pattern.sub("[REDACTED]", command)
@@ -171,7 +194,7 @@ def scan_content(content: str, patterns=None) -> list[str]:
         patterns: Compiled patterns to use. Defaults to COMPILED_PATTERNS (all).
     """
     if patterns is None:
-        patterns = COMPILED_PATTERNS
+        patterns = _lazy("COMPILED_PATTERNS")
     issues = []
     for line in content.splitlines():
         if _should_skip_line(line):
@@ -366,7 +389,7 @@ def main() -> None:
     if is_python:
         issues = scan_content(content)
     else:
-        issues = scan_content(content, patterns=COMPILED_SECRET_PATTERNS)
+        issues = scan_content(content, patterns=_lazy("COMPILED_SECRET_PATTERNS"))
 
     if issues:
         sys.stdout.write(f"\U0001f534 VibesRails BLOCKED ({len(issues)} issue(s)):\n")  # vibesrails: ignore
@@ -379,4 +402,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    from vibesrails.hooks.client import run_via_daemon
+
+    _code = run_via_daemon("pre_tool_use")
+    if _code is not None:
+        sys.exit(_code)
     main()
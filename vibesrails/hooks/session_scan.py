@@ -1,14 +1,30 @@
 """SessionStart hook: full project scan with fast V2 + Senior guards.
 
-Runs all fast guards on every .py file in the project (~5s for 400+ files).
+Runs all fast guards on every .py file in the project (~5s for 400+ files
+on a cold run). Findings are cached per file (see session_scan_cache), so
+later sessions only parse and scan the files that changed. Files that do
+need scanning are spread over worker processes (VIBESRAILS_SESSION_JOBS,
+default all cores); each worker loads the guards once.
 No Semgrep, no mutation testing — only AST-based analysis.
 Run as: python3 -m vibesrails.hooks.session_scan
 """
 
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
+from vibesrails.file_index import get_index
+from vibesrails.hooks.session_scan_cache import (
+    IssueTuple,
+    SessionScanCache,
+    guard_fingerprint,
+    is_cache_enabled,
+)
+from vibesrails.parsed_module import ParsedModule
+
 logger = logging.getLogger(__name__)
 
 _SKIP_DIRS = frozenset({
@@ -17,12 +33,23 @@ _SKIP_DIRS = frozenset({
     ".vibesrails", ".claude", "tests", "test",
 })
 
+# Below this many files per worker, process startup costs more than it saves
+MIN_FILES_PER_WORKER = 16
+# Chunks per worker: small enough to balance uneven file sizes
+CHUNKS_PER_WORKER = 4
+
+_worker_guards: tuple | None = None
+
 
 def _collect_py_files(root: Path) -> list[Path]:
-    """Collect all Python files, skipping excluded dirs."""
+    """Collect all Python files, skipping excluded dirs.
+
+    The file index is persisted, so an unchanged tree is not walked again
+    at the next session start.
+    """
     return [
-        py for py in sorted(root.rglob("*.py"))
-        if not any(p in py.parts for p in _SKIP_DIRS)
+        root / entry.rel for entry in get_index(root, persist=True).match("*.py")
+        if not _SKIP_DIRS.intersection(entry.rel.split("/"))
     ]
 
 
@@ -60,32 +87,153 @@ def _load_senior_guards() -> list:
         return []
 
 
-def _scan_file_v2(guard, filepath: Path, content: str) -> list:
-    """Run a single V2 guard on a file, return issues."""
-    try:
-        return list(guard.scan_file(filepath, content))
-    except Exception as e:  # noqa: BLE001
-        logger.debug("V2 guard %s failed on %s: %s", guard.__class__.__name__, filepath, e)
-        return []
+def _scan_file_v2(dispatcher, module: ParsedModule) -> list:
+    """Run all V2 guards on a parsed file in one AST walk, return issues.
 
+    A guard that raises is logged by the dispatcher and contributes nothing.
+    """
+    return [
+        issue for issues in dispatcher.run(module) if issues
+        for issue in issues
+    ]
 
-def _scan_file_senior(guard, content: str, fpath: str) -> list:
-    """Run a single Senior guard on a file, return issues."""
+
+def _scan_file_senior(guard, module: ParsedModule, fpath: str) -> list:
+    """Run a single Senior guard on a parsed file, return issues."""
     try:
-        return list(guard.check(content, fpath))
+        return list(guard.check_parsed(module, fpath))
     except Exception as e:  # noqa: BLE001
         logger.debug("Senior guard failed on %s: %s", fpath, e)
         return []
 
 
-def _tally_issue(issue, blocks: list, warns: list) -> tuple[int, int, int]:
+def _as_tuple(issue, rel: str) -> IssueTuple:
+    """Compact (severity, file, line, guard, message) form of a guard issue."""
+    return (issue.severity, rel, issue.line, getattr(issue, "guard", "?"), issue.message)
+
+
+def _scan_file(dispatcher, senior_guards: list, module: ParsedModule, rel: str) -> list[IssueTuple]:
+    """Run every guard on one parsed file; issues in V2-then-Senior order."""
+    issues = [_as_tuple(issue, rel) for issue in _scan_file_v2(dispatcher, module)]
+    for guard in senior_guards:
+        issues.extend(
+            _as_tuple(issue, issue.file) for issue in _scan_file_senior(guard, module, rel)
+        )
+    return issues
+
+
+def _decode(data: bytes) -> str | None:
+    """Decode file bytes like Path.read_text (UTF-8, universal newlines)."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _build_guards() -> tuple:
+    """Load the guard set once: (NodeDispatcher over V2 guards, Senior guards)."""
+    from vibesrails.guards_v2.dispatch import NodeDispatcher
+    return NodeDispatcher(_load_v2_guards()), _load_senior_guards()
+
+
+def session_jobs() -> int:
+    """Worker processes from VIBESRAILS_SESSION_JOBS (0 or unset = all cores)."""
+    try:
+        jobs = int(os.environ.get("VIBESRAILS_SESSION_JOBS", "0"))
+    except ValueError:
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _init_worker() -> None:
+    """Pool initializer: build the guard set once per worker process."""
+    global _worker_guards
+    _worker_guards = _build_guards()
+
+
+def _scan_sources(
+    items: list[tuple[str, str, str]], guards: tuple | None = None,
+) -> list[list[IssueTuple]]:
+    """Scan (path, rel, source) items with guards (default: this worker's set)."""
+    dispatcher, senior_guards = guards or _worker_guards
+    return [
+        _scan_file(dispatcher, senior_guards, ParsedModule(path, source), rel)
+        for path, rel, source in items
+    ]
+
+
+def _chunk(items: list, workers: int) -> list[list]:
+    size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _scan_all(
+    items: list[tuple[str, str, str]], guards: tuple, jobs: int,
+) -> list[list[IssueTuple]]:
+    """Scan items across up to `jobs` processes; one issue list per item, in order.
+
+    Falls back to scanning in this process if a pool cannot be started.
+    """
+    workers = min(jobs, len(items) // MIN_FILES_PER_WORKER)
+    if workers > 1:
+        try:
+            results: list[list[IssueTuple]] = []
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                for chunk_results in pool.map(_scan_sources, _chunk(items, workers)):
+                    results.extend(chunk_results)
+            return results
+        except (OSError, BrokenProcessPool) as e:
+            logger.debug("Parallel session scan unavailable, scanning serially: %s", e)
+    return _scan_sources(items, guards)
+
+
+def _read_source(
+    py: Path, rel: str, cache: SessionScanCache | None,
+) -> tuple[list[IssueTuple] | None, str | None]:
+    """Cached issues for a file, or its source when it has to be scanned."""
+    if cache is None:
+        module = ParsedModule.read(py)
+        return None, None if module is None else module.source
+    cached, data = cache.lookup(rel, py)
+    if cached is not None:
+        return cached, None
+    return None, None if data is None else _decode(data)
+
+
+def _collect_issues(
+    root: Path, py_files: list[Path], guards: tuple, cache: SessionScanCache | None,
+) -> list[list[IssueTuple]]:
+    """Issues per file in py_files order: cached ones reused, the rest scanned."""
+    per_file: list[list[IssueTuple]] = [[] for _ in py_files]
+    pending: list[int] = []
+    items: list[tuple[str, str, str]] = []
+    for idx, py in enumerate(py_files):
+        rel = str(py.relative_to(root))
+        cached, source = _read_source(py, rel, cache)
+        if cached is not None:
+            per_file[idx] = cached
+        elif source is not None:
+            pending.append(idx)
+            items.append((str(py), rel, source))
+    for idx, (_, rel, _), issues in zip(pending, items, _scan_all(items, guards, session_jobs())):
+        per_file[idx] = issues
+        if cache is not None:
+            cache.put(rel, issues)
+    return per_file
+
+
+def _tally_issue(issue: IssueTuple, blocks: list, warns: list) -> tuple[int, int, int]:
     """Classify an issue and append to appropriate detail list. Returns (b, w, i) counts."""
-    if issue.severity == "block":
-        blocks.append(f"  \U0001f6d1 {issue.file}:L{issue.line} [{getattr(issue, 'guard', '?')}] {issue.message}")
+    severity, file, line, guard, message = issue
+    if severity == "block":
+        blocks.append(f"  \U0001f6d1 {file}:L{line} [{guard}] {message}")
         return (1, 0, 0)
-    if issue.severity == "warn":
+    if severity == "warn":
         if len(warns) < 20:
-            warns.append(f"  \u26a0\ufe0f  {issue.file}:L{issue.line} [{getattr(issue, 'guard', '?')}] {issue.message}")
+            warns.append(f"  \u26a0\ufe0f  {file}:L{line} [{guard}] {message}")
         return (0, 1, 0)
     return (0, 0, 1)
 
@@ -99,35 +247,27 @@ def main() -> None:
     if not v2_guards and not senior_guards:
         sys.exit(0)
 
+    from vibesrails.guards_v2.dispatch import NodeDispatcher
+    guards = (NodeDispatcher(v2_guards), senior_guards)
+    cache = (
+        SessionScanCache(root, guard_fingerprint(v2_guards + senior_guards, root))
+        if is_cache_enabled() else None
+    )
+
     py_files = _collect_py_files(root)
     blocks_n = warns_n = infos_n = 0
     block_details: list[str] = []
     warn_details: list[str] = []
 
-    for py in py_files:
-        try:
-            content = py.read_text("utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-
-        rel = str(py.relative_to(root))
+    for issues in _collect_issues(root, py_files, guards, cache):
+        for issue in issues:
+            b, w, i = _tally_issue(issue, block_details, warn_details)
+            blocks_n += b
+            warns_n += w
+            infos_n += i
 
-        for guard in v2_guards:
-            for issue in _scan_file_v2(guard, py, content):
-                issue_file_bak = issue.file
-                issue.file = rel
-                b, w, i = _tally_issue(issue, block_details, warn_details)
-                issue.file = issue_file_bak
-                blocks_n += b
-                warns_n += w
-                infos_n += i
-
-        for guard in senior_guards:
-            for issue in _scan_file_senior(guard, content, rel):
-                b, w, i = _tally_issue(issue, block_details, warn_details)
-                blocks_n += b
-                warns_n += w
-                infos_n += i
+    if cache is not None:
+        cache.save()
 
     # Output summary
     sys.stdout.write(
@@ -0,0 +1,262 @@
+"""Per-file findings cache for the SessionStart scan.
+
+Stores the issues found in each file in .vibesrails/cache/session_scan.json,
+keyed by the file's content hash, together with its (mtime_ns, size) and the
+git HEAD of the last session. The next session only re-reads a file when
+git or its stat says it may have changed:
+
+- files reported by ``git diff <last HEAD>`` (commits since the last session
+  plus uncommitted edits) or ``git ls-files --others`` (untracked) are
+  re-hashed;
+- any other file whose mtime and size match the cached entry reuses its
+  findings without being read;
+- a re-hashed file whose content is unchanged (touched, or edited back)
+  still reuses its findings; only real changes are parsed and scanned.
+
+Outside a git repository, or when the last HEAD is gone, mtime and size
+alone decide. Entries are discarded when the vibesrails version or the
+guard set changes, and when the import environment does: HallucinationGuard
+asks importlib whether each import resolves, so installing a package or
+adding a top-level module changes findings in files that did not change.
+Set VIBESRAILS_SESSION_CACHE=0 to scan everything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.machinery
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from vibesrails import __version__
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".vibesrails") / "cache"
+CACHE_FILE_NAME = "session_scan.json"
+CACHE_VERSION = 1
+GIT_TIMEOUT = 5
+
+# Compact issue: (severity, file, line, guard, message)
+IssueTuple = tuple[str, str, int | None, str, str]
+
+
+def is_cache_enabled() -> bool:
+    """Return False when VIBESRAILS_SESSION_CACHE is set to 0/false/no."""
+    value = os.environ.get("VIBESRAILS_SESSION_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "no")
+
+
+def _module_names(directory: str) -> list[str]:
+    """Top-level names importable from a directory: modules and packages."""
+    suffixes = tuple(importlib.machinery.all_suffixes())
+    names = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    names.add(name)
+                elif name.endswith(suffixes):
+                    names.add(name.split(".", 1)[0])
+    except OSError:
+        return []
+    return sorted(n for n in names if n.isidentifier())
+
+
+def environment_stamp(root: Path) -> list:
+    """What import resolution depends on: sys.path and what its entries hold.
+
+    The project root (always: hooks run with it as cwd) stamps its module
+    names, so edits saved by rename do not count; any other sys.path entry
+    stamps its mtime, which an install or uninstall changes.
+    """
+    root_dir = os.path.abspath(root)
+    stamp: list = [["root", _module_names(root_dir)]]
+    for entry in sys.path:
+        path = os.path.abspath(entry or os.getcwd())
+        if path == root_dir:
+            stamp.append([entry, "root"])
+            continue
+        try:
+            stamp.append([entry, os.stat(path).st_mtime_ns])
+        except OSError:
+            stamp.append([entry, None])
+    return stamp
+
+
+def guard_fingerprint(guards: list, root: Path | None = None) -> str:
+    """Hash the vibesrails version and the classes of the active guards.
+
+    With root, the import environment too (see environment_stamp).
+    """
+    names = [f"{type(g).__module__}.{type(g).__qualname__}" for g in guards]
+    data: dict = {"version": __version__, "guards": names}
+    if root is not None:
+        data["environment"] = environment_stamp(root)
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+def _git(root: Path, *args: str) -> str | None:
+    """Run a git command in root; None if git is missing or the command fails."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True,
+            timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def git_head(root: Path) -> str | None:
+    """Current HEAD commit, or None outside a git repository / before the first commit."""
+    out = _git(root, "rev-parse", "--verify", "-q", "HEAD")
+    return out.strip() if out else None
+
+
+def git_changed_paths(root: Path, since: str | None) -> set[str] | None:
+    """Paths (relative to root) changed since commit `since`, committed or not.
+
+    None means git cannot tell (not a repo, unknown commit): treat every
+    file as possibly changed.
+    """
+    if not since:
+        return None
+    diff = _git(root, "diff", "--name-only", "--relative", "--no-renames", "-z", since, "--")
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard", "-z")
+    if diff is None or untracked is None:
+        return None
+    return {p for p in (diff + untracked).split("\0") if p}
+
+
+class SessionScanCache:
+    """Content-addressed per-file findings for one guard set."""
+
+    def __init__(self, root: Path, fingerprint: str, cache_dir: Path | None = None):
+        self.root = root
+        self.cache_dir = cache_dir or root / CACHE_DIR
+        self.fingerprint = fingerprint
+        self.head = git_head(root)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict] = {}
+        self._seen: set[str] = set()
+        self._pending: dict[str, tuple[str, list[int]]] = {}
+        self._last_head: str | None = None
+        self._dirty = False
+        self._load()
+        self._changed = git_changed_paths(root, self._last_head) if self._entries else None
+
+    @property
+    def cache_file(self) -> Path:
+        return self.cache_dir / CACHE_FILE_NAME
+
+    def _load(self) -> None:
+        """Load entries; a version or guard-set change discards everything."""
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("guards") != self.fingerprint:
+            self._dirty = True
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+        self._last_head = data.get("head")
+        if self._last_head != self.head:
+            self._dirty = True
+
+    def _may_have_changed(self, rel: str, entry: dict, stat: list[int]) -> bool:
+        if self._changed is not None and rel in self._changed:
+            return True
+        return entry.get("stat") != stat
+
+    def lookup(self, rel: str, path: Path) -> tuple[list[IssueTuple] | None, bytes | None]:
+        """Return (cached issues, None) on a hit, or (None, file bytes) on a miss.
+
+        The bytes are None too when the file cannot be read. After a miss,
+        put() stores the findings for the bytes returned here.
+        """
+        self._seen.add(rel)
+        try:
+            st = path.stat()
+        except OSError:
+            return None, None
+        stat = [st.st_mtime_ns, st.st_size]
+        entry = self._entries.get(rel)
+        if entry is not None and not self._may_have_changed(rel, entry, stat):
+            issues = _issues(entry)
+            if issues is not None:
+                self.hits += 1
+                return issues, None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None, None
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry.get("hash") == digest:
+            issues = _issues(entry)
+            if issues is not None:
+                entry["stat"] = stat
+                self._dirty = True
+                self.hits += 1
+                return issues, None
+        self.misses += 1
+        self._pending[rel] = (digest, stat)
+        return None, data
+
+    def put(self, rel: str, issues: list[IssueTuple]) -> None:
+        """Store the findings for the content lookup() returned for rel."""
+        pending = self._pending.pop(rel, None)
+        if pending is None:
+            return
+        digest, stat = pending
+        self._entries[rel] = {
+            "hash": digest,
+            "stat": stat,
+            "issues": [list(issue) for issue in issues],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Drop entries for files not seen this session, then write atomically."""
+        stale = [rel for rel in self._entries if rel not in self._seen]
+        for rel in stale:
+            del self._entries[rel]
+        if not (self._dirty or stale):
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Symlink protection: the cache directory must stay under the root
+            self.cache_dir.resolve().relative_to(self.root.resolve())
+            tmp = self.cache_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "version": CACHE_VERSION,
+                "guards": self.fingerprint,
+                "head": self.head,
+                "entries": self._entries,
+            }))
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
+        except (OSError, ValueError) as e:
+            logger.debug("Session scan cache not saved: %s", e)
+
+
+def _issues(entry: dict) -> list[IssueTuple] | None:
+    try:
+        return [
+            (str(sev), str(file), line, str(guard), str(msg))
+            for sev, file, line, guard, msg in entry.get("issues", [])
+        ]
+    except (TypeError, ValueError):
+        return None
@@ -16,6 +16,8 @@ import sys
 import time
 from pathlib import Path
 
+from vibesrails.git_snapshot import git_snapshot
+
 STATE_FILE = Path(".vibesrails") / ".session_state"
 COMMIT_THRESHOLD = 5
 TIME_THRESHOLD = 3600  # 1 hour
@@ -23,16 +25,8 @@ TIME_THRESHOLD = 3600  # 1 hour
 
 def _get_branch() -> str:
     """Get current git branch name."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        return result.stdout.strip()
-    except Exception:
-        return ""
+    status = git_snapshot(Path.cwd()).status
+    return status.branch if status is not None else ""
 
 
 def _load_state() -> dict:
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from ..file_index import project_files
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +45,7 @@ class PatternDetector:
 
     def _detect_test_pattern(self) -> DetectedPattern | None:
         """Find where test files are located."""
-        test_files = list(self.project_root.rglob("test_*.py"))
+        test_files = project_files(self.project_root, "test_*.py")
 
         if not test_files:
             return None
@@ -79,7 +81,7 @@ class PatternDetector:
 
     def _detect_service_pattern(self) -> DetectedPattern | None:
         """Find where service files are located."""
-        service_files = list(self.project_root.rglob("*_service.py"))
+        service_files = project_files(self.project_root, "*_service.py")
 
         if len(service_files) < 2:  # Need at least 2 for pattern
             return None
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from ..file_index import project_files
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +32,7 @@ class SignatureIndexer:
         """Scan all Python files and extract signatures."""
         signatures = []
 
-        for py_file in self.project_root.rglob("*.py"):
+        for py_file in project_files(self.project_root):
             try:
                 signatures.extend(self._extract_signatures(py_file))
             except (OSError, UnicodeDecodeError, SyntaxError):
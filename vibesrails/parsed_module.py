@@ -0,0 +1,71 @@
+"""Parsed Python module shared by AST-based guards.
+
+Built once per file and handed to every guard through scan_parsed() (V2
+guards) or check_parsed() (Senior guards), so a file is split into lines and
+parsed at most once per hook run. Each derived view (lines, tree, parent map,
+node-type index) is computed lazily on first use.
+"""
+
+from __future__ import annotations
+
+import ast
+from functools import cached_property
+from pathlib import Path
+
+
+class ParsedModule:
+    """Source, lines and AST of one Python file, computed at most once."""
+
+    def __init__(self, path: Path | str, source: str) -> None:
+        self.path = Path(path)
+        self.source = source
+
+    @classmethod
+    def read(cls, path: Path | str) -> ParsedModule | None:
+        """Read a UTF-8 file from disk; None if it cannot be read or decoded."""
+        try:
+            return cls(path, Path(path).read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Source lines (str.splitlines semantics)."""
+        return self.source.splitlines()
+
+    @cached_property
+    def tree(self) -> ast.Module | None:
+        """Parsed AST, or None if the source does not parse."""
+        try:
+            return ast.parse(self.source, filename=str(self.path))
+        except (SyntaxError, ValueError):
+            return None
+
+    @cached_property
+    def walk(self) -> list[ast.AST]:
+        """All nodes in ast.walk order (empty if the source does not parse)."""
+        return list(ast.walk(self.tree)) if self.tree is not None else []
+
+    @cached_property
+    def parents(self) -> dict[ast.AST, ast.AST]:
+        """Map each node to its parent node."""
+        parents: dict[ast.AST, ast.AST] = {}
+        for node in self.walk:
+            for child in ast.iter_child_nodes(node):
+                parents[child] = node
+        return parents
+
+    @cached_property
+    def index(self) -> dict[type, list[ast.AST]]:
+        """Nodes grouped by their exact AST class, each list in ast.walk order."""
+        index: dict[type, list[ast.AST]] = {}
+        for node in self.walk:
+            index.setdefault(type(node), []).append(node)
+        return index
+
+    def nodes(self, *types: type) -> list[ast.AST]:
+        """Return nodes of the given exact AST classes, in ast.walk order."""
+        if len(types) == 1:
+            return list(self.index.get(types[0], ()))
+        wanted = set(types)
+        return [node for node in self.walk if type(node) in wanted]
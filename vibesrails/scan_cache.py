@@ -0,0 +1,157 @@
+"""Incremental scan result cache for VibesRails.
+
+Stores scan_file results in .vibesrails/cache/scan_results.json, keyed by
+file content hash and a fingerprint of the effective scan config (patterns,
+exceptions, complexity limits, package version). Unchanged files reuse their
+cached results, so a full scan costs about as much as the diff.
+
+Guardian rules are applied after the cache (they depend on the detected AI
+agent, not on file content), so they are not part of the fingerprint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from . import __version__
+from .scanner_engine import PATTERN_SECTIONS
+from .scanner_types import ScanResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".vibesrails") / "cache"
+CACHE_FILE_NAME = "scan_results.json"
+CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 20_000
+
+_FINGERPRINT_KEYS = PATTERN_SECTIONS + ("exceptions", "complexity")
+
+
+def is_cache_enabled(config: dict) -> bool:
+    """Return True unless scan_cache.enabled is false in config."""
+    settings = config.get("scan_cache") or {}
+    return bool(settings.get("enabled", True))
+
+
+def config_fingerprint(config: dict) -> str:
+    """Hash every config section that can change scan_file output."""
+    payload = {key: config.get(key) for key in _FINGERPRINT_KEYS}
+    payload["vibesrails_version"] = __version__
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def file_digest(filepath: str) -> str | None:
+    """Return the sha256 of a file's bytes, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class ScanCache:
+    """Content-addressed cache of scan_file results for one config."""
+
+    def __init__(
+        self,
+        config: dict,
+        cache_dir: Path | None = None,
+        max_entries: int | None = None,
+    ):
+        settings = config.get("scan_cache") or {}
+        self.cache_dir = cache_dir or Path.cwd() / CACHE_DIR
+        self.fingerprint = config_fingerprint(config)
+        try:
+            self.max_entries = int(max_entries or settings.get("max_entries", DEFAULT_MAX_ENTRIES))
+        except (ValueError, TypeError):
+            self.max_entries = DEFAULT_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._run = 0
+        self._entries: dict[str, dict] = {}
+        self._load()
+
+    @property
+    def cache_file(self) -> Path:
+        return self.cache_dir / CACHE_FILE_NAME
+
+    def _load(self) -> None:
+        """Load entries; a version or config change discards everything."""
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("config") != self.fingerprint:
+            self._dirty = True
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+        self._run = int(data.get("run", 0)) + 1
+
+    def get(self, filepath: str, digest: str) -> list[ScanResult] | None:
+        """Return cached results for a file if its content is unchanged."""
+        entry = self._entries.get(filepath)
+        if not entry or entry.get("hash") != digest:
+            self.misses += 1
+            return None
+        try:
+            results = [
+                ScanResult(filepath, line, pattern_id, message, level)
+                for line, pattern_id, message, level in entry.get("results", [])
+            ]
+        except (TypeError, ValueError):
+            self.misses += 1
+            return None
+        if entry.get("run") != self._run:
+            entry["run"] = self._run
+            self._dirty = True
+        self.hits += 1
+        return results
+
+    def put(self, filepath: str, digest: str, results: list[ScanResult]) -> None:
+        """Store results for a file's current content."""
+        self._entries[filepath] = {
+            "hash": digest,
+            "run": self._run,
+            "results": [[r.line, r.pattern_id, r.message, r.level] for r in results],
+        }
+        self._dirty = True
+
+    def _evict(self) -> None:
+        """Drop entries for deleted files, then the least recently used beyond the cap."""
+        for path in [p for p in self._entries if not Path(p).exists()]:
+            del self._entries[path]
+        overflow = len(self._entries) - self.max_entries
+        if overflow > 0:
+            by_age = sorted(self._entries, key=lambda p: self._entries[p].get("run", 0))
+            for path in by_age[:overflow]:
+                del self._entries[path]
+
+    def save(self) -> None:
+        """Persist the cache atomically (no-op if nothing changed)."""
+        if not self._dirty:
+            return
+        self._evict()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Symlink protection: the cache directory must stay under cwd
+            self.cache_dir.resolve().relative_to(Path.cwd().resolve())
+            tmp = self.cache_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps({
+                "version": CACHE_VERSION,
+                "config": self.fingerprint,
+                "run": self._run,
+                "entries": self._entries,
+            }))
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
+        except (OSError, ValueError) as e:
+            logger.debug("Scan cache not saved: %s", e)
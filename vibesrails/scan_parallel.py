@@ -0,0 +1,69 @@
+"""Parallel file scanning for VibesRails.
+
+Splits a file list across a ProcessPoolExecutor. The config is sent to each
+worker once (pool initializer) and its patterns are compiled there once, so
+per-file tasks only carry file paths. Results come back in input order.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .scanner import ScanResult, scan_file
+from .scanner_engine import compile_config
+
+logger = logging.getLogger(__name__)
+
+# Below this many files per worker, process startup costs more than it saves
+MIN_FILES_PER_WORKER = 8
+# Chunks per worker: small enough to balance uneven file sizes
+CHUNKS_PER_WORKER = 4
+
+_worker_config: dict | None = None
+
+
+def resolve_jobs(config: dict, jobs: int | None = None) -> int:
+    """Resolve worker count from --jobs, then scan_jobs in config. 0 = all cores."""
+    if jobs is None:
+        jobs = config.get("scan_jobs", 1)
+    try:
+        jobs = int(jobs)
+    except (ValueError, TypeError):
+        return 1
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _init_worker(config: dict) -> None:
+    """Pool initializer: keep the config and its compiled patterns per worker."""
+    global _worker_config
+    _worker_config = config
+    compile_config(config)
+
+
+def _scan_chunk(files: list[str]) -> list[list[ScanResult]]:
+    """Scan a chunk of files inside a worker process."""
+    return [scan_file(filepath, _worker_config) for filepath in files]
+
+
+def _chunk(files: list[str], workers: int) -> list[list[str]]:
+    size = max(1, -(-len(files) // (workers * CHUNKS_PER_WORKER)))
+    return [files[i:i + size] for i in range(0, len(files), size)]
+
+
+def scan_files_parallel(files: list[str], config: dict, jobs: int) -> list[list[ScanResult]]:
+    """Scan files across up to `jobs` processes; returns one result list per file, in order."""
+    workers = min(jobs, len(files) // MIN_FILES_PER_WORKER)
+    if workers <= 1:
+        return [scan_file(filepath, config) for filepath in files]
+
+    results: list[list[ScanResult]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config,),
+    ) as pool:
+        for chunk_results in pool.map(_scan_chunk, _chunk(files, workers)):
+            results.extend(chunk_results)
+    return results
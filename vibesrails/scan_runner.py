@@ -5,6 +5,7 @@ Orchestrates Semgrep + VibesRails scanning and result merging.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .ai_guardian import (
     apply_guardian_rules,
@@ -16,6 +17,8 @@ from .ai_guardian import (
 )
 from .metrics import ScanTrackingData, track_scan
 from .result_merger import ResultMerger
+from .scan_cache import ScanCache, file_digest, is_cache_enabled
+from .scan_parallel import resolve_jobs, scan_files_parallel
 from .scanner import BLUE, GREEN, NC, RED, YELLOW, ScanResult, scan_file
 from .semgrep_adapter import SemgrepAdapter
 
@@ -39,17 +42,56 @@ def _setup_semgrep(config: dict) -> tuple[SemgrepAdapter, bool]:
     return semgrep, True
 
 
-def _run_vibesrails_scan(config: dict, files: list[str]) -> tuple[list, bool, str | None]:
+def _lookup_cache(
+    files: list[str], cache: ScanCache | None,
+) -> tuple[dict[str, list[ScanResult]], dict[str, str | None]]:
+    """Split files into cached results and pending files (with their digests)."""
+    cached_results: dict[str, list[ScanResult]] = {}
+    pending: dict[str, str | None] = {}
+    for filepath in files:
+        digest = file_digest(filepath) if cache is not None else None
+        cached = cache.get(filepath, digest) if cache is not None and digest else None
+        if cached is None:
+            pending[filepath] = digest
+        else:
+            cached_results[filepath] = cached
+    return cached_results, pending
+
+
+def _scan_pending(config: dict, files: list[str], jobs: int) -> list[list[ScanResult]]:
+    """Scan files serially or across a process pool; one result list per file."""
+    if jobs > 1:
+        return scan_files_parallel(files, config, jobs)
+    return [scan_file(filepath, config) for filepath in files]
+
+
+def _run_vibesrails_scan(
+    config: dict, files: list[str], use_cache: bool = True, jobs: int = 1,
+) -> tuple[list, bool, str | None]:
     """Run VibesRails scan on files. Returns (results, guardian_active, agent_name)."""
     logger.info("🔍 Running VibesRails scan...")
     guardian_active = should_apply_guardian(config)
     agent_name = get_ai_agent_name() if guardian_active else None
+    cache = ScanCache(config) if use_cache and is_cache_enabled(config) else None
+
+    by_file, pending = _lookup_cache(files, cache)
+    for filepath, file_results in zip(pending, _scan_pending(config, list(pending), jobs)):
+        by_file[filepath] = file_results
+        digest = pending[filepath]
+        # Only cache if the file did not change while it was being scanned
+        if cache is not None and digest and file_digest(filepath) == digest:
+            cache.put(filepath, digest, file_results)
+
     results = []
     for filepath in files:
-        file_results = scan_file(filepath, config)
+        file_results = by_file[filepath]
         if guardian_active:
             file_results = apply_guardian_rules(file_results, config, filepath)
         results.extend(file_results)
+    if cache is not None:
+        cache.save()
+        if cache.hits:
+            logger.info(f"   Reused cached results for {cache.hits} unchanged file(s)")
     logger.info(f"   Found {len(results)} issue(s)\n")
     return results, guardian_active, agent_name
 
@@ -64,8 +106,15 @@ def _print_scan_stats(stats: dict) -> None:
     logger.info(f"   Total:       {stats['total']} unique issues\n")
 
 
-def run_scan(config: dict, files: list[str]) -> int:
-    """Run scan with Semgrep + VibesRails orchestration and return exit code."""
+def run_scan(
+    config: dict, files: list[str], use_cache: bool = True, jobs: int | None = None,
+) -> int:
+    """Run scan with Semgrep + VibesRails orchestration and return exit code.
+
+    With use_cache, unchanged files reuse results from .vibesrails/cache/.
+    jobs (or scan_jobs in config) spreads VibesRails scanning over processes.
+    Semgrep runs in a background thread while VibesRails scans.
+    """
     start_time = time.time()
     logger.info(f"{BLUE}VibesRails - Security Scan{NC}")
     logger.info("=" * 30)
@@ -78,12 +127,19 @@ def run_scan(config: dict, files: list[str]) -> int:
 
     semgrep, semgrep_available = _setup_semgrep(config)
     semgrep_results = []
-    if semgrep_available and semgrep.enabled:
-        logger.info("🔍 Running Semgrep scan...")
-        semgrep_results = semgrep.scan(files)
-        logger.info(f"   Found {len(semgrep_results)} issue(s)")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        semgrep_future = None
+        if semgrep_available and semgrep.enabled:
+            logger.info("🔍 Running Semgrep scan (background)...")
+            semgrep_future = executor.submit(semgrep.scan, files)
+
+        vr_results, guardian_active, agent_name = _run_vibesrails_scan(
+            config, files, use_cache, resolve_jobs(config, jobs),
+        )
+        if semgrep_future is not None:
+            semgrep_results = semgrep_future.result()
+            logger.info(f"   Semgrep found {len(semgrep_results)} issue(s)")
 
-    vr_results, guardian_active, agent_name = _run_vibesrails_scan(config, files)
     merger = ResultMerger()
     unified_results, stats = merger.merge(semgrep_results, vr_results)
 
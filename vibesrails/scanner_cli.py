@@ -5,6 +5,7 @@ import re
 import sys
 from pathlib import Path
 
+from .file_index import project_files
 from .scanner_types import ScanResult
 
 logger = logging.getLogger(__name__)
@@ -96,7 +97,7 @@ def get_all_python_files() -> list[str]:
         ".mypy_cache", ".ruff_cache", ".pytest_cache",
     ]
     files = []
-    for p in Path(".").rglob("*.py"):
+    for p in project_files("."):
         path_str = str(p)
         if not any(ex in path_str for ex in exclude):
             files.append(path_str)
@@ -0,0 +1,259 @@
+"""Compiled pattern engine for vibesrails scanner.
+
+Patterns from vibesrails.yaml are compiled once per loaded config (regex and
+exclude_regex) and matched in a single pass over each file's lines. All
+combinable patterns are merged into one alternation that acts as a line
+prefilter: a line matching none of them costs one regex call instead of one
+call per pattern.
+"""
+
+import re
+from collections.abc import Callable
+from typing import NamedTuple
+
+from .scanner_types import ScanResult
+from .scanner_utils import is_line_suppressed, is_test_file, matches_pattern
+
+# Limit search to first 10000 chars per line to prevent ReDoS
+MAX_LINE_CHARS = 10_000
+
+# Patterns that only matter in executable code, not comments
+CODE_ONLY_PATTERNS = {
+    "hardcoded_secret", "sql_injection", "command_injection",
+    "shell_injection", "unsafe_yaml", "unsafe_numpy", "debug_mode_prod",
+    "mutable_default",
+}
+
+PATTERN_SECTIONS = ("blocking", "warning", "bugs", "architecture", "maintainability")
+
+# Backreferences, named groups, conditionals and global inline flags change
+# meaning (or clash) once a regex is embedded in a larger alternation.
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(|\(\?[aiLmsux]+\)")
+
+_CACHE_MAX = 8
+_cache: dict[str, "CompiledPatternSet"] = {}
+
+
+class CompiledPattern(NamedTuple):
+    """A config pattern with its regexes compiled once."""
+
+    pattern_id: str
+    message: str
+    level: str  # "BLOCK" or "WARN"
+    regex: re.Pattern
+    exclude: re.Pattern | None
+    source: str
+    flags: int
+    skip_in_tests: bool
+    scope: tuple[str, ...]
+    code_only: bool
+
+    @property
+    def combinable(self) -> bool:
+        return not _UNCOMBINABLE.search(self.source)
+
+    def applies_to(self, filepath: str, is_test: bool, allowed_patterns: set) -> bool:
+        """Check if the pattern should run on the given file."""
+        if self.level == "WARN" and self.skip_in_tests and is_test:
+            return False
+        if self.pattern_id in allowed_patterns:
+            return False
+        return not (self.scope and not matches_pattern(filepath, list(self.scope)))
+
+
+def collect_patterns(config: dict) -> tuple[list, list]:
+    """Collect all blocking and warning patterns from config sections."""
+    all_blocking = list(config.get("blocking") or [])
+    all_warning = list(config.get("warning") or [])
+
+    for section in ["bugs", "architecture", "maintainability"]:
+        for pattern in config.get(section) or []:
+            level = pattern.get("level", "WARN")
+            if level == "BLOCK":
+                all_blocking.append(pattern)
+            else:
+                all_warning.append(pattern)
+
+    return all_blocking, all_warning
+
+
+def _compile_or_none(source: str, flags: int = 0) -> re.Pattern | None:
+    """Compile a regex, returning None if it is invalid."""
+    try:
+        return re.compile(source, flags)
+    except (re.error, RecursionError, MemoryError, TypeError):
+        return None
+
+
+def compile_pattern(pattern: dict, level: str) -> CompiledPattern | None:
+    """Compile a single config pattern. Returns None for malformed patterns."""
+    if not isinstance(pattern, dict) or "id" not in pattern or "regex" not in pattern:
+        return None
+    source = pattern["regex"]
+    flags = re.IGNORECASE if pattern.get("flags") == "i" else 0
+    regex = _compile_or_none(source, flags)
+    if regex is None:
+        return None
+    exclude_source = pattern.get("exclude_regex")
+    return CompiledPattern(
+        pattern_id=pattern["id"],
+        message=pattern.get("message", ""),
+        level=level,
+        regex=regex,
+        exclude=_compile_or_none(exclude_source) if exclude_source else None,
+        source=source,
+        flags=flags,
+        skip_in_tests=bool(pattern.get("skip_in_tests")),
+        scope=tuple(pattern.get("scope") or ()),
+        code_only=pattern["id"] in CODE_ONLY_PATTERNS,
+    )
+
+
+def _build_prefilter(patterns: list[CompiledPattern]) -> re.Pattern | None:
+    """Merge combinable patterns into one alternation, keeping per-pattern flags."""
+    parts = []
+    for p in patterns:
+        if not p.combinable:
+            continue
+        inline = "(?i:" if p.flags & re.IGNORECASE else "(?:"
+        parts.append(f"{inline}{p.source})")
+    if not parts:
+        return None
+    return _compile_or_none("|".join(parts))
+
+
+def find_non_code_lines(lines: list[str]) -> set[int]:
+    """Find line numbers that are inside markdown code blocks or docstrings.
+
+    These lines contain examples/documentation, not executable code.
+    Returns a set of 1-based line numbers to skip for code-only patterns.
+    """
+    skip = set()
+    in_docstring = False
+    in_markdown_block = False
+
+    for i, line in enumerate(lines, 1):
+        stripped = line.strip()
+
+        # Track triple-quote docstrings containing markdown code blocks
+        if '"""' in stripped or "'''" in stripped:
+            # Count quotes to detect open/close
+            for quote in ('"""', "'''"):
+                count = stripped.count(quote)
+                if count == 1:
+                    in_docstring = not in_docstring
+                # count >= 2 means open+close on same line, no state change
+
+        # Track markdown code blocks inside docstrings/strings
+        if in_docstring and stripped.startswith("```"):
+            in_markdown_block = not in_markdown_block
+            continue
+
+        if in_docstring and in_markdown_block:
+            skip.add(i)
+
+    return skip
+
+
+class CompiledPatternSet:
+    """All patterns of a config, compiled and ready for single-pass scanning."""
+
+    def __init__(self, patterns: list[CompiledPattern]):
+        self.patterns = patterns
+        self.prefilter = _build_prefilter(patterns)
+        # If the merged regex failed to compile, every pattern runs per line.
+        self._always = {
+            i for i, p in enumerate(patterns)
+            if self.prefilter is None or not p.combinable
+        }
+
+    def scan_lines(
+        self, lines: list[str], filepath: str, allowed_patterns: set,
+    ) -> list[ScanResult]:
+        """Scan lines in a single pass; results are ordered by pattern, then line."""
+        is_test = is_test_file(filepath)
+        active = [
+            (i, p) for i, p in enumerate(self.patterns)
+            if p.applies_to(filepath, is_test, allowed_patterns)
+        ]
+        if not active:
+            return []
+        always = [(i, p) for i, p in active if i in self._always]
+        non_code_lines = (
+            find_non_code_lines(lines) if any(p.code_only for _, p in active) else set()
+        )
+        prefilter = self.prefilter
+        buckets: dict[int, list[ScanResult]] = {i: [] for i, _ in active}
+        prev_line = None
+
+        for lineno, line in enumerate(lines, 1):
+            text = line[:MAX_LINE_CHARS]
+            candidates = active if prefilter is not None and _search(prefilter, text) else always
+            if candidates:
+                is_comment = line.lstrip().startswith("#")
+                skip_code_only = is_comment or lineno in non_code_lines
+                for i, p in candidates:
+                    if p.code_only and skip_code_only:
+                        continue
+                    if not _search(p.regex, text):
+                        continue
+                    if p.exclude is not None and _search(p.exclude, text):
+                        continue
+                    if is_line_suppressed(line, p.pattern_id, prev_line):
+                        continue
+                    buckets[i].append(ScanResult(
+                        file=filepath, line=lineno, pattern_id=p.pattern_id,
+                        message=p.message, level=p.level,
+                    ))
+            prev_line = line
+
+        return [r for i, _ in active for r in buckets[i]]
+
+
+def _search(regex: re.Pattern, text: str) -> bool:
+    """Run a compiled regex search with ReDoS-related errors treated as no match."""
+    try:
+        return regex.search(text) is not None
+    except (RecursionError, MemoryError):
+        return False
+
+
+def _compile_set(groups: list[tuple[list, str]]) -> CompiledPatternSet:
+    compiled = []
+    for patterns, level in groups:
+        for pattern in patterns:
+            cp = compile_pattern(pattern, level)
+            if cp is not None:
+                compiled.append(cp)
+    return CompiledPatternSet(compiled)
+
+
+def _cached(key: str, build: Callable[[], list[tuple[list, str]]]) -> CompiledPatternSet:
+    pattern_set = _cache.get(key)
+    if pattern_set is None:
+        pattern_set = _compile_set(build())
+        if len(_cache) >= _CACHE_MAX:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = pattern_set
+    return pattern_set
+
+
+def compile_config(config: dict) -> CompiledPatternSet:
+    """Return the compiled pattern set for a config (cached per pattern content)."""
+    key = repr([config.get(section) for section in PATTERN_SECTIONS])
+
+    def build() -> list[tuple[list, str]]:
+        blocking, warning = collect_patterns(config)
+        return [(blocking, "BLOCK"), (warning, "WARN")]
+
+    return _cached(key, build)
+
+
+def compile_patterns(patterns: list, level: str) -> CompiledPatternSet:
+    """Return the compiled pattern set for a single list of patterns."""
+    return _cached(repr((level, patterns)), lambda: [(patterns, level)])
+
+
+def clear_cache() -> None:
+    """Drop all compiled pattern sets."""
+    _cache.clear()
@@ -4,6 +4,8 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from vibesrails.file_index import project_files
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,7 +53,7 @@ class ArchitectureMapper:
     def _analyze_modules(self) -> list[dict]:
         """Analyze Python modules."""
         modules = []
-        for py_file in self.project_root.glob("**/*.py"):
+        for py_file in project_files(self.project_root):
             if "__pycache__" in str(py_file):
                 continue
             try:
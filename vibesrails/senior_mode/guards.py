@@ -4,6 +4,8 @@ import re
 from dataclasses import dataclass
 from typing import Literal
 
+from vibesrails.parsed_module import ParsedModule
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,10 +66,12 @@ class ErrorHandlingGuard:
 
     def check(self, code: str, filepath: str) -> list[GuardIssue]:
         """Check for error handling issues."""
-        issues = []
-        lines = code.splitlines()
+        return self.check_parsed(ParsedModule(filepath, code), filepath)
 
-        for i, line in enumerate(lines, 1):
+    def check_parsed(self, module: ParsedModule, filepath: str) -> list[GuardIssue]:
+        """Check an already-parsed file for error handling issues."""
+        issues = []
+        for i, line in enumerate(module.lines, 1):
             for pattern, message in self.PATTERNS:
                 if re.search(pattern, line):
                     issues.append(GuardIssue(
@@ -204,9 +208,13 @@ class ResilienceGuard:
 
     def check(self, code: str, filepath: str) -> list[GuardIssue]:
         """Check for missing resilience patterns."""
-        lines = code.splitlines()
+        return self.check_parsed(ParsedModule(filepath, code), filepath)
+
+    def check_parsed(self, module: ParsedModule, filepath: str) -> list[GuardIssue]:
+        """Check an already-parsed file for missing resilience patterns."""
+        lines = module.lines
         issues = self._check_network_calls(lines, filepath)
-        issues.extend(self._check_db_calls(code, lines, filepath))
+        issues.extend(self._check_db_calls(module.source, lines, filepath))
         issues.extend(self._check_file_ops(lines, filepath))
         return issues
 
@@ -243,10 +251,12 @@ class SeniorGuards:
 
         if files:
             for filepath, content in files:
-                issues.extend(self.error_guard.check(content, filepath))
-                issues.extend(self.hallucination_guard.check(content, filepath))
-                issues.extend(self.lazy_guard.check(content, filepath))
-                issues.extend(self.bypass_guard.check(content, filepath))
-                issues.extend(self.resilience_guard.check(content, filepath))
+                # One parse per file, shared by the five code guards
+                module = ParsedModule(filepath, content)
+                issues.extend(self.error_guard.check_parsed(module, filepath))
+                issues.extend(self.hallucination_guard.check_parsed(module, filepath))
+                issues.extend(self.lazy_guard.check_parsed(module, filepath))
+                issues.extend(self.bypass_guard.check_parsed(module, filepath))
+                issues.extend(self.resilience_guard.check_parsed(module, filepath))
 
         return issues
@@ -4,6 +4,7 @@ import importlib.util
 import logging
 import re
 
+from vibesrails.parsed_module import ParsedModule
 from vibesrails.senior_mode.guards import GuardIssue
 
 logger = logging.getLogger(__name__)
@@ -47,13 +48,12 @@ class HallucinationGuard:
 
     def check(self, code: str, filepath: str) -> list[GuardIssue]:
         """Check for potentially hallucinated imports."""
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
-            return []
+        return self.check_parsed(ParsedModule(filepath, code), filepath)
 
+    def check_parsed(self, module: ParsedModule, filepath: str) -> list[GuardIssue]:
+        """Check an already-parsed file for potentially hallucinated imports."""
         issues = []
-        for node in ast.walk(tree):
+        for node in module.nodes(ast.Import, ast.ImportFrom):
             if isinstance(node, ast.Import):
                 issues.extend(self._check_import_node(node, filepath))
             elif isinstance(node, ast.ImportFrom):
@@ -90,16 +90,10 @@ class LazyCodeGuard:
     ]
 
     @staticmethod
-    def _check_empty_functions(code: str, filepath: str) -> list[GuardIssue]:
+    def _check_empty_functions(module: ParsedModule, filepath: str) -> list[GuardIssue]:
         """Check for empty functions (only pass or docstring+pass)."""
         issues = []
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
-            return issues
-        for node in ast.walk(tree):
-            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                continue
+        for node in module.nodes(ast.FunctionDef, ast.AsyncFunctionDef):
             body = node.body
             is_empty = (len(body) == 1 and isinstance(body[0], ast.Pass))
             is_docstring_pass = (
@@ -124,10 +118,12 @@ class LazyCodeGuard:
 
     def check(self, code: str, filepath: str) -> list[GuardIssue]:
         """Check for lazy code patterns."""
-        issues = []
-        lines = code.splitlines()
+        return self.check_parsed(ParsedModule(filepath, code), filepath)
 
-        for i, line in enumerate(lines, 1):
+    def check_parsed(self, module: ParsedModule, filepath: str) -> list[GuardIssue]:
+        """Check an already-parsed file for lazy code patterns."""
+        issues = []
+        for i, line in enumerate(module.lines, 1):
             for pattern, message in self.PATTERNS:
                 if re.search(pattern, line, re.IGNORECASE):
                     issues.append(GuardIssue(
@@ -138,7 +134,7 @@ class LazyCodeGuard:
                         line=i
                     ))
 
-        issues.extend(self._check_empty_functions(code, filepath))
+        issues.extend(self._check_empty_functions(module, filepath))
         return issues
 
 
@@ -164,10 +160,12 @@ class BypassGuard:
 
     def check(self, code: str, filepath: str) -> list[GuardIssue]:
         """Check for unjustified bypass comments."""
-        issues = []
-        lines = code.splitlines()
+        return self.check_parsed(ParsedModule(filepath, code), filepath)
 
-        for i, line in enumerate(lines, 1):
+    def check_parsed(self, module: ParsedModule, filepath: str) -> list[GuardIssue]:
+        """Check an already-parsed file for unjustified bypass comments."""
+        issues = []
+        for i, line in enumerate(module.lines, 1):
             for pattern, message in self.PATTERNS:
                 if message is None:  # OK pattern
                     continue
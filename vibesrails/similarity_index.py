@@ -0,0 +1,122 @@
+"""Trigram index for bounded edit-distance lookups over package names.
+
+Typosquat checks (guards_v2.dependency_audit_checks) and slopsquatting
+suggestions (core.hallucination_registry) both ask "which known names are
+within N edits of this one?". Comparing the query against every name is
+fine for 100 names and far too slow for the top-10k or the full PyPI list.
+
+The index maps each trigram of a padded name ("$$name$$") to the ids of
+the names containing it. One edit changes at most 3 trigrams, so a name
+within d edits shares at least len(query trigrams) - 3*d of them. Names
+are counted per shared trigram and only those over that bound (and within
+d characters of length) are checked with a banded Levenshtein. Very short
+queries, where the bound is zero, fall back to the names of similar
+length.
+
+Results are ordered by distance, then by insertion order, so a list
+sorted by popularity yields the most popular candidate first.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+
+_PAD = "$$"
+
+
+def _trigrams(name: str) -> set[str]:
+    padded = f"{_PAD}{name}{_PAD}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_levenshtein(s1: str, s2: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 as soon as it must exceed limit."""
+    if abs(len(s1) - len(s2)) > limit:
+        return limit + 1
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    prev_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        curr_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            curr_row.append(min(
+                curr_row[j] + 1,
+                prev_row[j + 1] + 1,
+                prev_row[j] + (c1 != c2),
+            ))
+        if min(curr_row) > limit:
+            return limit + 1
+        prev_row = curr_row
+    return min(prev_row[-1], limit + 1)
+
+
+class SimilarityIndex:
+    """Names indexed for "within N edits" and top-k nearest queries."""
+
+    def __init__(self, names: Iterable[str]):
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._postings: dict[str, array] = {}
+        self._by_length: dict[int, array] = {}
+        for name in names:
+            if not name or name in self._ids:
+                continue
+            idx = len(self._names)
+            self._ids[name] = idx
+            self._names.append(name)
+            for gram in _trigrams(name):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("I")
+                postings.append(idx)
+            bucket = self._by_length.get(len(name))
+            if bucket is None:
+                bucket = self._by_length[len(name)] = array("I")
+            bucket.append(idx)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def _candidates(self, query: str, max_distance: int) -> Iterable[int]:
+        grams = _trigrams(query)
+        needed = len(grams) - 3 * max_distance
+        if needed <= 0:
+            return (
+                idx
+                for length in range(len(query) - max_distance, len(query) + max_distance + 1)
+                for idx in self._by_length.get(length, ())
+            )
+        counts: Counter[int] = Counter()
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                counts.update(postings)
+        return (idx for idx, shared in counts.items() if shared >= needed)
+
+    def search(
+        self, query: str, max_distance: int = 2, limit: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """Return (name, distance) pairs within max_distance edits of query.
+
+        Sorted by distance, then insertion order. The query itself is
+        included (distance 0) if it is indexed.
+        """
+        if max_distance < 0:
+            return []
+        hits: list[tuple[int, int]] = []
+        for idx in self._candidates(query, max_distance):
+            name = self._names[idx]
+            if abs(len(name) - len(query)) > max_distance:
+                continue
+            dist = bounded_levenshtein(query, name, max_distance)
+            if dist <= max_distance:
+                hits.append((dist, idx))
+        hits.sort()
+        if limit is not None:
+            hits = hits[:limit]
+        return [(self._names[idx], dist) for dist, idx in hits]
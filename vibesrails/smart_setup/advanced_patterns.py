@@ -8,6 +8,7 @@ import logging
 import re
 from pathlib import Path
 
+from ..file_index import project_files
 from ..scanner import GREEN, NC, RED, YELLOW
 
 logger = logging.getLogger(__name__)
@@ -57,7 +58,7 @@ def validate_and_preview_regex(pattern: str, project_root: Path) -> tuple[bool,
 
     matches = []
     files_checked = 0
-    for py_file in project_root.rglob("*.py"):
+    for py_file in project_files(project_root):
         if files_checked >= 5:
             break
         file_matches = _preview_matches_in_file(py_file, compiled, project_root, 3)
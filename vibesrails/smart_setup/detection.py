@@ -9,6 +9,8 @@ import re
 import shutil
 from pathlib import Path
 
+from ..file_index import project_files
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -85,13 +87,13 @@ def detect_project_type(project_root: Path) -> list[str]:
     for project_type, signatures in PROJECT_SIGNATURES.items():
         # Check for signature files
         for sig_file in signatures["files"]:
-            if list(project_root.rglob(sig_file)):
+            if project_files(project_root, sig_file):
                 detected.append(project_type)
                 break
 
         # Check for imports in Python files
         if project_type not in detected:
-            for py_file in project_root.rglob("*.py"):
+            for py_file in project_files(project_root):
                 try:
                     content = py_file.read_text(errors="ignore")
                     for imp in signatures["imports"]:
@@ -130,7 +132,7 @@ def detect_existing_configs(project_root: Path) -> dict[str, Path]:
 
 def detect_secrets_risk(project_root: Path) -> bool:
     """Check if project has potential secret handling."""
-    for py_file in project_root.rglob("*.py"):
+    for py_file in project_files(project_root):
         try:
             content = py_file.read_text(errors="ignore")
             for pattern in SECRET_INDICATORS:
@@ -164,12 +166,12 @@ def detect_env_files(project_root: Path) -> list[Path]:
 def detect_project_language(project_root: Path) -> str:
     """Detect primary project language."""
     # Check for Python
-    py_files = list(project_root.rglob("*.py"))
+    py_files = project_files(project_root)
     py_count = len([f for f in py_files if ".venv" not in str(f) and "venv" not in str(f)])
 
     # Check for JS/TS
-    js_files = list(project_root.rglob("*.js")) + list(project_root.rglob("*.jsx"))
-    ts_files = list(project_root.rglob("*.ts")) + list(project_root.rglob("*.tsx"))
+    js_files = project_files(project_root, "*.js") + project_files(project_root, "*.jsx")
+    ts_files = project_files(project_root, "*.ts") + project_files(project_root, "*.tsx")
     js_count = len([f for f in js_files if "node_modules" not in str(f)])
     ts_count = len([f for f in ts_files if "node_modules" not in str(f)])
 
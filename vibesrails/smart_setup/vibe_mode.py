@@ -8,6 +8,7 @@ import logging
 import re
 from pathlib import Path
 
+from ..file_index import project_files
 from ..scanner import BLUE, GREEN, NC, RED, YELLOW
 from ._vibe_patterns import SKIP_DIRS as _SKIP_DIRS
 from ._vibe_patterns import VIBE_PROTECTIONS
@@ -65,7 +66,7 @@ def scan_for_secrets(project_root: Path) -> dict[str, list[dict]]:
     """
     found = {category: [] for category in VIBE_PROTECTIONS}
 
-    for py_file in project_root.rglob("*.py"):
+    for py_file in project_files(project_root):
         if any(part in py_file.parts for part in _SKIP_DIRS):
             continue
         try:
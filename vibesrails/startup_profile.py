@@ -0,0 +1,116 @@
+"""Startup profiling — per-module import cost of the VibesRails entry points.
+
+Hooks start a fresh interpreter on every Claude Code tool call, so their
+import time is paid on every call. ``vibesrails --profile-startup`` imports
+each entry point in a cold subprocess with ``python -X importtime`` and
+reports which modules dominate.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINTS = (
+    "vibesrails.hooks.pre_tool_use",
+    "vibesrails.hooks.post_tool_use",
+    "vibesrails.cli",
+)
+
+# Cumulative import budget for a hook entry point, excluding interpreter startup
+HOOK_IMPORT_BUDGET_MS = 60.0
+
+
+@dataclass
+class ImportCost:
+    """Import time of one module, as reported by -X importtime."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportCost]:
+    """Parse ``-X importtime`` stderr into ImportCost entries."""
+    costs = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped)) // 2
+        costs.append(ImportCost(stripped, self_us, cumulative_us, depth))
+    return costs
+
+
+def profile_import(module: str) -> list[ImportCost]:
+    """Import module in a cold interpreter and return per-module costs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, timeout=60,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-500:]}")
+    return parse_importtime(result.stderr)
+
+
+def entry_cost_ms(costs: list[ImportCost], module: str) -> float:
+    """Cumulative import time of module itself (0 if it was not imported)."""
+    for cost in costs:
+        if cost.module == module:
+            return cost.cumulative_us / 1000
+    return 0.0
+
+
+def format_report(module: str, costs: list[ImportCost], top: int = 10) -> str:
+    """Render the total and the most expensive modules an entry point pulls in."""
+    total = entry_cost_ms(costs, module)
+    lines = [f"{module}: {total:.1f} ms"]
+    # Only modules imported on behalf of the entry point, not interpreter startup
+    ours = _subtree(costs, module)
+    for cost in sorted(ours, key=lambda c: c.self_us, reverse=True)[:top]:
+        lines.append(
+            f"  {cost.self_us / 1000:7.1f} ms self  "
+            f"{cost.cumulative_us / 1000:7.1f} ms total  {cost.module}"
+        )
+    return "\n".join(lines)
+
+
+def _subtree(costs: list[ImportCost], module: str) -> list[ImportCost]:
+    """Entries imported under module (importtime lists children before parents)."""
+    for index, cost in enumerate(costs):
+        if cost.module == module and cost.depth == 0:
+            start = index
+            while start > 0 and costs[start - 1].depth > 0:
+                start -= 1
+            return costs[start:index + 1]
+    return []
+
+
+def run_profile_startup(modules: tuple[str, ...] = ENTRY_POINTS) -> int:
+    """Print an import-cost report per entry point; 1 if a hook is over budget."""
+    over_budget = False
+    for module in modules:
+        costs = profile_import(module)
+        logger.info(format_report(module, costs))
+        total = entry_cost_ms(costs, module)
+        if module.startswith("vibesrails.hooks.") and total > HOOK_IMPORT_BUDGET_MS:
+            logger.info(
+                "  over the %.0f ms hook budget by %.1f ms",
+                HOOK_IMPORT_BUDGET_MS, total - HOOK_IMPORT_BUDGET_MS,
+            )
+            over_budget = True
+        logger.info("")
+    return 1 if over_budget else 0
@@ -24,17 +24,15 @@ logger = logging.getLogger(__name__)
 
 def _git_info(root: Path) -> dict:
     """Collect git state. Returns dict with branch, dirty_count, unpushed."""
+    from .git_snapshot import git_snapshot
     from .guards_v2._git_helpers import run_git
 
     info: dict = {"branch": "?", "dirty_count": 0, "unpushed": 0}
 
-    ok, branch = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=root)
-    if ok:
-        info["branch"] = branch
-
-    ok, output = run_git(["status", "--porcelain"], cwd=root)
-    if ok:
-        info["dirty_count"] = sum(1 for line in output.splitlines() if line.strip())
+    status = git_snapshot(root).status
+    if status is not None:
+        info["branch"] = status.branch
+        info["dirty_count"] = status.dirty_count
 
     ok, output = run_git(
         ["rev-list", "--left-right", "--count", "main...HEAD"], cwd=root
@@ -17,6 +17,8 @@ import re
 import sqlite3
 from pathlib import Path
 
+from .file_index import project_files
+
 logger = logging.getLogger(__name__)
 
 _SKIP_DIRS = ("__pycache__", ".venv", "venv", ".git", "build", "dist", ".egg")
@@ -250,7 +252,7 @@ def generate_flows(root: Path) -> str:
         pkg_dir = root / pkg
         if not pkg_dir.is_dir():
             continue
-        for py_file in sorted(pkg_dir.rglob("*.py")):
+        for py_file in project_files(root, under=pkg):
             if any(skip in py_file.parts for skip in _SKIP_DIRS):
                 continue
             if py_file.name.startswith("_") and py_file.name != "__init__.py":